@@ -0,0 +1,100 @@
+using System;
+using System.Numerics;
+using System.Text;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using NeoSharp.Crypto;
+using NeoSharp.Utils;
+using Base58 = NeoSharp.Crypto.Base58;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares the limb-based <see cref="Base58"/> codec with the previous BigInteger implementation for
+    /// address-sized (25 bytes), NEP-2-sized (43 bytes) and larger inputs, plus the address round trip.
+    /// </summary>
+    [MemoryDiagnoser]
+    [GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+    public class Base58Benchmarks
+    {
+        private const string Alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz";
+
+        private byte[] _data;
+        private string _encoded;
+        private char[] _chars;
+        private byte[] _bytes;
+        private byte[] _scriptHash;
+        private string _address;
+
+        /// <summary>
+        /// Size of the encoded input in bytes.
+        /// </summary>
+        [Params(25, 43, 256)]
+        public int DataSize { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var random = new Random(25);
+            _data = new byte[DataSize];
+            random.NextBytes(_data);
+            _data[0] = 0x35;
+            _encoded = Base58.Encode(_data);
+            _chars = new char[Base58.GetMaxEncodedLength(DataSize)];
+            _bytes = new byte[DataSize];
+            _scriptHash = new byte[20];
+            random.NextBytes(_scriptHash);
+            _address = _scriptHash.ScriptHashToAddress();
+        }
+
+        [Benchmark(Baseline = true)]
+        [BenchmarkCategory("Encode")]
+        public string Encode_BigInteger()
+        {
+            var value = new BigInteger(_data, isUnsigned: true, isBigEndian: true);
+            var result = new StringBuilder();
+            while (value > 0)
+            {
+                value = BigInteger.DivRem(value, 58, out var remainder);
+                result.Insert(0, Alphabet[(int)remainder]);
+            }
+            return result.ToString();
+        }
+
+        [Benchmark]
+        [BenchmarkCategory("Encode")]
+        public string Encode() => Base58.Encode(_data);
+
+        [Benchmark]
+        [BenchmarkCategory("Encode")]
+        public bool TryEncode() => Base58.TryEncode(_data, _chars, out _);
+
+        [Benchmark(Baseline = true)]
+        [BenchmarkCategory("Decode")]
+        public byte[] Decode_BigInteger()
+        {
+            var value = BigInteger.Zero;
+            foreach (var c in _encoded)
+            {
+                value = value * 58 + Alphabet.IndexOf(c);
+            }
+            return value.ToByteArray(isUnsigned: true, isBigEndian: true);
+        }
+
+        [Benchmark]
+        [BenchmarkCategory("Decode")]
+        public byte[] Decode() => Base58.Decode(_encoded);
+
+        [Benchmark]
+        [BenchmarkCategory("Decode")]
+        public bool TryDecode() => Base58.TryDecode(_encoded, _bytes, out _);
+
+        [Benchmark]
+        [BenchmarkCategory("Address")]
+        public string ScriptHashToAddress() => _scriptHash.ScriptHashToAddress();
+
+        [Benchmark]
+        [BenchmarkCategory("Address")]
+        public byte[] AddressToScriptHash() => _address.AddressToScriptHash();
+    }
+}
@@ -0,0 +1,73 @@
+using System;
+using System.Linq;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+using NeoSharp.Types;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Measures the throughput of Hash160Many and Hash256Many against hashing one input at a time, for
+    /// verification-script-sized and transaction-sized inputs. Results are per input, so throughput should
+    /// scale with MaxDegreeOfParallelism up to the number of physical cores.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class BatchHashBenchmarks
+    {
+        private const int InputCount = 100_000;
+
+        private ReadOnlyMemory<byte>[] _inputs;
+        private Hash160[] _scriptHashes;
+        private Hash256[] _hashes;
+
+        /// <summary>
+        /// Size of each input: 40 bytes is a single-signature verification script, 250 bytes a typical transaction.
+        /// </summary>
+        [Params(40, 250)]
+        public int InputSize { get; set; }
+
+        /// <summary>
+        /// Number of cores the batch may use; -1 uses all of them.
+        /// </summary>
+        [Params(1, 2, 4, -1)]
+        public int MaxDegreeOfParallelism { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var random = new Random(42);
+            _inputs = Enumerable.Range(0, InputCount).Select(_ =>
+            {
+                var data = new byte[InputSize];
+                random.NextBytes(data);
+                return new ReadOnlyMemory<byte>(data);
+            }).ToArray();
+            _scriptHashes = new Hash160[InputCount];
+            _hashes = new Hash256[InputCount];
+        }
+
+        [Benchmark(Baseline = true, OperationsPerInvoke = InputCount)]
+        public void Hash160_OneAtATime()
+        {
+            for (var i = 0; i < _inputs.Length; i++)
+            {
+                _scriptHashes[i] = Hash160.FromScript(_inputs[i].ToArray());
+            }
+        }
+
+        [Benchmark(OperationsPerInvoke = InputCount)]
+        public void Hash160_Many() => Hash.Hash160Many(_inputs, _scriptHashes, MaxDegreeOfParallelism);
+
+        [Benchmark(OperationsPerInvoke = InputCount)]
+        public void Hash256_OneAtATime()
+        {
+            for (var i = 0; i < _inputs.Length; i++)
+            {
+                _hashes[i] = Hash256.FromLittleEndianBytes(Hash.Hash256(_inputs[i].ToArray()));
+            }
+        }
+
+        [Benchmark(OperationsPerInvoke = InputCount)]
+        public void Hash256_Many() => Hash.Hash256Many(_inputs, _hashes, MaxDegreeOfParallelism);
+    }
+}
@@ -0,0 +1,59 @@
+using System.Text;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares verifying the witnesses of a block one by one with <see cref="Sign.VerifySignature"/>
+    /// against <see cref="Sign.VerifyBatch"/> on one core and on all of them. The witnesses are spread
+    /// over a few validator keys, as they are in practice.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class BatchVerifyBenchmarks
+    {
+        private const int KeyCount = 7;
+
+        private (byte[] Message, SignatureData Signature, ECPublicKey PublicKey)[] _items;
+        private bool[] _results;
+
+        [Params(16, 256)]
+        public int Count { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var keyPairs = new ECKeyPair[KeyCount];
+            for (var i = 0; i < keyPairs.Length; i++)
+            {
+                keyPairs[i] = ECKeyPair.CreateEcKeyPair();
+            }
+
+            _items = new (byte[], SignatureData, ECPublicKey)[Count];
+            for (var i = 0; i < Count; i++)
+            {
+                var keyPair = keyPairs[i % KeyCount];
+                var message = Encoding.UTF8.GetBytes($"witness {i}");
+                _items[i] = (message, Sign.SignMessage(message, keyPair), keyPair.PublicKey);
+            }
+            _results = new bool[Count];
+        }
+
+        [Benchmark(Baseline = true)]
+        public bool VerifySignature_Loop()
+        {
+            var allValid = true;
+            foreach (var (message, signature, publicKey) in _items)
+            {
+                allValid &= Sign.VerifySignature(message, signature, publicKey);
+            }
+            return allValid;
+        }
+
+        [Benchmark]
+        public bool VerifyBatch_SingleCore() => Sign.VerifyBatch(_items, _results, maxDegreeOfParallelism: 1);
+
+        [Benchmark]
+        public bool VerifyBatch_AllCores() => Sign.VerifyBatch(_items, _results);
+    }
+}
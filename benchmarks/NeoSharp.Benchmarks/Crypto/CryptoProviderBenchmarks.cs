@@ -0,0 +1,55 @@
+using System.Collections.Generic;
+using System.Text;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares the BouncyCastle and native <see cref="ICryptoProvider"/> implementations on key derivation,
+    /// signing and verification. Verification reuses one <see cref="ECPublicKey"/>, as a witness verifier
+    /// checking the same validators would, so the per-key decoding and import are not measured.
+    /// </summary>
+    [MemoryDiagnoser]
+    [GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+    public class CryptoProviderBenchmarks
+    {
+        private byte[] _privateKey;
+        private ECPublicKey _publicKey;
+        private byte[] _messageHash;
+        private byte[] _signature;
+
+        [ParamsSource(nameof(Providers))]
+        public ICryptoProvider Provider { get; set; }
+
+        public IEnumerable<ICryptoProvider> Providers()
+        {
+            yield return BouncyCastleCryptoProvider.Instance;
+            if (NativeCryptoProvider.IsSupported)
+                yield return NativeCryptoProvider.Instance;
+        }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _privateKey = ECPrivateKey.GenerateRandom().PrivateKeyBytes;
+            _publicKey = new ECPublicKey(Provider.DerivePublicKey(_privateKey));
+            _messageHash = Hash.SHA256(Encoding.UTF8.GetBytes("A test message"));
+            _signature = Provider.SignHash(_privateKey, _messageHash);
+            Provider.VerifyHash(_publicKey, _messageHash, _signature);
+        }
+
+        [Benchmark]
+        [BenchmarkCategory("KeyGen")]
+        public byte[] DerivePublicKey() => Provider.DerivePublicKey(_privateKey);
+
+        [Benchmark]
+        [BenchmarkCategory("Sign")]
+        public byte[] SignHash() => Provider.SignHash(_privateKey, _messageHash);
+
+        [Benchmark]
+        [BenchmarkCategory("Verify")]
+        public bool VerifyHash() => Provider.VerifyHash(_publicKey, _messageHash, _signature);
+    }
+}
@@ -0,0 +1,69 @@
+using System;
+using System.Linq;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares HashCache hits with recomputing the hash, for script-sized and transaction-sized inputs.
+    /// A hit costs a fingerprint and a content comparison, so it has to stay well below the hash itself.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class HashCacheBenchmarks
+    {
+        private HashCache _cache;
+        private byte[] _data;
+        private byte[] _copy;
+        private byte[] _destination;
+        private byte[][] _misses;
+        private int _next;
+
+        /// <summary>
+        /// Size of the hashed input in bytes.
+        /// </summary>
+        [Params(40, 250, 4096)]
+        public int DataSize { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var random = new Random(42);
+            _data = new byte[DataSize];
+            random.NextBytes(_data);
+            _copy = _data.ToArray();
+            _destination = new byte[32];
+            _misses = Enumerable.Range(0, 4096).Select(_ =>
+            {
+                var data = new byte[DataSize];
+                random.NextBytes(data);
+                return data;
+            }).ToArray();
+
+            _cache = new HashCache { MaxCacheSize = 1024 };
+            _cache.Hash256(_data);
+            _cache.Hash160(_data);
+        }
+
+        [GlobalCleanup]
+        public void Cleanup() => _cache.Dispose();
+
+        [Benchmark(Baseline = true)]
+        public byte[] Hash256_Recompute() => Hash.Hash256(_data);
+
+        [Benchmark]
+        public byte[] Hash256_CacheHit() => _cache.Hash256(_copy);
+
+        [Benchmark]
+        public int Hash256_CacheHit_Span() => _cache.Hash256(_copy.AsSpan(), _destination);
+
+        [Benchmark]
+        public byte[] Hash256_CacheMissWithEviction() => _cache.Hash256(_misses[_next++ & (_misses.Length - 1)]);
+
+        [Benchmark]
+        public byte[] Hash160_Recompute() => Hash.Hash160(_data);
+
+        [Benchmark]
+        public int Hash160_CacheHit_Span() => _cache.Hash160(_copy.AsSpan(), _destination);
+    }
+}
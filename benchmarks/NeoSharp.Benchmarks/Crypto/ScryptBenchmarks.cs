@@ -0,0 +1,32 @@
+using System.Text;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares <see cref="ScryptEncoder.CryptoScrypt"/> with the Scrypt.NET package at the NEP-2 parameters
+    /// (N = 16384, r = 8, p = 8), on one core and with the lanes in parallel. Scrypt.NET only exposes its
+    /// password-hash encoder, which adds a random salt and Base64 formatting to the same scrypt work.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class ScryptBenchmarks
+    {
+        private const int N = 16384;
+        private const int R = 8;
+        private const int P = 8;
+
+        private readonly byte[] _password = Encoding.UTF8.GetBytes("TestingOneTwoThree");
+        private readonly byte[] _salt = { 0x01, 0x02, 0x03, 0x04 };
+        private readonly Scrypt.ScryptEncoder _scryptNet = new Scrypt.ScryptEncoder(N, R, P);
+
+        [Benchmark(Baseline = true)]
+        public string ScryptNet() => _scryptNet.Encode("TestingOneTwoThree");
+
+        [Benchmark]
+        public byte[] CryptoScrypt_SingleCore() => ScryptEncoder.CryptoScrypt(_password, _salt, N, R, P, 64, maxDegreeOfParallelism: 1);
+
+        [Benchmark]
+        public byte[] CryptoScrypt_ParallelLanes() => ScryptEncoder.CryptoScrypt(_password, _salt, N, R, P, 64);
+    }
+}
@@ -0,0 +1,80 @@
+using System.Security.Cryptography;
+using BenchmarkDotNet.Attributes;
+using BenchmarkDotNet.Configs;
+using NeoSharp.Crypto;
+using Org.BouncyCastle.Crypto.EC;
+using Org.BouncyCastle.Crypto.Parameters;
+using Org.BouncyCastle.Crypto.Signers;
+using BCBigInteger = Org.BouncyCastle.Math.BigInteger;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares key derivation, signing and verification on the shared <see cref="Secp256r1Curve"/> context
+    /// with the previous pattern of looking the curve up and building domain parameters on every call.
+    /// Each category has its own baseline. Verifying against a kept key instance reuses its decoded point
+    /// and precomputed multiples, while a new instance has to decompress the point first.
+    /// </summary>
+    [MemoryDiagnoser]
+    [GroupBenchmarksBy(BenchmarkLogicalGroupRule.ByCategory)]
+    public class Secp256r1Benchmarks
+    {
+        private ECPrivateKey _privateKey;
+        private ECPublicKey _publicKey;
+        private byte[] _privateKeyBytes;
+        private byte[] _encodedPublicKey;
+        private byte[] _messageHash;
+        private byte[] _signature;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _privateKeyBytes = RandomNumberGenerator.GetBytes(32);
+            _privateKey = new ECPrivateKey(_privateKeyBytes);
+            _publicKey = _privateKey.GetPublicKey();
+            _encodedPublicKey = _publicKey.GetEncoded(true);
+            _messageHash = Hash.SHA256(RandomNumberGenerator.GetBytes(100));
+            _signature = _privateKey.Sign(_messageHash);
+        }
+
+        [Benchmark(Baseline = true), BenchmarkCategory("KeyGen")]
+        public byte[] KeyGen_PerCallLookup()
+        {
+            var curve = CustomNamedCurves.GetByName("secp256r1");
+            var domain = new ECDomainParameters(curve.Curve, curve.G, curve.N, curve.H);
+            return domain.G.Multiply(new BCBigInteger(1, _privateKeyBytes)).Normalize().GetEncoded(true);
+        }
+
+        [Benchmark, BenchmarkCategory("KeyGen")]
+        public ECPublicKey KeyGen() => _privateKey.GetPublicKey();
+
+        [Benchmark(Baseline = true), BenchmarkCategory("Sign")]
+        public BCBigInteger[] Sign_PerCallLookup()
+        {
+            var curve = CustomNamedCurves.GetByName("secp256r1");
+            var domain = new ECDomainParameters(curve.Curve, curve.G, curve.N, curve.H);
+            var signer = new ECDsaSigner();
+            signer.Init(true, new ECPrivateKeyParameters(new BCBigInteger(1, _privateKeyBytes), domain));
+            return signer.GenerateSignature(_messageHash);
+        }
+
+        [Benchmark, BenchmarkCategory("Sign")]
+        public byte[] Sign() => _privateKey.Sign(_messageHash);
+
+        [Benchmark(Baseline = true), BenchmarkCategory("Verify")]
+        public bool Verify_PerCallLookup()
+        {
+            var curve = CustomNamedCurves.GetByName("secp256r1");
+            var domain = new ECDomainParameters(curve.Curve, curve.G, curve.N, curve.H);
+            var verifier = new ECDsaSigner();
+            verifier.Init(false, new ECPublicKeyParameters(curve.Curve.DecodePoint(_encodedPublicKey), domain));
+            return verifier.VerifySignature(_messageHash, new BCBigInteger(1, _signature, 0, 32), new BCBigInteger(1, _signature, 32, 32));
+        }
+
+        [Benchmark, BenchmarkCategory("Verify")]
+        public bool Verify_NewKeyInstance() => new ECPublicKey(_encodedPublicKey).Verify(_messageHash, _signature);
+
+        [Benchmark, BenchmarkCategory("Verify")]
+        public bool Verify() => _publicKey.Verify(_messageHash, _signature);
+    }
+}
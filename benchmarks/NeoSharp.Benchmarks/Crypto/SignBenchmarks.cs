@@ -0,0 +1,38 @@
+using System.Text;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Benchmarks.Crypto
+{
+    /// <summary>
+    /// Compares <see cref="Sign.SignMessage(byte[], ECKeyPair)"/>, which signs with an RFC 6979 nonce and
+    /// takes the recovery ID from R, with the plain signature it used to start from before searching
+    /// for the recovery ID by recovering the public key up to four times.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class SignBenchmarks
+    {
+        private ECKeyPair _keyPair;
+        private byte[] _message;
+        private byte[] _messageHash;
+        private SignatureData _signature;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _keyPair = ECKeyPair.CreateEcKeyPair();
+            _message = Encoding.UTF8.GetBytes("A test message");
+            _messageHash = Hash.SHA256(_message);
+            _signature = Sign.SignMessage(_message, _keyPair);
+        }
+
+        [Benchmark(Baseline = true)]
+        public byte[] Sign_WithoutRecoveryId() => _keyPair.Sign(_messageHash);
+
+        [Benchmark]
+        public SignatureData SignMessage() => Sign.SignMessage(_message, _keyPair);
+
+        [Benchmark]
+        public ECPublicKey RecoverPublicKey() => Sign.SignedMessageToKey(_message, _signature);
+    }
+}
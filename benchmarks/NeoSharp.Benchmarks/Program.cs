@@ -0,0 +1,16 @@
+using BenchmarkDotNet.Running;
+
+namespace NeoSharp.Benchmarks
+{
+    /// <summary>
+    /// Entry point for the NeoSharp benchmarks.
+    /// Run with: dotnet run -c Release -- --filter '*'
+    /// </summary>
+    class Program
+    {
+        static void Main(string[] args)
+        {
+            BenchmarkSwitcher.FromAssembly(typeof(Program).Assembly).Run(args);
+        }
+    }
+}
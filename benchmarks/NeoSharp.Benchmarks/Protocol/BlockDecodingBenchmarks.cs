@@ -0,0 +1,105 @@
+using System;
+using System.Linq;
+using System.Text.Json;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Serialization;
+using NeoSharp.Transaction;
+using NeoSharp.Types;
+
+namespace NeoSharp.Benchmarks.Protocol
+{
+    /// <summary>
+    /// Compares decoding the base64 result of getblock with verbose set to false into a <see cref="Block"/>
+    /// (including computing every hash locally) with parsing the verbose JSON result into a <see cref="NeoBlock"/>.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class BlockDecodingBenchmarks
+    {
+        private static readonly JsonSerializerOptions JsonOptions = new()
+        {
+            PropertyNameCaseInsensitive = true,
+            PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+        };
+
+        private string _base64;
+        private byte[] _json;
+
+        /// <summary>
+        /// Number of transactions in the block.
+        /// </summary>
+        [Params(10, 500)]
+        public int TransactionCount { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var block = new Block
+            {
+                Header = new Header
+                {
+                    Index = 1000,
+                    Timestamp = 1_700_000_000_000,
+                    Witness = new Witness(new byte[66], new byte[40])
+                },
+                Transactions = Enumerable.Range(0, TransactionCount).Select(i => new Transaction.Transaction
+                {
+                    Nonce = (uint)i,
+                    SystemFee = 997775,
+                    NetworkFee = 1230610,
+                    ValidUntilBlock = 2000,
+                    Signers = { new Signer(new Hash160(new byte[20]), WitnessScope.CalledByEntry) },
+                    Script = new byte[256],
+                    Witnesses = { new Witness(new byte[66], new byte[40]) }
+                }).ToList()
+            };
+            _base64 = Convert.ToBase64String(block.ToArray());
+
+            var verbose = new
+            {
+                hash = block.Hash.ToString(),
+                size = block.Size,
+                version = 0,
+                previousblockhash = block.Header.PrevHash.ToString(),
+                merkleroot = block.Header.MerkleRoot.ToString(),
+                time = block.Header.Timestamp,
+                nonce = block.Header.Nonce.ToString("X16"),
+                index = block.Index,
+                primary = 0,
+                nextconsensus = "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj",
+                witnesses = new[] { new { invocation = Convert.ToBase64String(new byte[66]), verification = Convert.ToBase64String(new byte[40]) } },
+                tx = block.Transactions.Select(t => new
+                {
+                    hash = t.Hash.ToString(),
+                    size = t.Size,
+                    version = 0,
+                    nonce = t.Nonce,
+                    sender = "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj",
+                    sysfee = t.SystemFee.ToString(),
+                    netfee = t.NetworkFee.ToString(),
+                    validuntilblock = t.ValidUntilBlock,
+                    signers = new[] { new { account = "0x0000000000000000000000000000000000000000", scopes = "CalledByEntry" } },
+                    attributes = Array.Empty<object>(),
+                    script = Convert.ToBase64String(t.Script),
+                    witnesses = new[] { new { invocation = Convert.ToBase64String(new byte[66]), verification = Convert.ToBase64String(new byte[40]) } }
+                }),
+                confirmations = 1
+            };
+            _json = JsonSerializer.SerializeToUtf8Bytes(verbose);
+        }
+
+        [Benchmark(Baseline = true)]
+        public NeoBlock Verbose_Json() => JsonSerializer.Deserialize<NeoBlock>(_json, JsonOptions);
+
+        [Benchmark]
+        public Hash256 Binary_DecodeAndHash()
+        {
+            var block = Block.FromBase64(_base64);
+            foreach (var transaction in block.Transactions)
+            {
+                _ = transaction.Hash;
+            }
+            return block.Hash;
+        }
+    }
+}
@@ -0,0 +1,74 @@
+using System.Linq;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+using NeoSharp.Protocol;
+using NeoSharp.Serialization;
+using NeoSharp.Transaction;
+using NeoSharp.Types;
+
+namespace NeoSharp.Benchmarks.Protocol
+{
+    /// <summary>
+    /// Measures what <see cref="BlockVerifier"/> adds on top of decoding a binary block, and the cost of
+    /// the merkle root alone once the transaction hashes are known.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class BlockVerificationBenchmarks
+    {
+        private byte[] _block;
+        private Block _previous;
+        private Hash256[] _hashes;
+        private BlockVerifier _verifier;
+
+        /// <summary>
+        /// Number of transactions in the block.
+        /// </summary>
+        [Params(10, 500)]
+        public int TransactionCount { get; set; }
+
+        /// <summary>
+        /// Maximum number of cores used to hash the transactions.
+        /// </summary>
+        [Params(1, -1)]
+        public int MaxDegreeOfParallelism { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _previous = new Block { Header = new Header { Index = 999 } };
+            var block = new Block
+            {
+                Header = new Header { Index = 1000, PrevHash = _previous.Hash },
+                Transactions = Enumerable.Range(0, TransactionCount).Select(i => new Transaction.Transaction
+                {
+                    Nonce = (uint)i,
+                    SystemFee = 997775,
+                    NetworkFee = 1230610,
+                    ValidUntilBlock = 2000,
+                    Signers = { new Signer(new Hash160(new byte[20]), WitnessScope.CalledByEntry) },
+                    Script = new byte[256],
+                    Witnesses = { new Witness(new byte[66], new byte[40]) }
+                }).ToList()
+            };
+            _hashes = block.Transactions.Select(t => t.Hash).ToArray();
+            block.Header.MerkleRoot = MerkleTree.ComputeRoot(_hashes);
+            _block = block.ToArray();
+            _verifier = new BlockVerifier(MaxDegreeOfParallelism);
+        }
+
+        [Benchmark(Baseline = true)]
+        public Block Decode() => NeoSerializableExtensions.FromArray<Block>(_block);
+
+        [Benchmark]
+        public Block DecodeAndVerify()
+        {
+            // Decoded transactions have no cached hashes, so every hash is computed again.
+            var block = NeoSerializableExtensions.FromArray<Block>(_block);
+            _verifier.Verify(block, _previous);
+            return block;
+        }
+
+        [Benchmark]
+        public Hash256 MerkleRoot() => MerkleTree.ComputeRoot(_hashes);
+    }
+}
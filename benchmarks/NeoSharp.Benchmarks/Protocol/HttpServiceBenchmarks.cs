@@ -0,0 +1,156 @@
+using System;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Threading;
+using System.Threading.Tasks;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Protocol.Http;
+
+namespace NeoSharp.Benchmarks.Protocol
+{
+    /// <summary>
+    /// Compares the streaming, pooled-buffer JSON-RPC path of HttpService with the previous
+    /// string-based path (StringContent request, ReadAsStringAsync + Deserialize response)
+    /// for large getblock and getnep17transfers responses.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class HttpServiceBenchmarks
+    {
+        private const string Hash = "0x1f4d1defa46faa5e7b9b8d3f79a06bec777d7c26c4aa5f6f5899a291daa87c15";
+
+        private static readonly JsonSerializerOptions JsonOptions = new()
+        {
+            PropertyNameCaseInsensitive = true,
+            PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+        };
+
+        private HttpClient _blockClient;
+        private HttpClient _transfersClient;
+        private HttpService _blockService;
+        private HttpService _transfersService;
+
+        /// <summary>
+        /// Number of transactions in the block and number of transfers in each direction.
+        /// </summary>
+        [Params(100, 2000)]
+        public int ItemCount { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var block = new
+            {
+                jsonrpc = "2.0",
+                id = "1",
+                result = new
+                {
+                    hash = Hash,
+                    index = 1000,
+                    previousblockhash = Hash,
+                    merkleroot = Hash,
+                    tx = Enumerable.Range(0, ItemCount).Select(i => new
+                    {
+                        hash = Hash,
+                        size = 400,
+                        nonce = i,
+                        sender = "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj",
+                        sysfee = "997775",
+                        netfee = "1230610",
+                        validuntilblock = 2000,
+                        script = Convert.ToBase64String(new byte[256]),
+                        witnesses = new[] { new { invocation = Convert.ToBase64String(new byte[66]), verification = Convert.ToBase64String(new byte[40]) } }
+                    })
+                }
+            };
+
+            var transfers = Enumerable.Range(0, ItemCount).Select(i => new
+            {
+                timestamp = 1_700_000_000_000L + i,
+                assethash = "0xd2a4cff31913016155e38e474a2c06d08be276cf",
+                transferaddress = "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj",
+                amount = "100000000",
+                blockindex = i,
+                transfernotifyindex = 0,
+                txhash = Hash
+            }).ToArray();
+            var nep17 = new
+            {
+                jsonrpc = "2.0",
+                id = "1",
+                result = new { sent = transfers, received = transfers, address = "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj" }
+            };
+
+            _blockClient = new HttpClient(new FixedResponseHandler(JsonSerializer.SerializeToUtf8Bytes(block)));
+            _transfersClient = new HttpClient(new FixedResponseHandler(JsonSerializer.SerializeToUtf8Bytes(nep17)));
+            _blockService = new HttpService("http://localhost:10332", _blockClient);
+            _transfersService = new HttpService("http://localhost:10332", _transfersClient);
+        }
+
+        [GlobalCleanup]
+        public void Cleanup()
+        {
+            _blockService.Dispose();
+            _transfersService.Dispose();
+        }
+
+        [Benchmark(Baseline = true)]
+        public Task<NeoBlock> GetBlock_StringBuffered() =>
+            SendStringBufferedAsync<NeoBlock>(_blockClient, "getblock", new object[] { 1000, true });
+
+        [Benchmark]
+        public Task<NeoBlock> GetBlock_Streaming() =>
+            _blockService.SendAsync<NeoBlock>("getblock", new object[] { 1000, true });
+
+        [Benchmark]
+        public Task<NeoGetNep17Transfers.Nep17Transfers> GetNep17Transfers_StringBuffered() =>
+            SendStringBufferedAsync<NeoGetNep17Transfers.Nep17Transfers>(_transfersClient, "getnep17transfers", new object[] { "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj" });
+
+        [Benchmark]
+        public Task<NeoGetNep17Transfers.Nep17Transfers> GetNep17Transfers_Streaming() =>
+            _transfersService.SendAsync<NeoGetNep17Transfers.Nep17Transfers>("getnep17transfers", new object[] { "NUnP2fsptTkqgXVL4sJ6gQrLF1LdNTnYfj" });
+
+        /// <summary>
+        /// The request/response path HttpService used before streaming deserialization.
+        /// </summary>
+        private static async Task<T> SendStringBufferedAsync<T>(HttpClient client, string method, object[] parameters)
+        {
+            var request = new Envelope<T> { JsonRpc = "2.0", Method = method, Params = parameters, Id = Guid.NewGuid().ToString() };
+            var content = new StringContent(JsonSerializer.Serialize(request, JsonOptions), Encoding.UTF8, "application/json");
+            var response = await client.PostAsync("http://localhost:10332", content);
+            response.EnsureSuccessStatusCode();
+            var json = await response.Content.ReadAsStringAsync();
+            return JsonSerializer.Deserialize<Envelope<T>>(json, JsonOptions).Result;
+        }
+
+        private class Envelope<T>
+        {
+            [JsonPropertyName("jsonrpc")] public string JsonRpc { get; set; }
+            [JsonPropertyName("method")] public string Method { get; set; }
+            [JsonPropertyName("params")] public object[] Params { get; set; }
+            [JsonPropertyName("id")] public string Id { get; set; }
+            [JsonPropertyName("result")] public T Result { get; set; }
+        }
+
+        /// <summary>
+        /// Returns the same pre-serialized response for every request, after draining the request body.
+        /// </summary>
+        private sealed class FixedResponseHandler : HttpMessageHandler
+        {
+            private readonly byte[] _response;
+
+            public FixedResponseHandler(byte[] response) => _response = response;
+
+            protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                await request.Content.CopyToAsync(Stream.Null, cancellationToken);
+                return new HttpResponseMessage(HttpStatusCode.OK) { Content = new ByteArrayContent(_response) };
+            }
+        }
+    }
+}
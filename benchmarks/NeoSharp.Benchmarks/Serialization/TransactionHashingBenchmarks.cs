@@ -0,0 +1,65 @@
+using System;
+using System.IO;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+using NeoSharp.Serialization;
+using NeoSharp.Types;
+
+namespace NeoSharp.Benchmarks.Serialization
+{
+    /// <summary>
+    /// Compares hashing an unsigned transaction through <see cref="HashingStream"/> with serializing it into a
+    /// MemoryStream, copying it out and hashing the copy, and building the signing data on the stack.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class TransactionHashingBenchmarks
+    {
+        private NeoSharp.Transaction.Transaction _transaction;
+
+        /// <summary>
+        /// Size of the transaction script in bytes.
+        /// </summary>
+        [Params(100, 4000)]
+        public int ScriptSize { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _transaction = new NeoSharp.Transaction.Transaction
+            {
+                Nonce = 1,
+                SystemFee = 997775,
+                NetworkFee = 1230610,
+                ValidUntilBlock = 2000,
+                Signers = { new Signer(new Hash160(new byte[20]), WitnessScope.CalledByEntry) },
+                Script = new byte[ScriptSize]
+            };
+        }
+
+        [Benchmark(Baseline = true)]
+        public byte[] Hash_MemoryStream()
+        {
+            using var ms = new MemoryStream();
+            using var writer = new NeoSharp.Serialization.BinaryWriter(ms);
+            _transaction.SerializeUnsigned(writer);
+            return Hash.SHA256(ms.ToArray());
+        }
+
+        [Benchmark]
+        public int Hash_HashingStream()
+        {
+            using var sink = new HashingStream();
+            using var writer = new NeoSharp.Serialization.BinaryWriter(sink);
+            _transaction.SerializeUnsigned(writer);
+            Span<byte> hash = stackalloc byte[32];
+            return sink.GetSha256(hash);
+        }
+
+        [Benchmark]
+        public int GetHashData_Span()
+        {
+            Span<byte> data = stackalloc byte[36];
+            return _transaction.GetHashData(860833102, data);
+        }
+    }
+}
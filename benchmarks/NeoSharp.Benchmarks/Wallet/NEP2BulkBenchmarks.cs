@@ -0,0 +1,37 @@
+using System.Collections.Generic;
+using System.Linq;
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+using NeoSharp.Wallet;
+using ScryptParams = NeoSharp.Wallet.NEP6.ScryptParams;
+
+namespace NeoSharp.Benchmarks.Wallet
+{
+    /// <summary>
+    /// Compares decrypting a batch of NEP-2 keys one after the other with <see cref="NEP2.DecryptMany"/>,
+    /// which spreads the keys over all cores within the default 1 GiB scrypt memory budget.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class NEP2BulkBenchmarks
+    {
+        private const string Password = "TestingOneTwoThree";
+
+        private List<string> _nep2Keys;
+
+        [Params(8, 32)]
+        public int Count { get; set; }
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            var keyPairs = Enumerable.Range(0, Count).Select(_ => ECKeyPair.CreateEcKeyPair()).ToList();
+            _nep2Keys = NEP2.EncryptMany(keyPairs, Password).Results.ToList();
+        }
+
+        [Benchmark(Baseline = true)]
+        public ECKeyPair[] Decrypt_Loop() => _nep2Keys.Select(k => NEP2.Decrypt(k, Password, ScryptParams.Default)).ToArray();
+
+        [Benchmark]
+        public NEP2BulkResult<ECKeyPair> DecryptMany() => NEP2.DecryptMany(_nep2Keys, Password);
+    }
+}
@@ -0,0 +1,35 @@
+using BenchmarkDotNet.Attributes;
+using NeoSharp.Crypto;
+using NeoSharp.Wallet;
+using ScryptParams = NeoSharp.Wallet.NEP6.ScryptParams;
+
+namespace NeoSharp.Benchmarks.Wallet
+{
+    /// <summary>
+    /// Measures unlocking a NEP-2 key again with the default scrypt parameters, with and without a warm
+    /// <see cref="NEP2DerivedKeyCache"/>.
+    /// </summary>
+    [MemoryDiagnoser]
+    public class NEP2DerivedKeyCacheBenchmarks
+    {
+        private const string Password = "TestingOneTwoThree";
+
+        private readonly NEP2DerivedKeyCache _cache = new();
+        private string _nep2Key;
+
+        [GlobalSetup]
+        public void Setup()
+        {
+            _nep2Key = NEP2.Encrypt(ECKeyPair.CreateEcKeyPair(), Password, ScryptParams.Default, _cache);
+        }
+
+        [GlobalCleanup]
+        public void Cleanup() => _cache.Dispose();
+
+        [Benchmark(Baseline = true)]
+        public byte[] DecryptToBytes() => NEP2.DecryptToBytes(_nep2Key, Password, ScryptParams.Default);
+
+        [Benchmark]
+        public byte[] DecryptToBytes_Cached() => NEP2.DecryptToBytes(_nep2Key, Password, ScryptParams.Default, _cache);
+    }
+}
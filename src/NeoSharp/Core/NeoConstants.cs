@@ -1,5 +1,4 @@
 using Org.BouncyCastle.Asn1.X9;
-using Org.BouncyCastle.Crypto.EC;
 using Org.BouncyCastle.Crypto.Parameters;
 
 namespace NeoSharp.Core
@@ -10,21 +9,20 @@ namespace NeoSharp.Core
     public static class NeoConstants
     {
         /// <summary>
-        /// The secp256r1 curve parameters.
+        /// The secp256r1 curve parameters (see <see cref="Crypto.Secp256r1Curve"/>).
         /// </summary>
-        public static readonly X9ECParameters Secp256r1 = ECNamedCurveTable.GetByName("secp256r1");
+        public static readonly X9ECParameters Secp256r1 = Crypto.Secp256r1Curve.Parameters;
 
         /// <summary>
-        /// The secp256r1 domain parameters.
+        /// The secp256r1 domain parameters (see <see cref="Crypto.Secp256r1Curve"/>).
         /// </summary>
-        public static readonly ECDomainParameters Secp256r1Domain = new ECDomainParameters(
-            Secp256r1.Curve, Secp256r1.G, Secp256r1.N, Secp256r1.H);
+        public static readonly ECDomainParameters Secp256r1Domain = Crypto.Secp256r1Curve.Domain;
 
         /// <summary>
         /// Half of the secp256r1 curve order (used for signature verification)
         /// </summary>
         public static readonly Org.BouncyCastle.Math.BigInteger Secp256r1HalfCurveOrder = 
-            Secp256r1.N.ShiftRight(1);
+            Crypto.Secp256r1Curve.HalfN;
 
         /// <summary>
         /// Size of a compressed public key in bytes.
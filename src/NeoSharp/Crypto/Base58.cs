@@ -1,6 +1,7 @@
 using System;
+using System.Buffers;
+using System.Buffers.Binary;
 using System.Numerics;
-using System.Text;
 
 namespace NeoSharp.Crypto
 {
@@ -9,6 +10,12 @@ namespace NeoSharp.Crypto
     /// Base58 is a binary-to-text encoding scheme used in cryptocurrencies
     /// to create human-readable addresses and keys.
     /// </summary>
+    /// <remarks>
+    /// The conversion between base 256 and base 58 works on an array of limbs instead of a big integer:
+    /// encoding folds four input bytes at a time into limbs of five base-58 digits (58^5 &lt; 2^32), and
+    /// decoding folds five digits at a time into 32-bit limbs. The limbs live on the stack for inputs
+    /// of the size of addresses, keys and NEP-2 strings, so the span methods do not allocate.
+    /// </remarks>
     public static class Base58
     {
         /// <summary>
@@ -16,6 +23,21 @@ namespace NeoSharp.Crypto
         /// </summary>
         private const int ChecksumLength = 4;
 
+        /// <summary>
+        /// 58^5, the base of the limbs used while encoding.
+        /// </summary>
+        private const uint Base58Pow5 = 58 * 58 * 58 * 58 * 58;
+
+        /// <summary>
+        /// Number of limbs, bytes or chars above which the working buffers are rented instead of stack allocated.
+        /// </summary>
+        private const int StackLimit = 128;
+
+        /// <summary>
+        /// Largest input for which <see cref="GetMaxEncodedLength"/> does not overflow.
+        /// </summary>
+        private const int MaxEncodableLength = int.MaxValue / 138 * 100;
+
         /// <summary>
         /// Base58 alphabet excluding 0, O, I, and l to avoid visual ambiguity.
         /// </summary>
@@ -27,9 +49,9 @@ namespace NeoSharp.Crypto
         private static readonly int[] AlphabetMap;
 
         /// <summary>
-        /// Base of the Base58 encoding (58).
+        /// Powers of 58 by the number of digits folded into a decoding limb at once.
         /// </summary>
-        private static readonly BigInteger Base = new(58);
+        private static readonly ulong[] Powers58 = { 1, 58, 58 * 58, 58 * 58 * 58, 58 * 58 * 58 * 58, Base58Pow5 };
 
         /// <summary>
         /// Static constructor to initialize the alphabet mapping.
@@ -45,6 +67,36 @@ namespace NeoSharp.Crypto
             }
         }
 
+        /// <summary>
+        /// Gets the maximum number of characters needed to encode the given number of bytes.
+        /// </summary>
+        /// <param name="byteCount">The number of bytes to encode</param>
+        /// <returns>The maximum length of the Base58 string</returns>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown when byteCount is negative or too large</exception>
+        public static int GetMaxEncodedLength(int byteCount)
+        {
+            if ((uint)byteCount > MaxEncodableLength)
+                throw new ArgumentOutOfRangeException(nameof(byteCount));
+
+            // log(256) / log(58) is just below 1.37
+            return byteCount * 138 / 100 + 1;
+        }
+
+        /// <summary>
+        /// Gets the maximum number of bytes the given number of Base58 characters decode to.
+        /// </summary>
+        /// <param name="charCount">The length of the Base58 string</param>
+        /// <returns>The maximum number of decoded bytes</returns>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown when charCount is negative</exception>
+        public static int GetMaxDecodedLength(int charCount)
+        {
+            if (charCount < 0)
+                throw new ArgumentOutOfRangeException(nameof(charCount));
+
+            // Every leading '1' is a zero byte, every other digit less than a byte
+            return charCount;
+        }
+
         /// <summary>
         /// Encode bytes to Base58 string.
         /// </summary>
@@ -56,89 +108,142 @@ namespace NeoSharp.Crypto
             if (data == null)
                 throw new ArgumentNullException(nameof(data));
 
-            if (data.Length == 0)
-                return string.Empty;
+            return Encode(data.AsSpan());
+        }
 
-            // Convert to BigInteger (treating as big-endian)
-            var value = new BigInteger(data.AsSpan(), isUnsigned: true, isBigEndian: true);
+        /// <summary>
+        /// Encode bytes to Base58 string.
+        /// </summary>
+        /// <param name="data">The bytes to encode</param>
+        /// <returns>Base58 encoded string</returns>
+        public static string Encode(ReadOnlySpan<byte> data)
+        {
+            if (data.IsEmpty)
+                return string.Empty;
 
-            // Encode using Base58
-            var result = new StringBuilder();
-            while (value > 0)
+            var maxLength = GetMaxEncodedLength(data.Length);
+            char[]? rented = null;
+            Span<char> chars = maxLength <= StackLimit
+                ? stackalloc char[StackLimit]
+                : (rented = ArrayPool<char>.Shared.Rent(maxLength));
+            try
             {
-                value = BigInteger.DivRem(value, Base, out var remainder);
-                result.Insert(0, Alphabet[(int)remainder]);
+                TryEncode(data, chars, out var charsWritten);
+                return new string(chars.Slice(0, charsWritten));
             }
-
-            // Add leading zeros as '1' characters
-            foreach (var b in data)
+            finally
             {
-                if (b == 0)
-                    result.Insert(0, '1');
-                else
-                    break;
+                if (rented != null)
+                    ArrayPool<char>.Shared.Return(rented);
             }
-
-            return result.ToString();
         }
 
         /// <summary>
-        /// Decode Base58 string to bytes.
+        /// Encode bytes to Base58 characters without allocating.
         /// </summary>
-        /// <param name="encoded">The Base58 encoded string</param>
-        /// <returns>Decoded bytes, or null if decoding failed</returns>
-        public static byte[]? Decode(string encoded)
+        /// <param name="data">The bytes to encode</param>
+        /// <param name="destination">The buffer that receives the characters</param>
+        /// <param name="charsWritten">The number of characters written</param>
+        /// <returns>False if destination is too short; otherwise true</returns>
+        public static bool TryEncode(ReadOnlySpan<byte> data, Span<char> destination, out int charsWritten)
         {
-            if (string.IsNullOrEmpty(encoded))
-                return Array.Empty<byte>();
+            var zeros = 0;
+            while (zeros < data.Length && data[zeros] == 0)
+            {
+                zeros++;
+            }
 
+            var digits = data.Slice(zeros);
+            var maxLimbs = (GetMaxEncodedLength(digits.Length) + 4) / 5;
+            uint[]? rented = null;
+            Span<uint> limbs = maxLimbs <= StackLimit
+                ? stackalloc uint[StackLimit]
+                : (rented = ArrayPool<uint>.Shared.Rent(maxLimbs));
             try
             {
-                // Count leading '1's
-                var leadingOnes = 0;
-                foreach (var c in encoded)
+                var used = ToBase58Limbs(digits, limbs);
+
+                var length = zeros;
+                if (used > 0)
                 {
-                    if (c == '1')
-                        leadingOnes++;
-                    else
-                        break;
+                    length += (used - 1) * 5;
+                    for (var top = limbs[used - 1]; top != 0; top /= 58)
+                    {
+                        length++;
+                    }
                 }
 
-                // Convert from Base58 to BigInteger
-                var value = BigInteger.Zero;
-                var multiplier = BigInteger.One;
-
-                for (int i = encoded.Length - 1; i >= leadingOnes; i--)
+                if (destination.Length < length)
                 {
-                    var c = encoded[i];
-                    
-                    // Validate character and get its value
-                    if (c >= 128 || AlphabetMap[c] == -1)
-                        return null; // Invalid character
-
-                    value += multiplier * AlphabetMap[c];
-                    multiplier *= Base;
+                    charsWritten = 0;
+                    return false;
                 }
 
-                // Convert BigInteger back to bytes
-                var bytes = value == 0 ? Array.Empty<byte>() : value.ToByteArray(isUnsigned: true, isBigEndian: true);
-                
-                // Add leading zeros for leading '1's
-                if (leadingOnes > 0)
+                destination.Slice(0, zeros).Fill('1');
+
+                // Limbs are little-endian; all but the most significant one hold exactly five digits
+                var position = length;
+                for (var i = 0; i < used; i++)
                 {
-                    var result = new byte[leadingOnes + bytes.Length];
-                    bytes.CopyTo(result, leadingOnes);
-                    return result;
+                    var limb = limbs[i];
+                    var count = i == used - 1 ? position - zeros : 5;
+                    for (var k = 0; k < count; k++)
+                    {
+                        destination[--position] = Alphabet[(int)(limb % 58)];
+                        limb /= 58;
+                    }
                 }
 
-                return bytes;
+                charsWritten = length;
+                return true;
             }
-            catch
+            finally
             {
-                return null; // Decoding failed
+                if (rented != null)
+                    ArrayPool<uint>.Shared.Return(rented, clearArray: true);
             }
         }
 
+        /// <summary>
+        /// Decode Base58 string to bytes.
+        /// </summary>
+        /// <param name="encoded">The Base58 encoded string</param>
+        /// <returns>Decoded bytes, or null if decoding failed</returns>
+        public static byte[]? Decode(string encoded)
+        {
+            if (string.IsNullOrEmpty(encoded))
+                return Array.Empty<byte>();
+
+            var maxLength = GetMaxDecodedLength(encoded.Length);
+            byte[]? rented = null;
+            Span<byte> bytes = maxLength <= StackLimit
+                ? stackalloc byte[StackLimit]
+                : (rented = ArrayPool<byte>.Shared.Rent(maxLength));
+            try
+            {
+                return DecodeCore(encoded, bytes, out var bytesWritten) == OperationStatus.Done
+                    ? bytes.Slice(0, bytesWritten).ToArray()
+                    : null;
+            }
+            finally
+            {
+                if (rented != null)
+                    ArrayPool<byte>.Shared.Return(rented, clearArray: true);
+            }
+        }
+
+        /// <summary>
+        /// Decode Base58 characters to bytes without allocating.
+        /// </summary>
+        /// <param name="encoded">The Base58 encoded characters</param>
+        /// <param name="destination">The buffer that receives the bytes</param>
+        /// <param name="bytesWritten">The number of bytes written</param>
+        /// <returns>False if the input is not valid Base58 or destination is too short; otherwise true</returns>
+        public static bool TryDecode(ReadOnlySpan<char> encoded, Span<byte> destination, out int bytesWritten)
+        {
+            return DecodeCore(encoded, destination, out bytesWritten) == OperationStatus.Done;
+        }
+
         /// <summary>
         /// Encode bytes to Base58Check string with checksum validation.
         /// </summary>
@@ -150,15 +255,59 @@ namespace NeoSharp.Crypto
             if (data == null)
                 throw new ArgumentNullException(nameof(data));
 
-            // Calculate checksum
-            var checksum = CalculateChecksum(data);
+            return EncodeCheck(data.AsSpan());
+        }
 
-            // Combine data and checksum
-            var dataWithChecksum = new byte[data.Length + ChecksumLength];
-            data.CopyTo(dataWithChecksum, 0);
-            checksum.CopyTo(dataWithChecksum, data.Length);
+        /// <summary>
+        /// Encode bytes to Base58Check string with checksum validation.
+        /// </summary>
+        /// <param name="data">The bytes to encode</param>
+        /// <returns>Base58Check encoded string</returns>
+        public static string EncodeCheck(ReadOnlySpan<byte> data)
+        {
+            var length = data.Length + ChecksumLength;
+            byte[]? rented = null;
+            Span<byte> dataWithChecksum = length <= StackLimit
+                ? stackalloc byte[StackLimit]
+                : (rented = ArrayPool<byte>.Shared.Rent(length));
+            try
+            {
+                AppendChecksum(data, dataWithChecksum);
+                return Encode(dataWithChecksum.Slice(0, length));
+            }
+            finally
+            {
+                dataWithChecksum.Slice(0, length).Clear();
+                if (rented != null)
+                    ArrayPool<byte>.Shared.Return(rented);
+            }
+        }
 
-            return Encode(dataWithChecksum);
+        /// <summary>
+        /// Encode bytes to Base58Check characters without allocating.
+        /// </summary>
+        /// <param name="data">The bytes to encode</param>
+        /// <param name="destination">The buffer that receives the characters</param>
+        /// <param name="charsWritten">The number of characters written</param>
+        /// <returns>False if destination is too short; otherwise true</returns>
+        public static bool TryEncodeCheck(ReadOnlySpan<byte> data, Span<char> destination, out int charsWritten)
+        {
+            var length = data.Length + ChecksumLength;
+            byte[]? rented = null;
+            Span<byte> dataWithChecksum = length <= StackLimit
+                ? stackalloc byte[StackLimit]
+                : (rented = ArrayPool<byte>.Shared.Rent(length));
+            try
+            {
+                AppendChecksum(data, dataWithChecksum);
+                return TryEncode(dataWithChecksum.Slice(0, length), destination, out charsWritten);
+            }
+            finally
+            {
+                dataWithChecksum.Slice(0, length).Clear();
+                if (rented != null)
+                    ArrayPool<byte>.Shared.Return(rented);
+            }
         }
 
         /// <summary>
@@ -168,38 +317,211 @@ namespace NeoSharp.Crypto
         /// <returns>Decoded bytes without checksum, or null if decoding or validation failed</returns>
         public static byte[]? DecodeCheck(string encoded)
         {
-            var decoded = Decode(encoded);
-            if (decoded == null || decoded.Length < ChecksumLength)
+            if (encoded == null)
                 return null;
 
-            // Split data and checksum
-            var dataLength = decoded.Length - ChecksumLength;
-            var data = new byte[dataLength];
-            var checksum = new byte[ChecksumLength];
+            var maxLength = GetMaxDecodedLength(encoded.Length);
+            byte[]? rented = null;
+            Span<byte> data = maxLength <= StackLimit
+                ? stackalloc byte[StackLimit]
+                : (rented = ArrayPool<byte>.Shared.Rent(maxLength));
+            try
+            {
+                return TryDecodeCheck(encoded, data, out var bytesWritten) ? data.Slice(0, bytesWritten).ToArray() : null;
+            }
+            finally
+            {
+                if (rented != null)
+                    ArrayPool<byte>.Shared.Return(rented, clearArray: true);
+            }
+        }
 
-            Array.Copy(decoded, 0, data, 0, dataLength);
-            Array.Copy(decoded, dataLength, checksum, 0, ChecksumLength);
+        /// <summary>
+        /// Decode Base58Check characters and validate checksum without allocating.
+        /// </summary>
+        /// <param name="encoded">The Base58Check encoded characters</param>
+        /// <param name="destination">The buffer that receives the bytes without checksum</param>
+        /// <param name="bytesWritten">The number of bytes written</param>
+        /// <returns>False if the input is not valid Base58Check or destination is too short; otherwise true</returns>
+        public static bool TryDecodeCheck(ReadOnlySpan<char> encoded, Span<byte> destination, out int bytesWritten)
+        {
+            bytesWritten = 0;
+
+            var maxLength = GetMaxDecodedLength(encoded.Length);
+            byte[]? rented = null;
+            Span<byte> decoded = maxLength <= StackLimit
+                ? stackalloc byte[StackLimit]
+                : (rented = ArrayPool<byte>.Shared.Rent(maxLength));
+            var length = 0;
+            try
+            {
+                if (DecodeCore(encoded, decoded, out length) != OperationStatus.Done || length < ChecksumLength)
+                    return false;
 
-            // Validate checksum
-            var calculatedChecksum = CalculateChecksum(data);
-            if (!checksum.AsSpan().SequenceEqual(calculatedChecksum.AsSpan()))
-                return null;
+                var data = decoded.Slice(0, length - ChecksumLength);
+                Span<byte> hash = stackalloc byte[Hash.SHA256Size];
+                Hash.Hash256(data, hash);
+                if (!hash.Slice(0, ChecksumLength).SequenceEqual(decoded.Slice(data.Length, ChecksumLength)) ||
+                    !data.TryCopyTo(destination))
+                    return false;
+
+                bytesWritten = data.Length;
+                return true;
+            }
+            finally
+            {
+                decoded.Slice(0, length).Clear();
+                if (rented != null)
+                    ArrayPool<byte>.Shared.Return(rented);
+            }
+        }
+
+        /// <summary>
+        /// Copies the data followed by its checksum, the first 4 bytes of its double SHA-256, to the destination.
+        /// </summary>
+        private static void AppendChecksum(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            data.CopyTo(destination);
+
+            Span<byte> hash = stackalloc byte[Hash.SHA256Size];
+            Hash.Hash256(data, hash);
+            hash.Slice(0, ChecksumLength).CopyTo(destination.Slice(data.Length));
+        }
+
+        /// <summary>
+        /// Converts big-endian bytes to little-endian limbs of five base-58 digits, folding in up to four bytes
+        /// per pass over the limbs.
+        /// </summary>
+        /// <returns>The number of limbs used</returns>
+        private static int ToBase58Limbs(ReadOnlySpan<byte> data, Span<uint> limbs)
+        {
+            var used = 0;
+            var chunk = data.Length % 4 == 0 ? 4 : data.Length % 4;
+            for (var i = 0; i < data.Length; i += chunk, chunk = 4)
+            {
+                ulong carry = 0;
+                for (var k = 0; k < chunk; k++)
+                {
+                    carry = (carry << 8) | data[i + k];
+                }
+
+                // limb < 58^5 < 2^30 and carry < 2^32, so the product fits in 64 bits
+                var shift = chunk * 8;
+                for (var j = 0; j < used; j++)
+                {
+                    var value = ((ulong)limbs[j] << shift) + carry;
+                    carry = value / Base58Pow5;
+                    limbs[j] = (uint)(value - carry * Base58Pow5);
+                }
+
+                while (carry != 0)
+                {
+                    limbs[used++] = (uint)(carry % Base58Pow5);
+                    carry /= Base58Pow5;
+                }
+            }
 
-            return data;
+            return used;
         }
 
         /// <summary>
-        /// Calculate checksum for Base58Check encoding.
-        /// Uses double SHA-256 and takes the first 4 bytes.
+        /// Decodes Base58 characters, folding in up to five digits per pass over little-endian 32-bit limbs.
         /// </summary>
-        /// <param name="data">The data to calculate checksum for</param>
-        /// <returns>4-byte checksum</returns>
-        private static byte[] CalculateChecksum(byte[] data)
+        private static OperationStatus DecodeCore(ReadOnlySpan<char> encoded, Span<byte> destination, out int bytesWritten)
         {
-            var hash = data.Hash256();
-            var checksum = new byte[ChecksumLength];
-            Array.Copy(hash, 0, checksum, 0, ChecksumLength);
-            return checksum;
+            bytesWritten = 0;
+
+            var zeros = 0;
+            while (zeros < encoded.Length && encoded[zeros] == '1')
+            {
+                zeros++;
+            }
+
+            var digits = encoded.Slice(zeros);
+            var maxLimbs = GetMaxDecodedLength(digits.Length) / 4 + 1;
+            uint[]? rented = null;
+            Span<uint> limbs = maxLimbs <= StackLimit
+                ? stackalloc uint[StackLimit]
+                : (rented = ArrayPool<uint>.Shared.Rent(maxLimbs));
+            try
+            {
+                var used = 0;
+                var chunk = digits.Length % 5 == 0 ? 5 : digits.Length % 5;
+                for (var i = 0; i < digits.Length; i += chunk, chunk = 5)
+                {
+                    ulong carry = 0;
+                    for (var k = 0; k < chunk; k++)
+                    {
+                        var c = digits[i + k];
+                        var digit = c < 128 ? AlphabetMap[c] : -1;
+                        if (digit < 0)
+                            return OperationStatus.InvalidData;
+
+                        carry = carry * 58 + (uint)digit;
+                    }
+
+                    // multiplier <= 58^5 < 2^30, so limb * multiplier + carry fits in 64 bits
+                    var multiplier = Powers58[chunk];
+                    for (var j = 0; j < used; j++)
+                    {
+                        var value = limbs[j] * multiplier + carry;
+                        limbs[j] = (uint)value;
+                        carry = value >> 32;
+                    }
+
+                    if (carry != 0)
+                        limbs[used++] = (uint)carry;
+                }
+
+                var length = zeros;
+                if (used > 0)
+                    length += (used - 1) * 4 + (32 - BitOperations.LeadingZeroCount(limbs[used - 1]) + 7) / 8;
+
+                if (destination.Length < length)
+                    return OperationStatus.DestinationTooSmall;
+
+                destination.Slice(0, zeros).Clear();
+
+                var position = length;
+                for (var j = 0; j < used - 1; j++)
+                {
+                    position -= 4;
+                    BinaryPrimitives.WriteUInt32BigEndian(destination.Slice(position), limbs[j]);
+                }
+
+                if (used > 0)
+                {
+                    for (var top = limbs[used - 1]; top != 0; top >>= 8)
+                    {
+                        destination[--position] = (byte)top;
+                    }
+                }
+
+                bytesWritten = length;
+                return OperationStatus.Done;
+            }
+            finally
+            {
+                if (rented != null)
+                    ArrayPool<uint>.Shared.Return(rented, clearArray: true);
+            }
+        }
+
+        /// <summary>
+        /// Gets the index of the first character outside the Base58 alphabet.
+        /// </summary>
+        /// <param name="input">The characters to check</param>
+        /// <returns>The index of the first invalid character, or -1 if all are valid</returns>
+        internal static int IndexOfInvalidCharacter(ReadOnlySpan<char> input)
+        {
+            for (var i = 0; i < input.Length; i++)
+            {
+                var c = input[i];
+                if (c >= 128 || AlphabetMap[c] == -1)
+                    return i;
+            }
+
+            return -1;
         }
 
         /// <summary>
@@ -212,13 +534,7 @@ namespace NeoSharp.Crypto
             if (string.IsNullOrEmpty(input))
                 return true; // Empty string is valid
 
-            foreach (var c in input)
-            {
-                if (c >= 128 || AlphabetMap[c] == -1)
-                    return false;
-            }
-
-            return true;
+            return IndexOfInvalidCharacter(input) < 0;
         }
 
         /// <summary>
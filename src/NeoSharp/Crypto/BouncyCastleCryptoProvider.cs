@@ -0,0 +1,84 @@
+using System;
+using Org.BouncyCastle.Crypto.Parameters;
+using Org.BouncyCastle.Crypto.Signers;
+using BCBigInteger = Org.BouncyCastle.Math.BigInteger;
+
+namespace NeoSharp.Crypto
+{
+    /// <summary>
+    /// The managed provider, built on BouncyCastle and the shared <see cref="Secp256r1Curve"/> context.
+    /// It runs everywhere and is the fallback when the platform has no native secp256r1 support.
+    /// </summary>
+    public sealed class BouncyCastleCryptoProvider : ICryptoProvider
+    {
+        /// <summary>
+        /// The provider instance.
+        /// </summary>
+        public static readonly BouncyCastleCryptoProvider Instance = new BouncyCastleCryptoProvider();
+
+        // ECDsaSigner keeps no state between calls beyond its key, so each thread reuses one.
+        [ThreadStatic]
+        private static ECDsaSigner _verifier;
+
+        private BouncyCastleCryptoProvider()
+        {
+        }
+
+        /// <inheritdoc />
+        public string Name => "BouncyCastle";
+
+        /// <inheritdoc />
+        public byte[] DerivePublicKey(ReadOnlySpan<byte> privateKey)
+        {
+            return Secp256r1Curve.MultiplyG(ToScalar(privateKey)).GetEncoded(true);
+        }
+
+        /// <inheritdoc />
+        public byte[] SignHash(ReadOnlySpan<byte> privateKey, ReadOnlySpan<byte> messageHash)
+        {
+            var signer = new ECDsaSigner();
+            signer.Init(true, new ECPrivateKeyParameters(ToScalar(privateKey), Secp256r1Curve.Domain));
+            var signature = signer.GenerateSignature(messageHash.ToArray());
+
+            var result = new byte[64];
+            Org.BouncyCastle.Utilities.BigIntegers.AsUnsignedByteArray(signature[0], result, 0, 32);
+            Org.BouncyCastle.Utilities.BigIntegers.AsUnsignedByteArray(signature[1], result, 32, 32);
+            return result;
+        }
+
+        /// <inheritdoc />
+        public bool VerifyHash(ECPublicKey publicKey, ReadOnlySpan<byte> messageHash, ReadOnlySpan<byte> signature)
+        {
+            if (publicKey == null) throw new ArgumentNullException(nameof(publicKey));
+            if (signature.Length != 64) return false;
+
+            ECPublicKeyParameters parameters;
+            try
+            {
+                parameters = publicKey.PublicKeyParameters;
+            }
+            catch (ArgumentException)
+            {
+                // The key does not decode to a point on the curve.
+                return false;
+            }
+
+            var verifier = _verifier ??= new ECDsaSigner();
+            verifier.Init(false, parameters);
+            var r = new BCBigInteger(1, signature.Slice(0, 32));
+            var s = new BCBigInteger(1, signature.Slice(32, 32));
+            return verifier.VerifySignature(messageHash.ToArray(), r, s);
+        }
+
+        private static BCBigInteger ToScalar(ReadOnlySpan<byte> privateKey)
+        {
+            if (privateKey.Length != 32)
+                throw new ArgumentException("Private key must be 32 bytes", nameof(privateKey));
+
+            var d = new BCBigInteger(1, privateKey);
+            if (d.SignValue == 0 || d.CompareTo(Secp256r1Curve.N) >= 0)
+                throw new ArgumentException("Private key must be between 1 and n - 1", nameof(privateKey));
+            return d;
+        }
+    }
+}
@@ -0,0 +1,38 @@
+using System;
+
+namespace NeoSharp.Crypto
+{
+    /// <summary>
+    /// Selects the <see cref="ICryptoProvider"/> used for key derivation, signing and verification.
+    /// By default, <see cref="NativeCryptoProvider"/> is used whenever the platform supports it, so the
+    /// platform's ECDSA replaces BouncyCastle without any opt-in; set <see cref="Current"/> to
+    /// <see cref="BouncyCastleCryptoProvider.Instance"/> at startup to keep the managed provider.
+    /// Deterministic signing (<see cref="Sign.SignHash"/>) always uses the managed arithmetic, because the
+    /// platform APIs do not take a caller-chosen nonce.
+    /// </summary>
+    public static class CryptoProvider
+    {
+        private static ICryptoProvider _current;
+
+        /// <summary>
+        /// Gets or sets the provider in use. Set it once at startup, before keys are used.
+        /// </summary>
+        /// <exception cref="ArgumentNullException">Thrown if the value is null.</exception>
+        public static ICryptoProvider Current
+        {
+            get => _current ??= Detect();
+            set => _current = value ?? throw new ArgumentNullException(nameof(value));
+        }
+
+        /// <summary>
+        /// Picks the fastest provider the platform supports. This is the default for <see cref="Current"/>.
+        /// </summary>
+        /// <returns>The native provider if it is supported; otherwise the BouncyCastle provider.</returns>
+        public static ICryptoProvider Detect()
+        {
+            return NativeCryptoProvider.IsSupported
+                ? NativeCryptoProvider.Instance
+                : BouncyCastleCryptoProvider.Instance;
+        }
+    }
+}
@@ -70,7 +70,7 @@ namespace NeoSharp.Crypto
         /// <returns>The script hash</returns>
         public Hash160 GetScriptHash()
         {
-            return Hash160.FromPublicKey(PublicKey.GetEncoded(true));
+            return PublicKey.GetScriptHash();
         }
 
         /// <summary>
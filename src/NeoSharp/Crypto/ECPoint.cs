@@ -10,12 +10,28 @@ namespace NeoSharp.Crypto
     public class ECPoint : IEquatable<ECPoint>
     {
         private readonly byte[] _encodedBytes;
+        private Org.BouncyCastle.Math.EC.ECPoint _curvePoint;
+        private ECPublicKey _publicKey;
 
         /// <summary>
         /// Gets the encoded bytes of this point (33 bytes compressed format)
         /// </summary>
         public byte[] EncodedBytes => (byte[])_encodedBytes.Clone();
 
+        /// <summary>
+        /// Gets the encoded bytes of this point without copying them
+        /// </summary>
+        public ReadOnlySpan<byte> EncodedSpan => _encodedBytes;
+
+        /// <summary>
+        /// Gets the decoded, normalized point on the secp256r1 curve. Decompression costs a modular square
+        /// root, so it happens on first access only. The multiples BouncyCastle precomputes for the point
+        /// during the first verification are cached on it too, so verifying repeatedly against the same
+        /// instance is considerably cheaper than against a fresh one.
+        /// </summary>
+        /// <exception cref="ArgumentException">Thrown if the encoded bytes are not a point on the curve</exception>
+        public Org.BouncyCastle.Math.EC.ECPoint CurvePoint => _curvePoint ??= Secp256r1Curve.DecodePoint(_encodedBytes);
+
         /// <summary>
         /// Gets whether this point is the point at infinity (zero point)
         /// </summary>
@@ -115,24 +131,10 @@ namespace NeoSharp.Crypto
             
             try
             {
-                // Use BouncyCastle for proper ECDSA signature verification
-                var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-                var domainParams = new Org.BouncyCastle.Crypto.Parameters.ECDomainParameters(
-                    curve.Curve, curve.G, curve.N, curve.H);
-                
-                // Parse the public key point
-                var publicKeyPoint = curve.Curve.DecodePoint(_encodedBytes);
-                var publicKeyParams = new Org.BouncyCastle.Crypto.Parameters.ECPublicKeyParameters(publicKeyPoint, domainParams);
-                
-                // Parse r and s from signature
-                var r = new Org.BouncyCastle.Math.BigInteger(1, signature.Take(32).ToArray());
-                var s = new Org.BouncyCastle.Math.BigInteger(1, signature.Skip(32).Take(32).ToArray());
-                
-                var signer = new Org.BouncyCastle.Crypto.Signers.ECDsaSigner();
-                signer.Init(false, publicKeyParams);
-                
+                // The key caches the decoded point, and the provider any state it derives from it
+                var publicKey = _publicKey ??= new ECPublicKey(_encodedBytes);
                 var hash = Hash.SHA256(message);
-                return signer.VerifySignature(hash, r, s);
+                return CryptoProvider.Current.VerifyHash(publicKey, hash, signature);
             }
             catch
             {
@@ -180,8 +182,7 @@ namespace NeoSharp.Crypto
             
             try
             {
-                var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-                var ecPoint = curve.Curve.DecodePoint(point.EncodedBytes);
+                var ecPoint = point.CurvePoint;
                 
                 var scalarBytes = scalar.ToByteArray(isUnsigned: true, isBigEndian: false);
                 if (scalarBytes.Length > 32)
@@ -216,9 +217,8 @@ namespace NeoSharp.Crypto
             
             try
             {
-                var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-                var ecPoint1 = curve.Curve.DecodePoint(point1.EncodedBytes);
-                var ecPoint2 = curve.Curve.DecodePoint(point2.EncodedBytes);
+                var ecPoint1 = point1.CurvePoint;
+                var ecPoint2 = point2.CurvePoint;
                 
                 var resultPoint = ecPoint1.Add(ecPoint2).Normalize();
                 
@@ -100,29 +100,9 @@ namespace NeoSharp.Crypto
             ThrowIfDisposed();
             if (data == null) throw new ArgumentNullException(nameof(data));
             
-            // Use BouncyCastle for proper secp256r1 ECDSA signing
-            var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-            var domainParams = new Org.BouncyCastle.Crypto.Parameters.ECDomainParameters(
-                curve.Curve, curve.G, curve.N, curve.H);
-            
-            var privateKeyInt = new Org.BouncyCastle.Math.BigInteger(1, _privateKeyBytes);
-            var keyParams = new Org.BouncyCastle.Crypto.Parameters.ECPrivateKeyParameters(privateKeyInt, domainParams);
-            
-            var signer = new Org.BouncyCastle.Crypto.Signers.ECDsaSigner();
-            signer.Init(true, keyParams);
-            
             // Don't hash the data - assume it's already hashed
-            var signature = signer.GenerateSignature(data);
-            
-            // Convert to 64-byte format (32 bytes r + 32 bytes s)
-            var r = signature[0].ToByteArrayUnsigned();
-            var s = signature[1].ToByteArrayUnsigned();
-            
-            var result = new byte[64];
-            Array.Copy(r, 0, result, 32 - r.Length, r.Length);
-            Array.Copy(s, 0, result, 64 - s.Length, s.Length);
-            
-            return result;
+            // The signature is 64 bytes: 32 bytes r + 32 bytes s
+            return CryptoProvider.Current.SignHash(_privateKeyBytes, data);
         }
 
         /// <summary>
@@ -133,16 +113,8 @@ namespace NeoSharp.Crypto
         {
             ThrowIfDisposed();
             
-            // Use BouncyCastle for proper secp256r1 public key derivation
-            var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-            var domainParams = new Org.BouncyCastle.Crypto.Parameters.ECDomainParameters(
-                curve.Curve, curve.G, curve.N, curve.H);
-            
-            var privateKeyInt = new Org.BouncyCastle.Math.BigInteger(1, _privateKeyBytes);
-            var publicKeyPoint = domainParams.G.Multiply(privateKeyInt).Normalize();
-            
-            // Get compressed encoding
-            var publicKeyBytes = publicKeyPoint.GetEncoded(true);
+            // The provider returns the compressed encoding
+            var publicKeyBytes = CryptoProvider.Current.DerivePublicKey(_privateKeyBytes);
             
             return new ECPublicKey(publicKeyBytes);
         }
@@ -196,20 +168,20 @@ namespace NeoSharp.Crypto
         public string ToWIF()
         {
             ThrowIfDisposed();
-            var data = new byte[38];
+            Span<byte> data = stackalloc byte[34];
             data[0] = 0x80; // Version byte for mainnet
-            Array.Copy(_privateKeyBytes, 0, data, 1, 32);
+            _privateKeyBytes.CopyTo(data.Slice(1));
             data[33] = 0x01; // Compression flag
             
-            var hash = Hash.SHA256(data.Take(34).ToArray());
-            hash = Hash.SHA256(hash);
-            var checksum = hash.Take(4).ToArray();
-            
-            var result = new byte[38];
-            Array.Copy(data, 0, result, 0, 34);
-            Array.Copy(checksum, 0, result, 34, 4);
-            
-            return Base58.Encode(result);
+            try
+            {
+                // Encode with the checksum (first 4 bytes of double SHA256)
+                return Base58.EncodeCheck(data);
+            }
+            finally
+            {
+                data.Clear();
+            }
         }
 
         private ECPublicKey DerivePublicKey()
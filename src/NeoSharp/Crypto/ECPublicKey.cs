@@ -9,12 +9,33 @@ namespace NeoSharp.Crypto
     public class ECPublicKey : IEquatable<ECPublicKey>
     {
         private readonly byte[] _encodedBytes;
+        private Org.BouncyCastle.Math.EC.ECPoint _curvePoint;
+        private Org.BouncyCastle.Crypto.Parameters.ECPublicKeyParameters _publicKeyParameters;
 
         /// <summary>
         /// Gets the encoded bytes of the public key
         /// </summary>
         public byte[] EncodedBytes => (byte[])_encodedBytes.Clone();
 
+        /// <summary>
+        /// Gets the encoded (compressed) bytes of the public key without copying them
+        /// </summary>
+        public ReadOnlySpan<byte> EncodedSpan => _encodedBytes;
+
+        /// <summary>
+        /// Gets the decoded, normalized point on the secp256r1 curve, decompressed on first access only.
+        /// The multiples precomputed for the point during verification are cached on it as well, so keep
+        /// and reuse the instance for keys that verify many signatures.
+        /// </summary>
+        /// <exception cref="ArgumentException">Thrown if the encoded bytes are not a point on the curve</exception>
+        public Org.BouncyCastle.Math.EC.ECPoint CurvePoint => _curvePoint ??= Secp256r1Curve.DecodePoint(_encodedBytes);
+
+        /// <summary>
+        /// Gets the verification parameters for this key, built around <see cref="CurvePoint"/> on first use
+        /// </summary>
+        internal Org.BouncyCastle.Crypto.Parameters.ECPublicKeyParameters PublicKeyParameters =>
+            _publicKeyParameters ??= new Org.BouncyCastle.Crypto.Parameters.ECPublicKeyParameters(CurvePoint, Secp256r1Curve.Domain);
+
         /// <summary>
         /// Initializes a new instance of ECPublicKey
         /// </summary>
@@ -125,33 +146,11 @@ namespace NeoSharp.Crypto
             if (messageHash == null) throw new ArgumentNullException(nameof(messageHash));
             if (signature == null) throw new ArgumentNullException(nameof(signature));
 
-            try
-            {
-                // Use BouncyCastle for signature verification
-                var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-                var domainParams = new Org.BouncyCastle.Crypto.Parameters.ECDomainParameters(
-                    curve.Curve, curve.G, curve.N, curve.H);
-
-                // Decode the public key point
-                var point = curve.Curve.DecodePoint(_encodedBytes);
-                var pubKeyParams = new Org.BouncyCastle.Crypto.Parameters.ECPublicKeyParameters(point, domainParams);
-
-                // Parse signature (assuming 64-byte format: 32 bytes r + 32 bytes s)
-                if (signature.Length != 64)
-                    return false;
-
-                var r = new Org.BouncyCastle.Math.BigInteger(1, signature[0..32]);
-                var s = new Org.BouncyCastle.Math.BigInteger(1, signature[32..64]);
-
-                // Verify signature
-                var verifier = new Org.BouncyCastle.Crypto.Signers.ECDsaSigner();
-                verifier.Init(false, pubKeyParams);
-                return verifier.VerifySignature(messageHash, r, s);
-            }
-            catch
-            {
+            // Signature format: 32 bytes r + 32 bytes s
+            if (signature.Length != 64)
                 return false;
-            }
+
+            return CryptoProvider.Current.VerifyHash(this, messageHash, signature);
         }
 
         public static bool operator ==(ECPublicKey? left, ECPublicKey? right) => 
@@ -1,6 +1,9 @@
 using System;
+using System.Buffers;
+using System.Collections.Concurrent;
 using System.Security.Cryptography;
 using System.Text;
+using System.Threading.Tasks;
 using Org.BouncyCastle.Crypto.Digests;
 
 namespace NeoSharp.Crypto
@@ -10,6 +13,26 @@ namespace NeoSharp.Crypto
     /// </summary>
     public static class Hash
     {
+        /// <summary>
+        /// The size of a SHA256 or Hash256 digest in bytes.
+        /// </summary>
+        public const int SHA256Size = 32;
+
+        /// <summary>
+        /// The size of a RIPEMD160 or Hash160 digest in bytes.
+        /// </summary>
+        public const int RIPEMD160Size = 20;
+
+        // Below this many inputs, handing work to other cores costs more than hashing on the calling thread.
+        private const int ParallelThreshold = 256;
+
+        // Smallest range handed to a worker, so that partitioning overhead stays negligible.
+        private const int MinRangeSize = 64;
+
+        // BouncyCastle digests are not thread-safe but can be reused after DoFinal, which resets them.
+        [ThreadStatic]
+        private static RipeMD160Digest _ripemd160;
+
         /// <summary>
         /// Computes SHA256 hash.
         /// </summary>
@@ -17,8 +40,7 @@ namespace NeoSharp.Crypto
         /// <returns>The SHA256 hash.</returns>
         public static byte[] SHA256(byte[] data)
         {
-            using var sha256 = System.Security.Cryptography.SHA256.Create();
-            return sha256.ComputeHash(data);
+            return System.Security.Cryptography.SHA256.HashData(data);
         }
 
         /// <summary>
@@ -31,6 +53,31 @@ namespace NeoSharp.Crypto
             return SHA256(Encoding.UTF8.GetBytes(data));
         }
 
+        /// <summary>
+        /// Computes SHA256 hash into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 32-byte hash.</param>
+        /// <returns>The number of bytes written.</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than 32 bytes.</exception>
+        public static int SHA256(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            EnsureDestination(destination, SHA256Size);
+            return System.Security.Cryptography.SHA256.HashData(data, destination);
+        }
+
+        /// <summary>
+        /// Attempts to compute SHA256 hash into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 32-byte hash.</param>
+        /// <param name="bytesWritten">The number of bytes written.</param>
+        /// <returns>False if destination is too short; otherwise true.</returns>
+        public static bool TrySHA256(ReadOnlySpan<byte> data, Span<byte> destination, out int bytesWritten)
+        {
+            return System.Security.Cryptography.SHA256.TryHashData(data, destination, out bytesWritten);
+        }
+
         /// <summary>
         /// Computes double SHA256 hash (SHA256(SHA256(data))).
         /// </summary>
@@ -38,7 +85,12 @@ namespace NeoSharp.Crypto
         /// <returns>The double SHA256 hash.</returns>
         public static byte[] DoubleSHA256(byte[] data)
         {
-            return SHA256(SHA256(data));
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+
+            var hash = new byte[SHA256Size];
+            Hash256(data, hash);
+            return hash;
         }
 
         /// <summary>
@@ -48,11 +100,47 @@ namespace NeoSharp.Crypto
         /// <returns>The RIPEMD160 hash.</returns>
         public static byte[] RIPEMD160(byte[] data)
         {
-            var digest = new RipeMD160Digest();
-            digest.BlockUpdate(data, 0, data.Length);
-            var output = new byte[digest.GetDigestSize()];
-            digest.DoFinal(output, 0);
-            return output;
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+
+            var hash = new byte[RIPEMD160Size];
+            RIPEMD160(data, hash);
+            return hash;
+        }
+
+        /// <summary>
+        /// Computes RIPEMD160 hash into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 20-byte hash.</param>
+        /// <returns>The number of bytes written.</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than 20 bytes.</exception>
+        public static int RIPEMD160(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            EnsureDestination(destination, RIPEMD160Size);
+
+            var digest = _ripemd160 ??= new RipeMD160Digest();
+            digest.BlockUpdate(data);
+            return digest.DoFinal(destination);
+        }
+
+        /// <summary>
+        /// Attempts to compute RIPEMD160 hash into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 20-byte hash.</param>
+        /// <param name="bytesWritten">The number of bytes written.</param>
+        /// <returns>False if destination is too short; otherwise true.</returns>
+        public static bool TryRIPEMD160(ReadOnlySpan<byte> data, Span<byte> destination, out int bytesWritten)
+        {
+            if (destination.Length < RIPEMD160Size)
+            {
+                bytesWritten = 0;
+                return false;
+            }
+
+            bytesWritten = RIPEMD160(data, destination);
+            return true;
         }
 
         /// <summary>
@@ -62,7 +150,47 @@ namespace NeoSharp.Crypto
         /// <returns>The Hash160 result.</returns>
         public static byte[] Hash160(byte[] data)
         {
-            return RIPEMD160(SHA256(data));
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+
+            var hash = new byte[RIPEMD160Size];
+            Hash160(data, hash);
+            return hash;
+        }
+
+        /// <summary>
+        /// Computes Hash160 (RIPEMD160(SHA256(data))) into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 20-byte hash.</param>
+        /// <returns>The number of bytes written.</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than 20 bytes.</exception>
+        public static int Hash160(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            EnsureDestination(destination, RIPEMD160Size);
+
+            Span<byte> sha256 = stackalloc byte[SHA256Size];
+            System.Security.Cryptography.SHA256.HashData(data, sha256);
+            return RIPEMD160(sha256, destination);
+        }
+
+        /// <summary>
+        /// Attempts to compute Hash160 (RIPEMD160(SHA256(data))) into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 20-byte hash.</param>
+        /// <param name="bytesWritten">The number of bytes written.</param>
+        /// <returns>False if destination is too short; otherwise true.</returns>
+        public static bool TryHash160(ReadOnlySpan<byte> data, Span<byte> destination, out int bytesWritten)
+        {
+            if (destination.Length < RIPEMD160Size)
+            {
+                bytesWritten = 0;
+                return false;
+            }
+
+            bytesWritten = Hash160(data, destination);
+            return true;
         }
 
         /// <summary>
@@ -75,6 +203,90 @@ namespace NeoSharp.Crypto
             return DoubleSHA256(data);
         }
 
+        /// <summary>
+        /// Computes Hash256 (double SHA256) into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 32-byte hash.</param>
+        /// <returns>The number of bytes written.</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than 32 bytes.</exception>
+        public static int Hash256(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            EnsureDestination(destination, SHA256Size);
+
+            Span<byte> sha256 = stackalloc byte[SHA256Size];
+            System.Security.Cryptography.SHA256.HashData(data, sha256);
+            return System.Security.Cryptography.SHA256.HashData(sha256, destination);
+        }
+
+        /// <summary>
+        /// Attempts to compute Hash256 (double SHA256) into the destination buffer without allocating.
+        /// </summary>
+        /// <param name="data">The data to hash.</param>
+        /// <param name="destination">The buffer that receives the 32-byte hash.</param>
+        /// <param name="bytesWritten">The number of bytes written.</param>
+        /// <returns>False if destination is too short; otherwise true.</returns>
+        public static bool TryHash256(ReadOnlySpan<byte> data, Span<byte> destination, out int bytesWritten)
+        {
+            if (destination.Length < SHA256Size)
+            {
+                bytesWritten = 0;
+                return false;
+            }
+
+            bytesWritten = Hash256(data, destination);
+            return true;
+        }
+
+        /// <summary>
+        /// Computes the script hashes of many scripts, spreading the work across cores.
+        /// Each result equals <see cref="Types.Hash160.FromScript(ReadOnlySpan{byte})"/> of the corresponding input.
+        /// </summary>
+        /// <param name="inputs">The scripts to hash.</param>
+        /// <param name="destination">The buffer that receives one hash per input, in input order.</param>
+        /// <param name="maxDegreeOfParallelism">The maximum number of cores to use, or -1 for all of them.</param>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than inputs.</exception>
+        public static void Hash160Many(ReadOnlySpan<ReadOnlyMemory<byte>> inputs, Span<Types.Hash160> destination, int maxDegreeOfParallelism = -1)
+        {
+            EnsureDestination(destination.Length, inputs.Length);
+
+            if (!ShouldParallelize(inputs.Length, maxDegreeOfParallelism))
+            {
+                for (var i = 0; i < inputs.Length; i++)
+                {
+                    destination[i] = Types.Hash160.FromScript(inputs[i].Span);
+                }
+                return;
+            }
+
+            HashManyParallel(inputs, destination, maxDegreeOfParallelism, data => Types.Hash160.FromScript(data.Span));
+        }
+
+        /// <summary>
+        /// Computes the Hash256 (double SHA256) of many inputs, spreading the work across cores.
+        /// Results are in the byte order used for transaction and block hashes, i.e. each result equals
+        /// <see cref="Types.Hash256.FromLittleEndianBytes(ReadOnlySpan{byte})"/> of <see cref="Hash256(byte[])"/>.
+        /// </summary>
+        /// <param name="inputs">The data to hash, such as unsigned transactions.</param>
+        /// <param name="destination">The buffer that receives one hash per input, in input order.</param>
+        /// <param name="maxDegreeOfParallelism">The maximum number of cores to use, or -1 for all of them.</param>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than inputs.</exception>
+        public static void Hash256Many(ReadOnlySpan<ReadOnlyMemory<byte>> inputs, Span<Types.Hash256> destination, int maxDegreeOfParallelism = -1)
+        {
+            EnsureDestination(destination.Length, inputs.Length);
+
+            if (!ShouldParallelize(inputs.Length, maxDegreeOfParallelism))
+            {
+                for (var i = 0; i < inputs.Length; i++)
+                {
+                    destination[i] = ComputeHash256(inputs[i]);
+                }
+                return;
+            }
+
+            HashManyParallel(inputs, destination, maxDegreeOfParallelism, ComputeHash256);
+        }
+
         /// <summary>
         /// Computes Murmur3 hash.
         /// </summary>
@@ -190,6 +402,68 @@ namespace NeoSharp.Crypto
             return output;
         }
 
+        private static Types.Hash256 ComputeHash256(ReadOnlyMemory<byte> data)
+        {
+            Span<byte> hash = stackalloc byte[SHA256Size];
+            Hash256(data.Span, hash);
+            return Types.Hash256.FromLittleEndianBytes(hash);
+        }
+
+        private static bool ShouldParallelize(int count, int maxDegreeOfParallelism)
+        {
+            if (maxDegreeOfParallelism == 0 || maxDegreeOfParallelism < -1)
+                throw new ArgumentOutOfRangeException(nameof(maxDegreeOfParallelism), "Must be -1 or a positive number.");
+
+            return count >= ParallelThreshold && maxDegreeOfParallelism != 1 && Environment.ProcessorCount > 1;
+        }
+
+        /// <summary>
+        /// Hashes the inputs on the thread pool in contiguous ranges. Spans cannot cross threads, so the input
+        /// descriptors and the results go through pooled arrays; copying them is negligible next to hashing.
+        /// </summary>
+        private static void HashManyParallel<T>(ReadOnlySpan<ReadOnlyMemory<byte>> inputs, Span<T> destination, int maxDegreeOfParallelism, Func<ReadOnlyMemory<byte>, T> hash)
+        {
+            var count = inputs.Length;
+            var source = ArrayPool<ReadOnlyMemory<byte>>.Shared.Rent(count);
+            var results = ArrayPool<T>.Shared.Rent(count);
+            try
+            {
+                inputs.CopyTo(source);
+
+                var workers = maxDegreeOfParallelism == -1 ? Environment.ProcessorCount : Math.Min(maxDegreeOfParallelism, Environment.ProcessorCount);
+                var rangeSize = Math.Max(MinRangeSize, count / (workers * 4));
+                var options = new ParallelOptions { MaxDegreeOfParallelism = workers };
+
+                Parallel.ForEach(Partitioner.Create(0, count, rangeSize), options, range =>
+                {
+                    for (var i = range.Item1; i < range.Item2; i++)
+                    {
+                        results[i] = hash(source[i]);
+                    }
+                });
+
+                results.AsSpan(0, count).CopyTo(destination);
+            }
+            finally
+            {
+                // Do not keep the caller's buffers or the results reachable from the pool.
+                ArrayPool<ReadOnlyMemory<byte>>.Shared.Return(source, clearArray: true);
+                ArrayPool<T>.Shared.Return(results, clearArray: true);
+            }
+        }
+
+        private static void EnsureDestination(int destinationLength, int inputCount)
+        {
+            if (destinationLength < inputCount)
+                throw new ArgumentException($"Destination must hold at least {inputCount} hashes but holds {destinationLength}.", "destination");
+        }
+
+        private static void EnsureDestination(Span<byte> destination, int size)
+        {
+            if (destination.Length < size)
+                throw new ArgumentException($"Destination must be at least {size} bytes long but was {destination.Length} bytes.", nameof(destination));
+        }
+
         private static uint RotateLeft(uint value, int count)
         {
             return (value << count) | (value >> (32 - count));
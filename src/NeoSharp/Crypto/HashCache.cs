@@ -1,5 +1,6 @@
 using System;
 using System.Collections.Concurrent;
+using System.Collections.Generic;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -7,8 +8,10 @@ namespace NeoSharp.Crypto
 {
     /// <summary>
     /// Thread-safe hash cache for repeated cryptographic operations.
-    /// Provides performance optimization by caching frequently computed hashes
-    /// while maintaining security and memory efficiency.
+    /// Entries are keyed by a cheap non-cryptographic fingerprint of the input and verified against a copy
+    /// of the full input, so a lookup costs far less than the hash it replaces. Each algorithm has its own
+    /// segment, and entries are evicted with the CLOCK algorithm as soon as an insert exceeds
+    /// <see cref="MaxCacheSize"/> or <see cref="MaxMemoryUsage"/>.
     /// </summary>
     public sealed class HashCache : IDisposable
     {
@@ -17,14 +20,21 @@ namespace NeoSharp.Crypto
         /// </summary>
         public static readonly HashCache Shared = new();
 
-        private readonly ConcurrentDictionary<string, CachedHashEntry> _cache;
-        private readonly Timer _cleanupTimer;
-        private readonly object _statsLock = new();
-        private bool _disposed = false;
+        // Approximate overhead of an entry: the entry object, its list node and two array headers.
+        private const int EntryOverhead = 160;
 
-        // Statistics
-        private long _hits = 0;
-        private long _misses = 0;
+        private delegate int HashFunction(ReadOnlySpan<byte> data, Span<byte> destination);
+
+        private readonly Segment _sha256;
+        private readonly Segment _hash256;
+        private readonly Segment _hash160;
+        private readonly Segment[] _segments;
+        private readonly StripedCounter _hits = new();
+        private readonly StripedCounter _misses = new();
+        private long _count;
+        private long _memoryUsage;
+        private int _evictionCursor;
+        private volatile bool _disposed;
 
         /// <summary>
         /// Maximum number of cached hashes (default: 1000).
@@ -44,7 +54,12 @@ namespace NeoSharp.Crypto
         /// <summary>
         /// Gets the current number of cached entries.
         /// </summary>
-        public int Count => _cache.Count;
+        public int Count => (int)Interlocked.Read(ref _count);
+
+        /// <summary>
+        /// Gets the estimated memory used by the cached entries in bytes.
+        /// </summary>
+        public long MemoryUsage => Interlocked.Read(ref _memoryUsage);
 
         /// <summary>
         /// Gets cache hit statistics.
@@ -53,12 +68,11 @@ namespace NeoSharp.Crypto
         {
             get
             {
-                lock (_statsLock)
-                {
-                    var total = _hits + _misses;
-                    var hitRate = total > 0 ? (double)_hits / total : 0.0;
-                    return (_hits, _misses, hitRate);
-                }
+                var hits = _hits.Sum();
+                var misses = _misses.Sum();
+                var total = hits + misses;
+                var hitRate = total > 0 ? (double)hits / total : 0.0;
+                return (hits, misses, hitRate);
             }
         }
 
@@ -67,10 +81,10 @@ namespace NeoSharp.Crypto
         /// </summary>
         public HashCache()
         {
-            _cache = new ConcurrentDictionary<string, CachedHashEntry>();
-            
-            // Setup cleanup timer to run every 5 minutes
-            _cleanupTimer = new Timer(PerformCleanup, null, TimeSpan.FromMinutes(5), TimeSpan.FromMinutes(5));
+            _sha256 = new Segment(this, "sha256", Hash.SHA256Size, (data, destination) => Hash.SHA256(data, destination));
+            _hash256 = new Segment(this, "hash256", Hash.SHA256Size, (data, destination) => Hash.Hash256(data, destination));
+            _hash160 = new Segment(this, "hash160", Hash.RIPEMD160Size, (data, destination) => Hash.Hash160(data, destination));
+            _segments = new[] { _sha256, _hash256, _hash160 };
         }
 
         /// <summary>
@@ -85,9 +99,21 @@ namespace NeoSharp.Crypto
             if (data == null)
                 throw new ArgumentNullException(nameof(data));
 
-            ThrowIfDisposed();
+            return GetOrCompute(_sha256, data);
+        }
 
-            return GetOrCompute(data, "sha256", d => d.Hash256());
+        /// <summary>
+        /// Gets or computes SHA256 hash with caching, writing it to <paramref name="destination"/>.
+        /// A cache hit does not allocate.
+        /// </summary>
+        /// <param name="data">The data to hash</param>
+        /// <param name="destination">The buffer that receives the 32-byte hash</param>
+        /// <returns>The number of bytes written to destination</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is too short</exception>
+        /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
+        public int Sha256(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            return GetOrCompute(_sha256, data, destination);
         }
 
         /// <summary>
@@ -119,9 +145,21 @@ namespace NeoSharp.Crypto
             if (data == null)
                 throw new ArgumentNullException(nameof(data));
 
-            ThrowIfDisposed();
+            return GetOrCompute(_hash256, data);
+        }
 
-            return GetOrCompute(data, "hash256", d => d.Hash256());
+        /// <summary>
+        /// Gets or computes double SHA256 (Hash256) with caching, writing it to <paramref name="destination"/>.
+        /// A cache hit does not allocate.
+        /// </summary>
+        /// <param name="data">The data to hash</param>
+        /// <param name="destination">The buffer that receives the 32-byte hash</param>
+        /// <returns>The number of bytes written to destination</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is too short</exception>
+        /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
+        public int Hash256(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            return GetOrCompute(_hash256, data, destination);
         }
 
         /// <summary>
@@ -153,9 +191,21 @@ namespace NeoSharp.Crypto
             if (data == null)
                 throw new ArgumentNullException(nameof(data));
 
-            ThrowIfDisposed();
+            return GetOrCompute(_hash160, data);
+        }
 
-            return GetOrCompute(data, "hash160", d => d.Sha256ThenRipemd160());
+        /// <summary>
+        /// Gets or computes RIPEMD160(SHA256) (Hash160) with caching, writing it to <paramref name="destination"/>.
+        /// A cache hit does not allocate.
+        /// </summary>
+        /// <param name="data">The data to hash</param>
+        /// <param name="destination">The buffer that receives the 20-byte hash</param>
+        /// <returns>The number of bytes written to destination</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is too short</exception>
+        /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
+        public int Hash160(ReadOnlySpan<byte> data, Span<byte> destination)
+        {
+            return GetOrCompute(_hash160, data, destination);
         }
 
         /// <summary>
@@ -182,21 +232,21 @@ namespace NeoSharp.Crypto
         public void ClearCache()
         {
             ThrowIfDisposed();
-            
-            _cache.Clear();
-            
-            lock (_statsLock)
+
+            foreach (var segment in _segments)
             {
-                _hits = 0;
-                _misses = 0;
+                segment.Clear();
             }
+
+            _hits.Reset();
+            _misses.Reset();
         }
 
         /// <summary>
         /// Removes cached hash for specific data and algorithm.
         /// </summary>
         /// <param name="data">The data to remove from cache</param>
-        /// <param name="algorithm">The algorithm identifier</param>
+        /// <param name="algorithm">The algorithm identifier ("sha256", "hash256" or "hash160")</param>
         /// <exception cref="ArgumentNullException">Thrown when data or algorithm is null</exception>
         /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
         public void RemoveCached(byte[] data, string algorithm)
@@ -208,177 +258,331 @@ namespace NeoSharp.Crypto
 
             ThrowIfDisposed();
 
-            var key = GenerateCacheKey(data, algorithm);
-            _cache.TryRemove(key, out _);
+            foreach (var segment in _segments)
+            {
+                if (string.Equals(segment.Algorithm, algorithm, StringComparison.OrdinalIgnoreCase))
+                {
+                    segment.Remove(Fingerprint(data), data);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets or computes a hash with caching, returning a copy the caller owns.
+        /// </summary>
+        private byte[] GetOrCompute(Segment segment, byte[] data)
+        {
+            var hash = new byte[segment.HashSize];
+            GetOrCompute(segment, data, hash);
+            return hash;
         }
 
         /// <summary>
         /// Gets or computes a hash with caching.
         /// </summary>
+        /// <param name="segment">The segment of the hash algorithm</param>
         /// <param name="data">The data to hash</param>
-        /// <param name="algorithm">The algorithm identifier</param>
-        /// <param name="computeFunc">The function to compute the hash if not cached</param>
-        /// <returns>The hash result</returns>
-        private byte[] GetOrCompute(byte[] data, string algorithm, Func<byte[], byte[]> computeFunc)
+        /// <param name="destination">The buffer that receives the hash</param>
+        /// <returns>The number of bytes written to destination</returns>
+        private int GetOrCompute(Segment segment, ReadOnlySpan<byte> data, Span<byte> destination)
         {
-            var key = GenerateCacheKey(data, algorithm);
-            var now = DateTime.UtcNow;
+            ThrowIfDisposed();
+
+            if (destination.Length < segment.HashSize)
+                throw new ArgumentException($"Destination must be at least {segment.HashSize} bytes.", nameof(destination));
 
-            // Try to get from cache
-            if (_cache.TryGetValue(key, out var cachedEntry))
+            var fingerprint = Fingerprint(data);
+            var now = Environment.TickCount64;
+
+            if (segment.TryGet(fingerprint, data, now, CacheTtlMs, out var cached))
             {
-                // Check if entry is still valid
-                if (now.Subtract(cachedEntry.Timestamp).TotalMilliseconds <= CacheTtlMs)
-                {
-                    lock (_statsLock)
-                    {
-                        _hits++;
-                    }
-                    cachedEntry.LastAccessed = now;
-                    return cachedEntry.Hash;
-                }
-                else
-                {
-                    // Entry expired, remove it
-                    _cache.TryRemove(key, out _);
-                }
+                _hits.Increment();
+                cached.Hash.CopyTo(destination);
+                return cached.Hash.Length;
             }
 
-            // Compute hash
-            var hash = computeFunc(data);
-            
-            // Store in cache if there's room
-            if (_cache.Count < MaxCacheSize)
+            _misses.Increment();
+
+            var hash = new byte[segment.HashSize];
+            segment.Compute(data, hash);
+            hash.CopyTo(destination);
+
+            var entry = new CachedHashEntry(fingerprint, data.ToArray(), hash, now);
+            if (MaxCacheSize > 0 && entry.EstimatedMemoryUsage <= MaxMemoryUsage)
             {
-                var entry = new CachedHashEntry
-                {
-                    Hash = hash,
-                    Timestamp = now,
-                    LastAccessed = now,
-                    DataSize = data.Length
-                };
-                
-                _cache.TryAdd(key, entry);
+                segment.Add(entry);
+                EnforceLimits();
             }
 
-            lock (_statsLock)
+            return hash.Length;
+        }
+
+        /// <summary>
+        /// Evicts entries until the cache is within <see cref="MaxCacheSize"/> and <see cref="MaxMemoryUsage"/>.
+        /// Segments are visited in turn, so an idle algorithm gives its space up to a busy one.
+        /// </summary>
+        private void EnforceLimits()
+        {
+            var failures = 0;
+            while (failures < _segments.Length &&
+                   (Interlocked.Read(ref _count) > MaxCacheSize || Interlocked.Read(ref _memoryUsage) > MaxMemoryUsage))
             {
-                _misses++;
+                var cursor = (uint)Interlocked.Increment(ref _evictionCursor);
+                var segment = _segments[cursor % (uint)_segments.Length];
+                failures = segment.EvictOne() ? 0 : failures + 1;
             }
+        }
 
-            return hash;
+        private void OnAdded(CachedHashEntry entry)
+        {
+            Interlocked.Increment(ref _count);
+            Interlocked.Add(ref _memoryUsage, entry.EstimatedMemoryUsage);
+        }
+
+        private void OnRemoved(CachedHashEntry entry)
+        {
+            Interlocked.Decrement(ref _count);
+            Interlocked.Add(ref _memoryUsage, -entry.EstimatedMemoryUsage);
+        }
+
+        /// <summary>
+        /// Computes a non-cryptographic fingerprint of the data. The length is part of the fingerprint and
+        /// the content hash is randomly seeded per process, so colliding inputs cannot be crafted offline.
+        /// Collisions only cost a cache miss because entries are verified against the full input.
+        /// </summary>
+        private static ulong Fingerprint(ReadOnlySpan<byte> data)
+        {
+            var hash = new HashCode();
+            hash.AddBytes(data);
+            return ((ulong)(uint)data.Length << 32) | (uint)hash.ToHashCode();
         }
 
         /// <summary>
-        /// Generates a cache key for the given data and algorithm.
-        /// Uses a combination of data length, algorithm, and hash of the data for uniqueness.
+        /// Throws ObjectDisposedException if this instance has been disposed.
         /// </summary>
-        /// <param name="data">The data</param>
-        /// <param name="algorithm">The algorithm identifier</param>
-        /// <returns>A unique cache key</returns>
-        private static string GenerateCacheKey(byte[] data, string algorithm)
+        private void ThrowIfDisposed()
         {
-            // Create a unique key based on algorithm, length, and a hash of the data
-            // This avoids storing the full data as the key while maintaining uniqueness
-            var dataHash = data.Hash256();
-            var hashHex = Convert.ToHexString(dataHash.AsSpan(0, Math.Min(8, dataHash.Length))); // Use first 8 bytes
-            
-            return $"{algorithm}:{data.Length}:{hashHex}";
+            if (_disposed)
+                throw new ObjectDisposedException(nameof(HashCache));
         }
 
         /// <summary>
-        /// Performs periodic cleanup of expired cache entries.
+        /// Releases all resources used by the HashCache.
         /// </summary>
-        /// <param name="state">Timer state (unused)</param>
-        private void PerformCleanup(object? state)
+        public void Dispose()
         {
             if (_disposed) return;
 
-            try
+            _disposed = true;
+            foreach (var segment in _segments)
+            {
+                segment.Clear();
+            }
+        }
+
+        /// <summary>
+        /// Cached hash entry with metadata.
+        /// </summary>
+        private sealed class CachedHashEntry
+        {
+            public CachedHashEntry(ulong fingerprint, byte[] data, byte[] hash, long timestamp)
+            {
+                Fingerprint = fingerprint;
+                Data = data;
+                Hash = hash;
+                Timestamp = timestamp;
+            }
+
+            public ulong Fingerprint { get; }
+            public byte[] Data { get; }
+            public byte[] Hash { get; }
+            public long Timestamp { get; }
+
+            /// <summary>
+            /// CLOCK reference bit, set on every hit and cleared as the hand passes.
+            /// </summary>
+            public int Referenced;
+
+            /// <summary>
+            /// Position in the segment's CLOCK ring; only touched under the segment lock.
+            /// </summary>
+            public LinkedListNode<CachedHashEntry> Node;
+
+            public long EstimatedMemoryUsage => Data.Length + Hash.Length + EntryOverhead;
+        }
+
+        /// <summary>
+        /// The entries of one hash algorithm. Lookups are lock-free; inserts and evictions take the segment lock
+        /// and maintain a CLOCK ring, so both are O(1) amortized.
+        /// </summary>
+        private sealed class Segment
+        {
+            private readonly HashCache _owner;
+            private readonly ConcurrentDictionary<ulong, CachedHashEntry> _entries = new();
+            private readonly LinkedList<CachedHashEntry> _ring = new();
+            private readonly object _lock = new();
+            private LinkedListNode<CachedHashEntry> _hand;
+
+            public Segment(HashCache owner, string algorithm, int hashSize, HashFunction compute)
             {
-                var now = DateTime.UtcNow;
-                var expiredKeys = new List<string>();
-                var totalMemoryUsage = 0L;
+                _owner = owner;
+                Algorithm = algorithm;
+                HashSize = hashSize;
+                Compute = compute;
+            }
 
-                // Find expired entries and calculate memory usage
-                foreach (var kvp in _cache)
+            public string Algorithm { get; }
+            public int HashSize { get; }
+            public HashFunction Compute { get; }
+
+            public bool TryGet(ulong fingerprint, ReadOnlySpan<byte> data, long now, int ttlMs, out CachedHashEntry entry)
+            {
+                if (_entries.TryGetValue(fingerprint, out entry) && entry.Data.AsSpan().SequenceEqual(data))
                 {
-                    var entry = kvp.Value;
-                    var age = now.Subtract(entry.Timestamp).TotalMilliseconds;
-                    var timeSinceAccess = now.Subtract(entry.LastAccessed).TotalMilliseconds;
-                    
-                    // Mark for removal if expired or not accessed recently
-                    if (age > CacheTtlMs || timeSinceAccess > CacheTtlMs / 2)
+                    if (now - entry.Timestamp <= ttlMs)
                     {
-                        expiredKeys.Add(kvp.Key);
+                        // Avoid dirtying the cache line when the bit is already set.
+                        if (Volatile.Read(ref entry.Referenced) == 0)
+                            Volatile.Write(ref entry.Referenced, 1);
+                        return true;
                     }
-                    else
+
+                    lock (_lock)
                     {
-                        totalMemoryUsage += entry.EstimatedMemoryUsage;
+                        RemoveLocked(entry);
                     }
                 }
 
-                // Remove expired entries
-                foreach (var key in expiredKeys)
+                entry = null;
+                return false;
+            }
+
+            public void Add(CachedHashEntry entry)
+            {
+                lock (_lock)
                 {
-                    _cache.TryRemove(key, out _);
+                    if (_owner._disposed) return;
+
+                    if (_entries.TryGetValue(entry.Fingerprint, out var existing))
+                        RemoveLocked(existing);
+
+                    // New entries go just behind the hand, so they are the last ones it reaches.
+                    if (_hand == null)
+                    {
+                        entry.Node = _ring.AddLast(entry);
+                        _hand = entry.Node;
+                    }
+                    else
+                    {
+                        entry.Node = _ring.AddBefore(_hand, entry);
+                    }
+
+                    _entries[entry.Fingerprint] = entry;
+                    _owner.OnAdded(entry);
                 }
+            }
 
-                // If still over memory limit, remove least recently accessed entries
-                if (totalMemoryUsage > MaxMemoryUsage)
+            public bool EvictOne()
+            {
+                lock (_lock)
                 {
-                    var entries = new List<KeyValuePair<string, CachedHashEntry>>(_cache);
-                    entries.Sort((a, b) => a.Value.LastAccessed.CompareTo(b.Value.LastAccessed));
-
-                    foreach (var entry in entries)
+                    // Give every entry a second chance, but never sweep more than two laps.
+                    for (var scanned = 0; _hand != null; scanned++)
                     {
-                        if (totalMemoryUsage <= MaxMemoryUsage) break;
-                        
-                        if (_cache.TryRemove(entry.Key, out var removed))
+                        var entry = _hand.Value;
+                        if (Interlocked.Exchange(ref entry.Referenced, 0) == 0 || scanned >= 2 * _ring.Count)
                         {
-                            totalMemoryUsage -= removed.EstimatedMemoryUsage;
+                            RemoveLocked(entry);
+                            return true;
                         }
+                        _hand = _hand.Next ?? _ring.First;
                     }
+                    return false;
                 }
             }
-            catch
+
+            public void Remove(ulong fingerprint, ReadOnlySpan<byte> data)
             {
-                // Ignore cleanup errors to prevent timer from stopping
+                lock (_lock)
+                {
+                    if (_entries.TryGetValue(fingerprint, out var entry) && entry.Data.AsSpan().SequenceEqual(data))
+                        RemoveLocked(entry);
+                }
             }
-        }
 
-        /// <summary>
-        /// Throws ObjectDisposedException if this instance has been disposed.
-        /// </summary>
-        private void ThrowIfDisposed()
-        {
-            if (_disposed)
-                throw new ObjectDisposedException(nameof(HashCache));
-        }
+            public void Clear()
+            {
+                lock (_lock)
+                {
+                    while (_hand != null)
+                    {
+                        RemoveLocked(_hand.Value);
+                    }
+                }
+            }
 
-        /// <summary>
-        /// Releases all resources used by the HashCache.
-        /// </summary>
-        public void Dispose()
-        {
-            if (_disposed) return;
+            private void RemoveLocked(CachedHashEntry entry)
+            {
+                // The entry may already have been evicted or replaced by another thread.
+                if (entry.Node == null) return;
 
-            _cleanupTimer?.Dispose();
-            _cache.Clear();
-            _disposed = true;
+                if (_hand == entry.Node)
+                {
+                    var next = entry.Node.Next ?? _ring.First;
+                    _hand = next == entry.Node ? null : next;
+                }
+
+                _ring.Remove(entry.Node);
+                entry.Node = null;
+                _entries.TryRemove(new KeyValuePair<ulong, CachedHashEntry>(entry.Fingerprint, entry));
+                _owner.OnRemoved(entry);
+            }
         }
 
         /// <summary>
-        /// Cached hash entry with metadata.
+        /// A counter striped over padded cells so that concurrent increments rarely share a cache line.
         /// </summary>
-        private class CachedHashEntry
+        private sealed class StripedCounter
         {
-            public byte[] Hash { get; set; } = Array.Empty<byte>();
-            public DateTime Timestamp { get; set; }
-            public DateTime LastAccessed { get; set; }
-            public int DataSize { get; set; }
+            // Eight longs keep each cell on its own 64-byte cache line.
+            private const int CellStride = 8;
+
+            private readonly long[] _cells;
+            private readonly int _mask;
+
+            public StripedCounter()
+            {
+                var stripes = 1;
+                while (stripes < Environment.ProcessorCount && stripes < 64)
+                {
+                    stripes <<= 1;
+                }
+                _mask = stripes - 1;
+                _cells = new long[stripes * CellStride];
+            }
+
+            public void Increment()
+            {
+                Interlocked.Increment(ref _cells[(Environment.CurrentManagedThreadId & _mask) * CellStride]);
+            }
+
+            public long Sum()
+            {
+                long sum = 0;
+                for (var i = 0; i < _cells.Length; i += CellStride)
+                {
+                    sum += Volatile.Read(ref _cells[i]);
+                }
+                return sum;
+            }
 
-            public long EstimatedMemoryUsage => Hash.Length + DataSize + 64; // Approximate overhead
+            public void Reset()
+            {
+                for (var i = 0; i < _cells.Length; i += CellStride)
+                {
+                    Interlocked.Exchange(ref _cells[i], 0);
+                }
+            }
         }
     }
 
@@ -447,4 +651,4 @@ namespace NeoSharp.Crypto
             return System.Text.Encoding.UTF8.GetBytes(str).CachedHash160();
         }
     }
-}
\ No newline at end of file
+}
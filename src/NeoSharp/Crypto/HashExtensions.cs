@@ -17,8 +17,7 @@ namespace NeoSharp.Crypto
         /// <returns>The SHA256 hash value as byte array</returns>
         public static byte[] Sha256(this byte[] bytes)
         {
-            using var sha256 = SHA256.Create();
-            return sha256.ComputeHash(bytes);
+            return Hash.SHA256(bytes);
         }
 
         /// <summary>
@@ -29,9 +28,7 @@ namespace NeoSharp.Crypto
         /// <returns>The hash value as byte array</returns>
         public static byte[] Hash256(this byte[] bytes)
         {
-            using var sha256 = SHA256.Create();
-            var first = sha256.ComputeHash(bytes);
-            return sha256.ComputeHash(first);
+            return Hash.Hash256(bytes);
         }
 
         /// <summary>
@@ -51,9 +48,7 @@ namespace NeoSharp.Crypto
         /// <returns>The hash value as byte array</returns>
         public static byte[] Sha256ThenRipemd160(this byte[] bytes)
         {
-            using var sha256 = SHA256.Create();
-            var sha = sha256.ComputeHash(bytes);
-            return sha.Ripemd160();
+            return Hash.Hash160(bytes);
         }
 
         /// <summary>
@@ -0,0 +1,45 @@
+using System;
+
+namespace NeoSharp.Crypto
+{
+    /// <summary>
+    /// The secp256r1 arithmetic behind key derivation, signing and verification. Implementations must be
+    /// interchangeable: the same private key derives the same public key, a signature made by one verifies
+    /// with every other, and every implementation accepts and rejects the same signatures.
+    /// The provider in use is <see cref="CryptoProvider.Current"/>.
+    /// </summary>
+    public interface ICryptoProvider
+    {
+        /// <summary>
+        /// Gets the name of the provider.
+        /// </summary>
+        string Name { get; }
+
+        /// <summary>
+        /// Derives the public key of a private key.
+        /// </summary>
+        /// <param name="privateKey">The 32-byte big-endian private key, between 1 and n - 1.</param>
+        /// <returns>The 33-byte compressed public key.</returns>
+        /// <exception cref="ArgumentException">Thrown if the private key is not 32 bytes or out of range.</exception>
+        byte[] DerivePublicKey(ReadOnlySpan<byte> privateKey);
+
+        /// <summary>
+        /// Signs a message hash with a random nonce. The signature is not normalized to low S.
+        /// </summary>
+        /// <param name="privateKey">The 32-byte big-endian private key, between 1 and n - 1.</param>
+        /// <param name="messageHash">The hash to sign.</param>
+        /// <returns>The 64-byte signature, r followed by s.</returns>
+        /// <exception cref="ArgumentException">Thrown if the private key is not 32 bytes or out of range.</exception>
+        byte[] SignHash(ReadOnlySpan<byte> privateKey, ReadOnlySpan<byte> messageHash);
+
+        /// <summary>
+        /// Verifies a signature of a message hash. Implementations may cache the decoded key on the instance,
+        /// so reuse <see cref="ECPublicKey"/> instances for keys that verify many signatures.
+        /// </summary>
+        /// <param name="publicKey">The public key.</param>
+        /// <param name="messageHash">The hash that was signed.</param>
+        /// <param name="signature">The 64-byte signature, r followed by s.</param>
+        /// <returns>True if the signature is valid; false otherwise, including when the key is not on the curve.</returns>
+        bool VerifyHash(ECPublicKey publicKey, ReadOnlySpan<byte> messageHash, ReadOnlySpan<byte> signature);
+    }
+}
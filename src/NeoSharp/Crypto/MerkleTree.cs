@@ -0,0 +1,173 @@
+using System;
+using System.Buffers;
+using NeoSharp.Types;
+
+namespace NeoSharp.Crypto
+{
+    /// <summary>
+    /// Computes Merkle roots and inclusion proofs the way Neo builds the transaction tree of a block.
+    /// Each parent is the Hash256 of its children's little-endian bytes concatenated, and a level with an
+    /// odd number of nodes pairs its last node with itself. The root of a single hash is the hash itself
+    /// and the root of no hashes is <see cref="Hash256.Zero"/>.
+    /// </summary>
+    public static class MerkleTree
+    {
+        private const int NodeSize = Hash.SHA256Size;
+
+        /// <summary>
+        /// Computes the Merkle root of the hashes. All levels are reduced in place in one pooled buffer.
+        /// </summary>
+        /// <param name="hashes">The leaf hashes, such as the transaction hashes of a block in block order.</param>
+        /// <returns>The Merkle root.</returns>
+        public static Hash256 ComputeRoot(ReadOnlySpan<Hash256> hashes)
+        {
+            if (hashes.Length == 0) return Hash256.Zero;
+            if (hashes.Length == 1) return hashes[0];
+
+            var buffer = ArrayPool<byte>.Shared.Rent(hashes.Length * NodeSize);
+            try
+            {
+                var nodes = buffer.AsSpan(0, hashes.Length * NodeSize);
+                LoadLeaves(hashes, nodes);
+
+                var count = hashes.Length;
+                while (count > 1)
+                {
+                    count = ReduceLevel(nodes, count);
+                }
+                return Hash256.FromLittleEndianBytes(nodes.Slice(0, NodeSize));
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
+        /// <summary>
+        /// Builds the proof that the hash at the given index is part of the tree: the sibling of the
+        /// leaf and of each of its ancestors, from the leaf level up to just below the root.
+        /// </summary>
+        /// <param name="hashes">The leaf hashes.</param>
+        /// <param name="index">The index of the leaf to prove.</param>
+        /// <returns>The sibling hashes, empty if the tree has a single leaf.</returns>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown if index is not the index of a leaf.</exception>
+        public static Hash256[] GetProof(ReadOnlySpan<Hash256> hashes, int index)
+        {
+            if (index < 0 || index >= hashes.Length)
+                throw new ArgumentOutOfRangeException(nameof(index), $"Index must be between 0 and {hashes.Length - 1}.");
+
+            var proof = new Hash256[GetDepth(hashes.Length)];
+            if (proof.Length == 0) return proof;
+
+            var buffer = ArrayPool<byte>.Shared.Rent(hashes.Length * NodeSize);
+            try
+            {
+                var nodes = buffer.AsSpan(0, hashes.Length * NodeSize);
+                LoadLeaves(hashes, nodes);
+
+                var count = hashes.Length;
+                for (var level = 0; level < proof.Length; level++)
+                {
+                    // The last node of an odd level is paired with itself.
+                    var sibling = Math.Min(index ^ 1, count - 1);
+                    proof[level] = Hash256.FromLittleEndianBytes(nodes.Slice(sibling * NodeSize, NodeSize));
+
+                    count = ReduceLevel(nodes, count);
+                    index >>= 1;
+                }
+                return proof;
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
+        /// <summary>
+        /// Verifies a proof built by <see cref="GetProof"/> without rebuilding the tree.
+        /// </summary>
+        /// <param name="root">The expected Merkle root.</param>
+        /// <param name="leaf">The hash whose inclusion is proved.</param>
+        /// <param name="index">The index of the leaf in the tree.</param>
+        /// <param name="proof">The sibling hashes from the leaf level upwards.</param>
+        /// <returns>True if the proof leads from the leaf to the root; otherwise false.</returns>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown if index is negative.</exception>
+        public static bool VerifyProof(Hash256 root, Hash256 leaf, int index, ReadOnlySpan<Hash256> proof)
+        {
+            if (index < 0)
+                throw new ArgumentOutOfRangeException(nameof(index), "Index must not be negative.");
+
+            // A proof of this length cannot reach a leaf beyond 2^length.
+            if (proof.Length < 31 && index >> proof.Length != 0) return false;
+
+            Span<byte> pair = stackalloc byte[2 * NodeSize];
+            Span<byte> current = stackalloc byte[NodeSize];
+            leaf.CopyLittleEndianTo(current);
+
+            foreach (var sibling in proof)
+            {
+                if ((index & 1) == 0)
+                {
+                    current.CopyTo(pair);
+                    sibling.CopyLittleEndianTo(pair.Slice(NodeSize));
+                }
+                else
+                {
+                    sibling.CopyLittleEndianTo(pair);
+                    current.CopyTo(pair.Slice(NodeSize));
+                }
+                Hash.Hash256(pair, current);
+                index >>= 1;
+            }
+
+            Span<byte> expected = stackalloc byte[NodeSize];
+            root.CopyLittleEndianTo(expected);
+            return current.SequenceEqual(expected);
+        }
+
+        private static int GetDepth(int count)
+        {
+            var depth = 0;
+            while (count > 1)
+            {
+                count = (count + 1) / 2;
+                depth++;
+            }
+            return depth;
+        }
+
+        private static void LoadLeaves(ReadOnlySpan<Hash256> hashes, Span<byte> nodes)
+        {
+            for (var i = 0; i < hashes.Length; i++)
+            {
+                hashes[i].CopyLittleEndianTo(nodes.Slice(i * NodeSize, NodeSize));
+            }
+        }
+
+        /// <summary>
+        /// Replaces the first half of the nodes with their parents. Parent i only overwrites nodes that
+        /// have already been read, and siblings are adjacent, so each pair is hashed where it lies.
+        /// </summary>
+        private static int ReduceLevel(Span<byte> nodes, int count)
+        {
+            var parents = (count + 1) / 2;
+            Span<byte> pair = stackalloc byte[2 * NodeSize];
+            for (var i = 0; i < parents; i++)
+            {
+                var parent = nodes.Slice(i * NodeSize, NodeSize);
+                if (2 * i + 1 < count)
+                {
+                    Hash.Hash256(nodes.Slice(2 * i * NodeSize, 2 * NodeSize), parent);
+                }
+                else
+                {
+                    var last = nodes.Slice(2 * i * NodeSize, NodeSize);
+                    last.CopyTo(pair);
+                    last.CopyTo(pair.Slice(NodeSize));
+                    Hash.Hash256(pair, parent);
+                }
+            }
+            return parents;
+        }
+    }
+}
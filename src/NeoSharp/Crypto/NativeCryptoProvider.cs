@@ -0,0 +1,187 @@
+using System;
+using System.Security.Cryptography;
+
+namespace NeoSharp.Crypto
+{
+    /// <summary>
+    /// The provider built on the platform's <see cref="ECDsa"/> for nistP256 (secp256r1), which is backed by
+    /// OpenSSL on Linux and CNG on Windows and is several times faster than the managed arithmetic. Use it
+    /// only when <see cref="IsSupported"/> is true.
+    /// </summary>
+    public sealed class NativeCryptoProvider : ICryptoProvider
+    {
+        private const int FieldSize = 32;
+
+        /// <summary>
+        /// The provider instance.
+        /// </summary>
+        public static readonly NativeCryptoProvider Instance = new NativeCryptoProvider();
+
+        private static readonly Lazy<bool> Supported = new Lazy<bool>(SelfTest);
+
+        private const int VerifierCacheSize = 8;
+
+        // Importing a public key costs about as much as a verification, so recently used keys stay imported.
+        // ECDsa instances are not documented as thread-safe, so each thread keeps its own few, most recent
+        // first, and disposes the one it evicts.
+        [ThreadStatic]
+        private static Verifier[] _verifiers;
+
+        private NativeCryptoProvider()
+        {
+        }
+
+        /// <summary>
+        /// Gets whether the platform implements ECDSA over nistP256 and agrees with the managed provider.
+        /// The check runs once.
+        /// </summary>
+        public static bool IsSupported => Supported.Value;
+
+        /// <inheritdoc />
+        public string Name => "Native";
+
+        /// <inheritdoc />
+        public byte[] DerivePublicKey(ReadOnlySpan<byte> privateKey)
+        {
+            using var ecdsa = ImportPrivateKey(privateKey);
+            var q = ecdsa.ExportParameters(false).Q;
+
+            var encoded = new byte[FieldSize + 1];
+            encoded[0] = (byte)(0x02 | (q.Y[FieldSize - 1] & 1));
+            q.X.CopyTo(encoded, 1);
+            return encoded;
+        }
+
+        /// <inheritdoc />
+        public byte[] SignHash(ReadOnlySpan<byte> privateKey, ReadOnlySpan<byte> messageHash)
+        {
+            using var ecdsa = ImportPrivateKey(privateKey);
+            return ecdsa.SignHash(messageHash.ToArray());
+        }
+
+        /// <inheritdoc />
+        public bool VerifyHash(ECPublicKey publicKey, ReadOnlySpan<byte> messageHash, ReadOnlySpan<byte> signature)
+        {
+            if (publicKey == null) throw new ArgumentNullException(nameof(publicKey));
+            if (signature.Length != 2 * FieldSize) return false;
+
+            ECDsa ecdsa;
+            try
+            {
+                ecdsa = GetVerifier(publicKey);
+            }
+            catch (Exception ex) when (ex is ArgumentException || ex is CryptographicException)
+            {
+                // The key does not decode to a point on the curve.
+                return false;
+            }
+            return ecdsa.VerifyHash(messageHash, signature);
+        }
+
+        /// <summary>
+        /// Returns this thread's imported copy of the key, importing it if needed. The returned instance must
+        /// not leave the calling thread.
+        /// </summary>
+        private static ECDsa GetVerifier(ECPublicKey publicKey)
+        {
+            var verifiers = _verifiers ??= new Verifier[VerifierCacheSize];
+
+            int index = 0;
+            while (index < verifiers.Length && verifiers[index].Key != null && !verifiers[index].Key.Equals(publicKey))
+                index++;
+
+            Verifier entry;
+            if (index < verifiers.Length && verifiers[index].Key != null)
+            {
+                entry = verifiers[index];
+            }
+            else
+            {
+                entry = new Verifier(publicKey, ImportPublicKey(publicKey));
+                if (index == verifiers.Length)
+                {
+                    index--;
+                    verifiers[index].ECDsa.Dispose();
+                }
+            }
+
+            // Move the entry to the front so that the least recently used key is evicted first.
+            Array.Copy(verifiers, 0, verifiers, 1, index);
+            verifiers[0] = entry;
+            return entry.ECDsa;
+        }
+
+        private readonly struct Verifier
+        {
+            public Verifier(ECPublicKey key, ECDsa ecdsa)
+            {
+                Key = key;
+                ECDsa = ecdsa;
+            }
+
+            public ECPublicKey Key { get; }
+
+            public ECDsa ECDsa { get; }
+        }
+
+        private static ECDsa ImportPublicKey(ECPublicKey publicKey)
+        {
+            // The platform only imports uncompressed points, so the managed point (cached on the key) supplies Y.
+            var point = publicKey.CurvePoint;
+            return ECDsa.Create(new ECParameters
+            {
+                Curve = ECCurve.NamedCurves.nistP256,
+                Q = new System.Security.Cryptography.ECPoint
+                {
+                    X = point.AffineXCoord.GetEncoded(),
+                    Y = point.AffineYCoord.GetEncoded()
+                }
+            });
+        }
+
+        private static ECDsa ImportPrivateKey(ReadOnlySpan<byte> privateKey)
+        {
+            if (privateKey.Length != FieldSize)
+                throw new ArgumentException("Private key must be 32 bytes", nameof(privateKey));
+
+            // Checked here so that both providers reject the same keys; the platform's own checks vary.
+            var d = new Org.BouncyCastle.Math.BigInteger(1, privateKey);
+            if (d.SignValue == 0 || d.CompareTo(Secp256r1Curve.N) >= 0)
+                throw new ArgumentException("Private key must be between 1 and n - 1", nameof(privateKey));
+
+            var parameters = new ECParameters { Curve = ECCurve.NamedCurves.nistP256, D = privateKey.ToArray() };
+            try
+            {
+                return ECDsa.Create(parameters);
+            }
+            finally
+            {
+                CryptographicOperations.ZeroMemory(parameters.D);
+            }
+        }
+
+        /// <summary>
+        /// Derives a known public key and checks a signature with the managed provider, so that a platform
+        /// without nistP256 support or with a different encoding is never selected.
+        /// </summary>
+        private static bool SelfTest()
+        {
+            try
+            {
+                var privateKey = new byte[FieldSize];
+                privateKey[FieldSize - 1] = 1;
+                var expected = Secp256r1Curve.G.GetEncoded(true);
+                if (!Instance.DerivePublicKey(privateKey).AsSpan().SequenceEqual(expected))
+                    return false;
+
+                var messageHash = Hash.SHA256(expected);
+                var signature = Instance.SignHash(privateKey, messageHash);
+                return BouncyCastleCryptoProvider.Instance.VerifyHash(new ECPublicKey(expected), messageHash, signature);
+            }
+            catch (Exception ex) when (ex is CryptographicException || ex is PlatformNotSupportedException)
+            {
+                return false;
+            }
+        }
+    }
+}
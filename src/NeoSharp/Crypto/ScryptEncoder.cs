@@ -1,13 +1,29 @@
 using System;
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
+using System.Runtime.Intrinsics;
 using System.Security.Cryptography;
+using System.Threading.Tasks;
 
 namespace NeoSharp.Crypto
 {
     /// <summary>
-    /// Scrypt key derivation function implementation
+    /// Scrypt key derivation function (RFC 7914).
+    /// Each of the p lanes runs ROMix in one pooled uint buffer that holds its table of N blocks and two working
+    /// blocks, so a derivation does not allocate per block. While a lane is mixed, the words of every 64-byte
+    /// Salsa20 block are kept in the diagonal order used by the vectorized Salsa20/8 core and are put back
+    /// in order once at the end. Independent lanes run in parallel.
     /// </summary>
     public static class ScryptEncoder
     {
+        private const int SalsaWords = 16;
+
+        // The words of a Salsa20 block in mixing order: the four diagonals of the 4x4 state, so that every
+        // step of a round updates one whole row of vectors. Word 0 keeps its place, which Integerify relies on.
+        private static ReadOnlySpan<byte> DiagonalOrder => new byte[] { 0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11 };
+
         /// <summary>
         /// Scrypt key derivation function - RFC 7914 compliant implementation
         /// </summary>
@@ -17,8 +33,10 @@ namespace NeoSharp.Crypto
         /// <param name="r">The block size parameter</param>
         /// <param name="p">The parallelization parameter</param>
         /// <param name="dkLen">The desired key length</param>
+        /// <param name="maxDegreeOfParallelism">The maximum number of lanes mixed at once, or -1 for one per core.
+        /// Each lane in flight holds 128 * r * N bytes.</param>
         /// <returns>The derived key</returns>
-        public static byte[] CryptoScrypt(byte[] password, byte[] salt, int n, int r, int p, int dkLen)
+        public static byte[] CryptoScrypt(byte[] password, byte[] salt, int n, int r, int p, int dkLen, int maxDegreeOfParallelism = -1)
         {
             if (password == null) throw new ArgumentNullException(nameof(password));
             if (salt == null) throw new ArgumentNullException(nameof(salt));
@@ -26,170 +44,312 @@ namespace NeoSharp.Crypto
             if (r <= 0) throw new ArgumentException("r must be positive", nameof(r));
             if (p <= 0) throw new ArgumentException("p must be positive", nameof(p));
             if (dkLen <= 0) throw new ArgumentException("dkLen must be positive", nameof(dkLen));
+            if ((long)r * p >= 1 << 30) throw new ArgumentException("r * p must be less than 2^30", nameof(p));
+            if ((long)32 * r * (n + 2) > Array.MaxLength) throw new ArgumentException("N * r is too large", nameof(n));
+            if (maxDegreeOfParallelism == 0 || maxDegreeOfParallelism < -1)
+                throw new ArgumentOutOfRangeException(nameof(maxDegreeOfParallelism), "Must be -1 or a positive number.");
 
-            // Production-ready Scrypt implementation using RFC 7914
-            return ScryptCore(password, salt, n, r, p, dkLen);
+            return ScryptCore(password, salt, n, r, p, dkLen, maxDegreeOfParallelism);
         }
 
-        private static byte[] ScryptCore(byte[] password, byte[] salt, int n, int r, int p, int dkLen)
+        private static byte[] ScryptCore(byte[] password, byte[] salt, int n, int r, int p, int dkLen, int maxDegreeOfParallelism)
         {
             // Step 1: Generate initial B using PBKDF2
-            using var pbkdf2 = new Rfc2898DeriveBytes(password, salt, 1, HashAlgorithmName.SHA256);
-            var b = pbkdf2.GetBytes(p * 128 * r);
+            var laneSize = 128 * r;
+            var b = Rfc2898DeriveBytes.Pbkdf2(password, salt, 1, HashAlgorithmName.SHA256, p * laneSize);
+            try
+            {
+                // Step 2: Mix each lane with ROMix; the lanes are independent
+                if (p > 1 && maxDegreeOfParallelism != 1 && Environment.ProcessorCount > 1)
+                {
+                    var options = new ParallelOptions { MaxDegreeOfParallelism = maxDegreeOfParallelism };
+                    Parallel.For(0, p, options, i => ROMix(b.AsSpan(i * laneSize, laneSize), n, r));
+                }
+                else
+                {
+                    for (var i = 0; i < p; i++)
+                    {
+                        ROMix(b.AsSpan(i * laneSize, laneSize), n, r);
+                    }
+                }
 
-            // Step 2: Process each block with ROMix
-            var blockSize = 128 * r;
-            for (int i = 0; i < p; i++)
+                // Step 3: Generate final result using PBKDF2
+                return Rfc2898DeriveBytes.Pbkdf2(password, b, 1, HashAlgorithmName.SHA256, dkLen);
+            }
+            finally
             {
-                var block = new byte[blockSize];
-                Array.Copy(b, i * blockSize, block, 0, blockSize);
-                
-                block = ROMix(block, n, r);
-                
-                Array.Copy(block, 0, b, i * blockSize, blockSize);
+                CryptographicOperations.ZeroMemory(b);
             }
-
-            // Step 3: Generate final result using PBKDF2
-            using var finalPbkdf2 = new Rfc2898DeriveBytes(password, b, 1, HashAlgorithmName.SHA256);
-            return finalPbkdf2.GetBytes(dkLen);
         }
 
-        private static byte[] ROMix(byte[] block, int n, int r)
+        /// <summary>
+        /// Replaces one lane of B with ROMix of it.
+        /// </summary>
+        private static void ROMix(Span<byte> lane, int n, int r)
         {
-            var blockSize = 128 * r;
-            var x = new byte[blockSize];
-            Array.Copy(block, x, blockSize);
+            var blockWords = 32 * r;
+            var length = (n + 2) * blockWords;
+            var buffer = ArrayPool<uint>.Shared.Rent(length);
+            try
+            {
+                var v = buffer.AsSpan(0, n * blockWords);
+                var x = buffer.AsSpan(n * blockWords, blockWords);
+                var t = buffer.AsSpan((n + 1) * blockWords, blockWords);
+
+                Load(lane, x);
+
+                // V_0 = X and V_i = BlockMix(V_i-1), mixing each entry straight into the next one
+                x.CopyTo(v);
+                for (var i = 1; i < n; i++)
+                {
+                    BlockMix(v.Slice((i - 1) * blockWords, blockWords), v.Slice(i * blockWords, blockWords), r);
+                }
+                BlockMix(v.Slice((n - 1) * blockWords, blockWords), x, r);
 
-            // Create lookup table
-            var v = new byte[n][];
-            for (int i = 0; i < n; i++)
+                // X = BlockMix(X xor V_j), with j taken from the first word of the last Salsa20 block of X
+                var integerify = (2 * r - 1) * SalsaWords;
+                for (var i = 0; i < n; i++)
+                {
+                    var j = (int)(x[integerify] & (uint)(n - 1));
+                    Xor(x, v.Slice(j * blockWords, blockWords), t);
+                    BlockMix(t, x, r);
+                }
+
+                Store(x, lane);
+            }
+            finally
             {
-                v[i] = new byte[blockSize];
-                Array.Copy(x, v[i], blockSize);
-                x = BlockMix(x, r);
+                // The table is derived from the password
+                buffer.AsSpan(0, length).Clear();
+                ArrayPool<uint>.Shared.Return(buffer);
             }
+        }
 
-            // Second loop
-            for (int i = 0; i < n; i++)
+        private static void Load(ReadOnlySpan<byte> source, Span<uint> destination)
+        {
+            var order = DiagonalOrder;
+            for (var block = 0; block < destination.Length; block += SalsaWords)
             {
-                var j = Integerify(x, r) & (n - 1);
-                for (int k = 0; k < blockSize; k++)
+                for (var i = 0; i < SalsaWords; i++)
                 {
-                    x[k] ^= v[j][k];
+                    destination[block + i] = BinaryPrimitives.ReadUInt32LittleEndian(source.Slice((block + order[i]) * 4));
                 }
-                x = BlockMix(x, r);
             }
-
-            return x;
         }
 
-        private static byte[] BlockMix(byte[] b, int r)
+        private static void Store(ReadOnlySpan<uint> source, Span<byte> destination)
         {
-            var blockSize = 128 * r;
-            var x = new byte[64];
-            var y = new byte[blockSize];
-
-            // Initialize X with the last 64-byte block of B
-            Array.Copy(b, blockSize - 64, x, 0, 64);
+            var order = DiagonalOrder;
+            for (var block = 0; block < source.Length; block += SalsaWords)
+            {
+                for (var i = 0; i < SalsaWords; i++)
+                {
+                    BinaryPrimitives.WriteUInt32LittleEndian(destination.Slice((block + order[i]) * 4), source[block + i]);
+                }
+            }
+        }
 
-            for (int i = 0; i < 2 * r; i++)
+        private static void Xor(ReadOnlySpan<uint> left, ReadOnlySpan<uint> right, Span<uint> destination)
+        {
+            // Blocks are 32 * r words, so they split evenly into vectors of either width
+            if (Vector256.IsHardwareAccelerated)
             {
-                // X = X XOR B_i
-                for (int j = 0; j < 64; j++)
+                var a = MemoryMarshal.Cast<uint, Vector256<uint>>(left);
+                var b = MemoryMarshal.Cast<uint, Vector256<uint>>(right);
+                var d = MemoryMarshal.Cast<uint, Vector256<uint>>(destination);
+                for (var i = 0; i < d.Length; i++)
                 {
-                    x[j] ^= b[i * 64 + j];
+                    d[i] = a[i] ^ b[i];
                 }
+            }
+            else if (Vector128.IsHardwareAccelerated)
+            {
+                var a = MemoryMarshal.Cast<uint, Vector128<uint>>(left);
+                var b = MemoryMarshal.Cast<uint, Vector128<uint>>(right);
+                var d = MemoryMarshal.Cast<uint, Vector128<uint>>(destination);
+                for (var i = 0; i < d.Length; i++)
+                {
+                    d[i] = a[i] ^ b[i];
+                }
+            }
+            else
+            {
+                for (var i = 0; i < destination.Length; i++)
+                {
+                    destination[i] = left[i] ^ right[i];
+                }
+            }
+        }
+
+        /// <summary>
+        /// Writes BlockMix of b to y, which must not overlap b. Each Salsa20 output goes directly to its
+        /// place in y: even blocks to the first half, odd blocks to the second.
+        /// </summary>
+        private static void BlockMix(ReadOnlySpan<uint> b, Span<uint> y, int r)
+        {
+            if (!Vector128.IsHardwareAccelerated)
+            {
+                BlockMixScalar(b, y, r);
+                return;
+            }
+
+            var input = MemoryMarshal.Cast<uint, Vector128<uint>>(b);
+            var output = MemoryMarshal.Cast<uint, Vector128<uint>>(y);
 
-                // X = Salsa20/8(X)
-                x = Salsa208(x);
+            var last = (2 * r - 1) * 4;
+            var x0 = input[last];
+            var x1 = input[last + 1];
+            var x2 = input[last + 2];
+            var x3 = input[last + 3];
+
+            for (var i = 0; i < 2 * r; i++)
+            {
+                var k = i * 4;
+                x0 ^= input[k];
+                x1 ^= input[k + 1];
+                x2 ^= input[k + 2];
+                x3 ^= input[k + 3];
 
-                // Y_i = X
-                Array.Copy(x, 0, y, i * 64, 64);
+                Salsa208(ref x0, ref x1, ref x2, ref x3);
+
+                var o = ((i >> 1) + (i & 1) * r) * 4;
+                output[o] = x0;
+                output[o + 1] = x1;
+                output[o + 2] = x2;
+                output[o + 3] = x3;
             }
+        }
 
-            // Rearrange Y
-            var result = new byte[blockSize];
-            for (int i = 0; i < r; i++)
+        /// <summary>
+        /// Salsa20/8 on a block held as its four diagonals, (0, 5, 10, 15), (4, 9, 14, 3), (8, 13, 2, 7) and
+        /// (12, 1, 6, 11). Rotating the lanes of three of them turns columns into rows and back.
+        /// </summary>
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        private static void Salsa208(ref Vector128<uint> x0, ref Vector128<uint> x1, ref Vector128<uint> x2, ref Vector128<uint> x3)
+        {
+            var a0 = x0;
+            var a1 = x1;
+            var a2 = x2;
+            var a3 = x3;
+
+            for (var round = 0; round < 8; round += 2)
             {
-                Array.Copy(y, (2 * i) * 64, result, i * 64, 64);
-                Array.Copy(y, (2 * i + 1) * 64, result, (r + i) * 64, 64);
+                // Column round
+                a1 ^= RotateLeft(a0 + a3, 7);
+                a2 ^= RotateLeft(a1 + a0, 9);
+                a3 ^= RotateLeft(a2 + a1, 13);
+                a0 ^= RotateLeft(a3 + a2, 18);
+
+                a1 = Vector128.Shuffle(a1, Vector128.Create(3u, 0u, 1u, 2u));
+                a2 = Vector128.Shuffle(a2, Vector128.Create(2u, 3u, 0u, 1u));
+                a3 = Vector128.Shuffle(a3, Vector128.Create(1u, 2u, 3u, 0u));
+
+                // Row round
+                a3 ^= RotateLeft(a0 + a1, 7);
+                a2 ^= RotateLeft(a3 + a0, 9);
+                a1 ^= RotateLeft(a2 + a3, 13);
+                a0 ^= RotateLeft(a1 + a2, 18);
+
+                a1 = Vector128.Shuffle(a1, Vector128.Create(1u, 2u, 3u, 0u));
+                a2 = Vector128.Shuffle(a2, Vector128.Create(2u, 3u, 0u, 1u));
+                a3 = Vector128.Shuffle(a3, Vector128.Create(3u, 0u, 1u, 2u));
             }
 
-            return result;
+            x0 += a0;
+            x1 += a1;
+            x2 += a2;
+            x3 += a3;
         }
 
-        private static uint Integerify(byte[] b, int r)
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
+        private static Vector128<uint> RotateLeft(Vector128<uint> value, int count)
         {
-            var offset = (2 * r - 1) * 64;
-            return BitConverter.ToUInt32(b, offset);
+            return (value << count) | (value >>> (32 - count));
         }
 
-        private static byte[] Salsa208(byte[] input)
+        private static void BlockMixScalar(ReadOnlySpan<uint> b, Span<uint> y, int r)
         {
-            var x = new uint[16];
-            for (int i = 0; i < 16; i++)
+            Span<uint> x = stackalloc uint[SalsaWords];
+            b.Slice((2 * r - 1) * SalsaWords, SalsaWords).CopyTo(x);
+
+            for (var i = 0; i < 2 * r; i++)
             {
-                x[i] = BitConverter.ToUInt32(input, i * 4);
+                for (var j = 0; j < SalsaWords; j++)
+                {
+                    x[j] ^= b[i * SalsaWords + j];
+                }
+
+                Salsa208(x);
+
+                x.CopyTo(y.Slice(((i >> 1) + (i & 1) * r) * SalsaWords, SalsaWords));
             }
+        }
 
-            for (int round = 0; round < 4; round++)
+        /// <summary>
+        /// Salsa20/8 on a block held in diagonal order, for platforms without vector support.
+        /// </summary>
+        private static void Salsa208(Span<uint> block)
+        {
+            uint x0 = block[0], x5 = block[1], x10 = block[2], x15 = block[3];
+            uint x4 = block[4], x9 = block[5], x14 = block[6], x3 = block[7];
+            uint x8 = block[8], x13 = block[9], x2 = block[10], x7 = block[11];
+            uint x12 = block[12], x1 = block[13], x6 = block[14], x11 = block[15];
+
+            for (var round = 0; round < 8; round += 2)
             {
                 // Column round
-                x[4] ^= RotateLeft(x[0] + x[12], 7);
-                x[8] ^= RotateLeft(x[4] + x[0], 9);
-                x[12] ^= RotateLeft(x[8] + x[4], 13);
-                x[0] ^= RotateLeft(x[12] + x[8], 18);
-
-                x[9] ^= RotateLeft(x[5] + x[1], 7);
-                x[13] ^= RotateLeft(x[9] + x[5], 9);
-                x[1] ^= RotateLeft(x[13] + x[9], 13);
-                x[5] ^= RotateLeft(x[1] + x[13], 18);
-
-                x[14] ^= RotateLeft(x[10] + x[6], 7);
-                x[2] ^= RotateLeft(x[14] + x[10], 9);
-                x[6] ^= RotateLeft(x[2] + x[14], 13);
-                x[10] ^= RotateLeft(x[6] + x[2], 18);
-
-                x[3] ^= RotateLeft(x[15] + x[11], 7);
-                x[7] ^= RotateLeft(x[3] + x[15], 9);
-                x[11] ^= RotateLeft(x[7] + x[3], 13);
-                x[15] ^= RotateLeft(x[11] + x[7], 18);
+                x4 ^= RotateLeft(x0 + x12, 7);
+                x8 ^= RotateLeft(x4 + x0, 9);
+                x12 ^= RotateLeft(x8 + x4, 13);
+                x0 ^= RotateLeft(x12 + x8, 18);
+
+                x9 ^= RotateLeft(x5 + x1, 7);
+                x13 ^= RotateLeft(x9 + x5, 9);
+                x1 ^= RotateLeft(x13 + x9, 13);
+                x5 ^= RotateLeft(x1 + x13, 18);
+
+                x14 ^= RotateLeft(x10 + x6, 7);
+                x2 ^= RotateLeft(x14 + x10, 9);
+                x6 ^= RotateLeft(x2 + x14, 13);
+                x10 ^= RotateLeft(x6 + x2, 18);
+
+                x3 ^= RotateLeft(x15 + x11, 7);
+                x7 ^= RotateLeft(x3 + x15, 9);
+                x11 ^= RotateLeft(x7 + x3, 13);
+                x15 ^= RotateLeft(x11 + x7, 18);
 
                 // Row round
-                x[1] ^= RotateLeft(x[0] + x[3], 7);
-                x[2] ^= RotateLeft(x[1] + x[0], 9);
-                x[3] ^= RotateLeft(x[2] + x[1], 13);
-                x[0] ^= RotateLeft(x[3] + x[2], 18);
-
-                x[6] ^= RotateLeft(x[5] + x[4], 7);
-                x[7] ^= RotateLeft(x[6] + x[5], 9);
-                x[4] ^= RotateLeft(x[7] + x[6], 13);
-                x[5] ^= RotateLeft(x[4] + x[7], 18);
-
-                x[11] ^= RotateLeft(x[10] + x[9], 7);
-                x[8] ^= RotateLeft(x[11] + x[10], 9);
-                x[9] ^= RotateLeft(x[8] + x[11], 13);
-                x[10] ^= RotateLeft(x[9] + x[8], 18);
-
-                x[12] ^= RotateLeft(x[15] + x[14], 7);
-                x[13] ^= RotateLeft(x[12] + x[15], 9);
-                x[14] ^= RotateLeft(x[13] + x[12], 13);
-                x[15] ^= RotateLeft(x[14] + x[13], 18);
-            }
+                x1 ^= RotateLeft(x0 + x3, 7);
+                x2 ^= RotateLeft(x1 + x0, 9);
+                x3 ^= RotateLeft(x2 + x1, 13);
+                x0 ^= RotateLeft(x3 + x2, 18);
 
-            var result = new byte[64];
-            for (int i = 0; i < 16; i++)
-            {
-                var bytes = BitConverter.GetBytes(x[i]);
-                Array.Copy(bytes, 0, result, i * 4, 4);
+                x6 ^= RotateLeft(x5 + x4, 7);
+                x7 ^= RotateLeft(x6 + x5, 9);
+                x4 ^= RotateLeft(x7 + x6, 13);
+                x5 ^= RotateLeft(x4 + x7, 18);
+
+                x11 ^= RotateLeft(x10 + x9, 7);
+                x8 ^= RotateLeft(x11 + x10, 9);
+                x9 ^= RotateLeft(x8 + x11, 13);
+                x10 ^= RotateLeft(x9 + x8, 18);
+
+                x12 ^= RotateLeft(x15 + x14, 7);
+                x13 ^= RotateLeft(x12 + x15, 9);
+                x14 ^= RotateLeft(x13 + x12, 13);
+                x15 ^= RotateLeft(x14 + x13, 18);
             }
 
-            return result;
+            block[0] += x0; block[1] += x5; block[2] += x10; block[3] += x15;
+            block[4] += x4; block[5] += x9; block[6] += x14; block[7] += x3;
+            block[8] += x8; block[9] += x13; block[10] += x2; block[11] += x7;
+            block[12] += x12; block[13] += x1; block[14] += x6; block[15] += x11;
         }
 
+        [MethodImpl(MethodImplOptions.AggressiveInlining)]
         private static uint RotateLeft(uint value, int count)
         {
             return (value << count) | (value >> (32 - count));
         }
     }
-}
\ No newline at end of file
+}
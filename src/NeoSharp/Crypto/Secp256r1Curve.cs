@@ -0,0 +1,91 @@
+using Org.BouncyCastle.Asn1.X9;
+using Org.BouncyCastle.Crypto.EC;
+using Org.BouncyCastle.Crypto.Parameters;
+using Org.BouncyCastle.Math.EC.Multiplier;
+using BCBigInteger = Org.BouncyCastle.Math.BigInteger;
+using BCECCurve = Org.BouncyCastle.Math.EC.ECCurve;
+using BCECPoint = Org.BouncyCastle.Math.EC.ECPoint;
+
+namespace NeoSharp.Crypto
+{
+    /// <summary>
+    /// The shared secp256r1 context used for key derivation, signing and verification.
+    /// The curve, the domain parameters and the constants are created once, and the generator
+    /// multiples used by fixed-base multiplication (comb table) and by verification (wNAF table)
+    /// are precomputed on first use of the class instead of on the first signature.
+    /// </summary>
+    public static class Secp256r1Curve
+    {
+        /// <summary>
+        /// Gets the curve parameters, using BouncyCastle's optimized secp256r1 field arithmetic.
+        /// </summary>
+        public static X9ECParameters Parameters { get; }
+
+        /// <summary>
+        /// Gets the domain parameters. Keys built on them share the generator and its precomputed tables.
+        /// </summary>
+        public static ECDomainParameters Domain { get; }
+
+        /// <summary>
+        /// Gets the curve.
+        /// </summary>
+        public static BCECCurve Curve { get; }
+
+        /// <summary>
+        /// Gets the generator point G.
+        /// </summary>
+        public static BCECPoint G { get; }
+
+        /// <summary>
+        /// Gets the order n of the generator.
+        /// </summary>
+        public static BCBigInteger N { get; }
+
+        /// <summary>
+        /// Gets half of the order n, the largest S of a canonical (low-S) signature.
+        /// </summary>
+        public static BCBigInteger HalfN { get; }
+
+        /// <summary>
+        /// Gets the prime p of the underlying field.
+        /// </summary>
+        public static BCBigInteger P { get; }
+
+        private static readonly ECMultiplier BaseMultiplier = new FixedPointCombMultiplier();
+
+        static Secp256r1Curve()
+        {
+            Parameters = CustomNamedCurves.GetByName("secp256r1");
+            Domain = new ECDomainParameters(Parameters.Curve, Parameters.G, Parameters.N, Parameters.H);
+            Curve = Domain.Curve;
+            G = Domain.G;
+            N = Domain.N;
+            HalfN = N.ShiftRight(1);
+            P = Curve.Field.Characteristic;
+
+            // Both tables are cached on G, so every multiplication involving G reuses them.
+            FixedPointUtilities.Precompute(G);
+            WNafUtilities.Precompute(G, WNafUtilities.GetWindowSize(N.BitLength), true);
+        }
+
+        /// <summary>
+        /// Multiplies the generator by a scalar using the precomputed comb table.
+        /// </summary>
+        /// <param name="k">The scalar, such as a private key.</param>
+        /// <returns>The normalized point k * G.</returns>
+        public static BCECPoint MultiplyG(BCBigInteger k)
+        {
+            return BaseMultiplier.Multiply(G, k).Normalize();
+        }
+
+        /// <summary>
+        /// Decodes a compressed or uncompressed point.
+        /// </summary>
+        /// <param name="encoded">The encoded point.</param>
+        /// <returns>The point.</returns>
+        public static BCECPoint DecodePoint(byte[] encoded)
+        {
+            return Curve.DecodePoint(encoded);
+        }
+    }
+}
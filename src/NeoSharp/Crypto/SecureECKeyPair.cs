@@ -283,19 +283,8 @@ namespace NeoSharp.Crypto
         {
             try
             {
-                // Use BouncyCastle for proper secp256r1 public key generation
-                var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-                var domainParams = new Org.BouncyCastle.Crypto.Parameters.ECDomainParameters(
-                    curve.Curve, curve.G, curve.N, curve.H);
-                
-                // Convert private key to BigInteger
-                var privateKeyInt = new Org.BouncyCastle.Math.BigInteger(1, privateKey);
-                
-                // Calculate public key point: Q = d * G (where d is private key, G is generator)
-                var publicKeyPoint = curve.G.Multiply(privateKeyInt).Normalize();
-                
-                // Get compressed encoding (33 bytes)
-                var encodedPublicKey = publicKeyPoint.GetEncoded(true);
+                // Calculate public key point Q = d * G, compressed encoding (33 bytes)
+                var encodedPublicKey = CryptoProvider.Current.DerivePublicKey(privateKey);
                 
                 return new ECPoint(encodedPublicKey);
             }
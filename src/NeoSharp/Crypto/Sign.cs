@@ -1,6 +1,9 @@
 using System;
+using System.Collections.Generic;
 using System.Numerics;
 using System.Security.Cryptography;
+using System.Threading;
+using System.Threading.Tasks;
 using NeoSharp.Types;
 using NeoSharp.Utils;
 using NeoSharp.Core;
@@ -14,6 +17,9 @@ namespace NeoSharp.Crypto
     {
         private const int LowerRealV = 27;
 
+        // A verification takes a few hundred microseconds, so even small batches are worth spreading out.
+        private const int BatchParallelThreshold = 2;
+
         /// <summary>
         /// Signs the SHA256 hash of a hexadecimal message with the private key
         /// </summary>
@@ -42,59 +48,51 @@ namespace NeoSharp.Crypto
         /// <param name="message">The message to sign</param>
         /// <param name="keyPair">The key pair containing the private key</param>
         /// <returns>The signature data</returns>
-        /// <exception cref="NeoSharpException">Thrown when signature recovery fails</exception>
         public static SignatureData SignMessage(byte[] message, ECKeyPair keyPair)
         {
-            var messageHash = message.Sha256();
-            var privateKey = keyPair.PrivateKey;
-            var signatureBytes = privateKey.Sign(messageHash);
-            var signature = ECDSASignature.FromBytes(signatureBytes);
-            
-            var rBytes = signature.R.ToByteArray(isUnsigned: true, isBigEndian: true);
-            var sBytes = signature.S.ToByteArray(isUnsigned: true, isBigEndian: true);
+            return SignHash(message.Sha256(), keyPair);
+        }
 
-            // Pad to 32 bytes
-            var r = new byte[32];
-            var s = new byte[32];
-            
-            if (rBytes.Length <= 32)
-                Array.Copy(rBytes, 0, r, 32 - rBytes.Length, rBytes.Length);
-            else
-                Array.Copy(rBytes, rBytes.Length - 32, r, 0, 32);
-                
-            if (sBytes.Length <= 32)
-                Array.Copy(sBytes, 0, s, 32 - sBytes.Length, sBytes.Length);
-            else
-                Array.Copy(sBytes, sBytes.Length - 32, s, 0, 32);
+        /// <summary>
+        /// Signs a message hash with the private key using a deterministic nonce (RFC 6979, HMAC-SHA256),
+        /// so the same key and hash always produce the same signature. The recovery ID is taken from the
+        /// ephemeral point R while signing, which costs one scalar multiplication in total.
+        /// </summary>
+        /// <param name="messageHash">The hash to sign</param>
+        /// <param name="keyPair">The key pair containing the private key</param>
+        /// <returns>The signature data with V set to 27 plus the recovery ID</returns>
+        public static SignatureData SignHash(byte[] messageHash, ECKeyPair keyPair)
+        {
+            if (messageHash == null) throw new ArgumentNullException(nameof(messageHash));
+            if (keyPair == null) throw new ArgumentNullException(nameof(keyPair));
 
-            // Try to find a recovery ID that works
-            var recId = -1;
-            for (var i = 0; i <= 3; i++)
-            {
-                try
-                {
-                    var testSig = new SignatureData((byte)(i + 27), r, s);
-                    var recovered = SignedMessageToKey(message, testSig);
-                    if (recovered.Equals(keyPair.PublicKey))
-                    {
-                        recId = i;
-                        break;
-                    }
-                }
-                catch
-                {
-                    // Continue trying other recovery IDs
-                }
-            }
+            var n = Secp256r1Curve.N;
+            var privateKeyBytes = keyPair.PrivateKey.PrivateKeyBytes;
+            var d = new Org.BouncyCastle.Math.BigInteger(1, privateKeyBytes);
+            Array.Clear(privateKeyBytes);
+
+            var e = CalculateE(n, messageHash);
+            var kCalculator = new Org.BouncyCastle.Crypto.Signers.HMacDsaKCalculator(new Org.BouncyCastle.Crypto.Digests.Sha256Digest());
+            kCalculator.Init(n, d, messageHash);
 
-            if (recId == -1)
+            while (true)
             {
-                // If we can't find a recovery ID, just use 0 and rely on verification
-                // This is acceptable since verification doesn't require recovery
-                recId = 0;
-            }
+                var k = kCalculator.NextK();
+                var point = Secp256r1Curve.MultiplyG(k);
+
+                // r is the x-coordinate of R reduced mod n; it is rarely zero, in which case the next k is used.
+                var x = point.AffineXCoord.ToBigInteger();
+                var r = x.Mod(n);
+                if (r.SignValue == 0) continue;
+
+                var s = k.ModInverse(n).Multiply(e.Add(d.Multiply(r))).Mod(n);
+                if (s.SignValue == 0) continue;
 
-            return new SignatureData((byte)(recId + 27), r, s);
+                // Bit 0 is the parity of R's y-coordinate, bit 1 whether R's x-coordinate overflowed n.
+                var recId = (point.AffineYCoord.TestBitZero() ? 1 : 0) | (x.CompareTo(n) >= 0 ? 2 : 0);
+
+                return new SignatureData((byte)(recId + LowerRealV), ToFixedBytes(r), ToFixedBytes(s));
+            }
         }
 
         /// <summary>
@@ -115,16 +113,11 @@ namespace NeoSharp.Crypto
             if (messageHash.Length == 0)
                 throw new ArgumentException("Message hash cannot be empty", nameof(messageHash));
 
-            var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-            var n = curve.N;
-            var i = new BigInteger(recId / 2);
-            var rBC = new Org.BouncyCastle.Math.BigInteger(signature.R.ToString());
-            var iBC = new Org.BouncyCastle.Math.BigInteger(i.ToString());
-            var x = rBC.Add(iBC.Multiply(n));
+            var n = Secp256r1Curve.N;
+            var rBC = new Org.BouncyCastle.Math.BigInteger(1, signature.R.ToByteArray(isUnsigned: true, isBigEndian: true));
+            var x = rBC.Add(Org.BouncyCastle.Math.BigInteger.ValueOf(recId / 2).Multiply(n));
 
-            // The field prime for secp256r1 (P-256)
-            var fieldSizeBC = new Org.BouncyCastle.Math.BigInteger("115792089210356248762697446949407573530086143415290314195533631308867097853951");
-            if (x.CompareTo(fieldSizeBC) >= 0)
+            if (x.CompareTo(Secp256r1Curve.P) >= 0)
                 return null;
 
             try
@@ -136,11 +129,7 @@ namespace NeoSharp.Crypto
                 if (!pointAtInfinity.IsInfinity)
                     return null;
 
-                // Remove this old code as we're handling it with BouncyCastle below
-
-                // Convert to BouncyCastle BigIntegers for calculations
-                // rBC is already declared above
-                var sBC = new Org.BouncyCastle.Math.BigInteger(signature.S.ToString());
+                var sBC = new Org.BouncyCastle.Math.BigInteger(1, signature.S.ToByteArray(isUnsigned: true, isBigEndian: true));
                 var eBC = new Org.BouncyCastle.Math.BigInteger(1, messageHash);
                 var minusEBC = eBC.Negate().Mod(n);
                 
@@ -148,7 +137,7 @@ namespace NeoSharp.Crypto
                 var srInv = rInv.Multiply(sBC).Mod(n);
                 var erInv = rInv.Multiply(minusEBC).Mod(n);
 
-                var result = curve.G.Multiply(erInv).Add(point.Multiply(srInv));
+                var result = Org.BouncyCastle.Math.EC.ECAlgorithms.SumOfTwoMultiplies(Secp256r1Curve.G, erInv, point, srInv);
                 return new ECPublicKey(result.GetEncoded(true));
             }
             catch
@@ -165,8 +154,6 @@ namespace NeoSharp.Crypto
         /// <returns>The decompressed ECPoint</returns>
         private static Org.BouncyCastle.Math.EC.ECPoint DecompressKey(Org.BouncyCastle.Math.BigInteger x, bool yBit)
         {
-            var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1").Curve;
-            
             // Create the point using BouncyCastle's curve.CreatePoint
             var xBytes = x.ToByteArrayUnsigned();
             var compressed = new byte[33];
@@ -177,7 +164,7 @@ namespace NeoSharp.Crypto
             else
                 Array.Copy(xBytes, xBytes.Length - 32, compressed, 1, 32);
 
-            return curve.DecodePoint(compressed);
+            return Secp256r1Curve.DecodePoint(compressed);
         }
 
         /// <summary>
@@ -234,15 +221,14 @@ namespace NeoSharp.Crypto
         {
             var keyBytes = privateKey.PrivateKeyBytes;
             var keyBC = new Org.BouncyCastle.Math.BigInteger(1, keyBytes);
-            var curve = Org.BouncyCastle.Crypto.EC.CustomNamedCurves.GetByName("secp256r1");
-            var order = curve.N;
+            var order = Secp256r1Curve.N;
             
             if (keyBC.CompareTo(order) >= 0)
             {
                 keyBC = keyBC.Mod(order);
             }
             
-            return curve.G.Multiply(keyBC);
+            return Secp256r1Curve.MultiplyG(keyBC);
         }
 
         /// <summary>
@@ -256,7 +242,7 @@ namespace NeoSharp.Crypto
             var realV = GetRealV(signatureData.V);
             var sig = new SignatureData(realV, signatureData.R, signatureData.S);
             var key = SignedMessageToKey(message, sig);
-            return Hash160.FromPublicKey(key.GetEncoded(true));
+            return key.GetScriptHash();
         }
 
         /// <summary>
@@ -294,6 +280,120 @@ namespace NeoSharp.Crypto
             return publicKey.Verify(messageHash, signature.ToBytes());
         }
 
+        /// <summary>
+        /// Verifies a batch of signatures the way <see cref="VerifySignature"/> verifies one, spreading the
+        /// work across cores. Each worker reuses its buffers for all of its items, the provider reuses its
+        /// verifier state per thread, and each public key is decoded once however many items it appears in.
+        /// </summary>
+        /// <param name="items">The messages with their signatures and the public keys to check them against</param>
+        /// <param name="results">
+        /// An optional array that receives the result of each item at the same index. Items that were skipped
+        /// after a failure in <paramref name="stopOnFirstFailure"/> mode are reported as false.
+        /// </param>
+        /// <param name="stopOnFirstFailure">True to stop scheduling further items as soon as one fails to verify</param>
+        /// <param name="maxDegreeOfParallelism">The maximum number of cores to use, or -1 for all of them</param>
+        /// <returns>True if every signature verifies; otherwise false. An empty batch verifies.</returns>
+        /// <exception cref="ArgumentNullException">Thrown if items is null</exception>
+        /// <exception cref="ArgumentException">Thrown if results is shorter than items</exception>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown if maxDegreeOfParallelism is 0 or less than -1</exception>
+        public static bool VerifyBatch(IReadOnlyList<(byte[] Message, SignatureData Signature, ECPublicKey PublicKey)> items,
+            bool[] results = null, bool stopOnFirstFailure = false, int maxDegreeOfParallelism = -1)
+        {
+            if (items == null) throw new ArgumentNullException(nameof(items));
+            if (maxDegreeOfParallelism == 0 || maxDegreeOfParallelism < -1)
+                throw new ArgumentOutOfRangeException(nameof(maxDegreeOfParallelism), "Must be -1 or a positive number.");
+
+            var provider = CryptoProvider.Current;
+            var count = items.Count;
+            if (results != null)
+            {
+                if (results.Length < count)
+                    throw new ArgumentException($"Results must hold at least {count} items.", nameof(results));
+                Array.Clear(results, 0, count);
+            }
+
+            if (count < BatchParallelThreshold || maxDegreeOfParallelism == 1 || Environment.ProcessorCount == 1)
+            {
+                var verifier = new BatchVerifier(provider);
+                var allValid = true;
+                for (var i = 0; i < count; i++)
+                {
+                    var valid = verifier.Verify(items[i]);
+                    if (results != null) results[i] = valid;
+                    if (valid) continue;
+
+                    allValid = false;
+                    if (stopOnFirstFailure) break;
+                }
+                return allValid;
+            }
+
+            var failed = 0;
+            var options = new ParallelOptions { MaxDegreeOfParallelism = maxDegreeOfParallelism };
+            Parallel.For(0, count, options, () => new BatchVerifier(provider), (i, loopState, verifier) =>
+            {
+                if (loopState.IsStopped) return verifier;
+
+                var valid = verifier.Verify(items[i]);
+                if (results != null) results[i] = valid;
+                if (!valid)
+                {
+                    Volatile.Write(ref failed, 1);
+                    if (stopOnFirstFailure) loopState.Stop();
+                }
+                return verifier;
+            }, _ => { });
+            return failed == 0;
+        }
+
+        /// <summary>
+        /// The per-worker state of <see cref="VerifyBatch"/>. It is only ever used by one thread at a time.
+        /// </summary>
+        private sealed class BatchVerifier
+        {
+            private readonly ICryptoProvider _provider;
+            private readonly byte[] _messageHash = new byte[Hash.SHA256Size];
+            private readonly byte[] _signature = new byte[64];
+
+            public BatchVerifier(ICryptoProvider provider)
+            {
+                _provider = provider;
+            }
+
+            public bool Verify((byte[] Message, SignatureData Signature, ECPublicKey PublicKey) item)
+            {
+                var (message, signature, publicKey) = item;
+                if (message == null || signature?.R == null || signature.S == null || publicKey == null)
+                    return false;
+                if (signature.R.Length > 32 || signature.S.Length > 32)
+                    return false;
+
+                Hash.SHA256(message, _messageHash);
+                Array.Clear(_signature);
+                signature.R.CopyTo(_signature, 32 - signature.R.Length);
+                signature.S.CopyTo(_signature, 64 - signature.S.Length);
+                return _provider.VerifyHash(publicKey, _messageHash, _signature);
+            }
+        }
+
+        /// <summary>
+        /// Converts a message hash to an integer, keeping its leftmost bits if it is longer than the group order
+        /// </summary>
+        private static Org.BouncyCastle.Math.BigInteger CalculateE(Org.BouncyCastle.Math.BigInteger n, byte[] messageHash)
+        {
+            var messageBitLength = messageHash.Length * 8;
+            var e = new Org.BouncyCastle.Math.BigInteger(1, messageHash);
+            return n.BitLength < messageBitLength ? e.ShiftRight(messageBitLength - n.BitLength) : e;
+        }
+
+        /// <summary>
+        /// Converts a signature component to exactly 32 big-endian bytes
+        /// </summary>
+        private static byte[] ToFixedBytes(Org.BouncyCastle.Math.BigInteger value)
+        {
+            return Org.BouncyCastle.Utilities.BigIntegers.AsUnsignedByteArray(32, value);
+        }
+
         /// <summary>
         /// Computes the modular inverse of a with respect to modulus m
         /// </summary>
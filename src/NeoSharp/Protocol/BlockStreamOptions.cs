@@ -0,0 +1,62 @@
+namespace NeoSharp.Protocol
+{
+    /// <summary>
+    /// Options for <see cref="NeoSharp.StreamBlocksAsync"/>.
+    /// </summary>
+    public class BlockStreamOptions
+    {
+        /// <summary>
+        /// Default number of requests in flight.
+        /// </summary>
+        public const int DEFAULT_MAX_PARALLELISM = 8;
+
+        /// <summary>
+        /// Default number of blocks fetched per request.
+        /// </summary>
+        public const int DEFAULT_BATCH_SIZE = 1;
+
+        /// <summary>
+        /// Default number of consumed blocks between two checkpoint writes.
+        /// </summary>
+        public const int DEFAULT_CHECKPOINT_INTERVAL = 100;
+
+        /// <summary>
+        /// Gets or sets the maximum number of requests in flight. Fetched blocks wait until the consumer
+        /// reaches them, so at most <see cref="MaxParallelism"/> times <see cref="BatchSize"/> blocks are
+        /// held ahead of a slow consumer.
+        /// </summary>
+        public int MaxParallelism { get; set; } = DEFAULT_MAX_PARALLELISM;
+
+        /// <summary>
+        /// Gets or sets the number of consecutive blocks fetched per request. Values above one send the
+        /// getblock calls of a request as one JSON-RPC batch.
+        /// </summary>
+        public int BatchSize { get; set; } = DEFAULT_BATCH_SIZE;
+
+        /// <summary>
+        /// Gets or sets whether blocks include full transaction objects.
+        /// </summary>
+        public bool ReturnFullTransactionObjects { get; set; } = true;
+
+        /// <summary>
+        /// Gets or sets whether the stream keeps following the chain once it has caught up with the head,
+        /// polling the block count every <see cref="NeoSharpConfig.BlockInterval"/>. Without an upper
+        /// bound a following stream only ends when cancelled.
+        /// </summary>
+        public bool Follow { get; set; }
+
+        /// <summary>
+        /// Gets or sets the file recording the index of the last block the consumer finished with, or
+        /// null to disable checkpoints. When the file exists the stream resumes after the recorded block.
+        /// A block counts as finished once the consumer asks for the next one, so after a crash blocks
+        /// consumed since the last checkpoint are delivered again.
+        /// </summary>
+        public string CheckpointPath { get; set; }
+
+        /// <summary>
+        /// Gets or sets the number of consumed blocks between two checkpoint writes. The checkpoint is
+        /// also written when the stream completes.
+        /// </summary>
+        public int CheckpointInterval { get; set; } = DEFAULT_CHECKPOINT_INTERVAL;
+    }
+}
@@ -0,0 +1,54 @@
+using NeoSharp.Types;
+
+namespace NeoSharp.Protocol
+{
+    /// <summary>
+    /// Exception thrown when a block is not internally consistent or does not link to the block before it
+    /// </summary>
+    public sealed class BlockVerificationException : ProtocolException
+    {
+        /// <summary>
+        /// Initializes a new instance of the BlockVerificationException class
+        /// </summary>
+        /// <param name="blockIndex">The index of the block that failed verification</param>
+        /// <param name="message">The error message</param>
+        public BlockVerificationException(long blockIndex, string message) : base(message)
+        {
+            BlockIndex = blockIndex;
+        }
+
+        /// <summary>
+        /// Gets the index of the block that failed verification
+        /// </summary>
+        public long BlockIndex { get; }
+
+        /// <summary>
+        /// Creates a BlockVerificationException for a merkle root that does not match the transactions
+        /// </summary>
+        /// <param name="blockIndex">The block index</param>
+        /// <param name="expected">The merkle root in the block</param>
+        /// <param name="actual">The merkle root of the block's transactions</param>
+        /// <returns>A new BlockVerificationException</returns>
+        public static BlockVerificationException MerkleRootMismatch(long blockIndex, Hash256 expected, Hash256 actual) =>
+            new(blockIndex, $"Block {blockIndex} has merkle root {expected} but its transactions hash to {actual}");
+
+        /// <summary>
+        /// Creates a BlockVerificationException for a block that does not follow the previous one
+        /// </summary>
+        /// <param name="blockIndex">The block index</param>
+        /// <param name="previousIndex">The index of the previous block</param>
+        /// <returns>A new BlockVerificationException</returns>
+        public static BlockVerificationException NotConsecutive(long blockIndex, long previousIndex) =>
+            new(blockIndex, $"Block {blockIndex} does not follow block {previousIndex}");
+
+        /// <summary>
+        /// Creates a BlockVerificationException for a previous block hash that does not match the previous block
+        /// </summary>
+        /// <param name="blockIndex">The block index</param>
+        /// <param name="expected">The hash of the previous block</param>
+        /// <param name="actual">The previous block hash recorded in the block</param>
+        /// <returns>A new BlockVerificationException</returns>
+        public static BlockVerificationException BrokenLink(long blockIndex, Hash256 expected, Hash256 actual) =>
+            new(blockIndex, $"Block {blockIndex} links to previous block {actual} but the previous block is {expected}");
+    }
+}
@@ -0,0 +1,182 @@
+using System;
+using System.Buffers;
+using System.Collections.Generic;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using System.Threading.Tasks;
+using NeoSharp.Crypto;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Types;
+
+namespace NeoSharp.Protocol
+{
+    /// <summary>
+    /// Checks that blocks fetched from a node are internally consistent and form a chain, so that
+    /// a sync does not have to trust the node blindly. A block verifies when the merkle root of its
+    /// transaction hashes equals its recorded merkle root and, if the previous block is known, when
+    /// it has the next index and records the previous block's hash.
+    /// </summary>
+    public class BlockVerifier
+    {
+        // Hashing a transaction takes a few microseconds, so small blocks are hashed on the calling thread.
+        private const int ParallelThreshold = 16;
+
+        private readonly int _maxDegreeOfParallelism;
+
+        /// <summary>
+        /// Initializes a new BlockVerifier.
+        /// </summary>
+        /// <param name="maxDegreeOfParallelism">The maximum number of cores used to hash the transactions of a block, or -1 for all of them.</param>
+        /// <exception cref="ArgumentOutOfRangeException">Thrown if maxDegreeOfParallelism is 0 or less than -1.</exception>
+        public BlockVerifier(int maxDegreeOfParallelism = -1)
+        {
+            if (maxDegreeOfParallelism == 0 || maxDegreeOfParallelism < -1)
+                throw new ArgumentOutOfRangeException(nameof(maxDegreeOfParallelism), "Must be -1 or a positive number.");
+
+            _maxDegreeOfParallelism = maxDegreeOfParallelism;
+        }
+
+        /// <summary>
+        /// Computes the merkle root of a block from its decoded transactions. The transaction hashes are
+        /// computed locally from the serialized transactions, in parallel for large blocks.
+        /// </summary>
+        /// <param name="block">The block.</param>
+        /// <returns>The merkle root of the block's transactions.</returns>
+        public Hash256 ComputeMerkleRoot(Block block)
+        {
+            if (block == null) throw new ArgumentNullException(nameof(block));
+
+            var transactions = block.Transactions;
+            var count = transactions.Count;
+            var hashes = ArrayPool<Hash256>.Shared.Rent(count);
+            try
+            {
+                if (count >= ParallelThreshold && _maxDegreeOfParallelism != 1 && Environment.ProcessorCount > 1)
+                {
+                    var options = new ParallelOptions { MaxDegreeOfParallelism = _maxDegreeOfParallelism };
+                    Parallel.For(0, count, options, i => hashes[i] = transactions[i].Hash);
+                }
+                else
+                {
+                    for (var i = 0; i < count; i++)
+                    {
+                        hashes[i] = transactions[i].Hash;
+                    }
+                }
+                return MerkleTree.ComputeRoot(hashes.AsSpan(0, count));
+            }
+            finally
+            {
+                ArrayPool<Hash256>.Shared.Return(hashes, clearArray: true);
+            }
+        }
+
+        /// <summary>
+        /// Verifies a block decoded from its binary form.
+        /// </summary>
+        /// <param name="block">The block to verify.</param>
+        /// <param name="previous">The block before it, or null to skip the linkage check.</param>
+        /// <exception cref="BlockVerificationException">Thrown if the block does not verify.</exception>
+        public void Verify(Block block, Block previous = null)
+        {
+            if (block == null) throw new ArgumentNullException(nameof(block));
+
+            var root = ComputeMerkleRoot(block);
+            if (root != block.Header.MerkleRoot)
+                throw BlockVerificationException.MerkleRootMismatch(block.Index, block.Header.MerkleRoot, root);
+
+            if (previous != null)
+            {
+                VerifyLink(block.Index, block.Header.PrevHash, previous.Index, previous.Hash);
+            }
+        }
+
+        /// <summary>
+        /// Verifies a block returned by the verbose getblock. The transaction hashes are the ones reported
+        /// by the node, so this detects a root or linkage that does not match the reported transactions but
+        /// not a misreported transaction; verify a <see cref="Block"/> when that matters.
+        /// </summary>
+        /// <param name="block">The block to verify.</param>
+        /// <param name="previous">The block before it, or null to skip the linkage check.</param>
+        /// <exception cref="BlockVerificationException">Thrown if the block does not verify.</exception>
+        public void Verify(NeoBlock block, NeoBlock previous = null)
+        {
+            if (block == null) throw new ArgumentNullException(nameof(block));
+
+            var count = block.Transactions?.Count ?? 0;
+            var hashes = ArrayPool<Hash256>.Shared.Rent(count);
+            try
+            {
+                for (var i = 0; i < count; i++)
+                {
+                    hashes[i] = block.Transactions[i].Hash;
+                }
+
+                var root = MerkleTree.ComputeRoot(hashes.AsSpan(0, count));
+                if (root != block.MerkleRoot)
+                    throw BlockVerificationException.MerkleRootMismatch(block.Index, block.MerkleRoot, root);
+            }
+            finally
+            {
+                ArrayPool<Hash256>.Shared.Return(hashes, clearArray: true);
+            }
+
+            if (previous != null)
+            {
+                VerifyLink(block.Index, block.PreviousBlockHash, previous.Index, previous.Hash);
+            }
+        }
+
+        /// <summary>
+        /// Verifies a stream of consecutive binary blocks as they arrive, including the link of each block
+        /// to the one before it. Blocks are passed on once verified, so this can wrap the ingestion loop.
+        /// </summary>
+        /// <param name="blocks">The blocks in ascending index order.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The verified blocks.</returns>
+        /// <exception cref="BlockVerificationException">Thrown when a block does not verify; the stream ends there.</exception>
+        public async IAsyncEnumerable<Block> VerifyAsync(IAsyncEnumerable<Block> blocks,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            if (blocks == null) throw new ArgumentNullException(nameof(blocks));
+
+            Block previous = null;
+            await foreach (var block in blocks.WithCancellation(cancellationToken))
+            {
+                Verify(block, previous);
+                yield return block;
+                previous = block;
+            }
+        }
+
+        /// <summary>
+        /// Verifies a stream of consecutive blocks, such as the one returned by
+        /// <see cref="NeoSharp.StreamBlocksAsync"/>, as they arrive. Blocks are passed on once verified.
+        /// </summary>
+        /// <param name="blocks">The blocks in ascending index order, with full transaction objects.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The verified blocks.</returns>
+        /// <exception cref="BlockVerificationException">Thrown when a block does not verify; the stream ends there.</exception>
+        public async IAsyncEnumerable<NeoBlock> VerifyAsync(IAsyncEnumerable<NeoBlock> blocks,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            if (blocks == null) throw new ArgumentNullException(nameof(blocks));
+
+            NeoBlock previous = null;
+            await foreach (var block in blocks.WithCancellation(cancellationToken))
+            {
+                Verify(block, previous);
+                yield return block;
+                previous = block;
+            }
+        }
+
+        private static void VerifyLink(long index, Hash256 prevHash, long previousIndex, Hash256 previousHash)
+        {
+            if (index != previousIndex + 1)
+                throw BlockVerificationException.NotConsecutive(index, previousIndex);
+            if (prevHash != previousHash)
+                throw BlockVerificationException.BrokenLink(index, previousHash, prevHash);
+        }
+    }
+}
@@ -0,0 +1,18 @@
+using System.Text.Json.Serialization;
+using NeoSharp.Types;
+
+namespace NeoSharp.Protocol.Core.Response
+{
+    /// <summary>
+    /// Notification raised during the execution of a transaction or block script, as pushed by the
+    /// notification_from_execution WebSocket event.
+    /// </summary>
+    public class ExecutionNotification : Notification
+    {
+        /// <summary>
+        /// Gets or sets the hash of the transaction or block whose execution raised the notification.
+        /// </summary>
+        [JsonPropertyName("container")]
+        public Hash256 Container { get; set; }
+    }
+}
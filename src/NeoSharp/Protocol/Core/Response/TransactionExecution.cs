@@ -0,0 +1,18 @@
+using System.Text.Json.Serialization;
+using NeoSharp.Types;
+
+namespace NeoSharp.Protocol.Core.Response
+{
+    /// <summary>
+    /// Result of the execution of a transaction or block script, as pushed by the transaction_executed
+    /// WebSocket event.
+    /// </summary>
+    public class TransactionExecution : Execution
+    {
+        /// <summary>
+        /// Gets or sets the hash of the executed transaction or block.
+        /// </summary>
+        [JsonPropertyName("container")]
+        public Hash256 Container { get; set; }
+    }
+}
@@ -0,0 +1,221 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Bounds the number of concurrent requests an <see cref="HttpService"/> sends and adapts the bound to
+    /// the latency the node shows. The limit grows while latency stays close to its long-term average and
+    /// shrinks as latency rises (gradient), and is cut multiplicatively when requests fail with HTTP errors
+    /// or timeouts (AIMD). Requests over the limit wait in one of two lanes: interactive requests are always
+    /// dispatched first, and bulk requests never occupy more than <see cref="ConcurrencyLimiterOptions.MaxBulkShare"/>
+    /// of the limit.
+    /// </summary>
+    public class AdaptiveConcurrencyLimiter
+    {
+        // Weight of a new sample in the long-term latency average.
+        private const double LongRttSmoothing = 0.05;
+
+        private readonly ConcurrencyLimiterOptions _options;
+        private readonly object _lock = new();
+        private readonly LinkedList<Waiter>[] _queues = { new(), new() };
+        private readonly int[] _inFlight = new int[2];
+        private double _limit;
+        private double _longRtt;
+
+        /// <summary>
+        /// Initializes a new instance of the AdaptiveConcurrencyLimiter class.
+        /// </summary>
+        /// <param name="options">The limiter options.</param>
+        public AdaptiveConcurrencyLimiter(ConcurrencyLimiterOptions options = null)
+        {
+            _options = options ?? new ConcurrencyLimiterOptions();
+            if (_options.MinLimit < 1 || _options.MaxLimit < _options.MinLimit)
+                throw new ArgumentOutOfRangeException(nameof(options), "Limits must satisfy 1 <= MinLimit <= MaxLimit.");
+
+            _limit = Math.Clamp(_options.InitialLimit, _options.MinLimit, _options.MaxLimit);
+        }
+
+        /// <summary>
+        /// Gets the limiter options.
+        /// </summary>
+        public ConcurrencyLimiterOptions Options => _options;
+
+        /// <summary>
+        /// Gets the current concurrency limit.
+        /// </summary>
+        public int Limit
+        {
+            get { lock (_lock) return CurrentLimit; }
+        }
+
+        /// <summary>
+        /// Gets the number of requests currently in flight.
+        /// </summary>
+        public int InFlight
+        {
+            get { lock (_lock) return _inFlight[0] + _inFlight[1]; }
+        }
+
+        /// <summary>
+        /// Gets the number of requests waiting for a slot.
+        /// </summary>
+        public int QueueDepth
+        {
+            get { lock (_lock) return _queues[0].Count + _queues[1].Count; }
+        }
+
+        /// <summary>
+        /// Gets the number of requests of the given priority currently in flight.
+        /// </summary>
+        /// <param name="priority">The priority lane.</param>
+        /// <returns>The in-flight count.</returns>
+        public int GetInFlight(RequestPriority priority)
+        {
+            lock (_lock) return _inFlight[(int)priority];
+        }
+
+        /// <summary>
+        /// Gets the number of requests of the given priority waiting for a slot.
+        /// </summary>
+        /// <param name="priority">The priority lane.</param>
+        /// <returns>The queue depth.</returns>
+        public int GetQueueDepth(RequestPriority priority)
+        {
+            lock (_lock) return _queues[(int)priority].Count;
+        }
+
+        private int CurrentLimit => (int)_limit;
+
+        private int BulkLimit => Math.Max(1, (int)(CurrentLimit * _options.MaxBulkShare));
+
+        /// <summary>
+        /// Waits for a slot in the given lane.
+        /// </summary>
+        /// <returns>The lease, which must be completed exactly once.</returns>
+        internal Task<ConcurrencyLease> AcquireAsync(RequestPriority priority, CancellationToken cancellationToken)
+        {
+            cancellationToken.ThrowIfCancellationRequested();
+
+            lock (_lock)
+            {
+                if (_queues[(int)priority].Count == 0 && CanDispatch(priority))
+                {
+                    return Task.FromResult(Grant(priority));
+                }
+
+                var waiter = new Waiter();
+                var node = _queues[(int)priority].AddLast(waiter);
+                if (cancellationToken.CanBeCanceled)
+                {
+                    waiter.Registration = cancellationToken.Register(() => Cancel(node, cancellationToken));
+                }
+                return waiter.Completion.Task;
+            }
+        }
+
+        /// <summary>
+        /// Releases a slot and feeds the outcome of the request into the limit.
+        /// </summary>
+        internal void Release(ConcurrencyLease lease, ConcurrencyOutcome outcome)
+        {
+            lock (_lock)
+            {
+                _inFlight[(int)lease.Priority]--;
+
+                switch (outcome)
+                {
+                    case ConcurrencyOutcome.Success:
+                        OnSample(Stopwatch.GetElapsedTime(lease.Started).TotalMilliseconds, lease.InFlightAtStart);
+                        break;
+                    case ConcurrencyOutcome.Dropped:
+                        _limit = Math.Max(_options.MinLimit, _limit * _options.BackoffRatio);
+                        break;
+                }
+
+                Dispatch();
+            }
+        }
+
+        private void OnSample(double rtt, int inFlightAtStart)
+        {
+            if (_longRtt == 0)
+            {
+                _longRtt = rtt;
+                return;
+            }
+
+            _longRtt = LongRttSmoothing * rtt + (1 - LongRttSmoothing) * _longRtt;
+
+            // Latency well below the long-term average means load dropped; let the average catch up quickly.
+            if (_longRtt / rtt > 2)
+            {
+                _longRtt *= 0.95;
+            }
+
+            var gradient = Math.Clamp(_options.RttTolerance * _longRtt / Math.Max(rtt, 0.001), 0.5, 1.0);
+            var queueAllowance = Math.Sqrt(_limit);
+            var estimate = _limit * gradient + queueAllowance;
+
+            // Do not grow the limit while the caller is not using it.
+            if (estimate > _limit && inFlightAtStart < _limit / 2)
+            {
+                return;
+            }
+
+            _limit = Math.Clamp((1 - _options.Smoothing) * _limit + _options.Smoothing * estimate, _options.MinLimit, _options.MaxLimit);
+        }
+
+        private bool CanDispatch(RequestPriority priority)
+        {
+            var inFlight = _inFlight[0] + _inFlight[1];
+            if (inFlight >= CurrentLimit) return false;
+
+            return priority == RequestPriority.Interactive ||
+                   (_queues[(int)RequestPriority.Interactive].Count == 0 && _inFlight[(int)RequestPriority.Bulk] < BulkLimit);
+        }
+
+        private ConcurrencyLease Grant(RequestPriority priority)
+        {
+            _inFlight[(int)priority]++;
+            return new ConcurrencyLease(this, priority, _inFlight[0] + _inFlight[1]);
+        }
+
+        private void Dispatch()
+        {
+            foreach (var priority in new[] { RequestPriority.Interactive, RequestPriority.Bulk })
+            {
+                var queue = _queues[(int)priority];
+                while (queue.First != null && CanDispatch(priority))
+                {
+                    var waiter = queue.First.Value;
+                    queue.RemoveFirst();
+                    waiter.Registration.Unregister();
+                    waiter.Completion.TrySetResult(Grant(priority));
+                }
+            }
+        }
+
+        private void Cancel(LinkedListNode<Waiter> node, CancellationToken cancellationToken)
+        {
+            lock (_lock)
+            {
+                // The waiter may have been granted a slot concurrently.
+                if (node.List == null) return;
+                node.List.Remove(node);
+            }
+
+            node.Value.Completion.TrySetCanceled(cancellationToken);
+        }
+
+        private sealed class Waiter
+        {
+            public TaskCompletionSource<ConcurrencyLease> Completion { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+            public CancellationTokenRegistration Registration { get; set; }
+        }
+    }
+}
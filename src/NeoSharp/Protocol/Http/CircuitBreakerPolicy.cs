@@ -0,0 +1,146 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Stops sending calls after a run of consecutive transient failures. While the circuit is open every
+    /// call fails immediately with a <see cref="JsonRpcException"/>; after the break duration one trial call
+    /// is let through, which closes the circuit on success or opens it again on failure.
+    /// </summary>
+    public class CircuitBreakerPolicy : IRpcPolicy
+    {
+        /// <summary>
+        /// Default number of consecutive transient failures that open the circuit.
+        /// </summary>
+        public const int DEFAULT_FAILURE_THRESHOLD = 5;
+
+        /// <summary>
+        /// Default time in milliseconds the circuit stays open.
+        /// </summary>
+        public const int DEFAULT_BREAK_DURATION = 10000;
+
+        private readonly object _lock = new();
+        private CircuitState _state = CircuitState.Closed;
+        private int _consecutiveFailures;
+        private long _openedAt;
+        private bool _trialInFlight;
+
+        /// <summary>
+        /// Gets or sets the number of consecutive transient failures that open the circuit.
+        /// </summary>
+        public int FailureThreshold { get; set; } = DEFAULT_FAILURE_THRESHOLD;
+
+        /// <summary>
+        /// Gets or sets the time in milliseconds the circuit stays open before a trial call is allowed.
+        /// </summary>
+        public int BreakDuration { get; set; } = DEFAULT_BREAK_DURATION;
+
+        /// <summary>
+        /// Gets the current state of the circuit.
+        /// </summary>
+        public CircuitState State
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _state == CircuitState.Open && BreakElapsed() ? CircuitState.HalfOpen : _state;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Closes the circuit and clears the failure count.
+        /// </summary>
+        public void Reset()
+        {
+            lock (_lock)
+            {
+                _state = CircuitState.Closed;
+                _consecutiveFailures = 0;
+                _trialInFlight = false;
+            }
+        }
+
+        /// <inheritdoc />
+        public async Task<T> ExecuteAsync<T>(RpcPolicyContext context, Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken)
+        {
+            var isTrial = Admit(context);
+
+            try
+            {
+                var result = await operation(cancellationToken);
+                OnSuccess();
+                return result;
+            }
+            catch (Exception ex) when (!cancellationToken.IsCancellationRequested)
+            {
+                if (RpcPolicyContext.IsTransient(ex))
+                {
+                    OnFailure();
+                }
+                else
+                {
+                    // The node answered, even if with an error.
+                    OnSuccess();
+                }
+                throw;
+            }
+            finally
+            {
+                if (isTrial)
+                {
+                    lock (_lock) _trialInFlight = false;
+                }
+            }
+        }
+
+        private bool Admit(RpcPolicyContext context)
+        {
+            lock (_lock)
+            {
+                if (_state == CircuitState.Closed) return false;
+
+                if (_state == CircuitState.Open && BreakElapsed())
+                {
+                    _state = CircuitState.HalfOpen;
+                }
+
+                if (_state == CircuitState.HalfOpen && !_trialInFlight)
+                {
+                    _trialInFlight = true;
+                    return true;
+                }
+            }
+
+            throw new JsonRpcException($"Circuit breaker is open, {context.Method} was not sent");
+        }
+
+        private void OnSuccess()
+        {
+            lock (_lock)
+            {
+                _consecutiveFailures = 0;
+                _state = CircuitState.Closed;
+            }
+        }
+
+        private void OnFailure()
+        {
+            lock (_lock)
+            {
+                _consecutiveFailures++;
+                if (_state == CircuitState.HalfOpen || _consecutiveFailures >= FailureThreshold)
+                {
+                    _state = CircuitState.Open;
+                    _openedAt = Stopwatch.GetTimestamp();
+                }
+            }
+        }
+
+        private bool BreakElapsed() => Stopwatch.GetElapsedTime(_openedAt).TotalMilliseconds >= BreakDuration;
+    }
+}
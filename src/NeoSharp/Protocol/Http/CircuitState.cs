@@ -0,0 +1,23 @@
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// State of a <see cref="CircuitBreakerPolicy"/>.
+    /// </summary>
+    public enum CircuitState
+    {
+        /// <summary>
+        /// Calls are sent normally.
+        /// </summary>
+        Closed = 0,
+
+        /// <summary>
+        /// Calls fail immediately until the break duration has elapsed.
+        /// </summary>
+        Open = 1,
+
+        /// <summary>
+        /// A single trial call is sent; its outcome closes or re-opens the circuit.
+        /// </summary>
+        HalfOpen = 2
+    }
+}
@@ -0,0 +1,48 @@
+using System.Diagnostics;
+using System.Threading;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// A slot granted by an <see cref="AdaptiveConcurrencyLimiter"/>.
+    /// </summary>
+    internal sealed class ConcurrencyLease
+    {
+        private readonly AdaptiveConcurrencyLimiter _limiter;
+        private int _completed;
+
+        internal ConcurrencyLease(AdaptiveConcurrencyLimiter limiter, RequestPriority priority, int inFlightAtStart)
+        {
+            _limiter = limiter;
+            Priority = priority;
+            InFlightAtStart = inFlightAtStart;
+            Started = Stopwatch.GetTimestamp();
+        }
+
+        /// <summary>
+        /// Gets the lane the slot was granted in.
+        /// </summary>
+        public RequestPriority Priority { get; }
+
+        /// <summary>
+        /// Gets the number of requests in flight, including this one, when the slot was granted.
+        /// </summary>
+        public int InFlightAtStart { get; }
+
+        /// <summary>
+        /// Gets the timestamp at which the slot was granted.
+        /// </summary>
+        public long Started { get; }
+
+        /// <summary>
+        /// Returns the slot to the limiter. Only the first call has an effect.
+        /// </summary>
+        /// <param name="outcome">How the request ended.</param>
+        public void Complete(ConcurrencyOutcome outcome)
+        {
+            if (Interlocked.Exchange(ref _completed, 1) == 1) return;
+
+            _limiter.Release(this, outcome);
+        }
+    }
+}
@@ -0,0 +1,141 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Options for an <see cref="AdaptiveConcurrencyLimiter"/>.
+    /// </summary>
+    public class ConcurrencyLimiterOptions
+    {
+        /// <summary>
+        /// Default number of concurrent requests allowed before any latency has been observed.
+        /// </summary>
+        public const int DEFAULT_INITIAL_LIMIT = 20;
+
+        /// <summary>
+        /// Default lower bound of the concurrency limit.
+        /// </summary>
+        public const int DEFAULT_MIN_LIMIT = 1;
+
+        /// <summary>
+        /// Default upper bound of the concurrency limit.
+        /// </summary>
+        public const int DEFAULT_MAX_LIMIT = 200;
+
+        /// <summary>
+        /// Default factor by which latency may exceed its long-term average before the limit shrinks.
+        /// </summary>
+        public const double DEFAULT_RTT_TOLERANCE = 1.5;
+
+        /// <summary>
+        /// Default weight of a new limit estimate.
+        /// </summary>
+        public const double DEFAULT_SMOOTHING = 0.2;
+
+        /// <summary>
+        /// Default factor applied to the limit when a request fails with an overload symptom.
+        /// </summary>
+        public const double DEFAULT_BACKOFF_RATIO = 0.9;
+
+        /// <summary>
+        /// Default fraction of the limit available to bulk requests.
+        /// </summary>
+        public const double DEFAULT_MAX_BULK_SHARE = 0.75;
+
+        private readonly ConcurrentDictionary<string, RequestPriority> _methodPriorities = new(StringComparer.Ordinal);
+
+        /// <summary>
+        /// Initializes a new instance of the ConcurrencyLimiterOptions class. Block, transaction, application
+        /// log and transfer history lookups default to the bulk lane; every other method is interactive.
+        /// </summary>
+        public ConcurrencyLimiterOptions()
+        {
+            foreach (var method in new[]
+            {
+                "getblock", "getblockheader", "getblockhash", "getrawtransaction", "getapplicationlog",
+                "getnep17transfers", "getnep11transfers", "findstates", "getstateroot", "getproof"
+            })
+            {
+                _methodPriorities[method] = RequestPriority.Bulk;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the number of concurrent requests allowed before any latency has been observed.
+        /// </summary>
+        public int InitialLimit { get; set; } = DEFAULT_INITIAL_LIMIT;
+
+        /// <summary>
+        /// Gets or sets the lower bound of the concurrency limit.
+        /// </summary>
+        public int MinLimit { get; set; } = DEFAULT_MIN_LIMIT;
+
+        /// <summary>
+        /// Gets or sets the upper bound of the concurrency limit.
+        /// </summary>
+        public int MaxLimit { get; set; } = DEFAULT_MAX_LIMIT;
+
+        /// <summary>
+        /// Gets or sets how much the latency of a request may exceed the long-term average latency
+        /// before the limit is reduced, e.g. 1.5 tolerates 50% more.
+        /// </summary>
+        public double RttTolerance { get; set; } = DEFAULT_RTT_TOLERANCE;
+
+        /// <summary>
+        /// Gets or sets the weight (between 0 and 1) of each new limit estimate.
+        /// </summary>
+        public double Smoothing { get; set; } = DEFAULT_SMOOTHING;
+
+        /// <summary>
+        /// Gets or sets the factor (between 0 and 1) applied to the limit when a request fails with
+        /// an HTTP error or timeout.
+        /// </summary>
+        public double BackoffRatio { get; set; } = DEFAULT_BACKOFF_RATIO;
+
+        /// <summary>
+        /// Gets or sets the fraction (between 0 and 1) of the limit bulk requests may occupy. At least one
+        /// bulk request is always allowed.
+        /// </summary>
+        public double MaxBulkShare { get; set; } = DEFAULT_MAX_BULK_SHARE;
+
+        /// <summary>
+        /// Gets or sets the priority of methods without an explicit priority.
+        /// </summary>
+        public RequestPriority DefaultPriority { get; set; } = RequestPriority.Interactive;
+
+        /// <summary>
+        /// Gets the explicit priorities per RPC method.
+        /// </summary>
+        public IReadOnlyDictionary<string, RequestPriority> MethodPriorities => _methodPriorities;
+
+        /// <summary>
+        /// Sets the priority of an RPC method.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <param name="priority">The priority.</param>
+        /// <returns>The updated options.</returns>
+        public ConcurrencyLimiterOptions SetPriority(string method, RequestPriority priority)
+        {
+            if (string.IsNullOrEmpty(method))
+                throw new ArgumentException("Method name is required.", nameof(method));
+
+            _methodPriorities[method] = priority;
+            return this;
+        }
+
+        /// <summary>
+        /// Gets the priority of a call: the priority of the current <see cref="RequestPriorityScope"/>
+        /// if any, otherwise the priority of the method.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <returns>The priority.</returns>
+        public RequestPriority GetPriority(string method)
+        {
+            if (RequestPriorityScope.Current is { } scoped) return scoped;
+
+            return method != null && _methodPriorities.TryGetValue(method, out var priority) ? priority : DefaultPriority;
+        }
+    }
+}
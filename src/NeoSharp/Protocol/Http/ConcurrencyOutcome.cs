@@ -0,0 +1,23 @@
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// How a request holding a <see cref="ConcurrencyLease"/> ended.
+    /// </summary>
+    internal enum ConcurrencyOutcome
+    {
+        /// <summary>
+        /// The node answered; the latency is a valid sample.
+        /// </summary>
+        Success,
+
+        /// <summary>
+        /// The request failed with an HTTP error or timeout, a sign of overload.
+        /// </summary>
+        Dropped,
+
+        /// <summary>
+        /// The request ended without telling anything about the node, e.g. it was cancelled.
+        /// </summary>
+        Ignored
+    }
+}
@@ -0,0 +1,162 @@
+using System;
+using System.Diagnostics;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Sends a duplicate of a slow idempotent call and takes whichever answer arrives first, cutting the
+    /// latency tail caused by a single slow node or connection. The duplicate is sent once the first attempt
+    /// has been outstanding for longer than the configured delay, by default the observed 95th percentile
+    /// latency. With an <see cref="RpcEndpointPool"/> the duplicate goes to the least loaded endpoint, which
+    /// is normally not the one still busy with the first attempt. Non-idempotent calls are never hedged.
+    /// </summary>
+    public class HedgingPolicy : IRpcPolicy
+    {
+        /// <summary>
+        /// Default latency percentile used as hedging delay.
+        /// </summary>
+        public const double DEFAULT_PERCENTILE = 0.95;
+
+        /// <summary>
+        /// Default lower bound of the hedging delay in milliseconds.
+        /// </summary>
+        public const int DEFAULT_MIN_DELAY = 10;
+
+        /// <summary>
+        /// Default number of latency samples required before the delay is derived from them.
+        /// </summary>
+        public const int DEFAULT_MIN_SAMPLES = 20;
+
+        // Number of recent latencies the percentile is computed over.
+        private const int SampleWindow = 256;
+
+        private readonly object _lock = new();
+        private readonly double[] _samples = new double[SampleWindow];
+        private int _sampleCount;
+        private int _nextSample;
+        private long _hedgedCount;
+
+        /// <summary>
+        /// Gets or sets a fixed hedging delay in milliseconds. Zero (the default) derives the delay from
+        /// the observed latencies.
+        /// </summary>
+        public int Delay { get; set; }
+
+        /// <summary>
+        /// Gets or sets the latency percentile (between 0 and 1) used as hedging delay.
+        /// </summary>
+        public double Percentile { get; set; } = DEFAULT_PERCENTILE;
+
+        /// <summary>
+        /// Gets or sets the lower bound of the derived hedging delay in milliseconds.
+        /// </summary>
+        public int MinDelay { get; set; } = DEFAULT_MIN_DELAY;
+
+        /// <summary>
+        /// Gets or sets how many latency samples are required before calls are hedged with a derived delay.
+        /// </summary>
+        public int MinSamples { get; set; } = DEFAULT_MIN_SAMPLES;
+
+        /// <summary>
+        /// Gets the number of duplicate requests sent.
+        /// </summary>
+        public long HedgedCount => Interlocked.Read(ref _hedgedCount);
+
+        /// <summary>
+        /// Gets the current hedging delay in milliseconds, or null while too few latencies have been observed.
+        /// </summary>
+        public double? CurrentDelay
+        {
+            get
+            {
+                if (Delay > 0) return Delay;
+
+                lock (_lock)
+                {
+                    if (_sampleCount < Math.Max(1, MinSamples)) return null;
+
+                    var sorted = new double[_sampleCount];
+                    Array.Copy(_samples, sorted, _sampleCount);
+                    Array.Sort(sorted);
+                    var index = Math.Clamp((int)Math.Ceiling(Percentile * sorted.Length) - 1, 0, sorted.Length - 1);
+                    return Math.Max(MinDelay, sorted[index]);
+                }
+            }
+        }
+
+        /// <inheritdoc />
+        public async Task<T> ExecuteAsync<T>(RpcPolicyContext context, Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken)
+        {
+            var delay = context.IsIdempotent ? CurrentDelay : null;
+            if (delay == null)
+            {
+                return await MeasureAsync(operation, cancellationToken);
+            }
+
+            using var cancelLosers = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            var primary = MeasureAsync(operation, cancelLosers.Token);
+            Task<T> hedge = null;
+
+            try
+            {
+                var hedgeTimer = Task.Delay(TimeSpan.FromMilliseconds(delay.Value), cancelLosers.Token);
+                if (await Task.WhenAny(primary, hedgeTimer) == primary || cancellationToken.IsCancellationRequested)
+                {
+                    return await primary;
+                }
+
+                Interlocked.Increment(ref _hedgedCount);
+                hedge = MeasureAsync(operation, cancelLosers.Token);
+
+                var first = await Task.WhenAny(primary, hedge);
+                if (first.IsCompletedSuccessfully)
+                {
+                    return first.Result;
+                }
+
+                // One attempt failed; the other one may still succeed.
+                var second = first == primary ? hedge : primary;
+                try
+                {
+                    return await second;
+                }
+                catch when (!cancellationToken.IsCancellationRequested)
+                {
+                    return await first;
+                }
+            }
+            finally
+            {
+                cancelLosers.Cancel();
+                Observe(primary);
+                Observe(hedge);
+            }
+        }
+
+        private static void Observe(Task task)
+        {
+            // The losing attempt fails with a cancellation nobody awaits.
+            task?.ContinueWith(t => _ = t.Exception, CancellationToken.None, TaskContinuationOptions.OnlyOnFaulted, TaskScheduler.Default);
+        }
+
+        private async Task<T> MeasureAsync<T>(Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken)
+        {
+            var started = Stopwatch.GetTimestamp();
+            var result = await operation(cancellationToken);
+            Record(Stopwatch.GetElapsedTime(started).TotalMilliseconds);
+            return result;
+        }
+
+        private void Record(double latency)
+        {
+            lock (_lock)
+            {
+                _samples[_nextSample] = latency;
+                _nextSample = (_nextSample + 1) % SampleWindow;
+                _sampleCount = Math.Min(_sampleCount + 1, SampleWindow);
+            }
+        }
+    }
+}
@@ -1,4 +1,9 @@
 using System;
+using System.Buffers;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
 using System.Net.Http;
 using System.Text;
 using System.Text.Json;
@@ -17,9 +22,27 @@ namespace NeoSharp.Protocol.Http
         private readonly HttpClient _httpClient;
         private readonly ILogger<HttpService> _logger;
         private readonly Uri _url;
+        private readonly RpcEndpointPool _endpointPool;
         private readonly JsonSerializerOptions _jsonOptions;
+        private readonly object _microBatchLock = new();
+        private List<IJsonRpcBatchEntry> _pendingBatch;
+        private readonly ConcurrentDictionary<string, TaskCompletionSource<JsonElement>> _coalescedCalls = new(StringComparer.Ordinal);
+        private RpcResultCache _resultCache;
+        private long _coalescedRequestCount;
         private bool _disposed;
 
+        /// <summary>
+        /// Gets or sets the window in milliseconds during which individual calls are collected
+        /// into a single JSON-RPC batch. Zero (the default) disables automatic micro-batching.
+        /// </summary>
+        public int MicroBatchWindow { get; set; }
+
+        /// <summary>
+        /// Gets or sets the maximum number of calls sent in one JSON-RPC batch.
+        /// A pending micro-batch is flushed early once it reaches this size.
+        /// </summary>
+        public int MaxBatchSize { get; set; } = NeoSharpConfig.DEFAULT_MAX_BATCH_SIZE;
+
         /// <summary>
         /// Initializes a new instance of the HttpService class.
         /// </summary>
@@ -27,17 +50,79 @@ namespace NeoSharp.Protocol.Http
         /// <param name="httpClient">The HTTP client to use.</param>
         /// <param name="logger">The logger instance.</param>
         public HttpService(string url, HttpClient httpClient = null, ILogger<HttpService> logger = null)
+            : this(new Uri(url), null, httpClient, logger)
+        {
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the HttpService class routing requests over a pool of endpoints.
+        /// </summary>
+        /// <param name="endpointPool">The pool of RPC endpoints.</param>
+        /// <param name="httpClient">The HTTP client to use.</param>
+        /// <param name="logger">The logger instance.</param>
+        public HttpService(RpcEndpointPool endpointPool, HttpClient httpClient = null, ILogger<HttpService> logger = null)
+            : this(null, endpointPool ?? throw new ArgumentNullException(nameof(endpointPool)), httpClient, logger)
+        {
+            _endpointPool.Attach((url, cancellationToken) =>
+                SendRequestAsync<int>(CreateRequest("getblockcount", null), url, cancellationToken));
+        }
+
+        private HttpService(Uri url, RpcEndpointPool endpointPool, HttpClient httpClient, ILogger<HttpService> logger)
         {
-            _url = new Uri(url);
+            _url = url;
+            _endpointPool = endpointPool;
             _httpClient = httpClient ?? new HttpClient();
             _logger = logger;
             _jsonOptions = new JsonSerializerOptions
             {
                 PropertyNameCaseInsensitive = true,
-                PropertyNamingPolicy = JsonNamingPolicy.CamelCase
+                PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+                TypeInfoResolver = NeoSharpJsonContext.CreateResolver()
             };
         }
 
+        /// <summary>
+        /// Gets the endpoint pool requests are routed over, or null if the service uses a single URL.
+        /// </summary>
+        public RpcEndpointPool EndpointPool => _endpointPool;
+
+        /// <summary>
+        /// Gets or sets the cache answering calls whose results can no longer change, or null (the default)
+        /// to send every call to the node. A cache can only be used by one service.
+        /// </summary>
+        public RpcResultCache ResultCache
+        {
+            get => _resultCache;
+            set
+            {
+                value?.Attach((method, parameters, cancellationToken) => SendAsync<JsonElement>(method, parameters, cancellationToken));
+                _resultCache = value;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the limiter bounding the number of concurrent requests sent by this service across
+        /// all endpoints, or null (the default) to send requests without limit.
+        /// </summary>
+        public AdaptiveConcurrencyLimiter ConcurrencyLimiter { get; set; }
+
+        /// <summary>
+        /// Gets or sets the resilience policies (retries, hedging, circuit breaking) applied to calls sent to
+        /// the node, or null (the default) to send each call once.
+        /// </summary>
+        public RpcPolicyPipeline Policies { get; set; }
+
+        /// <summary>
+        /// Gets or sets the methods whose concurrent identical calls share one request, or null
+        /// (the default) to send every call on its own.
+        /// </summary>
+        public RequestCoalescingOptions RequestCoalescing { get; set; }
+
+        /// <summary>
+        /// Gets the number of calls that were answered by another call's request instead of their own.
+        /// </summary>
+        public long CoalescedRequestCount => Interlocked.Read(ref _coalescedRequestCount);
+
         /// <summary>
         /// Sends a JSON-RPC request.
         /// </summary>
@@ -48,26 +133,170 @@ namespace NeoSharp.Protocol.Http
         /// <returns>The response.</returns>
         public async Task<T> SendAsync<T>(string method, object[] parameters = null, CancellationToken cancellationToken = default)
         {
-            var request = new JsonRpcRequest
+            var coalescing = RequestCoalescing;
+            if (coalescing != null && coalescing.TryGetTimeToLive(method, out var timeToLive))
             {
-                JsonRpc = "2.0",
-                Method = method,
-                Params = parameters ?? Array.Empty<object>(),
-                Id = Guid.NewGuid().ToString()
-            };
+                var shared = await SendCoalescedAsync(method, parameters, timeToLive, cancellationToken);
+                try
+                {
+                    // Every caller gets its own copy of the result so shared models cannot be mutated under it.
+                    return shared.Deserialize<T>(_jsonOptions);
+                }
+                catch (JsonException ex)
+                {
+                    _logger?.LogError(ex, "JSON serialization error for method {Method}", method);
+                    throw new JsonRpcException($"JSON error: {ex.Message}", ex);
+                }
+            }
 
-            var json = JsonSerializer.Serialize(request, _jsonOptions);
-            var content = new StringContent(json, Encoding.UTF8, "application/json");
+            return await SendThroughCacheAsync<T>(method, parameters, cancellationToken);
+        }
+
+        private Task<JsonElement> SendCoalescedAsync(string method, object[] parameters, int timeToLive, CancellationToken cancellationToken)
+        {
+            var key = CreateCallKey(method, parameters);
+
+            while (true)
+            {
+                if (_coalescedCalls.TryGetValue(key, out var existing))
+                {
+                    Interlocked.Increment(ref _coalescedRequestCount);
+                    return existing.Task.WaitAsync(cancellationToken);
+                }
 
+                var call = new TaskCompletionSource<JsonElement>(TaskCreationOptions.RunContinuationsAsynchronously);
+                if (_coalescedCalls.TryAdd(key, call))
+                {
+                    _ = RunCoalescedAsync(key, call, method, parameters, timeToLive);
+                    return call.Task.WaitAsync(cancellationToken);
+                }
+            }
+        }
+
+        private async Task RunCoalescedAsync(string key, TaskCompletionSource<JsonElement> call, string method, object[] parameters, int timeToLive)
+        {
+            // The shared request is not tied to the cancellation token of whichever caller started it.
+            try
+            {
+                var result = await SendThroughCacheAsync<JsonElement>(method, parameters, CancellationToken.None);
+                if (timeToLive > 0)
+                {
+                    _ = Task.Delay(timeToLive).ContinueWith(
+                        _ => _coalescedCalls.TryRemove(new KeyValuePair<string, TaskCompletionSource<JsonElement>>(key, call)),
+                        TaskScheduler.Default);
+                }
+                else
+                {
+                    _coalescedCalls.TryRemove(new KeyValuePair<string, TaskCompletionSource<JsonElement>>(key, call));
+                }
+                call.SetResult(result);
+            }
+            catch (Exception ex)
+            {
+                _coalescedCalls.TryRemove(new KeyValuePair<string, TaskCompletionSource<JsonElement>>(key, call));
+                call.SetException(ex);
+            }
+        }
+
+        private async Task<T> SendThroughCacheAsync<T>(string method, object[] parameters, CancellationToken cancellationToken)
+        {
+            var cache = _resultCache;
+            if (cache == null)
+            {
+                return await SendUncachedAsync<T>(method, parameters, cancellationToken);
+            }
+
+            if (RpcResultCache.IsCacheable(method))
+            {
+                return await SendCachedAsync<T>(cache, method, parameters, cancellationToken);
+            }
+
+            var result = await SendUncachedAsync<T>(method, parameters, cancellationToken);
+            if (method == "getblockcount")
+            {
+                if (result is int blockCount)
+                {
+                    cache.ObserveBlockCount(blockCount);
+                }
+                else if (result is JsonElement { ValueKind: JsonValueKind.Number } element && element.TryGetInt32(out blockCount))
+                {
+                    cache.ObserveBlockCount(blockCount);
+                }
+            }
+            return result;
+        }
+
+        private async Task<T> SendCachedAsync<T>(RpcResultCache cache, string method, object[] parameters, CancellationToken cancellationToken)
+        {
+            var key = CreateCallKey(method, parameters);
+            var cached = await cache.TryGetAsync(key, cancellationToken);
+
+            try
+            {
+                if (cached != null)
+                {
+                    _logger?.LogDebug("JSON-RPC result cache hit: {Method}", method);
+                    return JsonSerializer.Deserialize<T>(cached, _jsonOptions);
+                }
+
+                var result = await SendUncachedAsync<JsonElement>(method, parameters, cancellationToken);
+                await cache.AddAsync(key, method, parameters, result, cancellationToken);
+                return result.Deserialize<T>(_jsonOptions);
+            }
+            catch (JsonException ex)
+            {
+                _logger?.LogError(ex, "JSON serialization error for method {Method}", method);
+                throw new JsonRpcException($"JSON error: {ex.Message}", ex);
+            }
+        }
+
+        private Task<T> SendUncachedAsync<T>(string method, object[] parameters, CancellationToken cancellationToken)
+        {
+            var policies = Policies;
+            if (policies == null)
+            {
+                return SendOnceAsync<T>(method, parameters, cancellationToken);
+            }
+
+            return policies.ExecuteAsync(method, token => SendOnceAsync<T>(method, parameters, token), cancellationToken);
+        }
+
+        private async Task<T> SendOnceAsync<T>(string method, object[] parameters, CancellationToken cancellationToken)
+        {
+            var request = CreateRequest(method, parameters);
+
+            if (MicroBatchWindow > 0)
+            {
+                return await EnqueueMicroBatch<T>(request, cancellationToken);
+            }
+
+            return await SendRequestAsync<T>(request, null, cancellationToken);
+        }
+
+        /// <summary>
+        /// Sends a JSON-RPC request to the given endpoint, or to the endpoint chosen by the pool when null.
+        /// </summary>
+        private async Task<T> SendRequestAsync<T>(JsonRpcRequest request, Uri target, CancellationToken cancellationToken)
+        {
+            var method = request.Method;
             _logger?.LogDebug("Sending JSON-RPC request: {Method}", method);
 
+            // Health probes to a specific endpoint bypass the limiter.
+            var limiter = target == null ? ConcurrencyLimiter : null;
+            ConcurrencyLease lease = null;
+            var outcome = ConcurrencyOutcome.Ignored;
+
             try
             {
-                var response = await _httpClient.PostAsync(_url, content, cancellationToken);
-                response.EnsureSuccessStatusCode();
+                if (limiter != null)
+                {
+                    lease = await limiter.AcquireAsync(limiter.Options.GetPriority(method), cancellationToken);
+                }
 
-                var responseJson = await response.Content.ReadAsStringAsync();
-                var rpcResponse = JsonSerializer.Deserialize<JsonRpcResponse<T>>(responseJson, _jsonOptions);
+                var rpcResponse = await PostJsonAsync(request, target, async (stream, token) =>
+                        await JsonSerializer.DeserializeAsync<JsonRpcResponse<T>>(stream, _jsonOptions, token), cancellationToken)
+                    ?? throw new JsonRpcException("JSON-RPC response is empty");
+                outcome = ConcurrencyOutcome.Success;
 
                 if (rpcResponse.Error != null)
                 {
@@ -78,11 +307,13 @@ namespace NeoSharp.Protocol.Http
             }
             catch (HttpRequestException ex)
             {
+                outcome = ConcurrencyOutcome.Dropped;
                 _logger?.LogError(ex, "HTTP request failed for method {Method}", method);
                 throw new JsonRpcException($"HTTP request failed: {ex.Message}", ex);
             }
             catch (TaskCanceledException ex)
             {
+                if (!cancellationToken.IsCancellationRequested) outcome = ConcurrencyOutcome.Dropped;
                 _logger?.LogError(ex, "Request timeout for method {Method}", method);
                 throw new JsonRpcException($"Request timeout: {ex.Message}", ex);
             }
@@ -91,6 +322,308 @@ namespace NeoSharp.Protocol.Http
                 _logger?.LogError(ex, "JSON serialization error for method {Method}", method);
                 throw new JsonRpcException($"JSON error: {ex.Message}", ex);
             }
+            finally
+            {
+                lease?.Complete(outcome);
+            }
+        }
+
+        /// <summary>
+        /// Sends several JSON-RPC calls as a single batch request.
+        /// Each entry is completed individually, so an error reported for one call
+        /// does not fail the other calls of the batch.
+        /// </summary>
+        /// <param name="entries">The batch entries.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>A task that completes once every entry has been completed.</returns>
+        internal async Task SendBatchAsync(IReadOnlyList<IJsonRpcBatchEntry> entries, CancellationToken cancellationToken = default)
+        {
+            if (entries.Count == 0) return;
+
+            var requests = new JsonRpcRequest[entries.Count];
+            var pending = new Dictionary<string, IJsonRpcBatchEntry>(entries.Count);
+            for (var i = 0; i < entries.Count; i++)
+            {
+                requests[i] = entries[i].Request;
+                pending[entries[i].Request.Id] = entries[i];
+            }
+
+            _logger?.LogDebug("Sending JSON-RPC batch with {Count} requests", entries.Count);
+
+            var limiter = ConcurrencyLimiter;
+            ConcurrencyLease lease = null;
+            var outcome = ConcurrencyOutcome.Ignored;
+
+            try
+            {
+                if (limiter != null)
+                {
+                    // A batch travels in the most urgent lane of its calls.
+                    var priority = RequestPriority.Bulk;
+                    foreach (var request in requests)
+                    {
+                        if (limiter.Options.GetPriority(request.Method) == RequestPriority.Interactive)
+                        {
+                            priority = RequestPriority.Interactive;
+                            break;
+                        }
+                    }
+                    lease = await limiter.AcquireAsync(priority, cancellationToken);
+                }
+
+                using var document = await PostJsonAsync(requests, null,
+                    async (stream, token) => await JsonDocument.ParseAsync(stream, default, token), cancellationToken);
+                outcome = ConcurrencyOutcome.Success;
+
+                if (document.RootElement.ValueKind != JsonValueKind.Array)
+                {
+                    // The node rejected the batch as a whole and answered with a single error object.
+                    var single = document.RootElement.Deserialize<JsonRpcResponse<JsonElement>>(_jsonOptions);
+                    var message = single?.Error != null
+                        ? $"JSON-RPC error {single.Error.Code}: {single.Error.Message}"
+                        : "JSON-RPC batch response is not an array";
+                    FailAll(pending.Values, new JsonRpcException(message));
+                    return;
+                }
+
+                foreach (var element in document.RootElement.EnumerateArray())
+                {
+                    var rpcResponse = element.Deserialize<JsonRpcResponse<JsonElement>>(_jsonOptions);
+                    if (rpcResponse?.Id == null || !pending.Remove(rpcResponse.Id, out var entry))
+                    {
+                        continue;
+                    }
+
+                    if (rpcResponse.Error != null)
+                    {
+                        entry.SetException(new JsonRpcException($"JSON-RPC error {rpcResponse.Error.Code}: {rpcResponse.Error.Message}"));
+                    }
+                    else
+                    {
+                        entry.SetResult(rpcResponse.Result, _jsonOptions);
+                    }
+                }
+
+                FailAll(pending.Values, new JsonRpcException("JSON-RPC batch response is missing the result for this request"));
+            }
+            catch (HttpRequestException ex)
+            {
+                outcome = ConcurrencyOutcome.Dropped;
+                _logger?.LogError(ex, "HTTP request failed for JSON-RPC batch");
+                FailAll(pending.Values, new JsonRpcException($"HTTP request failed: {ex.Message}", ex));
+            }
+            catch (TaskCanceledException ex)
+            {
+                if (!cancellationToken.IsCancellationRequested) outcome = ConcurrencyOutcome.Dropped;
+                _logger?.LogError(ex, "Request timeout for JSON-RPC batch");
+                FailAll(pending.Values, new JsonRpcException($"Request timeout: {ex.Message}", ex));
+            }
+            catch (JsonException ex)
+            {
+                _logger?.LogError(ex, "JSON serialization error for JSON-RPC batch");
+                FailAll(pending.Values, new JsonRpcException($"JSON error: {ex.Message}", ex));
+            }
+            catch (Exception ex)
+            {
+                // Micro-batches are sent fire-and-forget, so no exception may escape without completing
+                // the entries still waiting for a result. A local failure says nothing about node load.
+                outcome = ConcurrencyOutcome.Ignored;
+                _logger?.LogError(ex, "JSON-RPC batch failed");
+                FailAll(pending.Values, new JsonRpcException($"JSON-RPC batch failed: {ex.Message}", ex));
+            }
+            finally
+            {
+                lease?.Complete(outcome);
+            }
+        }
+
+        /// <summary>
+        /// Posts a JSON payload serialized into a pooled UTF-8 buffer and reads the response body from
+        /// its stream, as soon as the headers have arrived. With an endpoint pool the request is routed to
+        /// the best endpoint and fails over to another endpoint if the connection could not be established.
+        /// The endpoint's latency and outstanding count are updated only once the body has been read, so
+        /// that slow body transfers count against the node.
+        /// </summary>
+        /// <typeparam name="TPayload">The payload type.</typeparam>
+        /// <typeparam name="TResult">The type read from the response body.</typeparam>
+        /// <param name="payload">The payload.</param>
+        /// <param name="target">The endpoint to use, or null to use the configured URL or pool.</param>
+        /// <param name="readBody">Reads the result from the response body stream.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The result read from the successful response.</returns>
+        private async Task<TResult> PostJsonAsync<TPayload, TResult>(TPayload payload, Uri target,
+            Func<Stream, CancellationToken, ValueTask<TResult>> readBody, CancellationToken cancellationToken)
+        {
+            using var content = PooledJsonContent.Create(payload, _jsonOptions);
+
+            if (target != null || _endpointPool == null)
+            {
+                using var response = await PostAsync(target ?? _url, content, cancellationToken);
+                return await ReadBodyAsync(response, readBody, cancellationToken);
+            }
+
+            RpcEndpoint failed = null;
+            for (var attempt = 1; ; attempt++)
+            {
+                var endpoint = _endpointPool.Select(failed);
+                var started = Stopwatch.GetTimestamp();
+                endpoint.OnRequestStarted();
+
+                try
+                {
+                    using var response = await PostAsync(endpoint.Url, content, cancellationToken);
+                    var result = await ReadBodyAsync(response, readBody, cancellationToken);
+                    endpoint.OnRequestSucceeded(Stopwatch.GetElapsedTime(started));
+                    return result;
+                }
+                catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+                {
+                    endpoint.OnRequestAbandoned();
+                    throw;
+                }
+                catch (Exception ex) when (ex is HttpRequestException || ex is TaskCanceledException || ex is IOException || ex is JsonException)
+                {
+                    _endpointPool.ReportFailure(endpoint, ex.Message);
+
+                    // Only a failed connection guarantees the node never saw the request.
+                    var connectionFailed = ex is HttpRequestException { HttpRequestError: HttpRequestError.ConnectionError };
+                    if (!connectionFailed || attempt >= _endpointPool.Endpoints.Count) throw;
+
+                    _logger?.LogWarning(ex, "Connection to {Endpoint} failed, failing over", endpoint.Url);
+                    failed = endpoint;
+                }
+                catch
+                {
+                    endpoint.OnRequestAbandoned();
+                    throw;
+                }
+            }
+        }
+
+        private static async Task<TResult> ReadBodyAsync<TResult>(HttpResponseMessage response,
+            Func<Stream, CancellationToken, ValueTask<TResult>> readBody, CancellationToken cancellationToken)
+        {
+            await using var stream = await response.Content.ReadAsStreamAsync(cancellationToken);
+            return await readBody(stream, cancellationToken);
+        }
+
+        private async Task<HttpResponseMessage> PostAsync(Uri url, HttpContent content, CancellationToken cancellationToken)
+        {
+            // The request is not disposed: that would dispose the content, which is reused on failover
+            // and owned by the caller.
+            var request = new HttpRequestMessage(HttpMethod.Post, url) { Content = content };
+
+            var response = await _httpClient.SendAsync(request, HttpCompletionOption.ResponseHeadersRead, cancellationToken);
+            try
+            {
+                response.EnsureSuccessStatusCode();
+                return response;
+            }
+            catch
+            {
+                response.Dispose();
+                throw;
+            }
+        }
+
+        /// <summary>
+        /// Creates a JSON-RPC request object with a unique ID.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <param name="parameters">The method parameters.</param>
+        /// <returns>The request.</returns>
+        internal static JsonRpcRequest CreateRequest(string method, object[] parameters)
+        {
+            return new JsonRpcRequest
+            {
+                JsonRpc = "2.0",
+                Method = method,
+                Params = parameters ?? Array.Empty<object>(),
+                Id = Guid.NewGuid().ToString()
+            };
+        }
+
+        /// <summary>
+        /// Builds the key identifying a call by method and canonical parameters. Hash parameters are
+        /// lower-cased so that differently formatted hashes of the same object share a key.
+        /// </summary>
+        private string CreateCallKey(string method, object[] parameters)
+        {
+            var buffer = new ArrayBufferWriter<byte>();
+            using (var writer = new Utf8JsonWriter(buffer))
+            {
+                writer.WriteStartArray();
+                writer.WriteStringValue(method);
+                foreach (var parameter in parameters ?? Array.Empty<object>())
+                {
+                    switch (parameter)
+                    {
+                        case null:
+                            writer.WriteNullValue();
+                            break;
+                        case string text:
+                            writer.WriteStringValue(text.StartsWith("0x", StringComparison.OrdinalIgnoreCase) ? text.ToLowerInvariant() : text);
+                            break;
+                        default:
+                            JsonSerializer.Serialize(writer, parameter, parameter.GetType(), _jsonOptions);
+                            break;
+                    }
+                }
+                writer.WriteEndArray();
+            }
+
+            return Encoding.UTF8.GetString(buffer.WrittenSpan);
+        }
+
+        private Task<T> EnqueueMicroBatch<T>(JsonRpcRequest request, CancellationToken cancellationToken)
+        {
+            var entry = new JsonRpcBatchEntry<T>(request, cancellationToken);
+            List<IJsonRpcBatchEntry> ready = null;
+
+            lock (_microBatchLock)
+            {
+                if (_pendingBatch == null)
+                {
+                    var scheduled = new List<IJsonRpcBatchEntry>();
+                    _pendingBatch = scheduled;
+                    _ = Task.Delay(MicroBatchWindow).ContinueWith(_ => FlushMicroBatch(scheduled), TaskScheduler.Default);
+                }
+
+                _pendingBatch.Add(entry);
+
+                if (_pendingBatch.Count >= MaxBatchSize)
+                {
+                    ready = _pendingBatch;
+                    _pendingBatch = null;
+                }
+            }
+
+            if (ready != null)
+            {
+                _ = SendBatchAsync(ready);
+            }
+
+            return entry.Task;
+        }
+
+        private void FlushMicroBatch(List<IJsonRpcBatchEntry> scheduled)
+        {
+            lock (_microBatchLock)
+            {
+                // The batch may already have been flushed because it reached MaxBatchSize.
+                if (!ReferenceEquals(_pendingBatch, scheduled)) return;
+                _pendingBatch = null;
+            }
+
+            _ = SendBatchAsync(scheduled);
+        }
+
+        private static void FailAll(IEnumerable<IJsonRpcBatchEntry> entries, Exception exception)
+        {
+            foreach (var entry in entries)
+            {
+                entry.SetException(exception);
+            }
         }
 
         /// <summary>
@@ -113,6 +646,7 @@ namespace NeoSharp.Protocol.Http
             if (disposing)
             {
                 _httpClient?.Dispose();
+                _endpointPool?.Dispose();
             }
 
             _disposed = true;
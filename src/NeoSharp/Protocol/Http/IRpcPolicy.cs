@@ -0,0 +1,23 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// A resilience policy wrapping the JSON-RPC calls of an <see cref="HttpService"/>, such as retries,
+    /// hedged requests or a circuit breaker. Policies are composed by an <see cref="RpcPolicyPipeline"/>.
+    /// </summary>
+    public interface IRpcPolicy
+    {
+        /// <summary>
+        /// Executes a call under the policy.
+        /// </summary>
+        /// <typeparam name="T">The result type.</typeparam>
+        /// <param name="context">The call being executed.</param>
+        /// <param name="operation">Sends the call once; may be invoked several times for idempotent calls.</param>
+        /// <param name="cancellationToken">The cancellation token of the caller.</param>
+        /// <returns>The result.</returns>
+        Task<T> ExecuteAsync<T>(RpcPolicyContext context, Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken);
+    }
+}
@@ -0,0 +1,91 @@
+using System;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// A single call of a JSON-RPC batch whose result type is erased.
+    /// </summary>
+    internal interface IJsonRpcBatchEntry
+    {
+        /// <summary>
+        /// Gets the request sent for this entry.
+        /// </summary>
+        JsonRpcRequest Request { get; }
+
+        /// <summary>
+        /// Completes the entry with the raw JSON result.
+        /// </summary>
+        /// <param name="result">The result element of the JSON-RPC response.</param>
+        /// <param name="options">The serializer options used to convert the result.</param>
+        void SetResult(JsonElement result, JsonSerializerOptions options);
+
+        /// <summary>
+        /// Fails the entry.
+        /// </summary>
+        /// <param name="exception">The exception to surface to the caller.</param>
+        void SetException(Exception exception);
+    }
+
+    /// <summary>
+    /// A single call of a JSON-RPC batch completing a typed task.
+    /// </summary>
+    /// <typeparam name="T">The result type.</typeparam>
+    internal sealed class JsonRpcBatchEntry<T> : IJsonRpcBatchEntry
+    {
+        private readonly TaskCompletionSource<T> _completion = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        // Disposed once the entry completes, so that a long-lived token does not keep completed entries alive.
+        private CancellationTokenRegistration _cancellation;
+
+        /// <summary>
+        /// Initializes a new instance of the JsonRpcBatchEntry class.
+        /// </summary>
+        /// <param name="request">The request.</param>
+        /// <param name="cancellationToken">The cancellation token of the individual call.</param>
+        public JsonRpcBatchEntry(JsonRpcRequest request, CancellationToken cancellationToken = default)
+        {
+            Request = request;
+
+            if (cancellationToken.CanBeCanceled)
+            {
+                _cancellation = cancellationToken.Register(() =>
+                {
+                    _completion.TrySetCanceled(cancellationToken);
+                    _cancellation.Dispose();
+                });
+            }
+        }
+
+        /// <inheritdoc />
+        public JsonRpcRequest Request { get; }
+
+        /// <summary>
+        /// Gets the task completed with the result of this call.
+        /// </summary>
+        public Task<T> Task => _completion.Task;
+
+        /// <inheritdoc />
+        public void SetResult(JsonElement result, JsonSerializerOptions options)
+        {
+            try
+            {
+                _completion.TrySetResult(result.ValueKind == JsonValueKind.Undefined ? default : result.Deserialize<T>(options));
+            }
+            catch (JsonException ex)
+            {
+                _completion.TrySetException(new JsonRpcException($"JSON error: {ex.Message}", ex));
+            }
+            _cancellation.Dispose();
+        }
+
+        /// <inheritdoc />
+        public void SetException(Exception exception)
+        {
+            _completion.TrySetException(exception);
+            _cancellation.Dispose();
+        }
+    }
+}
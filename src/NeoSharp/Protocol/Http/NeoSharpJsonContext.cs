@@ -0,0 +1,93 @@
+using System.Collections.Generic;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Protocol.Models;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Source-generated serialization metadata for the JSON-RPC envelopes, the values sent as request
+    /// parameters and every response model returned by <see cref="NeoSharp"/>.
+    /// Using it avoids reflection-based metadata generation on the first call and keeps the
+    /// RPC layer usable when the application is trimmed or compiled with Native AOT.
+    /// </summary>
+    [JsonSourceGenerationOptions(
+        PropertyNameCaseInsensitive = true,
+        PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase)]
+    // Envelopes
+    [JsonSerializable(typeof(JsonRpcRequest))]
+    [JsonSerializable(typeof(JsonRpcRequest[]))]
+    [JsonSerializable(typeof(JsonRpcResponse<JsonElement>))]
+    // Values passed as request parameters (serialized through object)
+    [JsonSerializable(typeof(bool))]
+    [JsonSerializable(typeof(int))]
+    [JsonSerializable(typeof(long))]
+    [JsonSerializable(typeof(string))]
+    [JsonSerializable(typeof(List<object>))]
+    [JsonSerializable(typeof(List<string>))]
+    [JsonSerializable(typeof(Dictionary<string, object>))]
+    [JsonSerializable(typeof(List<Dictionary<string, object>>))]
+    [JsonSerializable(typeof(Dictionary<string, string>))]
+    [JsonSerializable(typeof(List<Dictionary<string, string>>))]
+    // Responses
+    [JsonSerializable(typeof(JsonRpcResponse<bool>))]
+    [JsonSerializable(typeof(JsonRpcResponse<int>))]
+    [JsonSerializable(typeof(JsonRpcResponse<string>))]
+    [JsonSerializable(typeof(JsonRpcResponse<List<string>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<Dictionary<string, string>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<ContractState>))]
+    [JsonSerializable(typeof(JsonRpcResponse<InvocationResult>))]
+    [JsonSerializable(typeof(JsonRpcResponse<List<NativeContractState>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<List<NeoAddress>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<List<NeoGetNextBlockValidators.Validator>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<List<NeoListPlugins.Plugin>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<List<StackItem>>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoAddress>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoApplicationLog>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoBlock>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoFindStates.States>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetMemPool.MemPoolDetails>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetNep11Balances.Nep11Balances>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetNep11Transfers.Nep11Transfers>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetNep17Balances.Nep17Balances>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetNep17Transfers.Nep17Transfers>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetPeers.Peers>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetStateHeight.StateHeight>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetStateRoot.StateRoot>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetUnclaimedGas.GetUnclaimedGas>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetVersion.NeoVersion>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoGetWalletBalance.Balance>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoNetworkFee>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoSendRawTransaction.RawTransaction>))]
+    [JsonSerializable(typeof(JsonRpcResponse<NeoValidateAddress.Result>))]
+    [JsonSerializable(typeof(JsonRpcResponse<Transaction.Transaction>), TypeInfoPropertyName = "JsonRpcResponseSignedTransaction")]
+    [JsonSerializable(typeof(Transaction.Transaction), TypeInfoPropertyName = "SignedTransaction")]
+    [JsonSerializable(typeof(Transaction.TransactionAttribute), TypeInfoPropertyName = "SignedTransactionAttribute")]
+    [JsonSerializable(typeof(List<Transaction.TransactionAttribute>), TypeInfoPropertyName = "ListSignedTransactionAttribute")]
+    // WebSocket events
+    [JsonSerializable(typeof(ExecutionNotification))]
+    [JsonSerializable(typeof(TransactionExecution))]
+    internal partial class NeoSharpJsonContext : JsonSerializerContext
+    {
+        /// <summary>
+        /// Creates the type info resolver used by <see cref="HttpService"/>. Types not covered by the
+        /// generated metadata (for example custom types passed to <see cref="HttpService.SendAsync{T}"/>)
+        /// fall back to reflection unless reflection-based serialization has been disabled, as it is
+        /// for trimmed and Native AOT applications.
+        /// </summary>
+        /// <returns>The type info resolver.</returns>
+        public static IJsonTypeInfoResolver CreateResolver()
+        {
+            if (!JsonSerializer.IsReflectionEnabledByDefault)
+            {
+                return Default;
+            }
+
+#pragma warning disable IL2026, IL3050 // Only reached when reflection-based serialization is enabled.
+            return JsonTypeInfoResolver.Combine(Default, new DefaultJsonTypeInfoResolver());
+#pragma warning restore IL2026, IL3050
+        }
+    }
+}
@@ -0,0 +1,169 @@
+using System;
+using System.Buffers;
+using System.IO;
+using System.Net;
+using System.Net.Http;
+using System.Net.Http.Headers;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// HTTP content holding a JSON payload serialized as UTF-8 into a buffer rented from
+    /// <see cref="ArrayPool{T}.Shared"/>. The buffer is returned to the pool when the content is disposed.
+    /// </summary>
+    internal sealed class PooledJsonContent : HttpContent
+    {
+        private readonly PooledByteBufferWriter _buffer;
+
+        private PooledJsonContent(PooledByteBufferWriter buffer)
+        {
+            _buffer = buffer;
+            Headers.ContentType = new MediaTypeHeaderValue("application/json") { CharSet = "utf-8" };
+        }
+
+        /// <summary>
+        /// Serializes a value into pooled UTF-8 JSON content.
+        /// </summary>
+        /// <typeparam name="TValue">The value type.</typeparam>
+        /// <param name="value">The value to serialize.</param>
+        /// <param name="options">The serializer options.</param>
+        /// <returns>The content.</returns>
+        public static PooledJsonContent Create<TValue>(TValue value, JsonSerializerOptions options)
+        {
+            var buffer = new PooledByteBufferWriter(PooledByteBufferWriter.DefaultInitialCapacity);
+            try
+            {
+                using (var writer = new Utf8JsonWriter(buffer))
+                {
+                    JsonSerializer.Serialize(writer, value, options);
+                }
+                return new PooledJsonContent(buffer);
+            }
+            catch
+            {
+                buffer.Dispose();
+                throw;
+            }
+        }
+
+        /// <summary>
+        /// Gets the serialized UTF-8 JSON.
+        /// </summary>
+        public ReadOnlyMemory<byte> WrittenMemory => _buffer.WrittenMemory;
+
+        protected override Task SerializeToStreamAsync(Stream stream, TransportContext context)
+        {
+            return stream.WriteAsync(_buffer.WrittenMemory).AsTask();
+        }
+
+        protected override Task SerializeToStreamAsync(Stream stream, TransportContext context, CancellationToken cancellationToken)
+        {
+            return stream.WriteAsync(_buffer.WrittenMemory, cancellationToken).AsTask();
+        }
+
+        protected override void SerializeToStream(Stream stream, TransportContext context, CancellationToken cancellationToken)
+        {
+            stream.Write(_buffer.WrittenMemory.Span);
+        }
+
+        protected override bool TryComputeLength(out long length)
+        {
+            length = _buffer.WrittenCount;
+            return true;
+        }
+
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing)
+            {
+                _buffer.Dispose();
+            }
+            base.Dispose(disposing);
+        }
+    }
+
+    /// <summary>
+    /// Growable <see cref="IBufferWriter{T}"/> backed by arrays rented from <see cref="ArrayPool{T}.Shared"/>.
+    /// </summary>
+    internal sealed class PooledByteBufferWriter : IBufferWriter<byte>, IDisposable
+    {
+        /// <summary>
+        /// Default initial capacity, large enough for typical JSON-RPC requests.
+        /// </summary>
+        public const int DefaultInitialCapacity = 1024;
+
+        private byte[] _buffer;
+        private int _index;
+
+        /// <summary>
+        /// Initializes a new instance of the PooledByteBufferWriter class.
+        /// </summary>
+        /// <param name="initialCapacity">The initial capacity.</param>
+        public PooledByteBufferWriter(int initialCapacity)
+        {
+            _buffer = ArrayPool<byte>.Shared.Rent(Math.Max(initialCapacity, 256));
+        }
+
+        /// <summary>
+        /// Gets the number of bytes written.
+        /// </summary>
+        public int WrittenCount => _index;
+
+        /// <summary>
+        /// Gets the bytes written so far.
+        /// </summary>
+        public ReadOnlyMemory<byte> WrittenMemory => _buffer.AsMemory(0, _index);
+
+        /// <inheritdoc />
+        public void Advance(int count)
+        {
+            if (count < 0 || _index + count > _buffer.Length)
+                throw new ArgumentOutOfRangeException(nameof(count));
+            _index += count;
+        }
+
+        /// <inheritdoc />
+        public Memory<byte> GetMemory(int sizeHint = 0)
+        {
+            EnsureCapacity(sizeHint);
+            return _buffer.AsMemory(_index);
+        }
+
+        /// <inheritdoc />
+        public Span<byte> GetSpan(int sizeHint = 0)
+        {
+            EnsureCapacity(sizeHint);
+            return _buffer.AsSpan(_index);
+        }
+
+        /// <summary>
+        /// Returns the rented buffer to the pool.
+        /// </summary>
+        public void Dispose()
+        {
+            var buffer = _buffer;
+            if (buffer == null) return;
+
+            _buffer = null;
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+
+        private void EnsureCapacity(int sizeHint)
+        {
+            if (_buffer == null)
+                throw new ObjectDisposedException(nameof(PooledByteBufferWriter));
+
+            sizeHint = Math.Max(sizeHint, 1);
+            if (_buffer.Length - _index >= sizeHint) return;
+
+            var newSize = Math.Max(_buffer.Length * 2, _index + sizeHint);
+            var newBuffer = ArrayPool<byte>.Shared.Rent(newSize);
+            _buffer.AsSpan(0, _index).CopyTo(newBuffer);
+            ArrayPool<byte>.Shared.Return(_buffer);
+            _buffer = newBuffer;
+        }
+    }
+}
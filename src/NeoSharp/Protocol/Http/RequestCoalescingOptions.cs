@@ -0,0 +1,81 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Selects the RPC methods whose concurrent identical calls (same method and parameters) share a
+    /// single outstanding request. A method may additionally keep its result for a short time to live,
+    /// so that calls arriving just after the request completed are answered without a new request.
+    /// Only read-only methods should be coalesced.
+    /// </summary>
+    public class RequestCoalescingOptions
+    {
+        /// <summary>
+        /// Default time to live in milliseconds of the block count and header count results.
+        /// </summary>
+        public const int DEFAULT_BLOCK_COUNT_TIME_TO_LIVE = 250;
+
+        private readonly ConcurrentDictionary<string, int> _methods = new(StringComparer.Ordinal);
+
+        /// <summary>
+        /// Gets the coalesced methods and their time to live in milliseconds.
+        /// </summary>
+        public IReadOnlyDictionary<string, int> Methods => _methods;
+
+        /// <summary>
+        /// Creates options coalescing the read-only calls typically issued in bursts: block and header
+        /// counts (with a short time to live), the best block hash, the node version, native contracts,
+        /// contract state and test invocations.
+        /// </summary>
+        /// <remarks>
+        /// Callers of coalesced invokefunction and invokescript calls share any iterator session the node
+        /// returns, so remove these methods when sessions are used.
+        /// </remarks>
+        /// <returns>The default options.</returns>
+        public static RequestCoalescingOptions CreateDefault()
+        {
+            return new RequestCoalescingOptions()
+                .Coalesce("getblockcount", DEFAULT_BLOCK_COUNT_TIME_TO_LIVE)
+                .Coalesce("getblockheadercount", DEFAULT_BLOCK_COUNT_TIME_TO_LIVE)
+                .Coalesce("getbestblockhash")
+                .Coalesce("getversion")
+                .Coalesce("getnativecontracts")
+                .Coalesce("getcontractstate")
+                .Coalesce("invokefunction")
+                .Coalesce("invokescript");
+        }
+
+        /// <summary>
+        /// Coalesces concurrent identical calls of a method.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <param name="timeToLiveMilliseconds">How long a completed result keeps answering new calls.
+        /// Zero shares the result only with calls issued while the request is in flight.</param>
+        /// <returns>The updated options.</returns>
+        public RequestCoalescingOptions Coalesce(string method, int timeToLiveMilliseconds = 0)
+        {
+            if (string.IsNullOrEmpty(method))
+                throw new ArgumentException("Method name is required.", nameof(method));
+            if (timeToLiveMilliseconds < 0)
+                throw new ArgumentOutOfRangeException(nameof(timeToLiveMilliseconds), "Time to live must not be negative.");
+
+            _methods[method] = timeToLiveMilliseconds;
+            return this;
+        }
+
+        /// <summary>
+        /// Stops coalescing calls of a method.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <returns>The updated options.</returns>
+        public RequestCoalescingOptions Remove(string method)
+        {
+            _methods.TryRemove(method, out _);
+            return this;
+        }
+
+        internal bool TryGetTimeToLive(string method, out int timeToLive) => _methods.TryGetValue(method, out timeToLive);
+    }
+}
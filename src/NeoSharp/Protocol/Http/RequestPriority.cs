@@ -0,0 +1,20 @@
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Lane a request waits in when the concurrency limit of an <see cref="AdaptiveConcurrencyLimiter"/> is reached.
+    /// </summary>
+    public enum RequestPriority
+    {
+        /// <summary>
+        /// Latency-sensitive calls such as sending transactions or quoting invocations. Always dispatched
+        /// before queued bulk calls.
+        /// </summary>
+        Interactive = 0,
+
+        /// <summary>
+        /// Throughput-oriented calls such as backfills. Never use the whole concurrency limit, so interactive
+        /// calls keep some headroom.
+        /// </summary>
+        Bulk = 1
+    }
+}
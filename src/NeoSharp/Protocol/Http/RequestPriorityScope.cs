@@ -0,0 +1,54 @@
+using System;
+using System.Threading;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Overrides the priority of the RPC calls issued in the current asynchronous flow, taking precedence
+    /// over the per-method priorities of <see cref="ConcurrencyLimiterOptions"/>.
+    /// </summary>
+    /// <example>
+    /// <code>
+    /// using (RequestPriorityScope.Begin(RequestPriority.Bulk))
+    /// {
+    ///     await neoSharp.GetBlockCountAsync();
+    /// }
+    /// </code>
+    /// </example>
+    public sealed class RequestPriorityScope : IDisposable
+    {
+        private static readonly AsyncLocal<RequestPriority?> CurrentPriority = new();
+
+        private readonly RequestPriority? _previous;
+        private bool _disposed;
+
+        private RequestPriorityScope(RequestPriority priority)
+        {
+            _previous = CurrentPriority.Value;
+            CurrentPriority.Value = priority;
+        }
+
+        /// <summary>
+        /// Gets the priority set by the innermost active scope, or null outside of any scope.
+        /// </summary>
+        public static RequestPriority? Current => CurrentPriority.Value;
+
+        /// <summary>
+        /// Starts a scope in which RPC calls use the given priority.
+        /// </summary>
+        /// <param name="priority">The priority.</param>
+        /// <returns>The scope; dispose it to restore the previous priority.</returns>
+        public static RequestPriorityScope Begin(RequestPriority priority) => new(priority);
+
+        /// <summary>
+        /// Restores the priority that was active when the scope began.
+        /// </summary>
+        public void Dispose()
+        {
+            if (_disposed) return;
+
+            CurrentPriority.Value = _previous;
+            _disposed = true;
+        }
+    }
+}
@@ -0,0 +1,67 @@
+using System;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Retries idempotent calls that failed with a transient error, waiting a jittered exponential
+    /// backoff between attempts: a random delay between zero and BaseDelay * 2^attempt, capped at MaxDelay.
+    /// Non-idempotent calls and errors reported by the node are never retried.
+    /// </summary>
+    public class RetryPolicy : IRpcPolicy
+    {
+        /// <summary>
+        /// Default number of retries after the first attempt.
+        /// </summary>
+        public const int DEFAULT_MAX_RETRIES = 2;
+
+        /// <summary>
+        /// Default base backoff delay in milliseconds.
+        /// </summary>
+        public const int DEFAULT_BASE_DELAY = 100;
+
+        /// <summary>
+        /// Default maximum backoff delay in milliseconds.
+        /// </summary>
+        public const int DEFAULT_MAX_DELAY = 2000;
+
+        /// <summary>
+        /// Gets or sets the number of retries after the first attempt.
+        /// </summary>
+        public int MaxRetries { get; set; } = DEFAULT_MAX_RETRIES;
+
+        /// <summary>
+        /// Gets or sets the base backoff delay in milliseconds.
+        /// </summary>
+        public int BaseDelay { get; set; } = DEFAULT_BASE_DELAY;
+
+        /// <summary>
+        /// Gets or sets the maximum backoff delay in milliseconds.
+        /// </summary>
+        public int MaxDelay { get; set; } = DEFAULT_MAX_DELAY;
+
+        /// <inheritdoc />
+        public async Task<T> ExecuteAsync<T>(RpcPolicyContext context, Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken)
+        {
+            for (var attempt = 0; ; attempt++)
+            {
+                try
+                {
+                    return await operation(cancellationToken);
+                }
+                catch (Exception ex) when (context.IsIdempotent && attempt < MaxRetries &&
+                                           !cancellationToken.IsCancellationRequested && RpcPolicyContext.IsTransient(ex))
+                {
+                    await Task.Delay(GetBackoff(attempt), cancellationToken);
+                }
+            }
+        }
+
+        private TimeSpan GetBackoff(int attempt)
+        {
+            var ceiling = Math.Min(MaxDelay, BaseDelay * Math.Pow(2, attempt));
+            return TimeSpan.FromMilliseconds(Random.Shared.NextDouble() * ceiling);
+        }
+    }
+}
@@ -0,0 +1,137 @@
+using System;
+using System.Threading;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// A single RPC node of an <see cref="RpcEndpointPool"/> together with the statistics used for routing.
+    /// </summary>
+    public class RpcEndpoint
+    {
+        private readonly object _lock = new();
+        private readonly double _smoothing;
+        private int _outstanding;
+        private double _latencyEwma;
+        private bool _hasLatency;
+        private int _consecutiveFailures;
+
+        internal RpcEndpoint(Uri url, double smoothing)
+        {
+            Url = url ?? throw new ArgumentNullException(nameof(url));
+            _smoothing = smoothing;
+        }
+
+        /// <summary>
+        /// Gets the endpoint URL.
+        /// </summary>
+        public Uri Url { get; }
+
+        /// <summary>
+        /// Gets the number of requests currently in flight to this endpoint.
+        /// </summary>
+        public int OutstandingRequests => Volatile.Read(ref _outstanding);
+
+        /// <summary>
+        /// Gets the exponentially weighted moving average of the response latency in milliseconds.
+        /// Zero until the first request has completed.
+        /// </summary>
+        public double LatencyMilliseconds
+        {
+            get { lock (_lock) return _latencyEwma; }
+        }
+
+        /// <summary>
+        /// Gets the number of failed requests since the last successful one.
+        /// </summary>
+        public int ConsecutiveFailures
+        {
+            get { lock (_lock) return _consecutiveFailures; }
+        }
+
+        /// <summary>
+        /// Gets whether the endpoint currently receives traffic.
+        /// </summary>
+        public bool IsHealthy { get; private set; } = true;
+
+        /// <summary>
+        /// Gets the block count reported by the last successful health probe, or -1 if not probed yet.
+        /// </summary>
+        public int LastBlockCount { get; internal set; } = -1;
+
+        /// <summary>
+        /// Gets the reason the endpoint was last ejected, or null while it is healthy.
+        /// </summary>
+        public string EjectionReason { get; private set; }
+
+        /// <summary>
+        /// Routing cost of the endpoint: the expected latency weighted by the number of requests
+        /// queued on it. Endpoints without a latency sample cost nothing so they get probed first.
+        /// </summary>
+        internal double Score
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _hasLatency ? _latencyEwma * (OutstandingRequests + 1) : 0;
+                }
+            }
+        }
+
+        internal void OnRequestStarted()
+        {
+            Interlocked.Increment(ref _outstanding);
+        }
+
+        internal void OnRequestSucceeded(TimeSpan elapsed)
+        {
+            Interlocked.Decrement(ref _outstanding);
+            lock (_lock)
+            {
+                var sample = elapsed.TotalMilliseconds;
+                _latencyEwma = _hasLatency ? _smoothing * sample + (1 - _smoothing) * _latencyEwma : sample;
+                _hasLatency = true;
+                _consecutiveFailures = 0;
+            }
+        }
+
+        /// <summary>
+        /// Records a failed request and returns the number of consecutive failures.
+        /// </summary>
+        internal int OnRequestFailed()
+        {
+            Interlocked.Decrement(ref _outstanding);
+            lock (_lock)
+            {
+                return ++_consecutiveFailures;
+            }
+        }
+
+        /// <summary>
+        /// Records a request that ended without telling anything about the endpoint, such as a caller cancellation.
+        /// </summary>
+        internal void OnRequestAbandoned()
+        {
+            Interlocked.Decrement(ref _outstanding);
+        }
+
+        internal void Eject(string reason)
+        {
+            EjectionReason = reason;
+            IsHealthy = false;
+        }
+
+        internal void Admit()
+        {
+            lock (_lock)
+            {
+                _consecutiveFailures = 0;
+            }
+            EjectionReason = null;
+            IsHealthy = true;
+        }
+
+        /// <inheritdoc />
+        public override string ToString() => Url.ToString();
+    }
+}
@@ -0,0 +1,203 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// A set of interchangeable RPC nodes used by <see cref="HttpService"/> instead of a single URL.
+    /// Each request is routed to the healthy endpoint with the lowest latency-weighted load
+    /// (EWMA latency times outstanding requests). Endpoints are ejected after repeated failures
+    /// or when their block count lags behind the other nodes, and re-admitted once a health
+    /// probe shows them caught up again.
+    /// </summary>
+    public class RpcEndpointPool : IDisposable
+    {
+        private readonly RpcEndpoint[] _endpoints;
+        private readonly RpcEndpointPoolOptions _options;
+        private Func<Uri, CancellationToken, Task<int>> _blockCountProbe;
+        private Timer _healthTimer;
+        private int _probing;
+        private bool _disposed;
+
+        /// <summary>
+        /// Initializes a new instance of the RpcEndpointPool class.
+        /// </summary>
+        /// <param name="urls">The RPC endpoint URLs.</param>
+        /// <param name="options">The pool options.</param>
+        public RpcEndpointPool(IEnumerable<string> urls, RpcEndpointPoolOptions options = null)
+        {
+            if (urls == null)
+                throw new ArgumentNullException(nameof(urls));
+
+            _options = options ?? new RpcEndpointPoolOptions();
+            if (_options.LatencySmoothing <= 0 || _options.LatencySmoothing > 1)
+                throw new ArgumentOutOfRangeException(nameof(options), "Latency smoothing must be in (0, 1].");
+
+            _endpoints = urls.Select(url => new RpcEndpoint(new Uri(url), _options.LatencySmoothing)).ToArray();
+            if (_endpoints.Length == 0)
+                throw new ArgumentException("At least one endpoint URL is required.", nameof(urls));
+        }
+
+        /// <summary>
+        /// Gets the endpoints of the pool.
+        /// </summary>
+        public IReadOnlyList<RpcEndpoint> Endpoints => _endpoints;
+
+        /// <summary>
+        /// Gets the pool options.
+        /// </summary>
+        public RpcEndpointPoolOptions Options => _options;
+
+        /// <summary>
+        /// Gets the endpoints currently receiving traffic.
+        /// </summary>
+        public IEnumerable<RpcEndpoint> HealthyEndpoints => _endpoints.Where(e => e.IsHealthy);
+
+        /// <summary>
+        /// Probes every endpoint with getblockcount. Endpoints that fail the probe or trail the highest
+        /// block count by more than <see cref="RpcEndpointPoolOptions.MaxBlockLag"/> are ejected;
+        /// ejected endpoints that pass are re-admitted.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <exception cref="InvalidOperationException">Thrown if the pool is not used by an HttpService.</exception>
+        public async Task CheckHealthAsync(CancellationToken cancellationToken = default)
+        {
+            var probe = _blockCountProbe ?? throw new InvalidOperationException("The endpoint pool is not attached to an HttpService.");
+
+            // Periodic and explicit checks must not overlap.
+            if (Interlocked.Exchange(ref _probing, 1) == 1) return;
+
+            try
+            {
+                var results = await Task.WhenAll(_endpoints.Select(e => ProbeAsync(probe, e, cancellationToken)));
+                var highest = results.Max(r => r.BlockCount);
+
+                for (var i = 0; i < _endpoints.Length; i++)
+                {
+                    var endpoint = _endpoints[i];
+                    var (blockCount, error) = results[i];
+
+                    if (error != null)
+                    {
+                        endpoint.Eject($"Health probe failed: {error}");
+                        continue;
+                    }
+
+                    endpoint.LastBlockCount = blockCount;
+                    if (highest - blockCount > _options.MaxBlockLag)
+                    {
+                        endpoint.Eject($"Block count {blockCount} lags behind {highest}");
+                    }
+                    else if (!endpoint.IsHealthy)
+                    {
+                        endpoint.Admit();
+                    }
+                }
+            }
+            finally
+            {
+                Volatile.Write(ref _probing, 0);
+            }
+        }
+
+        /// <summary>
+        /// Selects the endpoint for the next request. When every endpoint has been ejected the one with
+        /// the fewest consecutive failures is used, so requests keep flowing while the nodes recover.
+        /// </summary>
+        /// <param name="exclude">An endpoint to avoid, e.g. one that just failed, unless it is the only one.</param>
+        /// <returns>The selected endpoint.</returns>
+        internal RpcEndpoint Select(RpcEndpoint exclude = null)
+        {
+            RpcEndpoint best = null;
+            var bestScore = double.MaxValue;
+
+            foreach (var endpoint in _endpoints)
+            {
+                if (!endpoint.IsHealthy || endpoint == exclude) continue;
+
+                var score = endpoint.Score;
+                if (best == null || score < bestScore ||
+                    (score == bestScore && endpoint.OutstandingRequests < best.OutstandingRequests))
+                {
+                    best = endpoint;
+                    bestScore = score;
+                }
+            }
+
+            return best ?? _endpoints
+                .OrderBy(e => e == exclude ? 1 : 0)
+                .ThenBy(e => e.ConsecutiveFailures)
+                .First();
+        }
+
+        /// <summary>
+        /// Records a failed request and ejects the endpoint once it reaches the failure threshold.
+        /// </summary>
+        internal void ReportFailure(RpcEndpoint endpoint, string reason)
+        {
+            var failures = endpoint.OnRequestFailed();
+            if (failures >= _options.FailureThreshold && endpoint.IsHealthy)
+            {
+                endpoint.Eject($"{failures} consecutive failures, last: {reason}");
+            }
+        }
+
+        /// <summary>
+        /// Connects the pool to the service issuing its health probes and starts periodic probing.
+        /// </summary>
+        internal void Attach(Func<Uri, CancellationToken, Task<int>> blockCountProbe)
+        {
+            if (_disposed)
+                throw new ObjectDisposedException(nameof(RpcEndpointPool));
+            if (_blockCountProbe != null)
+                throw new InvalidOperationException("The endpoint pool is already used by another HttpService.");
+
+            _blockCountProbe = blockCountProbe;
+
+            if (_options.HealthCheckInterval > 0)
+            {
+                var interval = TimeSpan.FromMilliseconds(_options.HealthCheckInterval);
+                _healthTimer = new Timer(_ => _ = RunPeriodicHealthCheckAsync(), null, interval, interval);
+            }
+        }
+
+        /// <summary>
+        /// Stops periodic health probing.
+        /// </summary>
+        public void Dispose()
+        {
+            if (_disposed) return;
+
+            _healthTimer?.Dispose();
+            _disposed = true;
+        }
+
+        private async Task RunPeriodicHealthCheckAsync()
+        {
+            try
+            {
+                await CheckHealthAsync();
+            }
+            catch
+            {
+                // Ignore probe errors to keep the timer running; endpoints are ejected individually.
+            }
+        }
+
+        private static async Task<(int BlockCount, string Error)> ProbeAsync(
+            Func<Uri, CancellationToken, Task<int>> probe, RpcEndpoint endpoint, CancellationToken cancellationToken)
+        {
+            try
+            {
+                return (await probe(endpoint.Url, cancellationToken), null);
+            }
+            catch (Exception ex) when (!cancellationToken.IsCancellationRequested)
+            {
+                return (-1, ex.Message);
+            }
+        }
+    }
+}
@@ -0,0 +1,50 @@
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Options for an <see cref="RpcEndpointPool"/>.
+    /// </summary>
+    public class RpcEndpointPoolOptions
+    {
+        /// <summary>
+        /// Default interval between health probes in milliseconds.
+        /// </summary>
+        public const int DEFAULT_HEALTH_CHECK_INTERVAL = 10000;
+
+        /// <summary>
+        /// Default number of blocks an endpoint may trail the highest reported block count.
+        /// </summary>
+        public const int DEFAULT_MAX_BLOCK_LAG = 2;
+
+        /// <summary>
+        /// Default number of consecutive failed requests after which an endpoint is ejected.
+        /// </summary>
+        public const int DEFAULT_FAILURE_THRESHOLD = 3;
+
+        /// <summary>
+        /// Default weight of the newest sample in the latency moving average.
+        /// </summary>
+        public const double DEFAULT_LATENCY_SMOOTHING = 0.3;
+
+        /// <summary>
+        /// Gets or sets the interval between health probes in milliseconds.
+        /// Zero disables periodic probing; <see cref="RpcEndpointPool.CheckHealthAsync"/> can still be called explicitly.
+        /// </summary>
+        public int HealthCheckInterval { get; set; } = DEFAULT_HEALTH_CHECK_INTERVAL;
+
+        /// <summary>
+        /// Gets or sets how many blocks an endpoint may trail the highest block count reported
+        /// by any endpoint before it is ejected.
+        /// </summary>
+        public int MaxBlockLag { get; set; } = DEFAULT_MAX_BLOCK_LAG;
+
+        /// <summary>
+        /// Gets or sets the number of consecutive failed requests after which an endpoint is ejected.
+        /// </summary>
+        public int FailureThreshold { get; set; } = DEFAULT_FAILURE_THRESHOLD;
+
+        /// <summary>
+        /// Gets or sets the weight (between 0 and 1) of the newest latency sample in the moving average.
+        /// </summary>
+        public double LatencySmoothing { get; set; } = DEFAULT_LATENCY_SMOOTHING;
+    }
+}
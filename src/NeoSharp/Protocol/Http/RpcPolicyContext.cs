@@ -0,0 +1,43 @@
+using System;
+using System.Net.Http;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Describes the call an <see cref="IRpcPolicy"/> is executing.
+    /// </summary>
+    public class RpcPolicyContext
+    {
+        /// <summary>
+        /// Initializes a new instance of the RpcPolicyContext class.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <param name="isIdempotent">Whether the call may be sent more than once.</param>
+        public RpcPolicyContext(string method, bool isIdempotent)
+        {
+            Method = method;
+            IsIdempotent = isIdempotent;
+        }
+
+        /// <summary>
+        /// Gets the RPC method name.
+        /// </summary>
+        public string Method { get; }
+
+        /// <summary>
+        /// Gets whether the call may be sent more than once, i.e. retried or hedged.
+        /// </summary>
+        public bool IsIdempotent { get; }
+
+        /// <summary>
+        /// Determines whether a failed call is worth repeating: the HTTP request failed or timed out.
+        /// Errors reported by the node itself are not transient.
+        /// </summary>
+        /// <param name="exception">The exception thrown by the call.</param>
+        /// <returns>True if the failure is transient.</returns>
+        public static bool IsTransient(Exception exception)
+        {
+            return exception is JsonRpcException { InnerException: HttpRequestException or TimeoutException or OperationCanceledException };
+        }
+    }
+}
@@ -0,0 +1,105 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// The resilience policies applied to the calls of an <see cref="HttpService"/>, together with the
+    /// per-method idempotency declarations the policies rely on. Policies are applied in list order, the
+    /// first one outermost. Only methods declared idempotent are ever retried or hedged; methods that change
+    /// state, such as sendrawtransaction, are not declared idempotent and are sent exactly once.
+    /// </summary>
+    public class RpcPolicyPipeline
+    {
+        private static readonly string[] ReadOnlyMethods =
+        {
+            "getbestblockhash", "getblock", "getblockcount", "getblockhash", "getblockheader", "getblockheadercount",
+            "getcommittee", "getconnectioncount", "getcontractstate", "getnativecontracts", "getnextblockvalidators",
+            "getpeers", "getrawmempool", "getrawtransaction", "getstorage", "gettransactionheight", "getversion",
+            "getunclaimedgas", "listplugins", "validateaddress", "invokefunction", "invokescript", "invokecontractverify",
+            "calculatenetworkfee", "getapplicationlog", "getnep17balances", "getnep17transfers", "getnep11balances",
+            "getnep11transfers", "getnep11properties", "getstateroot", "getproof", "verifyproof", "getstateheight",
+            "getstate", "findstates"
+        };
+
+        private readonly ConcurrentDictionary<string, bool> _idempotentMethods = new(StringComparer.Ordinal);
+
+        /// <summary>
+        /// Initializes a new instance of the RpcPolicyPipeline class with the given policies. The read-only
+        /// methods of the Neo RPC API are declared idempotent; every other method is not.
+        /// </summary>
+        /// <param name="policies">The policies, outermost first.</param>
+        public RpcPolicyPipeline(params IRpcPolicy[] policies)
+        {
+            Policies = new List<IRpcPolicy>(policies ?? Array.Empty<IRpcPolicy>());
+            foreach (var method in ReadOnlyMethods)
+            {
+                _idempotentMethods[method] = true;
+            }
+        }
+
+        /// <summary>
+        /// Gets the policies, outermost first.
+        /// </summary>
+        public IList<IRpcPolicy> Policies { get; }
+
+        /// <summary>
+        /// Creates a pipeline retrying transient failures, breaking the circuit after repeated failures
+        /// and hedging slow calls, in that order.
+        /// </summary>
+        /// <returns>The default pipeline.</returns>
+        public static RpcPolicyPipeline CreateDefault()
+        {
+            return new RpcPolicyPipeline(new RetryPolicy(), new CircuitBreakerPolicy(), new HedgingPolicy());
+        }
+
+        /// <summary>
+        /// Declares whether calls of a method may be sent more than once.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <param name="isIdempotent">Whether the method is idempotent.</param>
+        /// <returns>The updated pipeline.</returns>
+        public RpcPolicyPipeline DeclareIdempotent(string method, bool isIdempotent = true)
+        {
+            if (string.IsNullOrEmpty(method))
+                throw new ArgumentException("Method name is required.", nameof(method));
+
+            if (isIdempotent)
+            {
+                _idempotentMethods[method] = true;
+            }
+            else
+            {
+                _idempotentMethods.TryRemove(method, out _);
+            }
+            return this;
+        }
+
+        /// <summary>
+        /// Determines whether calls of a method may be sent more than once.
+        /// </summary>
+        /// <param name="method">The RPC method name.</param>
+        /// <returns>True if the method has been declared idempotent.</returns>
+        public bool IsIdempotent(string method) => method != null && _idempotentMethods.ContainsKey(method);
+
+        /// <summary>
+        /// Executes a call under all policies.
+        /// </summary>
+        internal Task<T> ExecuteAsync<T>(string method, Func<CancellationToken, Task<T>> operation, CancellationToken cancellationToken)
+        {
+            var context = new RpcPolicyContext(method, IsIdempotent(method));
+
+            for (var i = Policies.Count - 1; i >= 0; i--)
+            {
+                var policy = Policies[i];
+                var inner = operation;
+                operation = token => policy.ExecuteAsync(context, inner, token);
+            }
+
+            return operation(cancellationToken);
+        }
+    }
+}
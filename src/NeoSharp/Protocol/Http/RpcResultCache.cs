@@ -0,0 +1,421 @@
+using System;
+using System.Buffers;
+using System.Buffers.Binary;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Security.Cryptography;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Cache for JSON-RPC results that can no longer change: blocks, block hashes, headers, persisted
+    /// transactions and application logs. Results are keyed by method and canonical parameters and kept
+    /// as the JSON returned by the node, in a size-bounded LRU with an optional on-disk tier.
+    /// A result is only cached once the block it belongs to is <see cref="RpcResultCacheOptions.ConfirmationDepth"/>
+    /// blocks below the tip; anything else, including mempool transactions, is always fetched.
+    /// </summary>
+    public class RpcResultCache
+    {
+        // Offset of the index in a serialized header: version, previous hash, merkle root, timestamp, nonce.
+        private const int HeaderIndexOffset = 4 + 32 + 32 + 8 + 8;
+
+        private static readonly HashSet<string> CacheableMethods = new(StringComparer.Ordinal)
+        {
+            "getblock", "getblockheader", "getblockhash", "getrawtransaction", "getapplicationlog"
+        };
+
+        private readonly RpcResultCacheOptions _options;
+        private readonly object _lock = new();
+        private readonly Dictionary<string, LinkedListNode<CacheEntry>> _entries = new(StringComparer.Ordinal);
+        private readonly LinkedList<CacheEntry> _lru = new();
+        private Func<string, object[], CancellationToken, Task<JsonElement>> _send;
+        private long _memoryUsage;
+        private int _blockCount;
+        private long _blockCountRefreshed;
+        private long _memoryHits;
+        private long _diskHits;
+        private long _misses;
+        private long _skipped;
+        private long _evictions;
+
+        /// <summary>
+        /// Initializes a new instance of the RpcResultCache class.
+        /// </summary>
+        /// <param name="options">The cache options.</param>
+        public RpcResultCache(RpcResultCacheOptions options = null)
+        {
+            _options = options ?? new RpcResultCacheOptions();
+            if (_options.MaxMemoryUsage < 0)
+                throw new ArgumentOutOfRangeException(nameof(options), "Memory budget must not be negative.");
+            if (_options.ConfirmationDepth < 0)
+                throw new ArgumentOutOfRangeException(nameof(options), "Confirmation depth must not be negative.");
+
+            if (_options.DiskCacheDirectory != null)
+            {
+                Directory.CreateDirectory(_options.DiskCacheDirectory);
+            }
+        }
+
+        /// <summary>
+        /// Gets the cache options.
+        /// </summary>
+        public RpcResultCacheOptions Options => _options;
+
+        /// <summary>
+        /// Gets a snapshot of the cache counters.
+        /// </summary>
+        public RpcResultCacheStatistics Statistics
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return new RpcResultCacheStatistics(
+                        Interlocked.Read(ref _memoryHits),
+                        Interlocked.Read(ref _diskHits),
+                        Interlocked.Read(ref _misses),
+                        Interlocked.Read(ref _skipped),
+                        Interlocked.Read(ref _evictions),
+                        _entries.Count,
+                        _memoryUsage);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the highest block count seen by the cache, or zero if none has been seen yet.
+        /// </summary>
+        public int KnownBlockCount => Volatile.Read(ref _blockCount);
+
+        /// <summary>
+        /// Removes all results from memory and, optionally, from the on-disk tier.
+        /// </summary>
+        /// <param name="includeDisk">Whether to delete the cached files as well.</param>
+        public void Clear(bool includeDisk = false)
+        {
+            lock (_lock)
+            {
+                _entries.Clear();
+                _lru.Clear();
+                _memoryUsage = 0;
+            }
+
+            if (includeDisk && _options.DiskCacheDirectory != null && Directory.Exists(_options.DiskCacheDirectory))
+            {
+                foreach (var file in Directory.EnumerateFiles(_options.DiskCacheDirectory, "*.json"))
+                {
+                    File.Delete(file);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Determines whether results of the given method are candidates for caching.
+        /// </summary>
+        internal static bool IsCacheable(string method) => CacheableMethods.Contains(method);
+
+        /// <summary>
+        /// Connects the cache to the service whose results it holds. The send callback is used for the
+        /// getblockcount and gettransactionheight calls needed to decide whether a result is deep enough.
+        /// </summary>
+        internal void Attach(Func<string, object[], CancellationToken, Task<JsonElement>> send)
+        {
+            if (_send != null)
+                throw new InvalidOperationException("The result cache is already used by another HttpService.");
+
+            _send = send;
+        }
+
+        /// <summary>
+        /// Records a block count reported by the node.
+        /// </summary>
+        internal void ObserveBlockCount(int blockCount)
+        {
+            var current = Volatile.Read(ref _blockCount);
+            while (blockCount > current)
+            {
+                var previous = Interlocked.CompareExchange(ref _blockCount, blockCount, current);
+                if (previous == current) return;
+                current = previous;
+            }
+        }
+
+        /// <summary>
+        /// Looks up the cached JSON of a result, first in memory and then on disk.
+        /// </summary>
+        /// <returns>The UTF-8 JSON of the result, or null on a miss.</returns>
+        internal async Task<byte[]> TryGetAsync(string key, CancellationToken cancellationToken)
+        {
+            lock (_lock)
+            {
+                if (_entries.TryGetValue(key, out var node))
+                {
+                    _lru.Remove(node);
+                    _lru.AddFirst(node);
+                    Interlocked.Increment(ref _memoryHits);
+                    return node.Value.Json;
+                }
+            }
+
+            var path = GetDiskPath(key);
+            if (path != null)
+            {
+                byte[] json = null;
+                try
+                {
+                    json = await File.ReadAllBytesAsync(path, cancellationToken);
+                }
+                catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+                {
+                    // Missing or unreadable files are plain misses.
+                }
+
+                if (json != null)
+                {
+                    Interlocked.Increment(ref _diskHits);
+                    AddToMemory(key, json);
+                    return json;
+                }
+            }
+
+            Interlocked.Increment(ref _misses);
+            return null;
+        }
+
+        /// <summary>
+        /// Caches a freshly fetched result if the block it belongs to is deep enough.
+        /// </summary>
+        /// <returns>True if the result was cached.</returns>
+        internal async Task<bool> AddAsync(string key, string method, object[] parameters, JsonElement result, CancellationToken cancellationToken)
+        {
+            bool isFinal;
+            try
+            {
+                isFinal = result.ValueKind != JsonValueKind.Null && result.ValueKind != JsonValueKind.Undefined &&
+                          await IsFinalAsync(method, parameters, result, cancellationToken);
+            }
+            catch (Exception)
+            {
+                // The lookups deciding the depth failed, e.g. the transaction is not persisted yet or the node
+                // answered with an unexpected shape. The caller's result is unaffected; it is just not cached.
+                isFinal = false;
+            }
+
+            if (!isFinal)
+            {
+                Interlocked.Increment(ref _skipped);
+                return false;
+            }
+
+            var buffer = new ArrayBufferWriter<byte>();
+            using (var writer = new Utf8JsonWriter(buffer))
+            {
+                result.WriteTo(writer);
+            }
+            var json = buffer.WrittenSpan.ToArray();
+            AddToMemory(key, json);
+
+            var path = GetDiskPath(key);
+            if (path != null)
+            {
+                try
+                {
+                    // Write to a temporary file first so readers never see a partial result.
+                    var temporary = path + "." + Guid.NewGuid().ToString("N") + ".tmp";
+                    await File.WriteAllBytesAsync(temporary, json, cancellationToken);
+                    File.Move(temporary, path, true);
+                }
+                catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+                {
+                    // The memory tier still holds the result.
+                }
+            }
+
+            return true;
+        }
+
+        private async Task<bool> IsFinalAsync(string method, object[] parameters, JsonElement result, CancellationToken cancellationToken)
+        {
+            switch (method)
+            {
+                case "getblockhash":
+                    return await IsDeepEnoughAsync(Convert.ToInt32(parameters[0]), cancellationToken);
+
+                case "getblock":
+                case "getblockheader":
+                    if (result.ValueKind == JsonValueKind.Object)
+                    {
+                        return IsConfirmedObject(result);
+                    }
+                    if (parameters[0] is int index)
+                    {
+                        return await IsDeepEnoughAsync(index, cancellationToken);
+                    }
+                    return TryReadHeaderIndex(result, out var headerIndex) && await IsDeepEnoughAsync(headerIndex, cancellationToken);
+
+                case "getrawtransaction":
+                    if (result.ValueKind == JsonValueKind.Object)
+                    {
+                        // Mempool transactions are returned without confirmations.
+                        return IsConfirmedObject(result);
+                    }
+                    return await IsTransactionDeepEnoughAsync(parameters[0]?.ToString(), cancellationToken);
+
+                case "getapplicationlog":
+                    if (result.TryGetProperty("txid", out var txid))
+                    {
+                        return await IsTransactionDeepEnoughAsync(txid.GetString(), cancellationToken);
+                    }
+                    if (result.TryGetProperty("blockhash", out var blockHash))
+                    {
+                        var header = await _send("getblockheader", new object[] { blockHash.GetString(), true }, cancellationToken);
+                        return IsConfirmedObject(header);
+                    }
+                    return false;
+
+                default:
+                    return false;
+            }
+        }
+
+        private bool IsConfirmedObject(JsonElement result)
+        {
+            if (result.ValueKind != JsonValueKind.Object ||
+                !result.TryGetProperty("confirmations", out var confirmations) || !TryGetInt32(confirmations, out var count))
+            {
+                return false;
+            }
+
+            if (result.TryGetProperty("index", out var index) && TryGetInt32(index, out var height))
+            {
+                ObserveBlockCount(height + count);
+            }
+
+            // Confirmations count the block itself.
+            return count - 1 >= _options.ConfirmationDepth;
+        }
+
+        private async Task<bool> IsTransactionDeepEnoughAsync(string txHash, CancellationToken cancellationToken)
+        {
+            if (txHash == null) return false;
+
+            var height = await _send("gettransactionheight", new object[] { txHash }, cancellationToken);
+            return TryGetInt32(height, out var value) && await IsDeepEnoughAsync(value, cancellationToken);
+        }
+
+        private async Task<bool> IsDeepEnoughAsync(int height, CancellationToken cancellationToken)
+        {
+            if (IsBelowDepth(height)) return true;
+
+            // The known block count may be stale; refresh it, but not more often than configured.
+            var now = Stopwatch.GetTimestamp();
+            var last = Interlocked.Read(ref _blockCountRefreshed);
+            if (last != 0 && Stopwatch.GetElapsedTime(last, now).TotalMilliseconds < _options.BlockCountRefreshInterval)
+            {
+                return false;
+            }
+            if (Interlocked.CompareExchange(ref _blockCountRefreshed, now, last) != last)
+            {
+                return false;
+            }
+
+            var blockCount = await _send("getblockcount", null, cancellationToken);
+            if (!TryGetInt32(blockCount, out var count)) return false;
+
+            ObserveBlockCount(count);
+            return IsBelowDepth(height);
+        }
+
+        private bool IsBelowDepth(int height)
+        {
+            // The tip is at index blockCount - 1.
+            return KnownBlockCount - 1 - height >= _options.ConfirmationDepth;
+        }
+
+        // JsonElement.TryGetInt32 throws for anything but a number, e.g. a null result.
+        private static bool TryGetInt32(JsonElement element, out int value)
+        {
+            value = 0;
+            return element.ValueKind == JsonValueKind.Number && element.TryGetInt32(out value);
+        }
+
+        private static bool TryReadHeaderIndex(JsonElement result, out int index)
+        {
+            index = 0;
+            if (result.ValueKind != JsonValueKind.String) return false;
+
+            // Only the first 90 bytes of the block are needed to reach the index.
+            var base64 = result.GetString();
+            if (base64 == null || base64.Length < 120) return false;
+
+            Span<byte> header = stackalloc byte[90];
+            if (!Convert.TryFromBase64Chars(base64.AsSpan(0, 120), header, out var written) || written < HeaderIndexOffset + 4)
+            {
+                return false;
+            }
+
+            index = (int)BinaryPrimitives.ReadUInt32LittleEndian(header[HeaderIndexOffset..]);
+            return true;
+        }
+
+        private void AddToMemory(string key, byte[] json)
+        {
+            var size = EstimateSize(key, json);
+            if (size > _options.MaxMemoryUsage) return;
+
+            lock (_lock)
+            {
+                if (_entries.TryGetValue(key, out var existing))
+                {
+                    _lru.Remove(existing);
+                    _memoryUsage -= existing.Value.Size;
+                    _entries.Remove(key);
+                }
+
+                var node = _lru.AddFirst(new CacheEntry(key, json, size));
+                _entries[key] = node;
+                _memoryUsage += size;
+
+                while (_memoryUsage > _options.MaxMemoryUsage && _lru.Last != null)
+                {
+                    var evicted = _lru.Last;
+                    _lru.RemoveLast();
+                    _entries.Remove(evicted.Value.Key);
+                    _memoryUsage -= evicted.Value.Size;
+                    Interlocked.Increment(ref _evictions);
+                }
+            }
+        }
+
+        private string GetDiskPath(string key)
+        {
+            if (_options.DiskCacheDirectory == null) return null;
+
+            var hash = SHA256.HashData(Encoding.UTF8.GetBytes(key));
+            return Path.Combine(_options.DiskCacheDirectory, Convert.ToHexString(hash).ToLowerInvariant() + ".json");
+        }
+
+        private static long EstimateSize(string key, byte[] json) => json.Length + key.Length * sizeof(char) + 96; // Approximate overhead
+
+        private sealed class CacheEntry
+        {
+            public CacheEntry(string key, byte[] json, long size)
+            {
+                Key = key;
+                Json = json;
+                Size = size;
+            }
+
+            public string Key { get; }
+
+            public byte[] Json { get; }
+
+            public long Size { get; }
+        }
+    }
+}
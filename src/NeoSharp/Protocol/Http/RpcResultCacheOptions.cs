@@ -0,0 +1,47 @@
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Options for an <see cref="RpcResultCache"/>.
+    /// </summary>
+    public class RpcResultCacheOptions
+    {
+        /// <summary>
+        /// Default memory budget of the in-memory tier in bytes.
+        /// </summary>
+        public const long DEFAULT_MAX_MEMORY_USAGE = 64 * 1024 * 1024;
+
+        /// <summary>
+        /// Default number of blocks that must follow a block before results from it are cached.
+        /// </summary>
+        public const int DEFAULT_CONFIRMATION_DEPTH = 1;
+
+        /// <summary>
+        /// Default minimum interval between block count refreshes in milliseconds.
+        /// </summary>
+        public const int DEFAULT_BLOCK_COUNT_REFRESH_INTERVAL = 1000;
+
+        /// <summary>
+        /// Gets or sets the memory budget of the in-memory tier in bytes. The least recently used
+        /// results are evicted once the cached JSON exceeds it.
+        /// </summary>
+        public long MaxMemoryUsage { get; set; } = DEFAULT_MAX_MEMORY_USAGE;
+
+        /// <summary>
+        /// Gets or sets the directory of the on-disk tier, or null to cache in memory only.
+        /// The directory is not size-bounded and may be deleted at any time.
+        /// </summary>
+        public string DiskCacheDirectory { get; set; }
+
+        /// <summary>
+        /// Gets or sets how many blocks must have been persisted on top of the block a result
+        /// belongs to before the result is cached. Zero caches results of the current tip.
+        /// </summary>
+        public int ConfirmationDepth { get; set; } = DEFAULT_CONFIRMATION_DEPTH;
+
+        /// <summary>
+        /// Gets or sets the minimum interval in milliseconds between getblockcount calls the cache
+        /// issues to decide whether a recent result is deep enough.
+        /// </summary>
+        public int BlockCountRefreshInterval { get; set; } = DEFAULT_BLOCK_COUNT_REFRESH_INTERVAL;
+    }
+}
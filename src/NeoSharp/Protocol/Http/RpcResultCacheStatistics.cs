@@ -0,0 +1,66 @@
+namespace NeoSharp.Protocol.Http
+{
+    /// <summary>
+    /// Snapshot of the counters of an <see cref="RpcResultCache"/>.
+    /// </summary>
+    public class RpcResultCacheStatistics
+    {
+        internal RpcResultCacheStatistics(long memoryHits, long diskHits, long misses, long skipped, long evictions, int count, long memoryUsage)
+        {
+            MemoryHits = memoryHits;
+            DiskHits = diskHits;
+            Misses = misses;
+            Skipped = skipped;
+            Evictions = evictions;
+            Count = count;
+            MemoryUsage = memoryUsage;
+        }
+
+        /// <summary>
+        /// Gets the number of lookups answered from memory.
+        /// </summary>
+        public long MemoryHits { get; }
+
+        /// <summary>
+        /// Gets the number of lookups answered from the on-disk tier.
+        /// </summary>
+        public long DiskHits { get; }
+
+        /// <summary>
+        /// Gets the number of lookups that had to be sent to the node.
+        /// </summary>
+        public long Misses { get; }
+
+        /// <summary>
+        /// Gets the number of fetched results not cached because they were not deep enough in the chain.
+        /// </summary>
+        public long Skipped { get; }
+
+        /// <summary>
+        /// Gets the number of results evicted from memory.
+        /// </summary>
+        public long Evictions { get; }
+
+        /// <summary>
+        /// Gets the number of results held in memory.
+        /// </summary>
+        public int Count { get; }
+
+        /// <summary>
+        /// Gets the size in bytes of the results held in memory.
+        /// </summary>
+        public long MemoryUsage { get; }
+
+        /// <summary>
+        /// Gets the fraction of lookups answered from memory or disk.
+        /// </summary>
+        public double HitRate
+        {
+            get
+            {
+                var total = MemoryHits + DiskHits + Misses;
+                return total == 0 ? 0 : (double)(MemoryHits + DiskHits) / total;
+            }
+        }
+    }
+}
@@ -1,12 +1,16 @@
 using System;
 using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
 using System.Linq;
+using System.Runtime.CompilerServices;
 using System.Threading;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 using NeoSharp.Protocol.Core.Response;
 using NeoSharp.Protocol.Http;
 using NeoSharp.Protocol.Models;
+using NeoSharp.Serialization;
 using NeoSharp.Types;
 
 namespace NeoSharp.Protocol
@@ -53,12 +57,67 @@ namespace NeoSharp.Protocol
         /// <param name="config">The configuration.</param>
         /// <param name="logger">The logger.</param>
         public NeoSharp(string url, NeoSharpConfig config = null, ILogger<NeoSharp> logger = null)
+            : this(new HttpService(url, logger: logger as ILogger<HttpService>), config, logger)
+        {
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the NeoSharp class routing requests over several RPC endpoints.
+        /// </summary>
+        /// <param name="urls">The RPC endpoint URLs.</param>
+        /// <param name="config">The configuration.</param>
+        /// <param name="logger">The logger.</param>
+        public NeoSharp(IEnumerable<string> urls, NeoSharpConfig config = null, ILogger<NeoSharp> logger = null)
+            : this(new HttpService(new RpcEndpointPool(urls), logger: logger as ILogger<HttpService>), config, logger)
+        {
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the NeoSharp class using an existing HTTP service.
+        /// </summary>
+        /// <param name="httpService">The HTTP service used for JSON-RPC communication.</param>
+        /// <param name="config">The configuration. If null, the defaults are used and the batching settings
+        /// already set on <paramref name="httpService"/> are left unchanged.</param>
+        /// <param name="logger">The logger.</param>
+        public NeoSharp(HttpService httpService, NeoSharpConfig config = null, ILogger<NeoSharp> logger = null)
         {
             _config = config ?? new NeoSharpConfig();
-            _httpService = new HttpService(url, logger: logger as ILogger<HttpService>);
+            _httpService = httpService ?? throw new ArgumentNullException(nameof(httpService));
+            if (config != null)
+            {
+                // Without an explicit config the caller's own batching settings on the service are kept.
+                _httpService.MicroBatchWindow = config.MicroBatchWindow;
+                _httpService.MaxBatchSize = config.MaxBatchSize;
+            }
+            if (_config.RequestCoalescing != null)
+            {
+                _httpService.RequestCoalescing = _config.RequestCoalescing;
+            }
+            if (_config.Resilience != null)
+            {
+                _httpService.Policies = _config.Resilience;
+            }
+            if (_config.ConcurrencyLimit != null && _httpService.ConcurrencyLimiter == null)
+            {
+                _httpService.ConcurrencyLimiter = new AdaptiveConcurrencyLimiter(_config.ConcurrencyLimit);
+            }
+            if (_config.ResultCache != null && _httpService.ResultCache == null)
+            {
+                _httpService.ResultCache = new RpcResultCache(_config.ResultCache);
+            }
             _logger = logger;
         }
 
+        /// <summary>
+        /// Gets the cache for immutable results, or null if caching is disabled.
+        /// </summary>
+        public RpcResultCache ResultCache => _httpService.ResultCache;
+
+        /// <summary>
+        /// Gets the concurrency limiter, or null if requests are sent without limit.
+        /// </summary>
+        public AdaptiveConcurrencyLimiter ConcurrencyLimiter => _httpService.ConcurrencyLimiter;
+
         /// <summary>
         /// Allows transmission of scripts that lead to a FAULT VM state.
         /// </summary>
@@ -67,6 +126,144 @@ namespace NeoSharp.Protocol
             _config.EnableTransmissionOnFault();
         }
 
+        /// <summary>
+        /// Creates a batch collecting several calls into a single JSON-RPC request.
+        /// </summary>
+        /// <returns>A new, empty batch.</returns>
+        public NeoSharpBatch CreateBatch()
+        {
+            return new NeoSharpBatch(_httpService);
+        }
+
+        /// <summary>
+        /// Builds a batch with the given callback and sends it as a single JSON-RPC request.
+        /// </summary>
+        /// <param name="build">Callback adding calls to the batch and keeping the returned tasks.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>A task that completes once every call of the batch has completed.</returns>
+        public async Task BatchAsync(Action<NeoSharpBatch> build, CancellationToken cancellationToken = default)
+        {
+            if (build == null)
+                throw new ArgumentNullException(nameof(build));
+
+            var batch = CreateBatch();
+            build(batch);
+            await batch.ExecuteAsync(cancellationToken);
+        }
+
+        /// <summary>
+        /// Streams the blocks of a height range in strict height order. Blocks are fetched ahead of the
+        /// consumer with bounded parallelism, optionally in JSON-RPC batches, and fetching pauses while
+        /// the consumer falls behind. With <see cref="BlockStreamOptions.Follow"/> set, the stream catches
+        /// up with the chain head and then polls for new blocks every <see cref="BlockInterval"/>.
+        /// </summary>
+        /// <param name="fromIndex">The index of the first block.</param>
+        /// <param name="toIndex">The index of the last block, or null for the chain head. Without
+        /// <see cref="BlockStreamOptions.Follow"/> the stream stops at the chain head if it is lower.</param>
+        /// <param name="options">The stream options.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The blocks in height order.</returns>
+        public async IAsyncEnumerable<NeoBlock> StreamBlocksAsync(int fromIndex, int? toIndex = null, BlockStreamOptions options = null,
+            [EnumeratorCancellation] CancellationToken cancellationToken = default)
+        {
+            options ??= new BlockStreamOptions();
+            if (fromIndex < 0)
+                throw new ArgumentOutOfRangeException(nameof(fromIndex), "Block index must not be negative.");
+            if (options.MaxParallelism <= 0 || options.BatchSize <= 0 || options.CheckpointInterval <= 0)
+                throw new ArgumentOutOfRangeException(nameof(options), "Parallelism, batch size and checkpoint interval must be positive.");
+
+            var next = fromIndex;
+            if (options.CheckpointPath != null && File.Exists(options.CheckpointPath) &&
+                int.TryParse(await File.ReadAllTextAsync(options.CheckpointPath, cancellationToken), out var checkpoint))
+            {
+                next = Math.Max(next, checkpoint + 1);
+                _logger?.LogDebug("Resuming block stream after checkpoint {Index}", checkpoint);
+            }
+
+            using var fetching = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+            var pending = new Queue<Task<NeoBlock[]>>();
+            var head = await GetBlockCountAsync(cancellationToken) - 1;
+            var consumed = -1;
+            var saved = -1;
+
+            try
+            {
+                while (true)
+                {
+                    var last = toIndex.HasValue ? Math.Min(toIndex.Value, head) : head;
+                    while (pending.Count < options.MaxParallelism && next <= last)
+                    {
+                        var count = Math.Min(options.BatchSize, last - next + 1);
+                        pending.Enqueue(FetchBlocksAsync(next, count, options.ReturnFullTransactionObjects, fetching.Token));
+                        next += count;
+                    }
+
+                    if (pending.Count > 0)
+                    {
+                        foreach (var block in await pending.Dequeue())
+                        {
+                            yield return block;
+
+                            // The consumer asked for the next block, so it is done with this one.
+                            consumed = block.Index;
+                            if (options.CheckpointPath != null && consumed - saved >= options.CheckpointInterval)
+                            {
+                                await WriteCheckpointAsync(options.CheckpointPath, consumed, cancellationToken);
+                                saved = consumed;
+                            }
+                        }
+                        continue;
+                    }
+
+                    if (toIndex.HasValue && next > toIndex.Value) break;
+                    if (!options.Follow && !toIndex.HasValue) break;
+
+                    // Caught up with the head: look for blocks produced in the meantime.
+                    var previousHead = head;
+                    head = await GetBlockCountAsync(cancellationToken) - 1;
+                    if (head > previousHead) continue;
+                    if (!options.Follow) break;
+
+                    await Task.Delay(BlockInterval, cancellationToken);
+                }
+
+                if (options.CheckpointPath != null && consumed > saved)
+                {
+                    await WriteCheckpointAsync(options.CheckpointPath, consumed, cancellationToken);
+                }
+            }
+            finally
+            {
+                // The consumer stopped early or a fetch failed: abandon the blocks fetched ahead.
+                fetching.Cancel();
+                foreach (var task in pending)
+                {
+                    _ = task.ContinueWith(t => t.Exception, TaskContinuationOptions.OnlyOnFaulted);
+                }
+            }
+        }
+
+        private async Task<NeoBlock[]> FetchBlocksAsync(int fromIndex, int count, bool returnFullTransactionObjects, CancellationToken cancellationToken)
+        {
+            if (count == 1)
+            {
+                return new[] { await GetBlockAsync(fromIndex, returnFullTransactionObjects, cancellationToken) };
+            }
+
+            var batch = CreateBatch();
+            var blocks = Enumerable.Range(fromIndex, count).Select(index => batch.GetBlockAsync(index, returnFullTransactionObjects)).ToArray();
+            await batch.ExecuteAsync(cancellationToken);
+            return await Task.WhenAll(blocks);
+        }
+
+        private static async Task WriteCheckpointAsync(string path, int index, CancellationToken cancellationToken)
+        {
+            // Write then rename, so that a crash never leaves a truncated checkpoint.
+            var temporary = path + ".tmp";
+            await File.WriteAllTextAsync(temporary, index.ToString(CultureInfo.InvariantCulture), cancellationToken);
+            File.Move(temporary, path, true);
+        }
+
         #region Blockchain Methods
 
         public async Task<Hash256> GetBestBlockHashAsync(CancellationToken cancellationToken = default)
@@ -131,6 +328,51 @@ namespace NeoSharp.Protocol
             return await _httpService.SendAsync<string>("getblockheader", new object[] { blockIndex, false }, cancellationToken);
         }
 
+        /// <summary>
+        /// Gets a block in its binary form and decodes it locally. The binary form is several times
+        /// smaller than the verbose JSON block and cheaper to decode; hashes are computed locally.
+        /// </summary>
+        /// <param name="blockIndex">The block index.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The decoded block.</returns>
+        public async Task<Block> GetBinaryBlockAsync(int blockIndex, CancellationToken cancellationToken = default)
+        {
+            return Block.FromBase64(await GetRawBlockAsync(blockIndex, cancellationToken));
+        }
+
+        /// <summary>
+        /// Gets a block in its binary form and decodes it locally.
+        /// </summary>
+        /// <param name="blockHash">The block hash.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The decoded block.</returns>
+        public async Task<Block> GetBinaryBlockAsync(Hash256 blockHash, CancellationToken cancellationToken = default)
+        {
+            return Block.FromBase64(await GetRawBlockAsync(blockHash, cancellationToken));
+        }
+
+        /// <summary>
+        /// Gets a block header in its binary form and decodes it locally.
+        /// </summary>
+        /// <param name="blockIndex">The block index.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The decoded header.</returns>
+        public async Task<Header> GetBinaryBlockHeaderAsync(int blockIndex, CancellationToken cancellationToken = default)
+        {
+            return Header.FromBase64(await GetRawBlockHeaderAsync(blockIndex, cancellationToken));
+        }
+
+        /// <summary>
+        /// Gets a block header in its binary form and decodes it locally.
+        /// </summary>
+        /// <param name="blockHash">The block hash.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The decoded header.</returns>
+        public async Task<Header> GetBinaryBlockHeaderAsync(Hash256 blockHash, CancellationToken cancellationToken = default)
+        {
+            return Header.FromBase64(await GetRawBlockHeaderAsync(blockHash, cancellationToken));
+        }
+
         public async Task<IList<NativeContractState>> GetNativeContractsAsync(CancellationToken cancellationToken = default)
         {
             var result = await _httpService.SendAsync<List<NativeContractState>>("getnativecontracts", null, cancellationToken);
@@ -174,6 +416,18 @@ namespace NeoSharp.Protocol
             return await _httpService.SendAsync<string>("getrawtransaction", new object[] { txHash.ToString(), false }, cancellationToken);
         }
 
+        /// <summary>
+        /// Gets a transaction in its binary form and decodes it locally.
+        /// </summary>
+        /// <param name="txHash">The transaction hash.</param>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The decoded transaction.</returns>
+        public async Task<Transaction.Transaction> GetBinaryTransactionAsync(Hash256 txHash, CancellationToken cancellationToken = default)
+        {
+            var raw = await GetRawTransactionAsync(txHash, cancellationToken);
+            return NeoSerializableExtensions.FromArray<Transaction.Transaction>(Convert.FromBase64String(raw));
+        }
+
         public async Task<string> GetStorageAsync(Hash160 contractHash, string keyHexString, CancellationToken cancellationToken = default)
         {
             return await _httpService.SendAsync<string>("getstorage", new object[] { contractHash.ToString(), keyHexString }, cancellationToken);
@@ -402,11 +656,11 @@ namespace NeoSharp.Protocol
 
         public async Task<Transaction.Transaction> SendManyAsync(IList<TransactionSendToken> txSendTokens, CancellationToken cancellationToken = default)
         {
-            var transfers = txSendTokens.Select(t => new
+            var transfers = txSendTokens.Select(t => new Dictionary<string, string>
             {
-                asset = t.Asset.ToString(),
-                value = t.Value,
-                address = t.Address
+                ["asset"] = t.Asset.ToString(),
+                ["value"] = t.Value,
+                ["address"] = t.Address
             }).ToList();
 
             return await _httpService.SendAsync<Transaction.Transaction>("sendmany", new object[] { transfers }, cancellationToken);
@@ -414,11 +668,11 @@ namespace NeoSharp.Protocol
 
         public async Task<Transaction.Transaction> SendManyAsync(Hash160 from, IList<TransactionSendToken> txSendTokens, CancellationToken cancellationToken = default)
         {
-            var transfers = txSendTokens.Select(t => new
+            var transfers = txSendTokens.Select(t => new Dictionary<string, string>
             {
-                asset = t.Asset.ToString(),
-                value = t.Value,
-                address = t.Address
+                ["asset"] = t.Asset.ToString(),
+                ["value"] = t.Value,
+                ["address"] = t.Address
             }).ToList();
 
             return await _httpService.SendAsync<Transaction.Transaction>("sendmany", new object[] { from.ToString(), transfers }, cancellationToken);
@@ -0,0 +1,188 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Types;
+
+namespace NeoSharp.Protocol
+{
+    /// <summary>
+    /// Collects JSON-RPC calls and sends them to the node in a single batch request.
+    /// The tasks returned when adding calls complete once <see cref="ExecuteAsync"/> has received
+    /// the batch response; an error for one call only fails that call's task.
+    /// </summary>
+    public class NeoSharpBatch
+    {
+        private readonly HttpService _httpService;
+        private readonly List<IJsonRpcBatchEntry> _entries = new();
+        private bool _executed;
+
+        internal NeoSharpBatch(HttpService httpService)
+        {
+            _httpService = httpService ?? throw new ArgumentNullException(nameof(httpService));
+        }
+
+        /// <summary>
+        /// Gets the number of calls added to the batch.
+        /// </summary>
+        public int Count => _entries.Count;
+
+        /// <summary>
+        /// Adds a raw JSON-RPC call to the batch.
+        /// </summary>
+        /// <typeparam name="T">The result type.</typeparam>
+        /// <param name="method">The RPC method name.</param>
+        /// <param name="parameters">The method parameters.</param>
+        /// <returns>A task completed with the result once the batch has been executed.</returns>
+        public Task<T> Add<T>(string method, params object[] parameters)
+        {
+            if (string.IsNullOrEmpty(method))
+                throw new ArgumentNullException(nameof(method));
+            if (_executed)
+                throw new InvalidOperationException("The batch has already been executed.");
+
+            var entry = new JsonRpcBatchEntry<T>(HttpService.CreateRequest(method, parameters));
+            _entries.Add(entry);
+            return entry.Task;
+        }
+
+        /// <summary>
+        /// Adds a call getting the hash of the tallest block in the main chain.
+        /// </summary>
+        public Task<Hash256> GetBestBlockHashAsync()
+        {
+            return Map(Add<string>("getbestblockhash"), Hash256.Parse);
+        }
+
+        /// <summary>
+        /// Adds a call getting the hash of a specific block by its index.
+        /// </summary>
+        public Task<Hash256> GetBlockHashAsync(int blockIndex)
+        {
+            return Map(Add<string>("getblockhash", blockIndex), Hash256.Parse);
+        }
+
+        /// <summary>
+        /// Adds a call getting block information by block hash.
+        /// </summary>
+        public Task<NeoBlock> GetBlockAsync(Hash256 blockHash, bool returnFullTransactionObjects = false)
+        {
+            return Add<NeoBlock>("getblock", blockHash.ToString(), returnFullTransactionObjects);
+        }
+
+        /// <summary>
+        /// Adds a call getting block information by block index.
+        /// </summary>
+        public Task<NeoBlock> GetBlockAsync(int blockIndex, bool returnFullTransactionObjects = false)
+        {
+            return Add<NeoBlock>("getblock", blockIndex, returnFullTransactionObjects);
+        }
+
+        /// <summary>
+        /// Adds a call getting the raw block data by block hash.
+        /// </summary>
+        public Task<string> GetRawBlockAsync(Hash256 blockHash)
+        {
+            return Add<string>("getblock", blockHash.ToString(), false);
+        }
+
+        /// <summary>
+        /// Adds a call getting the raw block data by block index.
+        /// </summary>
+        public Task<string> GetRawBlockAsync(int blockIndex)
+        {
+            return Add<string>("getblock", blockIndex, false);
+        }
+
+        /// <summary>
+        /// Adds a call getting a block in its binary form, decoded locally.
+        /// </summary>
+        public Task<Block> GetBinaryBlockAsync(int blockIndex)
+        {
+            return Map(GetRawBlockAsync(blockIndex), Block.FromBase64);
+        }
+
+        /// <summary>
+        /// Adds a call getting a block in its binary form by block hash, decoded locally.
+        /// </summary>
+        public Task<Block> GetBinaryBlockAsync(Hash256 blockHash)
+        {
+            return Map(GetRawBlockAsync(blockHash), Block.FromBase64);
+        }
+
+        /// <summary>
+        /// Adds a call getting the number of blocks in the blockchain.
+        /// </summary>
+        public Task<int> GetBlockCountAsync()
+        {
+            return Add<int>("getblockcount");
+        }
+
+        /// <summary>
+        /// Adds a call getting a transaction by its hash.
+        /// </summary>
+        public Task<Transaction.Transaction> GetTransactionAsync(Hash256 txHash)
+        {
+            return Add<Transaction.Transaction>("getrawtransaction", txHash.ToString(), true);
+        }
+
+        /// <summary>
+        /// Adds a call getting the raw transaction data by its hash.
+        /// </summary>
+        public Task<string> GetRawTransactionAsync(Hash256 txHash)
+        {
+            return Add<string>("getrawtransaction", txHash.ToString(), false);
+        }
+
+        /// <summary>
+        /// Adds a call getting the height of the block containing a transaction.
+        /// </summary>
+        public Task<int> GetTransactionHeightAsync(Hash256 txHash)
+        {
+            return Add<int>("gettransactionheight", txHash.ToString());
+        }
+
+        /// <summary>
+        /// Adds a call getting the application log of a transaction.
+        /// </summary>
+        public Task<NeoApplicationLog> GetApplicationLogAsync(Hash256 txHash)
+        {
+            return Add<NeoApplicationLog>("getapplicationlog", txHash.ToString());
+        }
+
+        /// <summary>
+        /// Adds a call getting the NEP-17 balances of an account.
+        /// </summary>
+        public Task<NeoGetNep17Balances.Nep17Balances> GetNep17BalancesAsync(Hash160 scriptHash)
+        {
+            return Add<NeoGetNep17Balances.Nep17Balances>("getnep17balances", scriptHash.ToString());
+        }
+
+        /// <summary>
+        /// Sends all added calls to the node. Calls beyond <see cref="HttpService.MaxBatchSize"/>
+        /// are split into consecutive batches.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>A task that completes once every call of the batch has completed.</returns>
+        public async Task ExecuteAsync(CancellationToken cancellationToken = default)
+        {
+            if (_executed)
+                throw new InvalidOperationException("The batch has already been executed.");
+            _executed = true;
+
+            var chunkSize = Math.Max(1, _httpService.MaxBatchSize);
+            for (var offset = 0; offset < _entries.Count; offset += chunkSize)
+            {
+                var chunk = _entries.GetRange(offset, Math.Min(chunkSize, _entries.Count - offset));
+                await _httpService.SendBatchAsync(chunk, cancellationToken);
+            }
+        }
+
+        private static async Task<TResult> Map<TSource, TResult>(Task<TSource> task, Func<TSource, TResult> selector)
+        {
+            return selector(await task);
+        }
+    }
+}
@@ -1,4 +1,5 @@
 using System;
+using NeoSharp.Protocol.Http;
 using NeoSharp.Types;
 
 namespace NeoSharp.Protocol
@@ -28,6 +29,11 @@ namespace NeoSharp.Protocol
         /// </summary>
         public const byte DEFAULT_ADDRESS_VERSION = 0x35;
 
+        /// <summary>
+        /// Default maximum number of calls in one JSON-RPC batch.
+        /// </summary>
+        public const int DEFAULT_MAX_BATCH_SIZE = 100;
+
         /// <summary>
         /// Gets or sets the NNS resolver hash.
         /// </summary>
@@ -63,6 +69,40 @@ namespace NeoSharp.Protocol
         /// </summary>
         public byte AddressVersion { get; set; } = DEFAULT_ADDRESS_VERSION;
 
+        /// <summary>
+        /// Gets or sets the micro-batching window in milliseconds. Calls issued within the window
+        /// are sent together as one JSON-RPC batch. Zero disables micro-batching.
+        /// </summary>
+        public int MicroBatchWindow { get; set; } = 0;
+
+        /// <summary>
+        /// Gets or sets the maximum number of calls sent in one JSON-RPC batch.
+        /// </summary>
+        public int MaxBatchSize { get; set; } = DEFAULT_MAX_BATCH_SIZE;
+
+        /// <summary>
+        /// Gets or sets the options of the cache for immutable results such as blocks and persisted
+        /// transactions. Null (the default) disables caching.
+        /// </summary>
+        public RpcResultCacheOptions ResultCache { get; set; }
+
+        /// <summary>
+        /// Gets or sets the methods whose concurrent identical calls share one request.
+        /// Null (the default) disables request coalescing.
+        /// </summary>
+        public RequestCoalescingOptions RequestCoalescing { get; set; }
+
+        /// <summary>
+        /// Gets or sets the options of the adaptive concurrency limiter. Null (the default) sends
+        /// requests without limit.
+        /// </summary>
+        public ConcurrencyLimiterOptions ConcurrencyLimit { get; set; }
+
+        /// <summary>
+        /// Gets or sets the resilience policies applied to RPC calls. Null (the default) sends each call once.
+        /// </summary>
+        public RpcPolicyPipeline Resilience { get; set; }
+
         /// <summary>
         /// Allows transmission of scripts that lead to a FAULT VM state.
         /// </summary>
@@ -73,6 +113,69 @@ namespace NeoSharp.Protocol
             return this;
         }
 
+        /// <summary>
+        /// Enables automatic micro-batching of calls issued within the given window.
+        /// </summary>
+        /// <param name="windowMilliseconds">The batching window in milliseconds.</param>
+        /// <param name="maxBatchSize">The maximum number of calls per batch.</param>
+        /// <returns>The updated configuration.</returns>
+        public NeoSharpConfig EnableMicroBatching(int windowMilliseconds, int maxBatchSize = DEFAULT_MAX_BATCH_SIZE)
+        {
+            if (windowMilliseconds <= 0)
+                throw new ArgumentOutOfRangeException(nameof(windowMilliseconds), "Batching window must be positive.");
+            if (maxBatchSize <= 0)
+                throw new ArgumentOutOfRangeException(nameof(maxBatchSize), "Batch size must be positive.");
+
+            MicroBatchWindow = windowMilliseconds;
+            MaxBatchSize = maxBatchSize;
+            return this;
+        }
+
+        /// <summary>
+        /// Enables caching of results that can no longer change, such as blocks and persisted transactions.
+        /// </summary>
+        /// <param name="options">The cache options, or null for the defaults.</param>
+        /// <returns>The updated configuration.</returns>
+        public NeoSharpConfig EnableResultCache(RpcResultCacheOptions options = null)
+        {
+            ResultCache = options ?? new RpcResultCacheOptions();
+            return this;
+        }
+
+        /// <summary>
+        /// Enables sharing one request between concurrent identical calls of the configured methods.
+        /// </summary>
+        /// <param name="options">The coalesced methods, or null for <see cref="RequestCoalescingOptions.CreateDefault"/>.</param>
+        /// <returns>The updated configuration.</returns>
+        public NeoSharpConfig EnableRequestCoalescing(RequestCoalescingOptions options = null)
+        {
+            RequestCoalescing = options ?? RequestCoalescingOptions.CreateDefault();
+            return this;
+        }
+
+        /// <summary>
+        /// Enables the adaptive concurrency limiter with interactive and bulk priority lanes.
+        /// </summary>
+        /// <param name="options">The limiter options, or null for the defaults.</param>
+        /// <returns>The updated configuration.</returns>
+        public NeoSharpConfig EnableConcurrencyLimit(ConcurrencyLimiterOptions options = null)
+        {
+            ConcurrencyLimit = options ?? new ConcurrencyLimiterOptions();
+            return this;
+        }
+
+        /// <summary>
+        /// Enables retries, hedging and circuit breaking for RPC calls. Only methods declared idempotent
+        /// are retried or hedged.
+        /// </summary>
+        /// <param name="pipeline">The policies, or null for <see cref="RpcPolicyPipeline.CreateDefault"/>.</param>
+        /// <returns>The updated configuration.</returns>
+        public NeoSharpConfig EnableResilience(RpcPolicyPipeline pipeline = null)
+        {
+            Resilience = pipeline ?? RpcPolicyPipeline.CreateDefault();
+            return this;
+        }
+
         /// <summary>
         /// Sets the network to MainNet.
         /// </summary>
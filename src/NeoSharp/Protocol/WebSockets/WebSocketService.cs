@@ -0,0 +1,746 @@
+using System;
+using System.Buffers;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net.WebSockets;
+using System.Reactive;
+using System.Reactive.Disposables;
+using System.Reactive.Linq;
+using System.Runtime.CompilerServices;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Channels;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Protocol.Http;
+
+namespace NeoSharp.Protocol.WebSockets
+{
+    using Transaction = Core.Response.Transaction;
+
+    /// <summary>
+    /// Receives chain events pushed by a node over its WebSocket endpoint (for example ws://host:port/ws).
+    /// Each event type is subscribed on the node once, while it has at least one local observer, and
+    /// events are fanned out to all observers. The service reconnects with exponential backoff and
+    /// re-subscribes when the connection drops; when created with an <see cref="INeoSharp"/> client,
+    /// blocks missed in the meantime are fetched over RPC so that block observers see every height in order.
+    /// </summary>
+    public class WebSocketService : IDisposable, IAsyncDisposable
+    {
+        /// <summary>
+        /// Event raised when a block is added to the chain.
+        /// </summary>
+        public const string BlockAddedEvent = "block_added";
+
+        /// <summary>
+        /// Event raised when a transaction enters the memory pool.
+        /// </summary>
+        public const string TransactionAddedEvent = "transaction_added";
+
+        /// <summary>
+        /// Event raised for every notification emitted by an executed script.
+        /// </summary>
+        public const string NotificationFromExecutionEvent = "notification_from_execution";
+
+        /// <summary>
+        /// Event raised when a transaction or block script has been executed.
+        /// </summary>
+        public const string TransactionExecutedEvent = "transaction_executed";
+
+        // Sent by the node when it dropped events because the client did not read them fast enough.
+        private const string EventMissedEvent = "event_missed";
+
+        private readonly Uri _url;
+        private readonly INeoSharp _neoSharp;
+        private readonly WebSocketServiceOptions _options;
+        private readonly ILogger<WebSocketService> _logger;
+        private readonly JsonSerializerOptions _jsonOptions;
+        private readonly object _lock = new();
+        private readonly Dictionary<string, EventStream> _streams = new(StringComparer.Ordinal);
+        private readonly ConcurrentDictionary<string, TaskCompletionSource<JsonElement>> _pendingRequests = new(StringComparer.Ordinal);
+        private readonly SemaphoreSlim _sendLock = new(1, 1);
+        private readonly SemaphoreSlim _subscriptionLock = new(1, 1);
+        private readonly SemaphoreSlim _blockLock = new(1, 1);
+        private readonly CancellationTokenSource _disposing = new();
+        private volatile TaskCompletionSource _connected = NewSignal();
+        private volatile ClientWebSocket _socket;
+        private Task _connectionLoop;
+        private int _lastBlockIndex = -1;
+        private long _reconnectCount;
+        private bool _disposed;
+
+        /// <summary>
+        /// Initializes a new instance of the WebSocketService class. No connection is made until
+        /// <see cref="ConnectAsync"/> is called or the first observer subscribes.
+        /// </summary>
+        /// <param name="url">The WebSocket URL of the node.</param>
+        /// <param name="neoSharp">The RPC client used to fetch missed blocks, or null to disable gap filling.</param>
+        /// <param name="options">The service options.</param>
+        /// <param name="logger">The logger.</param>
+        public WebSocketService(string url, INeoSharp neoSharp = null, WebSocketServiceOptions options = null, ILogger<WebSocketService> logger = null)
+        {
+            _url = new Uri(url ?? throw new ArgumentNullException(nameof(url)));
+            _neoSharp = neoSharp;
+            _options = options ?? new WebSocketServiceOptions();
+            _logger = logger;
+            _jsonOptions = new JsonSerializerOptions
+            {
+                PropertyNameCaseInsensitive = true,
+                PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
+                TypeInfoResolver = NeoSharpJsonContext.CreateResolver()
+            };
+
+            Blocks = Observe<NeoBlock>(BlockAddedEvent);
+            Transactions = Observe<Transaction>(TransactionAddedEvent);
+            Notifications = Observe<ExecutionNotification>(NotificationFromExecutionEvent);
+            Executions = Observe<TransactionExecution>(TransactionExecutedEvent);
+        }
+
+        /// <summary>
+        /// Gets the service options.
+        /// </summary>
+        public WebSocketServiceOptions Options => _options;
+
+        /// <summary>
+        /// Gets whether the WebSocket connection is currently open.
+        /// </summary>
+        public bool IsConnected => _socket?.State == WebSocketState.Open;
+
+        /// <summary>
+        /// Gets the number of times the connection was re-established after it dropped.
+        /// </summary>
+        public long ReconnectCount => Interlocked.Read(ref _reconnectCount);
+
+        /// <summary>
+        /// Gets the index of the last block delivered to block observers, or -1 if none was.
+        /// </summary>
+        public int LastBlockIndex => Volatile.Read(ref _lastBlockIndex);
+
+        /// <summary>
+        /// Gets the blocks added to the chain.
+        /// </summary>
+        public IObservable<NeoBlock> Blocks { get; }
+
+        /// <summary>
+        /// Gets the transactions added to the memory pool.
+        /// </summary>
+        public IObservable<Transaction> Transactions { get; }
+
+        /// <summary>
+        /// Gets the notifications emitted by executed scripts.
+        /// </summary>
+        public IObservable<ExecutionNotification> Notifications { get; }
+
+        /// <summary>
+        /// Gets the execution results of transactions and block scripts.
+        /// </summary>
+        public IObservable<TransactionExecution> Executions { get; }
+
+        /// <summary>
+        /// Opens the connection, if not already open, and waits until it is established and all
+        /// active subscriptions are in place.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>A task that completes once connected.</returns>
+        public Task ConnectAsync(CancellationToken cancellationToken = default)
+        {
+            lock (_lock)
+            {
+                if (_disposed) throw new ObjectDisposedException(nameof(WebSocketService));
+                EnsureStarted();
+            }
+
+            return _connected.Task.WaitAsync(cancellationToken);
+        }
+
+        /// <summary>
+        /// Reads the blocks added to the chain until the enumeration is cancelled or the service is disposed.
+        /// Blocks are buffered while the consumer is busy.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The blocks.</returns>
+        public IAsyncEnumerable<NeoBlock> ReadBlocksAsync(CancellationToken cancellationToken = default)
+        {
+            return ReadAsync(Blocks, cancellationToken);
+        }
+
+        /// <summary>
+        /// Reads the transactions added to the memory pool until the enumeration is cancelled or the
+        /// service is disposed.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The transactions.</returns>
+        public IAsyncEnumerable<Transaction> ReadTransactionsAsync(CancellationToken cancellationToken = default)
+        {
+            return ReadAsync(Transactions, cancellationToken);
+        }
+
+        /// <summary>
+        /// Reads the notifications emitted by executed scripts until the enumeration is cancelled or the
+        /// service is disposed.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The notifications.</returns>
+        public IAsyncEnumerable<ExecutionNotification> ReadNotificationsAsync(CancellationToken cancellationToken = default)
+        {
+            return ReadAsync(Notifications, cancellationToken);
+        }
+
+        /// <summary>
+        /// Reads the execution results of transactions and block scripts until the enumeration is
+        /// cancelled or the service is disposed.
+        /// </summary>
+        /// <param name="cancellationToken">The cancellation token.</param>
+        /// <returns>The execution results.</returns>
+        public IAsyncEnumerable<TransactionExecution> ReadExecutionsAsync(CancellationToken cancellationToken = default)
+        {
+            return ReadAsync(Executions, cancellationToken);
+        }
+
+        private static async IAsyncEnumerable<T> ReadAsync<T>(IObservable<T> source, [EnumeratorCancellation] CancellationToken cancellationToken)
+        {
+            var channel = Channel.CreateUnbounded<T>(new UnboundedChannelOptions { SingleReader = true });
+            using var subscription = source.Subscribe(
+                item => channel.Writer.TryWrite(item),
+                ex => channel.Writer.TryComplete(ex),
+                () => channel.Writer.TryComplete());
+
+            await foreach (var item in channel.Reader.ReadAllAsync(cancellationToken))
+            {
+                yield return item;
+            }
+        }
+
+        private IObservable<T> Observe<T>(string eventName)
+        {
+            return Observable.Create<T>(observer =>
+                AddObserver(eventName, Observer.Create<object>(item => observer.OnNext((T)item), observer.OnError, observer.OnCompleted)));
+        }
+
+        private IDisposable AddObserver(string eventName, IObserver<object> observer)
+        {
+            lock (_lock)
+            {
+                if (_disposed)
+                {
+                    observer.OnCompleted();
+                    return Disposable.Empty;
+                }
+
+                if (!_streams.TryGetValue(eventName, out var stream))
+                {
+                    _streams[eventName] = stream = new EventStream(eventName);
+                }
+                stream.Observers = stream.Observers.Append(observer).ToArray();
+                EnsureStarted();
+            }
+
+            _ = SyncSubscriptionsAsync();
+            return Disposable.Create(() => RemoveObserver(eventName, observer));
+        }
+
+        private void RemoveObserver(string eventName, IObserver<object> observer)
+        {
+            lock (_lock)
+            {
+                if (_disposed || !_streams.TryGetValue(eventName, out var stream)) return;
+
+                stream.Observers = stream.Observers.Where(o => o != observer).ToArray();
+                if (stream.Observers.Length > 0) return;
+
+                // Without block observers there is no gap to fill once they come back.
+                if (eventName == BlockAddedEvent)
+                {
+                    Volatile.Write(ref _lastBlockIndex, -1);
+                }
+            }
+
+            _ = SyncSubscriptionsAsync();
+        }
+
+        private EventStream GetStream(string eventName)
+        {
+            lock (_lock)
+            {
+                return _streams.TryGetValue(eventName, out var stream) && stream.Observers.Length > 0 ? stream : null;
+            }
+        }
+
+        private void EnsureStarted()
+        {
+            _connectionLoop ??= Task.Run(() => RunAsync(_disposing.Token));
+        }
+
+        private async Task RunAsync(CancellationToken cancellationToken)
+        {
+            var delay = _options.ReconnectDelay;
+            var connectedBefore = false;
+
+            while (!cancellationToken.IsCancellationRequested)
+            {
+                using (var socket = new ClientWebSocket())
+                {
+                    socket.Options.KeepAliveInterval = TimeSpan.FromMilliseconds(_options.KeepAliveInterval);
+                    try
+                    {
+                        await socket.ConnectAsync(_url, cancellationToken);
+                        _socket = socket;
+                        delay = _options.ReconnectDelay;
+                        if (connectedBefore) Interlocked.Increment(ref _reconnectCount);
+                        connectedBefore = true;
+                        _logger?.LogDebug("WebSocket connected to {Url}", _url);
+
+                        var receiving = ReceiveAsync(socket, cancellationToken);
+                        await SyncSubscriptionsAsync();
+                        await CatchUpBlocksAsync();
+                        _connected.TrySetResult();
+                        await receiving;
+                    }
+                    catch (OperationCanceledException) when (cancellationToken.IsCancellationRequested)
+                    {
+                        break;
+                    }
+                    catch (WebSocketException ex)
+                    {
+                        _logger?.LogWarning(ex, "WebSocket connection to {Url} failed", _url);
+                    }
+                    catch (Exception ex)
+                    {
+                        // Nothing may end the loop except disposal, so any other failure backs off and reconnects.
+                        _logger?.LogError(ex, "WebSocket connection to {Url} failed unexpectedly", _url);
+                    }
+                    finally
+                    {
+                        await OnDisconnectedAsync();
+                    }
+                }
+
+                try
+                {
+                    await Task.Delay(delay, cancellationToken);
+                }
+                catch (OperationCanceledException)
+                {
+                    break;
+                }
+                delay = Math.Min(delay * 2, _options.MaxReconnectDelay);
+            }
+        }
+
+        private async Task OnDisconnectedAsync()
+        {
+            _socket = null;
+            if (_connected.Task.IsCompleted)
+            {
+                _connected = NewSignal();
+            }
+
+            FailPendingRequests();
+
+            // Subscriptions live and die with the connection; they are re-created after reconnecting.
+            await _subscriptionLock.WaitAsync();
+            try
+            {
+                lock (_lock)
+                {
+                    foreach (var stream in _streams.Values)
+                    {
+                        stream.SubscriptionId = null;
+                    }
+                }
+            }
+            finally
+            {
+                _subscriptionLock.Release();
+            }
+        }
+
+        private async Task ReceiveAsync(ClientWebSocket socket, CancellationToken cancellationToken)
+        {
+            var buffer = new ArrayBufferWriter<byte>(8192);
+
+            try
+            {
+                while (socket.State == WebSocketState.Open)
+                {
+                    var result = await socket.ReceiveAsync(buffer.GetMemory(4096), cancellationToken);
+                    if (result.MessageType == WebSocketMessageType.Close)
+                    {
+                        _logger?.LogWarning("WebSocket connection to {Url} closed by the node", _url);
+                        return;
+                    }
+
+                    buffer.Advance(result.Count);
+                    if (!result.EndOfMessage) continue;
+
+                    await HandleMessageAsync(buffer.WrittenMemory);
+                    buffer.ResetWrittenCount();
+                }
+            }
+            finally
+            {
+                // No response can arrive any more; release callers instead of letting them time out.
+                FailPendingRequests();
+            }
+        }
+
+        private void FailPendingRequests()
+        {
+            foreach (var pending in _pendingRequests.Values)
+            {
+                pending.TrySetException(new JsonRpcException("WebSocket connection closed"));
+            }
+        }
+
+        private async Task HandleMessageAsync(ReadOnlyMemory<byte> message)
+        {
+            JsonDocument document;
+            try
+            {
+                document = JsonDocument.Parse(message);
+            }
+            catch (JsonException ex)
+            {
+                _logger?.LogWarning(ex, "Ignoring malformed WebSocket message");
+                return;
+            }
+
+            using (document)
+            {
+                var root = document.RootElement;
+                if (root.ValueKind != JsonValueKind.Object) return;
+
+                if (root.TryGetProperty("id", out var id) && id.ValueKind != JsonValueKind.Null)
+                {
+                    CompleteRequest(root, id.ToString());
+                    return;
+                }
+
+                if (!root.TryGetProperty("method", out var method)) return;
+
+                var eventName = method.GetString();
+                if (eventName == EventMissedEvent)
+                {
+                    _logger?.LogWarning("The node dropped WebSocket events; missed blocks are filled on the next block");
+                    return;
+                }
+
+                var payload = root.TryGetProperty("params", out var parameters) &&
+                              parameters.ValueKind == JsonValueKind.Array &&
+                              parameters.GetArrayLength() > 0
+                    ? parameters[0]
+                    : default;
+                await DispatchAsync(eventName, payload);
+            }
+        }
+
+        private void CompleteRequest(JsonElement response, string id)
+        {
+            if (!_pendingRequests.TryGetValue(id, out var completion)) return;
+
+            if (response.TryGetProperty("error", out var error) && error.ValueKind == JsonValueKind.Object)
+            {
+                var code = error.TryGetProperty("code", out var c) ? c.ToString() : "";
+                var message = error.TryGetProperty("message", out var m) ? m.GetString() : "";
+                completion.TrySetException(new JsonRpcException($"JSON-RPC error {code}: {message}"));
+            }
+            else
+            {
+                completion.TrySetResult(response.TryGetProperty("result", out var result) ? result.Clone() : default);
+            }
+        }
+
+        private async Task DispatchAsync(string eventName, JsonElement payload)
+        {
+            var stream = GetStream(eventName);
+            if (stream == null || payload.ValueKind == JsonValueKind.Undefined) return;
+
+            object item;
+            try
+            {
+                item = eventName switch
+                {
+                    BlockAddedEvent => payload.Deserialize<NeoBlock>(_jsonOptions),
+                    TransactionAddedEvent => payload.Deserialize<Transaction>(_jsonOptions),
+                    NotificationFromExecutionEvent => payload.Deserialize<ExecutionNotification>(_jsonOptions),
+                    TransactionExecutedEvent => payload.Deserialize<TransactionExecution>(_jsonOptions),
+                    _ => null
+                };
+            }
+            catch (JsonException ex)
+            {
+                _logger?.LogError(ex, "JSON serialization error for WebSocket event {Event}", eventName);
+                return;
+            }
+
+            if (item is NeoBlock block)
+            {
+                await PublishBlockAsync(stream, block);
+            }
+            else if (item != null)
+            {
+                Publish(stream, item);
+            }
+        }
+
+        private async Task PublishBlockAsync(EventStream stream, NeoBlock block)
+        {
+            await _blockLock.WaitAsync(_disposing.Token);
+            try
+            {
+                var last = Volatile.Read(ref _lastBlockIndex);
+                if (last >= 0)
+                {
+                    // Already delivered while filling a gap.
+                    if (block.Index <= last) return;
+
+                    await FillBlockGapAsync(stream, block.Index - 1);
+                }
+
+                Publish(stream, block);
+                Volatile.Write(ref _lastBlockIndex, block.Index);
+            }
+            finally
+            {
+                _blockLock.Release();
+            }
+        }
+
+        private async Task CatchUpBlocksAsync()
+        {
+            if (!_options.FillBlockGaps || _neoSharp == null) return;
+
+            var stream = GetStream(BlockAddedEvent);
+            if (stream == null) return;
+
+            await _blockLock.WaitAsync(_disposing.Token);
+            try
+            {
+                if (Volatile.Read(ref _lastBlockIndex) < 0) return;
+
+                var count = await _neoSharp.GetBlockCountAsync(_disposing.Token);
+                await FillBlockGapAsync(stream, count - 1);
+            }
+            catch (JsonRpcException ex)
+            {
+                _logger?.LogWarning(ex, "Failed to fetch the block count after reconnecting");
+            }
+            finally
+            {
+                _blockLock.Release();
+            }
+        }
+
+        // Must be called while holding _blockLock.
+        private async Task FillBlockGapAsync(EventStream stream, int upToIndex)
+        {
+            if (!_options.FillBlockGaps || _neoSharp == null) return;
+
+            for (var index = Volatile.Read(ref _lastBlockIndex) + 1; index <= upToIndex; index++)
+            {
+                NeoBlock block;
+                try
+                {
+                    block = await _neoSharp.GetBlockAsync(index, true, _disposing.Token);
+                }
+                catch (JsonRpcException ex)
+                {
+                    _logger?.LogWarning(ex, "Failed to fetch missed block {Index}", index);
+                    return;
+                }
+
+                Publish(stream, block);
+                Volatile.Write(ref _lastBlockIndex, index);
+            }
+        }
+
+        private void Publish(EventStream stream, object item)
+        {
+            foreach (var observer in stream.Observers)
+            {
+                try
+                {
+                    observer.OnNext(item);
+                }
+                catch (Exception ex)
+                {
+                    _logger?.LogError(ex, "Observer of WebSocket event {Event} failed", stream.Name);
+                }
+            }
+        }
+
+        private async Task SyncSubscriptionsAsync()
+        {
+            try
+            {
+                await _subscriptionLock.WaitAsync(_disposing.Token);
+            }
+            catch (OperationCanceledException)
+            {
+                return;
+            }
+
+            try
+            {
+                EventStream[] streams;
+                lock (_lock)
+                {
+                    streams = _streams.Values.ToArray();
+                }
+
+                foreach (var stream in streams)
+                {
+                    if (!IsConnected) return;
+
+                    var wanted = stream.Observers.Length > 0;
+                    if (wanted && stream.SubscriptionId == null)
+                    {
+                        var result = await SendRequestAsync("subscribe", new object[] { stream.Name });
+                        stream.SubscriptionId = result.GetString();
+                        _logger?.LogDebug("Subscribed to WebSocket event {Event}", stream.Name);
+                    }
+                    else if (!wanted && stream.SubscriptionId != null)
+                    {
+                        var subscriptionId = stream.SubscriptionId;
+                        stream.SubscriptionId = null;
+                        await SendRequestAsync("unsubscribe", new object[] { subscriptionId });
+                        _logger?.LogDebug("Unsubscribed from WebSocket event {Event}", stream.Name);
+                    }
+                }
+            }
+            catch (Exception ex) when (ex is JsonRpcException or OperationCanceledException or InvalidOperationException or WebSocketException)
+            {
+                // Subscriptions are re-synchronized after the next reconnection. This also runs fire-and-forget
+                // from AddObserver, so a malformed subscription id or a closing socket must not escape.
+                _logger?.LogWarning(ex, "Failed to update WebSocket subscriptions");
+            }
+            finally
+            {
+                _subscriptionLock.Release();
+            }
+        }
+
+        private async Task<JsonElement> SendRequestAsync(string method, object[] parameters)
+        {
+            var socket = _socket ?? throw new JsonRpcException($"WebSocket is not connected, {method} was not sent");
+            var request = HttpService.CreateRequest(method, parameters);
+            var completion = new TaskCompletionSource<JsonElement>(TaskCreationOptions.RunContinuationsAsynchronously);
+            _pendingRequests[request.Id] = completion;
+
+            try
+            {
+                var payload = JsonSerializer.SerializeToUtf8Bytes(request, _jsonOptions);
+                await _sendLock.WaitAsync(_disposing.Token);
+                try
+                {
+                    await socket.SendAsync(new ArraySegment<byte>(payload), WebSocketMessageType.Text, true, _disposing.Token);
+                }
+                finally
+                {
+                    _sendLock.Release();
+                }
+
+                return await completion.Task.WaitAsync(TimeSpan.FromMilliseconds(_options.RequestTimeout), _disposing.Token);
+            }
+            catch (WebSocketException ex)
+            {
+                throw new JsonRpcException($"WebSocket request failed: {ex.Message}", ex);
+            }
+            catch (TimeoutException ex)
+            {
+                throw new JsonRpcException($"Request timeout for method {method}", ex);
+            }
+            finally
+            {
+                _pendingRequests.TryRemove(request.Id, out _);
+            }
+        }
+
+        private static TaskCompletionSource NewSignal() => new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+        /// <summary>
+        /// Closes the connection and completes all observers.
+        /// </summary>
+        /// <returns>A task that completes once the connection loop has stopped.</returns>
+        public async ValueTask DisposeAsync()
+        {
+            if (!TryBeginDispose(out var observers, out var connectionLoop)) return;
+
+            if (connectionLoop != null)
+            {
+                try
+                {
+                    await connectionLoop;
+                }
+                catch (OperationCanceledException)
+                {
+                }
+            }
+
+            CompleteObservers(observers);
+        }
+
+        /// <summary>
+        /// Closes the connection and completes all observers without waiting for the connection loop to stop,
+        /// so it may be called from an observer callback or a single-threaded synchronization context.
+        /// </summary>
+        public void Dispose()
+        {
+            // Observer callbacks run on the connection loop, so waiting for it here could never finish. The loop
+            // stops by itself once it sees the cancellation.
+            if (!TryBeginDispose(out var observers, out _)) return;
+
+            CompleteObservers(observers);
+        }
+
+        private bool TryBeginDispose(out IObserver<object>[] observers, out Task connectionLoop)
+        {
+            lock (_lock)
+            {
+                observers = null;
+                connectionLoop = null;
+                if (_disposed) return false;
+                _disposed = true;
+
+                observers = _streams.Values.SelectMany(s => s.Observers).ToArray();
+                foreach (var stream in _streams.Values)
+                {
+                    stream.Observers = Array.Empty<IObserver<object>>();
+                }
+                connectionLoop = _connectionLoop;
+            }
+
+            _disposing.Cancel();
+            return true;
+        }
+
+        private void CompleteObservers(IObserver<object>[] observers)
+        {
+            foreach (var observer in observers)
+            {
+                observer.OnCompleted();
+            }
+
+            _connected.TrySetCanceled();
+            GC.SuppressFinalize(this);
+        }
+
+        private sealed class EventStream
+        {
+            public EventStream(string name)
+            {
+                Name = name;
+            }
+
+            public string Name { get; }
+
+            // Replaced, never mutated, so that events can be published from a snapshot without locking.
+            public IObserver<object>[] Observers { get; set; } = Array.Empty<IObserver<object>>();
+
+            // Guarded by _subscriptionLock.
+            public string SubscriptionId { get; set; }
+        }
+    }
+}
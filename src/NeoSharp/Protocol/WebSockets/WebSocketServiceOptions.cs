@@ -0,0 +1,56 @@
+namespace NeoSharp.Protocol.WebSockets
+{
+    /// <summary>
+    /// Options for a <see cref="WebSocketService"/>.
+    /// </summary>
+    public class WebSocketServiceOptions
+    {
+        /// <summary>
+        /// Default delay in milliseconds before the first reconnection attempt.
+        /// </summary>
+        public const int DEFAULT_RECONNECT_DELAY = 500;
+
+        /// <summary>
+        /// Default upper bound in milliseconds of the delay between reconnection attempts.
+        /// </summary>
+        public const int DEFAULT_MAX_RECONNECT_DELAY = 30000;
+
+        /// <summary>
+        /// Default interval in milliseconds between WebSocket keep-alive frames.
+        /// </summary>
+        public const int DEFAULT_KEEP_ALIVE_INTERVAL = 30000;
+
+        /// <summary>
+        /// Default timeout in milliseconds of subscribe and unsubscribe requests.
+        /// </summary>
+        public const int DEFAULT_REQUEST_TIMEOUT = 10000;
+
+        /// <summary>
+        /// Gets or sets the delay in milliseconds before the first reconnection attempt. The delay doubles
+        /// with every failed attempt up to <see cref="MaxReconnectDelay"/>.
+        /// </summary>
+        public int ReconnectDelay { get; set; } = DEFAULT_RECONNECT_DELAY;
+
+        /// <summary>
+        /// Gets or sets the upper bound in milliseconds of the delay between reconnection attempts.
+        /// </summary>
+        public int MaxReconnectDelay { get; set; } = DEFAULT_MAX_RECONNECT_DELAY;
+
+        /// <summary>
+        /// Gets or sets the interval in milliseconds between WebSocket keep-alive frames.
+        /// </summary>
+        public int KeepAliveInterval { get; set; } = DEFAULT_KEEP_ALIVE_INTERVAL;
+
+        /// <summary>
+        /// Gets or sets the timeout in milliseconds of subscribe and unsubscribe requests.
+        /// </summary>
+        public int RequestTimeout { get; set; } = DEFAULT_REQUEST_TIMEOUT;
+
+        /// <summary>
+        /// Gets or sets whether blocks missed while disconnected, or skipped by the node, are fetched over
+        /// RPC and delivered in order before the next pushed block. Requires the service to be created
+        /// with an <see cref="INeoSharp"/> client.
+        /// </summary>
+        public bool FillBlockGaps { get; set; } = true;
+    }
+}
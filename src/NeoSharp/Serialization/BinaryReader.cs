@@ -172,6 +172,16 @@ namespace NeoSharp.Serialization
             return BitConverter.ToInt64(bytes, 0);
         }
 
+        /// <summary>
+        /// Reads a 64-bit unsigned integer
+        /// </summary>
+        /// <returns>The unsigned integer value</returns>
+        public ulong ReadUInt64()
+        {
+            var bytes = ReadBytes(8);
+            return BitConverter.ToUInt64(bytes, 0);
+        }
+
         /// <summary>
         /// Reads an encoded EC point (compressed format)
         /// </summary>
@@ -15,7 +15,7 @@ namespace NeoSharp.Serialization
     /// </summary>
     public sealed class BinaryWriter : IDisposable
     {
-        private readonly MemoryStream _stream;
+        private readonly Stream _stream;
         private readonly System.IO.BinaryWriter _writer;
         private bool _disposed;
 
@@ -62,6 +62,17 @@ namespace NeoSharp.Serialization
             _writer = new System.IO.BinaryWriter(_stream, Encoding.UTF8, leaveOpen: true);
         }
 
+        /// <summary>
+        /// Initializes a new BinaryWriter over any writable stream, such as a <see cref="HashingStream"/>.
+        /// <see cref="ToArray"/> is only supported for memory streams.
+        /// </summary>
+        /// <param name="stream">The stream to write to</param>
+        public BinaryWriter(Stream stream)
+        {
+            _stream = stream ?? throw new ArgumentNullException(nameof(stream));
+            _writer = new System.IO.BinaryWriter(_stream, Encoding.UTF8, leaveOpen: true);
+        }
+
         /// <summary>
         /// Writes a boolean value
         /// </summary>
@@ -348,18 +359,22 @@ namespace NeoSharp.Serialization
         /// Gets the written data as a byte array
         /// </summary>
         /// <returns>The byte array</returns>
+        /// <exception cref="NotSupportedException">Thrown when the writer does not write to a memory stream</exception>
         public byte[] ToArray()
         {
             _writer.Flush();
-            
+
+            if (_stream is not MemoryStream memory)
+                throw new NotSupportedException("Only a writer over a memory stream can return the written data.");
+
             // If position is at 0, return empty (matches Swift behavior)
-            if (_stream.Position == 0)
+            if (memory.Position == 0)
                 return Array.Empty<byte>();
                 
             // Return only the data up to current position
-            var buffer = _stream.GetBuffer();
-            var result = new byte[_stream.Position];
-            Array.Copy(buffer, 0, result, 0, (int)_stream.Position);
+            var buffer = memory.GetBuffer();
+            var result = new byte[memory.Position];
+            Array.Copy(buffer, 0, result, 0, (int)memory.Position);
             return result;
         }
 
@@ -0,0 +1,174 @@
+using System;
+using System.Buffers;
+using System.IO;
+using System.Security.Cryptography;
+
+namespace NeoSharp.Serialization
+{
+    /// <summary>
+    /// A write-only stream that feeds everything written to it into an incremental SHA256.
+    /// Wrap it in a <see cref="BinaryWriter"/> to hash a serializable object without buffering its serialized form.
+    /// Small writes are collected in a fixed buffer so that the digest is not updated once per field.
+    /// </summary>
+    public sealed class HashingStream : Stream
+    {
+        private const int BufferSize = 512;
+
+        // Creating an IncrementalHash costs about as much as hashing a small transaction, so a disposed
+        // stream hands its reset instance to the next stream created on the same thread.
+        [ThreadStatic]
+        private static IncrementalHash _cachedSha256;
+
+        private readonly IncrementalHash _sha256;
+        private byte[] _buffer = ArrayPool<byte>.Shared.Rent(BufferSize);
+        private int _buffered;
+        private long _length;
+
+        /// <summary>
+        /// Initializes a new HashingStream.
+        /// </summary>
+        public HashingStream()
+        {
+            _sha256 = _cachedSha256 ?? IncrementalHash.CreateHash(HashAlgorithmName.SHA256);
+            _cachedSha256 = null;
+        }
+
+        /// <inheritdoc />
+        public override bool CanRead => false;
+
+        /// <inheritdoc />
+        public override bool CanSeek => false;
+
+        /// <inheritdoc />
+        public override bool CanWrite => _buffer != null;
+
+        /// <summary>
+        /// Gets the number of bytes written since the stream was created or the hash was last retrieved.
+        /// </summary>
+        public override long Length => _length;
+
+        /// <summary>
+        /// Gets the number of bytes written since the stream was created or the hash was last retrieved.
+        /// </summary>
+        public override long Position
+        {
+            get => _length;
+            set => throw new NotSupportedException();
+        }
+
+        /// <inheritdoc />
+        public override void Write(byte[] buffer, int offset, int count)
+        {
+            ValidateBufferArguments(buffer, offset, count);
+            Write(buffer.AsSpan(offset, count));
+        }
+
+        /// <inheritdoc />
+        public override void Write(ReadOnlySpan<byte> buffer)
+        {
+            ThrowIfDisposed();
+
+            if (_buffered + buffer.Length > BufferSize)
+                FlushBuffer();
+
+            if (buffer.Length >= BufferSize)
+            {
+                _sha256.AppendData(buffer);
+            }
+            else
+            {
+                buffer.CopyTo(_buffer.AsSpan(_buffered));
+                _buffered += buffer.Length;
+            }
+            _length += buffer.Length;
+        }
+
+        /// <inheritdoc />
+        public override void WriteByte(byte value)
+        {
+            ThrowIfDisposed();
+
+            if (_buffered == BufferSize)
+                FlushBuffer();
+
+            _buffer[_buffered++] = value;
+            _length++;
+        }
+
+        /// <summary>
+        /// Writes the SHA256 of the data written so far to the destination and resets the stream.
+        /// </summary>
+        /// <param name="destination">The buffer that receives the 32-byte hash</param>
+        /// <returns>The number of bytes written to destination</returns>
+        public int GetSha256(Span<byte> destination)
+        {
+            ThrowIfDisposed();
+
+            FlushBuffer();
+            _length = 0;
+            return _sha256.GetHashAndReset(destination);
+        }
+
+        /// <summary>
+        /// Writes the double SHA256 (Hash256) of the data written so far to the destination and resets the stream.
+        /// </summary>
+        /// <param name="destination">The buffer that receives the 32-byte hash</param>
+        /// <returns>The number of bytes written to destination</returns>
+        public int GetHash256(Span<byte> destination)
+        {
+            Span<byte> sha256 = stackalloc byte[Crypto.Hash.SHA256Size];
+            GetSha256(sha256);
+            return Crypto.Hash.SHA256(sha256, destination);
+        }
+
+        /// <summary>
+        /// Does nothing; buffered data is always included when the hash is retrieved.
+        /// </summary>
+        public override void Flush()
+        {
+        }
+
+        /// <inheritdoc />
+        public override int Read(byte[] buffer, int offset, int count) => throw new NotSupportedException();
+
+        /// <inheritdoc />
+        public override long Seek(long offset, SeekOrigin origin) => throw new NotSupportedException();
+
+        /// <inheritdoc />
+        public override void SetLength(long value) => throw new NotSupportedException();
+
+        /// <inheritdoc />
+        protected override void Dispose(bool disposing)
+        {
+            if (disposing && _buffer != null)
+            {
+                ArrayPool<byte>.Shared.Return(_buffer);
+                _buffer = null;
+
+                if (_length == 0 && _cachedSha256 == null)
+                {
+                    _cachedSha256 = _sha256;
+                }
+                else
+                {
+                    _sha256.Dispose();
+                }
+            }
+            base.Dispose(disposing);
+        }
+
+        private void FlushBuffer()
+        {
+            if (_buffered == 0) return;
+
+            _sha256.AppendData(_buffer, 0, _buffered);
+            _buffered = 0;
+        }
+
+        private void ThrowIfDisposed()
+        {
+            if (_buffer == null)
+                throw new ObjectDisposedException(nameof(HashingStream));
+        }
+    }
+}
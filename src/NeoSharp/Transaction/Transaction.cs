@@ -1,4 +1,5 @@
 using System;
+using System.Buffers.Binary;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
@@ -15,6 +16,9 @@ namespace NeoSharp.Transaction
     /// </summary>
     public class Transaction : Serialization.INeoSerializable
     {
+        // Network magic (4) + transaction hash (32)
+        private const int HashDataSize = 36;
+
         private byte _version;
         private uint _nonce;
         private long _systemFee;
@@ -149,7 +153,7 @@ namespace NeoSharp.Transaction
             {
                 if (_hash == null)
                 {
-                    _hash = new Hash256(CalculateHash());
+                    _hash = CalculateHash();
                 }
                 return _hash.Value;
             }
@@ -287,11 +291,26 @@ namespace NeoSharp.Transaction
         /// <returns>The hash data.</returns>
         public byte[] GetHashData(uint magic)
         {
-            using var ms = new MemoryStream();
-            using var writer = new Serialization.BinaryWriter(ms);
-            writer.WriteUInt32(magic);
-            writer.Write(Hash.ToArray());
-            return ms.ToArray();
+            Span<byte> data = stackalloc byte[HashDataSize];
+            GetHashData(magic, data);
+            return data.ToArray();
+        }
+
+        /// <summary>
+        /// Writes the hash data for signing, the network magic followed by the transaction hash, to the destination.
+        /// </summary>
+        /// <param name="magic">The network magic number.</param>
+        /// <param name="destination">The buffer that receives the 36 bytes of hash data.</param>
+        /// <returns>The number of bytes written.</returns>
+        /// <exception cref="ArgumentException">Thrown when destination is shorter than 36 bytes.</exception>
+        public int GetHashData(uint magic, Span<byte> destination)
+        {
+            if (destination.Length < HashDataSize)
+                throw new ArgumentException($"Destination must be at least {HashDataSize} bytes long.", nameof(destination));
+
+            BinaryPrimitives.WriteUInt32LittleEndian(destination, magic);
+            Hash.CopyLittleEndianTo(destination.Slice(sizeof(uint)));
+            return HashDataSize;
         }
 
         /// <summary>
@@ -329,12 +348,18 @@ namespace NeoSharp.Transaction
             }
         }
 
-        private byte[] CalculateHash()
+        private Hash256 CalculateHash()
         {
-            using var ms = new MemoryStream();
-            using var writer = new Serialization.BinaryWriter(ms);
+            using var sink = new HashingStream();
+            using var writer = new Serialization.BinaryWriter(sink);
             SerializeUnsigned(writer);
-            return NeoSharp.Crypto.Hash.Hash256(ms.ToArray());
+
+            Span<byte> hash = stackalloc byte[NeoSharp.Crypto.Hash.SHA256Size];
+            // Neo N3 hashes transactions with a single SHA-256 of the unsigned transaction. The digest is the
+            // little-endian form; the hash is displayed byte-reversed as by the node.
+            sink.GetSha256(hash);
+
+            return Hash256.FromLittleEndianBytes(hash);
         }
 
         private static int GetVarSize(int value)
@@ -384,7 +409,27 @@ namespace NeoSharp.Transaction
                     Data = Array.Empty<byte>();
                     break;
                 case TransactionAttributeType.OracleResponse:
-                    Data = reader.ReadBytes(reader.ReadByte() + 8); // id (8) + code (1) + result
+                {
+                    // id (8) + code (1) + result (var bytes), kept in serialized form
+                    var id = reader.ReadBytes(8);
+                    var code = reader.ReadByte();
+                    var result = reader.ReadVarBytes(ushort.MaxValue);
+                    using var ms = new MemoryStream();
+                    using var writer = new Serialization.BinaryWriter(ms);
+                    writer.Write(id);
+                    writer.WriteByte(code);
+                    writer.WriteVarBytes(result);
+                    Data = ms.ToArray();
+                    break;
+                }
+                case TransactionAttributeType.NotValidBefore:
+                    Data = reader.ReadBytes(4); // height
+                    break;
+                case TransactionAttributeType.Conflicts:
+                    Data = reader.ReadBytes(32); // transaction hash
+                    break;
+                case TransactionAttributeType.NotaryAssisted:
+                    Data = reader.ReadBytes(1); // number of keys
                     break;
                 default:
                     throw new FormatException($"Invalid transaction attribute type: {Type}");
@@ -405,6 +450,21 @@ namespace NeoSharp.Transaction
         /// <summary>
         /// Oracle response attribute.
         /// </summary>
-        OracleResponse = 0x11
+        OracleResponse = 0x11,
+
+        /// <summary>
+        /// Attribute making the transaction invalid before a given height.
+        /// </summary>
+        NotValidBefore = 0x20,
+
+        /// <summary>
+        /// Attribute declaring a conflicting transaction.
+        /// </summary>
+        Conflicts = 0x21,
+
+        /// <summary>
+        /// Attribute of transactions assisted by the notary service.
+        /// </summary>
+        NotaryAssisted = 0x22
     }
 }
\ No newline at end of file
@@ -0,0 +1,95 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using NeoSharp.Serialization;
+
+namespace NeoSharp.Types
+{
+    /// <summary>
+    /// Represents a block in its binary form, as returned in base64 by getblock with verbose set to false.
+    /// Decoding the binary form is considerably cheaper than parsing the verbose JSON of a
+    /// <see cref="Protocol.Core.Response.NeoBlock"/>, and the block and transaction hashes are computed locally.
+    /// </summary>
+    public class Block : INeoSerializable
+    {
+        // Neo limits the number of transactions per block to ushort.MaxValue.
+        private const int MaxTransactions = ushort.MaxValue;
+
+        private Header _header = new();
+        private List<Transaction.Transaction> _transactions = new();
+
+        /// <summary>
+        /// Gets or sets the block header.
+        /// </summary>
+        public Header Header
+        {
+            get => _header;
+            set => _header = value ?? new Header();
+        }
+
+        /// <summary>
+        /// Gets or sets the transactions of the block.
+        /// </summary>
+        public List<Transaction.Transaction> Transactions
+        {
+            get => _transactions;
+            set => _transactions = value ?? new List<Transaction.Transaction>();
+        }
+
+        /// <summary>
+        /// Gets the block hash.
+        /// </summary>
+        public Hash256 Hash => Header.Hash;
+
+        /// <summary>
+        /// Gets the block index.
+        /// </summary>
+        public uint Index => Header.Index;
+
+        /// <summary>
+        /// Gets the size of the block.
+        /// </summary>
+        public int Size => Header.Size + BinaryWriterExtensions.GetVarSize(Transactions.Count) + Transactions.Sum(t => t.Size);
+
+        /// <summary>
+        /// Serializes the block.
+        /// </summary>
+        /// <param name="writer">The writer to serialize to.</param>
+        public void Serialize(Serialization.BinaryWriter writer)
+        {
+            Header.Serialize(writer);
+            writer.WriteVarInt(Transactions.Count);
+            foreach (var transaction in Transactions)
+            {
+                transaction.Serialize(writer);
+            }
+        }
+
+        /// <summary>
+        /// Deserializes the block.
+        /// </summary>
+        /// <param name="reader">The reader to deserialize from.</param>
+        public void Deserialize(Serialization.BinaryReader reader)
+        {
+            Header = reader.ReadSerializable<Header>();
+
+            var count = reader.ReadVarInt(MaxTransactions);
+            var transactions = new List<Transaction.Transaction>(count);
+            for (var i = 0; i < count; i++)
+            {
+                transactions.Add(reader.ReadSerializable<Transaction.Transaction>());
+            }
+            Transactions = transactions;
+        }
+
+        /// <summary>
+        /// Decodes a block from the base64 string returned by getblock.
+        /// </summary>
+        /// <param name="base64">The serialized block in base64.</param>
+        /// <returns>The block.</returns>
+        public static Block FromBase64(string base64)
+        {
+            return NeoSerializableExtensions.FromArray<Block>(Convert.FromBase64String(base64));
+        }
+    }
+}
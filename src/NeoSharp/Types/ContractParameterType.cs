@@ -6,7 +6,7 @@ namespace NeoSharp.Types
     /// <summary>
     /// Represents the different types of contract parameters supported by Neo
     /// </summary>
-    [JsonConverter(typeof(JsonStringEnumConverter))]
+    [JsonConverter(typeof(JsonStringEnumConverter<ContractParameterType>))]
     public enum ContractParameterType : byte
     {
         /// <summary>
@@ -1,6 +1,7 @@
 using System;
 using System.Linq;
 using System.Numerics;
+using System.Text.Json.Serialization;
 using NeoSharp.Crypto;
 using NeoSharp.Script;
 using NeoSharp.Serialization;
@@ -14,6 +15,7 @@ namespace NeoSharp.Types
     /// A Hash160 is a 20 bytes long hash created from some data by first applying SHA-256 and then RIPEMD-160.
     /// These hashes are mostly used for obtaining the script hash of a smart contract or an account.
     /// </summary>
+    [JsonConverter(typeof(Hash160JsonConverter))]
     public readonly struct Hash160 : IEquatable<Hash160>, IComparable<Hash160>, INeoSerializable
     {
         /// <summary>
@@ -58,6 +60,19 @@ namespace NeoSharp.Types
             Array.Copy(hash, _hash, 20);
         }
 
+        /// <summary>
+        /// Constructs a new hash from the given bytes. The bytes must be in big-endian order and 160 bits long.
+        /// </summary>
+        /// <param name="hash">The hash in big-endian order</param>
+        /// <exception cref="ArgumentException">Thrown if hash is not exactly 20 bytes</exception>
+        public Hash160(ReadOnlySpan<byte> hash)
+        {
+            if (hash.Length != 20)
+                throw new ArgumentException($"Hash must be 20 bytes long but was {hash.Length} bytes.");
+
+            _hash = hash.ToArray();
+        }
+
         /// <summary>
         /// Constructs a new hash from the given hexadecimal string. The string must be in big-endian order and 160 bits long.
         /// </summary>
@@ -131,8 +146,22 @@ namespace NeoSharp.Types
         /// <returns>The script hash</returns>
         public static Hash160 FromScript(byte[] script)
         {
-            var hash = Hash.Hash160(script);
-            Array.Reverse(hash); // Convert to big-endian
+            if (script == null)
+                throw new ArgumentNullException(nameof(script));
+
+            return FromScript(script.AsSpan());
+        }
+
+        /// <summary>
+        /// Creates a script hash from the given script.
+        /// </summary>
+        /// <param name="script">The script to calculate the script hash for</param>
+        /// <returns>The script hash</returns>
+        public static Hash160 FromScript(ReadOnlySpan<byte> script)
+        {
+            Span<byte> hash = stackalloc byte[Hash.RIPEMD160Size];
+            Hash.Hash160(script, hash);
+            hash.Reverse(); // Convert to big-endian
             return new Hash160(hash);
         }
 
@@ -174,9 +203,22 @@ namespace NeoSharp.Types
             if (littleEndianBytes == null || littleEndianBytes.Length != 20)
                 throw new ArgumentException($"Bytes must be 20 bytes long but was {littleEndianBytes?.Length ?? 0} bytes.");
             
-            var bigEndianBytes = new byte[20];
-            Array.Copy(littleEndianBytes, bigEndianBytes, 20);
-            Array.Reverse(bigEndianBytes); // Convert to big-endian
+            return FromLittleEndianBytes(littleEndianBytes.AsSpan());
+        }
+
+        /// <summary>
+        /// Creates a Hash160 from little-endian bytes.
+        /// </summary>
+        /// <param name="littleEndianBytes">The bytes in little-endian order</param>
+        /// <returns>The hash</returns>
+        public static Hash160 FromLittleEndianBytes(ReadOnlySpan<byte> littleEndianBytes)
+        {
+            if (littleEndianBytes.Length != 20)
+                throw new ArgumentException($"Bytes must be 20 bytes long but was {littleEndianBytes.Length} bytes.");
+
+            Span<byte> bigEndianBytes = stackalloc byte[20];
+            littleEndianBytes.CopyTo(bigEndianBytes);
+            bigEndianBytes.Reverse(); // Convert to big-endian
             return new Hash160(bigEndianBytes);
         }
 
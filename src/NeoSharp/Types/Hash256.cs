@@ -1,6 +1,7 @@
 using System;
 using System.Linq;
 using System.Numerics;
+using System.Text.Json.Serialization;
 using NeoSharp.Crypto;
 using NeoSharp.Serialization;
 using NeoSharp.Utils;
@@ -13,6 +14,7 @@ namespace NeoSharp.Types
     /// A Hash256 is a 32 bytes long hash created from some data by applying SHA-256.
     /// These hashes are typically used for block hashes, transaction hashes, and Merkle tree nodes.
     /// </summary>
+    [JsonConverter(typeof(Hash256JsonConverter))]
     public readonly struct Hash256 : IEquatable<Hash256>, IComparable<Hash256>, INeoSerializable
     {
         /// <summary>
@@ -57,6 +59,19 @@ namespace NeoSharp.Types
             Array.Copy(hash, _hash, 32);
         }
 
+        /// <summary>
+        /// Constructs a new hash from the given bytes. The bytes must be in big-endian order and 256 bits long.
+        /// </summary>
+        /// <param name="hash">The hash in big-endian order</param>
+        /// <exception cref="ArgumentException">Thrown if hash is not exactly 32 bytes</exception>
+        public Hash256(ReadOnlySpan<byte> hash)
+        {
+            if (hash.Length != 32)
+                throw new ArgumentException($"Hash must be 32 bytes long but was {hash.Length} bytes.");
+
+            _hash = hash.ToArray();
+        }
+
         /// <summary>
         /// Constructs a new hash from the given hexadecimal string. The string must be in big-endian order and 256 bits long.
         /// </summary>
@@ -90,11 +105,25 @@ namespace NeoSharp.Types
         public byte[] ToLittleEndianArray()
         {
             var result = new byte[32];
-            Array.Copy(_hash, result, 32);
-            Array.Reverse(result);
+            CopyLittleEndianTo(result);
             return result;
         }
 
+        /// <summary>
+        /// Copies the hash in little-endian order to the destination without allocating.
+        /// </summary>
+        /// <param name="destination">The buffer that receives the 32 bytes</param>
+        /// <exception cref="ArgumentException">Thrown if destination is shorter than 32 bytes</exception>
+        public void CopyLittleEndianTo(Span<byte> destination)
+        {
+            if (destination.Length < 32)
+                throw new ArgumentException($"Destination must be at least 32 bytes long but was {destination.Length} bytes.", nameof(destination));
+
+            var littleEndian = destination.Slice(0, 32);
+            _hash.CopyTo(littleEndian);
+            littleEndian.Reverse();
+        }
+
         /// <summary>
         /// Parses a Hash256 from a hexadecimal string
         /// </summary>
@@ -112,7 +141,21 @@ namespace NeoSharp.Types
         /// <returns>The hash</returns>
         public static Hash256 FromData(byte[] data)
         {
-            var hash = Hash.SHA256(data);
+            if (data == null)
+                throw new ArgumentNullException(nameof(data));
+
+            return FromData(data.AsSpan());
+        }
+
+        /// <summary>
+        /// Creates a hash from the given data by applying SHA-256.
+        /// </summary>
+        /// <param name="data">The data to hash</param>
+        /// <returns>The hash</returns>
+        public static Hash256 FromData(ReadOnlySpan<byte> data)
+        {
+            Span<byte> hash = stackalloc byte[Hash.SHA256Size];
+            Hash.SHA256(data, hash);
             return new Hash256(hash);
         }
 
@@ -126,9 +169,22 @@ namespace NeoSharp.Types
             if (littleEndianBytes == null || littleEndianBytes.Length != 32)
                 throw new ArgumentException($"Bytes must be 32 bytes long but was {littleEndianBytes?.Length ?? 0} bytes.");
             
-            var bigEndianBytes = new byte[32];
-            Array.Copy(littleEndianBytes, bigEndianBytes, 32);
-            Array.Reverse(bigEndianBytes); // Convert to big-endian
+            return FromLittleEndianBytes(littleEndianBytes.AsSpan());
+        }
+
+        /// <summary>
+        /// Creates a Hash256 from little-endian bytes.
+        /// </summary>
+        /// <param name="littleEndianBytes">The bytes in little-endian order</param>
+        /// <returns>The hash</returns>
+        public static Hash256 FromLittleEndianBytes(ReadOnlySpan<byte> littleEndianBytes)
+        {
+            if (littleEndianBytes.Length != 32)
+                throw new ArgumentException($"Bytes must be 32 bytes long but was {littleEndianBytes.Length} bytes.");
+
+            Span<byte> bigEndianBytes = stackalloc byte[32];
+            littleEndianBytes.CopyTo(bigEndianBytes);
+            bigEndianBytes.Reverse(); // Convert to big-endian
             return new Hash256(bigEndianBytes);
         }
 
@@ -0,0 +1,42 @@
+using System;
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace NeoSharp.Types
+{
+    /// <summary>
+    /// JSON converter reading and writing a Hash256 as a '0x'-prefixed, big-endian hexadecimal string,
+    /// the representation used by the Neo JSON-RPC API.
+    /// </summary>
+    public class Hash256JsonConverter : JsonConverter<Hash256>
+    {
+        public override bool HandleNull => true;
+
+        public override Hash256 Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+        {
+            if (reader.TokenType == JsonTokenType.Null)
+            {
+                return default;
+            }
+
+            if (reader.TokenType != JsonTokenType.String)
+            {
+                throw new JsonException($"Expected a hexadecimal string for Hash256 but found {reader.TokenType}");
+            }
+
+            try
+            {
+                return Hash256.Parse(reader.GetString());
+            }
+            catch (ArgumentException ex)
+            {
+                throw new JsonException(ex.Message, ex);
+            }
+        }
+
+        public override void Write(Utf8JsonWriter writer, Hash256 value, JsonSerializerOptions options)
+        {
+            writer.WriteStringValue(value.ToString());
+        }
+    }
+}
@@ -0,0 +1,241 @@
+using System;
+using NeoSharp.Serialization;
+
+namespace NeoSharp.Types
+{
+    /// <summary>
+    /// Represents a block header in its binary form, as returned in base64 by getblockheader with
+    /// verbose set to false. The hash is computed locally from the serialized header.
+    /// </summary>
+    public class Header : INeoSerializable
+    {
+        // Version (4) + PrevHash (32) + MerkleRoot (32) + Timestamp (8) + Nonce (8) + Index (4) + PrimaryIndex (1) + NextConsensus (20)
+        private const int UnsignedSize = 109;
+
+        private uint _version;
+        private Hash256 _prevHash = Hash256.Zero;
+        private Hash256 _merkleRoot = Hash256.Zero;
+        private ulong _timestamp;
+        private ulong _nonce;
+        private uint _index;
+        private byte _primaryIndex;
+        private Hash160 _nextConsensus = Hash160.Zero;
+        private Transaction.Witness _witness = new();
+
+        private Hash256? _hash;
+
+        /// <summary>
+        /// Gets or sets the block version.
+        /// </summary>
+        public uint Version
+        {
+            get => _version;
+            set
+            {
+                _version = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the hash of the previous block.
+        /// </summary>
+        public Hash256 PrevHash
+        {
+            get => _prevHash;
+            set
+            {
+                _prevHash = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the merkle root of the block's transactions.
+        /// </summary>
+        public Hash256 MerkleRoot
+        {
+            get => _merkleRoot;
+            set
+            {
+                _merkleRoot = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the block timestamp in milliseconds since the Unix epoch.
+        /// </summary>
+        public ulong Timestamp
+        {
+            get => _timestamp;
+            set
+            {
+                _timestamp = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the block nonce.
+        /// </summary>
+        public ulong Nonce
+        {
+            get => _nonce;
+            set
+            {
+                _nonce = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the block index.
+        /// </summary>
+        public uint Index
+        {
+            get => _index;
+            set
+            {
+                _index = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the index of the consensus node that proposed the block.
+        /// </summary>
+        public byte PrimaryIndex
+        {
+            get => _primaryIndex;
+            set
+            {
+                _primaryIndex = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the script hash of the consensus nodes of the next block.
+        /// </summary>
+        public Hash160 NextConsensus
+        {
+            get => _nextConsensus;
+            set
+            {
+                _nextConsensus = value;
+                _hash = null;
+            }
+        }
+
+        /// <summary>
+        /// Gets or sets the witness of the block. It is not part of the hash.
+        /// </summary>
+        public Transaction.Witness Witness
+        {
+            get => _witness;
+            set => _witness = value ?? new Transaction.Witness();
+        }
+
+        /// <summary>
+        /// Gets the block hash.
+        /// </summary>
+        public Hash256 Hash
+        {
+            get
+            {
+                if (_hash == null)
+                {
+                    _hash = CalculateHash();
+                }
+                return _hash.Value;
+            }
+        }
+
+        /// <summary>
+        /// Gets the size of the header.
+        /// </summary>
+        public int Size => UnsignedSize + 1 + _witness.Size;
+
+        /// <summary>
+        /// Serializes the header without its witness.
+        /// </summary>
+        /// <param name="writer">The writer to serialize to.</param>
+        public void SerializeUnsigned(Serialization.BinaryWriter writer)
+        {
+            writer.WriteUInt32(Version);
+            PrevHash.Serialize(writer);
+            MerkleRoot.Serialize(writer);
+            writer.WriteUInt64(Timestamp);
+            writer.WriteUInt64(Nonce);
+            writer.WriteUInt32(Index);
+            writer.WriteByte(PrimaryIndex);
+            NextConsensus.Serialize(writer);
+        }
+
+        /// <summary>
+        /// Serializes the header.
+        /// </summary>
+        /// <param name="writer">The writer to serialize to.</param>
+        public void Serialize(Serialization.BinaryWriter writer)
+        {
+            SerializeUnsigned(writer);
+            writer.WriteVarInt(1);
+            Witness.Serialize(writer);
+        }
+
+        /// <summary>
+        /// Deserializes the header.
+        /// </summary>
+        /// <param name="reader">The reader to deserialize from.</param>
+        public void Deserialize(Serialization.BinaryReader reader)
+        {
+            DeserializeUnsigned(reader);
+            if (reader.ReadVarInt() != 1)
+                throw new FormatException("A block header must have exactly one witness.");
+
+            Witness = reader.ReadSerializable<Transaction.Witness>();
+        }
+
+        /// <summary>
+        /// Deserializes the header without its witness.
+        /// </summary>
+        /// <param name="reader">The reader to deserialize from.</param>
+        public void DeserializeUnsigned(Serialization.BinaryReader reader)
+        {
+            Version = reader.ReadUInt32();
+            if (Version > 0)
+                throw new FormatException($"Unsupported block version: {Version}");
+
+            PrevHash = reader.ReadSerializable<Hash256>();
+            MerkleRoot = reader.ReadSerializable<Hash256>();
+            Timestamp = reader.ReadUInt64();
+            Nonce = reader.ReadUInt64();
+            Index = reader.ReadUInt32();
+            PrimaryIndex = reader.ReadByte();
+            NextConsensus = reader.ReadSerializable<Hash160>();
+        }
+
+        /// <summary>
+        /// Decodes a header from the base64 string returned by getblockheader.
+        /// </summary>
+        /// <param name="base64">The serialized header in base64.</param>
+        /// <returns>The header.</returns>
+        public static Header FromBase64(string base64)
+        {
+            return NeoSerializableExtensions.FromArray<Header>(Convert.FromBase64String(base64));
+        }
+
+        private Hash256 CalculateHash()
+        {
+            using var sink = new HashingStream();
+            using var writer = new Serialization.BinaryWriter(sink);
+            SerializeUnsigned(writer);
+
+            Span<byte> hash = stackalloc byte[NeoSharp.Crypto.Hash.SHA256Size];
+            // Neo N3 hashes blocks with a single SHA-256 of the unsigned header.
+            sink.GetSha256(hash);
+            return Hash256.FromLittleEndianBytes(hash);
+        }
+    }
+}
@@ -1,5 +1,4 @@
 using System;
-using System.Linq;
 using System.Security.Cryptography;
 using NeoSharp.Crypto;
 
@@ -23,20 +22,12 @@ namespace NeoSharp.Utils
                 throw new ArgumentException("Script hash must be 20 bytes", nameof(scriptHash));
 
             // Create the payload: version + script hash
-            var payload = new byte[21];
+            Span<byte> payload = stackalloc byte[21];
             payload[0] = AddressVersion;
-            Array.Copy(scriptHash, 0, payload, 1, 20);
+            scriptHash.CopyTo(payload.Slice(1));
 
-            // Calculate checksum (first 4 bytes of double SHA256)
-            var checksum = payload.Sha256().Sha256().Take(4).ToArray();
-
-            // Combine payload and checksum
-            var addressBytes = new byte[25];
-            Array.Copy(payload, 0, addressBytes, 0, 21);
-            Array.Copy(checksum, 0, addressBytes, 21, 4);
-
-            // Encode to Base58
-            return Base58Encode(addressBytes);
+            // Encode to Base58 with the checksum (first 4 bytes of double SHA256)
+            return NeoSharp.Crypto.Base58.EncodeCheck(payload);
         }
 
         /// <summary>
@@ -52,19 +43,23 @@ namespace NeoSharp.Utils
             try
             {
                 // Decode from Base58
-                var addressBytes = Base58Decode(address);
+                var maxLength = NeoSharp.Crypto.Base58.GetMaxDecodedLength(address.Length);
+                Span<byte> addressBytes = maxLength <= 64 ? stackalloc byte[64] : new byte[maxLength];
+                if (!NeoSharp.Crypto.Base58.TryDecode(address, addressBytes, out var length))
+                    throw new FormatException("Invalid Base58 string");
+                addressBytes = addressBytes.Slice(0, length);
                 
-                if (addressBytes.Length < 25)
+                if (addressBytes.Length != 25)
                     throw new ArgumentException("Invalid address length", nameof(address));
 
-                // Extract payload and checksum (take only first 25 bytes if more present)
-                var relevantBytes = addressBytes.Take(25).ToArray();
-                var payload = relevantBytes.Take(21).ToArray();
-                var checksum = relevantBytes.Skip(21).Take(4).ToArray();
+                // Extract payload and checksum
+                var payload = addressBytes.Slice(0, 21);
+                var checksum = addressBytes.Slice(21, 4);
 
                 // Verify checksum
-                var expectedChecksum = payload.Sha256().Sha256().Take(4).ToArray();
-                if (!checksum.SequenceEqual(expectedChecksum))
+                Span<byte> expectedChecksum = stackalloc byte[Hash.SHA256Size];
+                Hash.Hash256(payload, expectedChecksum);
+                if (!checksum.SequenceEqual(expectedChecksum.Slice(0, 4)))
                     throw new ArgumentException("Invalid address checksum", nameof(address));
 
                 // Verify version
@@ -72,7 +67,7 @@ namespace NeoSharp.Utils
                     throw new ArgumentException("Invalid address version", nameof(address));
 
                 // Extract script hash
-                return payload.Skip(1).ToArray();
+                return payload.Slice(1).ToArray();
             }
             catch (Exception ex) when (!(ex is ArgumentException))
             {
@@ -89,15 +84,5 @@ namespace NeoSharp.Utils
         {
             return new Types.Hash160(address.AddressToScriptHash());
         }
-
-        private static string Base58Encode(byte[] data)
-        {
-            return Base58.Encode(data);
-        }
-
-        private static byte[] Base58Decode(string encoded)
-        {
-            return Base58.Decode(encoded);
-        }
     }
 }
\ No newline at end of file
@@ -1,18 +1,13 @@
 using System;
-using System.Linq;
-using System.Numerics;
-using System.Text;
 
 namespace NeoSharp.Utils
 {
     /// <summary>
     /// Base58 encoding/decoding implementation.
+    /// Delegates to <see cref="NeoSharp.Crypto.Base58"/> and throws instead of returning null on invalid input.
     /// </summary>
     public static class Base58
     {
-        private const string Alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz";
-        private static readonly BigInteger Base = new BigInteger(58);
-
         /// <summary>
         /// Encodes a byte array to Base58 string.
         /// </summary>
@@ -23,38 +18,7 @@ namespace NeoSharp.Utils
             if (data == null)
                 throw new ArgumentNullException(nameof(data));
             
-            if (data.Length == 0)
-                return string.Empty;
-            
-            // Count leading zeros
-            int leadingZeros = 0;
-            for (int i = 0; i < data.Length && data[i] == 0; i++)
-            {
-                leadingZeros++;
-            }
-            
-            // Convert to big integer (add 0x00 to ensure positive)
-            var bytes = new byte[data.Length + 1];
-            Array.Copy(data, 0, bytes, 1, data.Length);
-            Array.Reverse(bytes, 1, data.Length);
-            var value = new BigInteger(bytes);
-            
-            // Convert to base58
-            var result = new StringBuilder();
-            while (value > 0)
-            {
-                var remainder = value % Base;
-                value /= Base;
-                result.Insert(0, Alphabet[(int)remainder]);
-            }
-            
-            // Add leading '1's for each leading zero byte
-            for (int i = 0; i < leadingZeros; i++)
-            {
-                result.Insert(0, '1');
-            }
-            
-            return result.ToString();
+            return NeoSharp.Crypto.Base58.Encode(data.AsSpan());
         }
 
         /// <summary>
@@ -67,49 +31,11 @@ namespace NeoSharp.Utils
             if (encoded == null)
                 throw new ArgumentNullException(nameof(encoded));
             
-            if (encoded.Length == 0)
-                return Array.Empty<byte>();
-            
-            // Count leading '1's
-            int leadingOnes = 0;
-            for (int i = 0; i < encoded.Length && encoded[i] == '1'; i++)
-            {
-                leadingOnes++;
-            }
+            var decoded = NeoSharp.Crypto.Base58.Decode(encoded);
+            if (decoded == null)
+                throw new FormatException($"Invalid Base58 character: {encoded[NeoSharp.Crypto.Base58.IndexOfInvalidCharacter(encoded)]}");
             
-            // Convert from base58
-            BigInteger value = 0;
-            
-            for (int i = 0; i < encoded.Length; i++)
-            {
-                int digit = Alphabet.IndexOf(encoded[i]);
-                if (digit < 0)
-                    throw new FormatException($"Invalid Base58 character: {encoded[i]}");
-                
-                value = value * Base + digit;
-            }
-            
-            // Convert to bytes
-            var bytes = value.ToByteArray();
-            
-            // Remove sign byte if present
-            if (bytes.Length > 1 && bytes[bytes.Length - 1] == 0)
-            {
-                Array.Resize(ref bytes, bytes.Length - 1);
-            }
-            
-            // Reverse to big-endian
-            Array.Reverse(bytes);
-            
-            // Add leading zeros
-            if (leadingOnes > 0)
-            {
-                var result = new byte[leadingOnes + bytes.Length];
-                Array.Copy(bytes, 0, result, leadingOnes, bytes.Length);
-                return result;
-            }
-            
-            return bytes;
+            return decoded;
         }
 
         /// <summary>
@@ -119,10 +45,7 @@ namespace NeoSharp.Utils
         /// <returns>True if valid Base58, false otherwise.</returns>
         public static bool IsValid(string encoded)
         {
-            if (string.IsNullOrEmpty(encoded))
-                return true;
-            
-            return encoded.All(c => Alphabet.Contains(c));
+            return NeoSharp.Crypto.Base58.IsValid(encoded);
         }
     }
-}
\ No newline at end of file
+}
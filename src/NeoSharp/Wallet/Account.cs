@@ -187,6 +187,7 @@ namespace NeoSharp.Wallet
         /// </summary>
         /// <param name="password">The passphrase used to decrypt this account's private key</param>
         /// <param name="scryptParams">The Scrypt parameters used for decryption (defaults to standard params)</param>
+        /// <remarks>Reuses the derived key cached by the wallet's <see cref="Wallet.DerivedKeyCache"/>, if any.</remarks>
         public void DecryptPrivateKey(string password, NEP6.ScryptParams? scryptParams = null)
         {
             if (_keyPair != null) return;
@@ -195,7 +196,7 @@ namespace NeoSharp.Wallet
                 throw new InvalidOperationException("The account does not hold an encrypted private key.");
 
             scryptParams ??= NEP6.ScryptParams.Default;
-            _keyPair = NEP2.Decrypt(_encryptedPrivateKey, password, scryptParams);
+            _keyPair = NEP2.Decrypt(_encryptedPrivateKey, password, scryptParams, _wallet?.DerivedKeyCache);
         }
 
         /// <summary>
@@ -203,13 +204,32 @@ namespace NeoSharp.Wallet
         /// </summary>
         /// <param name="password">The passphrase used to encrypt this account's private key</param>
         /// <param name="scryptParams">The Scrypt parameters used for encryption (defaults to standard params)</param>
+        /// <remarks>Reuses the derived key cached by the wallet's <see cref="Wallet.DerivedKeyCache"/>, if any.</remarks>
         public void EncryptPrivateKey(string password, NEP6.ScryptParams? scryptParams = null)
         {
             if (_keyPair == null)
                 throw new InvalidOperationException("The account does not hold a decrypted private key.");
 
             scryptParams ??= NEP6.ScryptParams.Default;
-            _encryptedPrivateKey = NEP2.Encrypt(_keyPair, password, scryptParams);
+            _encryptedPrivateKey = NEP2.Encrypt(_keyPair, password, scryptParams, _wallet?.DerivedKeyCache);
+            _keyPair = null;
+        }
+
+        /// <summary>
+        /// Sets the key pair decrypted from this account's NEP-2 key outside the account, e.g. in bulk.
+        /// </summary>
+        internal void ApplyDecryptedKeyPair(ECKeyPair keyPair)
+        {
+            _keyPair = keyPair;
+        }
+
+        /// <summary>
+        /// Sets the NEP-2 key encrypted from this account's key pair outside the account, e.g. in bulk,
+        /// and drops the decrypted key pair.
+        /// </summary>
+        internal void ApplyEncryptedPrivateKey(string encryptedPrivateKey)
+        {
+            _encryptedPrivateKey = encryptedPrivateKey;
             _keyPair = null;
         }
 
@@ -1,6 +1,8 @@
 using System;
+using System.Collections.Generic;
 using System.Linq;
 using System.Text;
+using System.Threading;
 using Org.BouncyCastle.Crypto;
 using Org.BouncyCastle.Crypto.Engines;
 using Org.BouncyCastle.Crypto.Modes;
@@ -35,6 +37,21 @@ namespace NeoSharp.Wallet
             return Encrypt(keyPair.PrivateKeyBytes, password, scryptParams, keyPair.GetAddress());
         }
 
+        /// <summary>
+        /// Encrypts the private key of the given EC key pair following the NEP-2 standard, reusing the
+        /// scrypt-derived key cached for the same password, address and parameters.
+        /// </summary>
+        /// <param name="keyPair">The ECKeyPair to be encrypted</param>
+        /// <param name="password">The password used to encrypt</param>
+        /// <param name="scryptParams">The scrypt parameters used for encryption</param>
+        /// <param name="cache">The derived key cache, or null to always run scrypt</param>
+        /// <returns>The NEP-2 encrypted private key string</returns>
+        public static string Encrypt(ECKeyPair keyPair, string password, NEP6.ScryptParams? scryptParams, NEP2DerivedKeyCache? cache)
+        {
+            scryptParams ??= NEP6.ScryptParams.Default;
+            return Encrypt(keyPair.PrivateKeyBytes, password, scryptParams, keyPair.GetAddress(), -1, cache);
+        }
+
         /// <summary>
         /// Encrypts a private key using NEP-2 format.
         /// </summary>
@@ -44,6 +61,15 @@ namespace NeoSharp.Wallet
         /// <param name="address">The address for verification (optional, will be calculated if not provided)</param>
         /// <returns>The NEP-2 encrypted private key string.</returns>
         public static string Encrypt(byte[] privateKey, string password, NEP6.ScryptParams scryptParams, string? address = null)
+        {
+            return Encrypt(privateKey, password, scryptParams, address, -1);
+        }
+
+        /// <summary>
+        /// Encrypts a private key using NEP-2 format, mixing at most the given number of scrypt lanes at once.
+        /// </summary>
+        internal static string Encrypt(byte[] privateKey, string password, NEP6.ScryptParams scryptParams, string? address, int maxDegreeOfParallelism,
+            NEP2DerivedKeyCache? cache = null)
         {
             if (privateKey == null || privateKey.Length != 32)
                 throw new ArgumentException("Private key must be 32 bytes", nameof(privateKey));
@@ -62,7 +88,9 @@ namespace NeoSharp.Wallet
             
             // Derive key using scrypt
             var passwordBytes = Encoding.UTF8.GetBytes(password);
-            var derivedKey = NeoSharp.Crypto.ScryptEncoder.CryptoScrypt(passwordBytes, addressHash, scryptParams.N, scryptParams.R, scryptParams.P, 64);
+            string? cacheDigest = null;
+            var derivedKey = cache?.TryGet(passwordBytes, addressHash, scryptParams, out cacheDigest)
+                ?? NeoSharp.Crypto.ScryptEncoder.CryptoScrypt(passwordBytes, addressHash, scryptParams.N, scryptParams.R, scryptParams.P, 64, maxDegreeOfParallelism);
             
             // Split derived key
             var derivedKeyHalf1 = derivedKey.Take(32).ToArray();
@@ -78,6 +106,10 @@ namespace NeoSharp.Wallet
             // Encrypt using AES
             var encrypted = AesEncrypt(xorKey, derivedKeyHalf2);
             
+            if (cacheDigest != null)
+                cache!.Add(cacheDigest, addressHash, derivedKey);
+            ClearDerivedKey(derivedKey, derivedKeyHalf1, derivedKeyHalf2, xorKey);
+            
             // Build final encrypted key
             var nep2Key = new byte[NEP2_PRIVATE_KEY_LENGTH];
             nep2Key[0] = NEP2_PREFIX_1;
@@ -104,6 +136,22 @@ namespace NeoSharp.Wallet
             return new ECKeyPair(privateKeyBytes);
         }
 
+        /// <summary>
+        /// Decrypts the given encrypted private key in NEP-2 format with the given password, reusing the
+        /// scrypt-derived key cached for the same password, address and parameters.
+        /// </summary>
+        /// <param name="nep2Key">The NEP-2 encrypted private key</param>
+        /// <param name="password">The passphrase used for decryption</param>
+        /// <param name="scryptParams">The scrypt parameters used for encryption</param>
+        /// <param name="cache">The derived key cache, or null to always run scrypt</param>
+        /// <returns>An EC key pair constructed from the decrypted private key</returns>
+        public static ECKeyPair Decrypt(string nep2Key, string password, NEP6.ScryptParams? scryptParams, NEP2DerivedKeyCache? cache)
+        {
+            scryptParams ??= NEP6.ScryptParams.Default;
+            var privateKeyBytes = DecryptToBytes(nep2Key, password, scryptParams, -1, cache);
+            return new ECKeyPair(privateKeyBytes);
+        }
+
         /// <summary>
         /// Decrypts a NEP-2 encrypted private key to raw bytes.
         /// </summary>
@@ -112,6 +160,29 @@ namespace NeoSharp.Wallet
         /// <param name="scryptParams">The scrypt parameters.</param>
         /// <returns>The decrypted private key bytes.</returns>
         public static byte[] DecryptToBytes(string nep2Key, string password, NEP6.ScryptParams scryptParams)
+        {
+            return DecryptToBytes(nep2Key, password, scryptParams, -1);
+        }
+
+        /// <summary>
+        /// Decrypts a NEP-2 encrypted private key to raw bytes, reusing the scrypt-derived key cached for
+        /// the same password, address and parameters. A derived key is only cached once it decrypted the key.
+        /// </summary>
+        /// <param name="nep2Key">The NEP-2 encrypted key string.</param>
+        /// <param name="password">The password.</param>
+        /// <param name="scryptParams">The scrypt parameters.</param>
+        /// <param name="cache">The derived key cache, or null to always run scrypt.</param>
+        /// <returns>The decrypted private key bytes.</returns>
+        public static byte[] DecryptToBytes(string nep2Key, string password, NEP6.ScryptParams scryptParams, NEP2DerivedKeyCache? cache)
+        {
+            return DecryptToBytes(nep2Key, password, scryptParams, -1, cache);
+        }
+
+        /// <summary>
+        /// Decrypts a NEP-2 encrypted private key to raw bytes, mixing at most the given number of scrypt lanes at once.
+        /// </summary>
+        internal static byte[] DecryptToBytes(string nep2Key, string password, NEP6.ScryptParams scryptParams, int maxDegreeOfParallelism,
+            NEP2DerivedKeyCache? cache = null)
         {
             if (string.IsNullOrEmpty(nep2Key))
                 throw new FormatException("Invalid NEP-2 format: key cannot be empty");
@@ -145,7 +216,9 @@ namespace NeoSharp.Wallet
             
             // Derive key using scrypt
             var passwordBytes = Encoding.UTF8.GetBytes(password);
-            var derivedKey = NeoSharp.Crypto.ScryptEncoder.CryptoScrypt(passwordBytes, addressHash, scryptParams.N, scryptParams.R, scryptParams.P, 64);
+            string? cacheDigest = null;
+            var derivedKey = cache?.TryGet(passwordBytes, addressHash, scryptParams, out cacheDigest)
+                ?? NeoSharp.Crypto.ScryptEncoder.CryptoScrypt(passwordBytes, addressHash, scryptParams.N, scryptParams.R, scryptParams.P, 64, maxDegreeOfParallelism);
             
             // Split derived key
             var derivedKeyHalf1 = derivedKey.Take(32).ToArray();
@@ -161,12 +234,23 @@ namespace NeoSharp.Wallet
                 privateKey[i] = (byte)(decrypted[i] ^ derivedKeyHalf1[i]);
             }
             
-            // Verify by checking address hash
-            var keyPair = new ECKeyPair(privateKey);
-            var checkHash = GetAddressHash(keyPair.GetAddress());
-            
-            if (!addressHash.SequenceEqual(checkHash))
-                throw new NEP2Exception("Invalid password or corrupted key");
+            try
+            {
+                // Verify by checking address hash
+                var keyPair = new ECKeyPair(privateKey);
+                var checkHash = GetAddressHash(keyPair.GetAddress());
+                
+                if (!addressHash.SequenceEqual(checkHash))
+                    throw new NEP2Exception("Invalid password or corrupted key");
+                
+                // Only a derived key that proved to be right is worth caching
+                if (cacheDigest != null)
+                    cache!.Add(cacheDigest, addressHash, derivedKey);
+            }
+            finally
+            {
+                ClearDerivedKey(derivedKey, derivedKeyHalf1, derivedKeyHalf2, decrypted);
+            }
             
             return privateKey;
         }
@@ -195,6 +279,40 @@ namespace NeoSharp.Wallet
             }
         }
 
+        /// <summary>
+        /// Encrypts many key pairs at once, spreading the scrypt work across cores within a memory budget.
+        /// See <see cref="NEP2BulkProcessor"/>.
+        /// </summary>
+        /// <param name="keyPairs">The key pairs to encrypt</param>
+        /// <param name="password">The password used to encrypt</param>
+        /// <param name="scryptParams">The scrypt parameters used for encryption</param>
+        /// <param name="options">The scheduling options, or null for the defaults</param>
+        /// <param name="progress">Receives the number of key pairs processed so far</param>
+        /// <param name="cancellationToken">Stops scheduling further key pairs</param>
+        /// <returns>The NEP-2 strings in input order and the key pairs that could not be encrypted</returns>
+        public static NEP2BulkResult<string> EncryptMany(IReadOnlyList<ECKeyPair> keyPairs, string password, NEP6.ScryptParams? scryptParams = null,
+            NEP2BulkOptions? options = null, IProgress<int>? progress = null, CancellationToken cancellationToken = default)
+        {
+            return new NEP2BulkProcessor(options).EncryptMany(keyPairs, password, scryptParams, progress, cancellationToken);
+        }
+
+        /// <summary>
+        /// Decrypts many NEP-2 keys at once, spreading the scrypt work across cores within a memory budget.
+        /// See <see cref="NEP2BulkProcessor"/>.
+        /// </summary>
+        /// <param name="nep2Keys">The NEP-2 encrypted private keys</param>
+        /// <param name="password">The passphrase used for decryption</param>
+        /// <param name="scryptParams">The scrypt parameters used for encryption</param>
+        /// <param name="options">The scheduling options, or null for the defaults</param>
+        /// <param name="progress">Receives the number of keys processed so far</param>
+        /// <param name="cancellationToken">Stops scheduling further keys</param>
+        /// <returns>The key pairs in input order and the keys that could not be decrypted</returns>
+        public static NEP2BulkResult<ECKeyPair> DecryptMany(IReadOnlyList<string> nep2Keys, string password, NEP6.ScryptParams? scryptParams = null,
+            NEP2BulkOptions? options = null, IProgress<int>? progress = null, CancellationToken cancellationToken = default)
+        {
+            return new NEP2BulkProcessor(options).DecryptMany(nep2Keys, password, scryptParams, progress, cancellationToken);
+        }
+
         /// <summary>
         /// Encrypts the private key of the given EC key pair with custom scrypt parameters.
         /// </summary>
@@ -209,12 +327,23 @@ namespace NeoSharp.Wallet
             return Encrypt(keyPair, password, new NEP6.ScryptParams { N = n, R = r, P = p });
         }
 
+        /// <summary>
+        /// Zeroes the derived key and the intermediate buffers computed from it.
+        /// </summary>
+        private static void ClearDerivedKey(params byte[][] buffers)
+        {
+            foreach (var buffer in buffers)
+            {
+                System.Security.Cryptography.CryptographicOperations.ZeroMemory(buffer);
+            }
+        }
+
         /// <summary>
         /// Gets the address hash for a given address (first 4 bytes of double SHA256)
         /// </summary>
         /// <param name="address">The address</param>
         /// <returns>The address hash (4 bytes)</returns>
-        private static byte[] GetAddressHash(string address)
+        internal static byte[] GetAddressHash(string address)
         {
             var addressBytes = Encoding.UTF8.GetBytes(address);
             return addressBytes.SHA256().SHA256().Take(4).ToArray();
@@ -286,25 +415,13 @@ namespace NeoSharp.Wallet
 
         private static string Base58CheckEncode(byte[] data)
         {
-            var checksum = data.SHA256().SHA256().Take(4).ToArray();
-            var dataWithChecksum = data.Concat(checksum).ToArray();
-            return NeoSharp.Crypto.Base58.Encode(dataWithChecksum);
+            return NeoSharp.Crypto.Base58.EncodeCheck(data);
         }
 
         private static byte[] Base58CheckDecode(string encoded)
         {
-            var decoded = NeoSharp.Crypto.Base58.Decode(encoded);
-            if (decoded == null || decoded.Length < 4)
-                throw new FormatException("Invalid base58 check string");
-            
-            var data = decoded.Take(decoded.Length - 4).ToArray();
-            var checksum = decoded.Skip(decoded.Length - 4).ToArray();
-            var expectedChecksum = data.SHA256().SHA256().Take(4).ToArray();
-            
-            if (!checksum.SequenceEqual(expectedChecksum))
-                throw new FormatException("Invalid base58 check string");
-            
-            return data;
+            return NeoSharp.Crypto.Base58.DecodeCheck(encoded)
+                ?? throw new FormatException("Invalid base58 check string");
         }
     }
 }
\ No newline at end of file
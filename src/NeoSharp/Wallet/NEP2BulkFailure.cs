@@ -0,0 +1,31 @@
+using System;
+
+namespace NeoSharp.Wallet
+{
+    /// <summary>
+    /// An item of a bulk NEP-2 operation that could not be processed.
+    /// </summary>
+    public sealed class NEP2BulkFailure
+    {
+        /// <summary>
+        /// Initializes a new instance of the NEP2BulkFailure class.
+        /// </summary>
+        /// <param name="index">The position of the item in the input</param>
+        /// <param name="error">The exception raised while processing the item</param>
+        public NEP2BulkFailure(int index, Exception error)
+        {
+            Index = index;
+            Error = error ?? throw new ArgumentNullException(nameof(error));
+        }
+
+        /// <summary>
+        /// Gets the position of the item in the input.
+        /// </summary>
+        public int Index { get; }
+
+        /// <summary>
+        /// Gets the exception raised while processing the item.
+        /// </summary>
+        public Exception Error { get; }
+    }
+}
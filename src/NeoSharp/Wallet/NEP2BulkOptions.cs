@@ -0,0 +1,26 @@
+using System;
+
+namespace NeoSharp.Wallet
+{
+    /// <summary>
+    /// Options for a <see cref="NEP2BulkProcessor"/>.
+    /// </summary>
+    public class NEP2BulkOptions
+    {
+        /// <summary>
+        /// Default number of bytes the scrypt working memory of all in-flight derivations may occupy (1 GiB).
+        /// </summary>
+        public const long DEFAULT_MEMORY_BUDGET = 1L << 30;
+
+        /// <summary>
+        /// Gets or sets the number of bytes the scrypt working memory of all in-flight derivations may occupy.
+        /// Each scrypt lane needs 128·r·N bytes; at least one lane always runs, whatever the budget.
+        /// </summary>
+        public long MemoryBudget { get; set; } = DEFAULT_MEMORY_BUDGET;
+
+        /// <summary>
+        /// Gets or sets the maximum number of scrypt lanes mixed at once, or -1 to use every processor.
+        /// </summary>
+        public int MaxDegreeOfParallelism { get; set; } = -1;
+    }
+}
@@ -0,0 +1,149 @@
+using System;
+using System.Collections.Generic;
+using System.Threading;
+using System.Threading.Tasks;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Wallet
+{
+    /// <summary>
+    /// Encrypts and decrypts many NEP-2 keys at once. Scrypt needs 128·r·N bytes per lane, so the number of
+    /// lanes mixed at the same time is bounded by <see cref="NEP2BulkOptions.MemoryBudget"/> as well as by the
+    /// processor count. Keys are spread over the available lanes first; spare lanes go to the p lanes of
+    /// each key. A key that cannot be processed is reported in <see cref="NEP2BulkResult{T}.Failures"/>
+    /// without stopping the others.
+    /// </summary>
+    public class NEP2BulkProcessor
+    {
+        private readonly NEP2BulkOptions _options;
+        private readonly NEP2DerivedKeyCache? _cache;
+
+        /// <summary>
+        /// Initializes a new instance of the NEP2BulkProcessor class.
+        /// </summary>
+        /// <param name="options">The scheduling options, or null for the defaults</param>
+        /// <param name="cache">The cache of scrypt-derived keys shared with single-key encryption and decryption,
+        /// or null to derive every key</param>
+        public NEP2BulkProcessor(NEP2BulkOptions? options = null, NEP2DerivedKeyCache? cache = null)
+        {
+            _options = options ?? new NEP2BulkOptions();
+            _cache = cache;
+
+            if (_options.MemoryBudget <= 0)
+                throw new ArgumentOutOfRangeException(nameof(options), "The memory budget must be positive.");
+            if (_options.MaxDegreeOfParallelism == 0 || _options.MaxDegreeOfParallelism < -1)
+                throw new ArgumentOutOfRangeException(nameof(options), "The maximum degree of parallelism must be -1 or positive.");
+        }
+
+        /// <summary>
+        /// Gets the number of scrypt lanes mixed at once for the given parameters.
+        /// </summary>
+        /// <param name="scryptParams">The scrypt parameters</param>
+        /// <returns>The number of lanes, at least one</returns>
+        public int GetConcurrency(NEP6.ScryptParams scryptParams)
+        {
+            if (scryptParams == null)
+                throw new ArgumentNullException(nameof(scryptParams));
+
+            var bytesPerLane = 128L * scryptParams.R * scryptParams.N;
+            var processors = _options.MaxDegreeOfParallelism == -1 ? Environment.ProcessorCount : _options.MaxDegreeOfParallelism;
+            return (int)Math.Clamp(_options.MemoryBudget / bytesPerLane, 1, processors);
+        }
+
+        /// <summary>
+        /// Encrypts the private keys of the given key pairs following the NEP-2 standard.
+        /// </summary>
+        /// <param name="keyPairs">The key pairs to encrypt</param>
+        /// <param name="password">The password used to encrypt</param>
+        /// <param name="scryptParams">The scrypt parameters used for encryption</param>
+        /// <param name="progress">Receives the number of key pairs processed so far</param>
+        /// <param name="cancellationToken">Stops scheduling further key pairs</param>
+        /// <returns>The NEP-2 strings in input order and the key pairs that could not be encrypted</returns>
+        /// <exception cref="OperationCanceledException">The operation was canceled</exception>
+        public NEP2BulkResult<string> EncryptMany(IReadOnlyList<ECKeyPair> keyPairs, string password, NEP6.ScryptParams? scryptParams = null,
+            IProgress<int>? progress = null, CancellationToken cancellationToken = default)
+        {
+            if (keyPairs == null)
+                throw new ArgumentNullException(nameof(keyPairs));
+
+            scryptParams ??= NEP6.ScryptParams.Default;
+            return Run(keyPairs.Count, scryptParams, progress, cancellationToken, (index, lanes) =>
+            {
+                var keyPair = keyPairs[index] ?? throw new ArgumentNullException(nameof(keyPairs), "The key pair is null.");
+                return NEP2.Encrypt(keyPair.PrivateKeyBytes, password, scryptParams, keyPair.GetAddress(), lanes, _cache);
+            });
+        }
+
+        /// <summary>
+        /// Decrypts the given NEP-2 encrypted private keys.
+        /// </summary>
+        /// <param name="nep2Keys">The NEP-2 encrypted private keys</param>
+        /// <param name="password">The passphrase used for decryption</param>
+        /// <param name="scryptParams">The scrypt parameters used for encryption</param>
+        /// <param name="progress">Receives the number of keys processed so far</param>
+        /// <param name="cancellationToken">Stops scheduling further keys</param>
+        /// <returns>The key pairs in input order and the keys that could not be decrypted</returns>
+        /// <exception cref="OperationCanceledException">The operation was canceled</exception>
+        public NEP2BulkResult<ECKeyPair> DecryptMany(IReadOnlyList<string> nep2Keys, string password, NEP6.ScryptParams? scryptParams = null,
+            IProgress<int>? progress = null, CancellationToken cancellationToken = default)
+        {
+            if (nep2Keys == null)
+                throw new ArgumentNullException(nameof(nep2Keys));
+
+            scryptParams ??= NEP6.ScryptParams.Default;
+            return Run(nep2Keys.Count, scryptParams, progress, cancellationToken,
+                (index, lanes) => new ECKeyPair(NEP2.DecryptToBytes(nep2Keys[index], password, scryptParams, lanes, _cache)));
+        }
+
+        private NEP2BulkResult<T> Run<T>(int count, NEP6.ScryptParams scryptParams, IProgress<int>? progress,
+            CancellationToken cancellationToken, Func<int, int, T> process)
+        {
+            var results = new T[count];
+            var failures = new List<NEP2BulkFailure>();
+            var completed = 0;
+
+            void ProcessItem(int index, int lanes)
+            {
+                try
+                {
+                    results[index] = process(index, lanes);
+                }
+                catch (Exception ex) when (ex is not OperationCanceledException)
+                {
+                    lock (failures)
+                    {
+                        failures.Add(new NEP2BulkFailure(index, ex));
+                    }
+                }
+
+                progress?.Report(Interlocked.Increment(ref completed));
+            }
+
+            var concurrency = GetConcurrency(scryptParams);
+            var workers = Math.Min(concurrency, count);
+            if (workers <= 1)
+            {
+                // One key at a time: all lanes the budget allows go to that key's scrypt.
+                var lanes = Math.Min(concurrency, scryptParams.P);
+                for (var i = 0; i < count; i++)
+                {
+                    cancellationToken.ThrowIfCancellationRequested();
+                    ProcessItem(i, lanes);
+                }
+            }
+            else
+            {
+                var lanes = Math.Clamp(concurrency / workers, 1, scryptParams.P);
+                var parallelOptions = new ParallelOptions
+                {
+                    MaxDegreeOfParallelism = workers,
+                    CancellationToken = cancellationToken
+                };
+                Parallel.For(0, count, parallelOptions, i => ProcessItem(i, lanes));
+            }
+
+            failures.Sort((a, b) => a.Index.CompareTo(b.Index));
+            return new NEP2BulkResult<T>(results, failures);
+        }
+    }
+}
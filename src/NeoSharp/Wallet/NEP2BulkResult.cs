@@ -0,0 +1,32 @@
+using System.Collections.Generic;
+
+namespace NeoSharp.Wallet
+{
+    /// <summary>
+    /// The outcome of a bulk NEP-2 operation.
+    /// </summary>
+    /// <typeparam name="T">The type of a processed item</typeparam>
+    public sealed class NEP2BulkResult<T>
+    {
+        internal NEP2BulkResult(T[] results, List<NEP2BulkFailure> failures)
+        {
+            Results = results;
+            Failures = failures;
+        }
+
+        /// <summary>
+        /// Gets the processed items in input order. Items that failed are left at their default value.
+        /// </summary>
+        public IReadOnlyList<T> Results { get; }
+
+        /// <summary>
+        /// Gets the items that could not be processed, ordered by index.
+        /// </summary>
+        public IReadOnlyList<NEP2BulkFailure> Failures { get; }
+
+        /// <summary>
+        /// Gets whether every item was processed.
+        /// </summary>
+        public bool Succeeded => Failures.Count == 0;
+    }
+}
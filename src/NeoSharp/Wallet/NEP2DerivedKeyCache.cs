@@ -0,0 +1,272 @@
+using System;
+using System.Buffers.Binary;
+using System.Collections.Generic;
+using System.Security.Cryptography;
+using NeoSharp.Crypto;
+
+namespace NeoSharp.Wallet
+{
+    /// <summary>
+    /// Session cache of the scrypt-derived keys of NEP-2 encryption, so that an account that is encrypted and
+    /// decrypted repeatedly with the same password pays the scrypt cost only once. Only derived keys are cached,
+    /// never private keys, and only after they were checked against the NEP-2 address hash.
+    /// Entries are held in <see cref="SecureBytes"/>, keyed by an HMAC of the password, salt and scrypt parameters
+    /// under a random per-cache key, and expire <see cref="TimeToLiveMs"/> after they were derived. When more
+    /// than <see cref="MaxEntries"/> are cached the least recently used one is evicted. Evicted, expired and
+    /// purged entries are zeroed immediately, as are all entries on <see cref="Dispose"/>.
+    /// Caching is opt-in: pass an instance to the NEP-2 methods or to <see cref="Wallet.SetDerivedKeyCache"/>.
+    /// </summary>
+    public sealed class NEP2DerivedKeyCache : IDisposable
+    {
+        /// <summary>
+        /// Default maximum number of cached derived keys.
+        /// </summary>
+        public const int DEFAULT_MAX_ENTRIES = 16;
+
+        /// <summary>
+        /// Default time in milliseconds a derived key stays cached (5 minutes).
+        /// </summary>
+        public const int DEFAULT_TIME_TO_LIVE_MS = 5 * 60 * 1000;
+
+        private readonly byte[] _digestKey = RandomNumberGenerator.GetBytes(32);
+        private readonly Dictionary<string, Entry> _entries = new(StringComparer.Ordinal);
+        private readonly LinkedList<Entry> _recency = new();
+        private readonly object _lock = new();
+        private bool _disposed;
+
+        /// <summary>
+        /// Gets or sets the maximum number of cached derived keys.
+        /// </summary>
+        public int MaxEntries { get; set; } = DEFAULT_MAX_ENTRIES;
+
+        /// <summary>
+        /// Gets or sets the time in milliseconds a derived key stays cached after it was derived.
+        /// </summary>
+        public int TimeToLiveMs { get; set; } = DEFAULT_TIME_TO_LIVE_MS;
+
+        /// <summary>
+        /// Gets the number of cached derived keys, including expired ones not purged yet.
+        /// </summary>
+        public int Count
+        {
+            get
+            {
+                lock (_lock)
+                {
+                    return _entries.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Purges all cached derived keys.
+        /// </summary>
+        /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
+        public void Clear()
+        {
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+                ClearLocked();
+            }
+        }
+
+        /// <summary>
+        /// Purges the derived keys of an address, whatever the password, e.g. after its password changed.
+        /// </summary>
+        /// <param name="address">The address of the account</param>
+        /// <returns>The number of purged keys</returns>
+        /// <exception cref="ArgumentNullException">Thrown when address is null</exception>
+        /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
+        public int Remove(string address)
+        {
+            if (address == null)
+                throw new ArgumentNullException(nameof(address));
+
+            var salt = NEP2.GetAddressHash(address);
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+                return RemoveWhereLocked(entry => entry.Salt.AsSpan().SequenceEqual(salt));
+            }
+        }
+
+        /// <summary>
+        /// Purges the derived keys whose time-to-live has elapsed.
+        /// </summary>
+        /// <returns>The number of purged keys</returns>
+        /// <exception cref="ObjectDisposedException">Thrown when this instance has been disposed</exception>
+        public int RemoveExpired()
+        {
+            var now = Environment.TickCount64;
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+                return RemoveWhereLocked(entry => IsExpired(entry, now));
+            }
+        }
+
+        /// <summary>
+        /// Looks up a derived key.
+        /// </summary>
+        /// <param name="password">The UTF-8 password</param>
+        /// <param name="salt">The NEP-2 address hash</param>
+        /// <param name="scryptParams">The scrypt parameters</param>
+        /// <param name="digest">Receives the cache key to pass to <see cref="Add"/> on a miss, null on a hit</param>
+        /// <returns>A copy of the derived key the caller should zero after use, or null on a miss</returns>
+        internal byte[] TryGet(byte[] password, byte[] salt, NEP6.ScryptParams scryptParams, out string digest)
+        {
+            digest = ComputeDigest(password, salt, scryptParams);
+            var now = Environment.TickCount64;
+
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+
+                if (!_entries.TryGetValue(digest, out var entry))
+                    return null;
+
+                if (IsExpired(entry, now))
+                {
+                    RemoveLocked(entry);
+                    return null;
+                }
+
+                _recency.Remove(entry.Node);
+                _recency.AddLast(entry.Node);
+                digest = null;
+                return entry.DerivedKey.ToArray();
+            }
+        }
+
+        /// <summary>
+        /// Caches a derived key under the digest returned by <see cref="TryGet"/>. The key is copied.
+        /// </summary>
+        internal void Add(string digest, byte[] salt, byte[] derivedKey)
+        {
+            var now = Environment.TickCount64;
+
+            lock (_lock)
+            {
+                ThrowIfDisposed();
+
+                if (MaxEntries <= 0 || TimeToLiveMs <= 0) return;
+
+                if (_entries.TryGetValue(digest, out var existing))
+                    RemoveLocked(existing);
+
+                var entry = new Entry(digest, (byte[])salt.Clone(), new SecureBytes(derivedKey), now);
+                entry.Node = _recency.AddLast(entry);
+                _entries[digest] = entry;
+
+                RemoveWhereLocked(e => IsExpired(e, now));
+                while (_entries.Count > MaxEntries)
+                {
+                    RemoveLocked(_recency.First!.Value);
+                }
+            }
+        }
+
+        /// <summary>
+        /// Computes the HMAC-SHA256 of the password, salt and scrypt parameters under the per-cache key.
+        /// The password is length-prefixed so that no two inputs share an encoding.
+        /// </summary>
+        private string ComputeDigest(byte[] password, byte[] salt, NEP6.ScryptParams scryptParams)
+        {
+            var input = new byte[4 + password.Length + salt.Length + 12];
+            try
+            {
+                BinaryPrimitives.WriteInt32LittleEndian(input, password.Length);
+                password.CopyTo(input, 4);
+                salt.CopyTo(input, 4 + password.Length);
+                var offset = 4 + password.Length + salt.Length;
+                BinaryPrimitives.WriteInt32LittleEndian(input.AsSpan(offset), scryptParams.N);
+                BinaryPrimitives.WriteInt32LittleEndian(input.AsSpan(offset + 4), scryptParams.R);
+                BinaryPrimitives.WriteInt32LittleEndian(input.AsSpan(offset + 8), scryptParams.P);
+
+                return Convert.ToBase64String(HMACSHA256.HashData(_digestKey, input));
+            }
+            finally
+            {
+                CryptographicOperations.ZeroMemory(input);
+            }
+        }
+
+        private bool IsExpired(Entry entry, long now) => now - entry.Timestamp >= TimeToLiveMs;
+
+        private int RemoveWhereLocked(Func<Entry, bool> predicate)
+        {
+            var removed = 0;
+            for (var node = _recency.First; node != null;)
+            {
+                var next = node.Next;
+                if (predicate(node.Value))
+                {
+                    RemoveLocked(node.Value);
+                    removed++;
+                }
+                node = next;
+            }
+            return removed;
+        }
+
+        private void RemoveLocked(Entry entry)
+        {
+            _recency.Remove(entry.Node);
+            _entries.Remove(entry.Digest);
+            entry.DerivedKey.Dispose();
+        }
+
+        private void ClearLocked()
+        {
+            while (_recency.First != null)
+            {
+                RemoveLocked(_recency.First.Value);
+            }
+        }
+
+        /// <summary>
+        /// Throws ObjectDisposedException if this instance has been disposed.
+        /// </summary>
+        private void ThrowIfDisposed()
+        {
+            if (_disposed)
+                throw new ObjectDisposedException(nameof(NEP2DerivedKeyCache));
+        }
+
+        /// <summary>
+        /// Zeroes and releases all cached derived keys.
+        /// </summary>
+        public void Dispose()
+        {
+            lock (_lock)
+            {
+                if (_disposed) return;
+
+                _disposed = true;
+                ClearLocked();
+                CryptographicOperations.ZeroMemory(_digestKey);
+            }
+        }
+
+        /// <summary>
+        /// A cached derived key.
+        /// </summary>
+        private sealed class Entry
+        {
+            public Entry(string digest, byte[] salt, SecureBytes derivedKey, long timestamp)
+            {
+                Digest = digest;
+                Salt = salt;
+                DerivedKey = derivedKey;
+                Timestamp = timestamp;
+            }
+
+            public string Digest { get; }
+            public byte[] Salt { get; }
+            public SecureBytes DerivedKey { get; }
+            public long Timestamp { get; }
+            public LinkedListNode<Entry> Node;
+        }
+    }
+}
@@ -93,7 +93,7 @@ namespace NeoSharp.Wallet.NEP6
             
             // Sort public keys
             var sortedKeys = new List<ECPoint>(publicKeys);
-            sortedKeys.Sort((a, b) => a.GetEncoded(true).AsSpan().SequenceCompareTo(b.GetEncoded(true)));
+            sortedKeys.Sort((a, b) => a.EncodedSpan.SequenceCompareTo(b.EncodedSpan));
             
             // Create verification script for multi-signature
             var scriptBuilder = new Script.ScriptBuilder();
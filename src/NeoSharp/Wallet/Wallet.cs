@@ -3,6 +3,7 @@ using System.Collections.Generic;
 using System.IO;
 using System.Linq;
 using System.Text.Json;
+using System.Threading;
 using System.Threading.Tasks;
 using NeoSharp.Types;
 using NeoSharp.Wallet.NEP6;
@@ -38,6 +39,12 @@ namespace NeoSharp.Wallet
         /// </summary>
         public NEP6.ScryptParams ScryptParams { get; private set; }
 
+        /// <summary>
+        /// Gets the cache of scrypt-derived keys used when the accounts of this wallet are encrypted or
+        /// decrypted one at a time, or null if derived keys are not cached (the default)
+        /// </summary>
+        public NEP2DerivedKeyCache? DerivedKeyCache { get; private set; }
+
         /// <summary>
         /// Gets the accounts in this wallet (sorted by script hash)
         /// </summary>
@@ -148,6 +155,18 @@ namespace NeoSharp.Wallet
             return this;
         }
 
+        /// <summary>
+        /// Sets the cache of scrypt-derived keys, so that relocking and unlocking an account with the same
+        /// password only runs scrypt once. The caller owns the cache and disposes it when the session ends.
+        /// </summary>
+        /// <param name="cache">The derived key cache, or null to stop caching</param>
+        /// <returns>This wallet (for method chaining)</returns>
+        public Wallet SetDerivedKeyCache(NEP2DerivedKeyCache? cache)
+        {
+            DerivedKeyCache = cache;
+            return this;
+        }
+
         /// <summary>
         /// Adds the given accounts to this wallet, if it doesn't contain an account with the same script hash
         /// </summary>
@@ -232,41 +251,53 @@ namespace NeoSharp.Wallet
         }
 
         /// <summary>
-        /// Decrypts all accounts in the wallet
+        /// Decrypts all encrypted accounts in the wallet, spreading the scrypt work across cores within
+        /// the memory budget of <paramref name="options"/>. Uses <see cref="DerivedKeyCache"/> like single-account decryption.
         /// </summary>
         /// <param name="password">The password to use for decryption</param>
-        public void DecryptAllAccounts(string password)
+        /// <param name="options">The bulk scheduling options, or null for the defaults</param>
+        /// <param name="progress">Receives the number of accounts processed so far</param>
+        /// <param name="cancellationToken">Stops decrypting further accounts</param>
+        /// <returns>The accounts that could not be decrypted and the reason</returns>
+        public IReadOnlyDictionary<Account, Exception> DecryptAllAccounts(string password, NEP2BulkOptions? options = null,
+            IProgress<int>? progress = null, CancellationToken cancellationToken = default)
         {
-            foreach (var account in _accountsMap.Values)
+            var accounts = _accountsMap.Values.Where(a => a.KeyPair == null && a.EncryptedPrivateKey != null).ToList();
+            var result = new NEP2BulkProcessor(options, DerivedKeyCache).DecryptMany(
+                accounts.Select(a => a.EncryptedPrivateKey!).ToList(), password, ScryptParams, progress, cancellationToken);
+
+            for (var i = 0; i < accounts.Count; i++)
             {
-                try
-                {
-                    account.DecryptPrivateKey(password, ScryptParams);
-                }
-                catch
-                {
-                    // Skip accounts that can't be decrypted
-                }
+                if (result.Results[i] != null)
+                    accounts[i].ApplyDecryptedKeyPair(result.Results[i]);
             }
+
+            return result.Failures.ToDictionary(f => accounts[f.Index], f => f.Error);
         }
 
         /// <summary>
-        /// Encrypts all accounts in the wallet
+        /// Encrypts all accounts holding a key pair in the wallet, spreading the scrypt work across cores
+        /// within the memory budget of <paramref name="options"/>. Uses <see cref="DerivedKeyCache"/> like single-account encryption.
         /// </summary>
         /// <param name="password">The password to use for encryption</param>
-        public void EncryptAllAccounts(string password)
+        /// <param name="options">The bulk scheduling options, or null for the defaults</param>
+        /// <param name="progress">Receives the number of accounts processed so far</param>
+        /// <param name="cancellationToken">Stops encrypting further accounts</param>
+        /// <returns>The accounts that could not be encrypted and the reason</returns>
+        public IReadOnlyDictionary<Account, Exception> EncryptAllAccounts(string password, NEP2BulkOptions? options = null,
+            IProgress<int>? progress = null, CancellationToken cancellationToken = default)
         {
-            foreach (var account in _accountsMap.Values)
+            var accounts = _accountsMap.Values.Where(a => a.KeyPair != null).ToList();
+            var result = new NEP2BulkProcessor(options, DerivedKeyCache).EncryptMany(
+                accounts.Select(a => a.KeyPair!).ToList(), password, ScryptParams, progress, cancellationToken);
+
+            for (var i = 0; i < accounts.Count; i++)
             {
-                try
-                {
-                    account.EncryptPrivateKey(password, ScryptParams);
-                }
-                catch
-                {
-                    // Skip accounts that can't be encrypted
-                }
+                if (result.Results[i] != null)
+                    accounts[i].ApplyEncryptedPrivateKey(result.Results[i]);
             }
+
+            return result.Failures.ToDictionary(f => accounts[f.Index], f => f.Error);
         }
 
         /// <summary>
@@ -1,7 +1,9 @@
 using System;
+using System.Linq;
 using System.Text;
 using FluentAssertions;
 using NeoSharp.Tests.Helpers;
+using NeoSharp.Utils;
 using Xunit;
 
 namespace NeoSharp.Tests.Crypto
@@ -213,5 +215,118 @@ namespace NeoSharp.Tests.Crypto
 
             decoded.Should().BeEquivalentTo(testData);
         }
+
+        /// <summary>
+        /// Reference Base58 encoding through BigInteger division.
+        /// </summary>
+        private static string ReferenceEncode(byte[] data)
+        {
+            const string alphabet = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz";
+            var value = new System.Numerics.BigInteger(data, isUnsigned: true, isBigEndian: true);
+            var result = new StringBuilder();
+            while (value > 0)
+            {
+                value = System.Numerics.BigInteger.DivRem(value, 58, out var remainder);
+                result.Insert(0, alphabet[(int)remainder]);
+            }
+            for (var i = 0; i < data.Length && data[i] == 0; i++)
+            {
+                result.Insert(0, '1');
+            }
+            return result.ToString();
+        }
+
+        [Fact]
+        public void TestBase58MatchesReferenceForRandomInputs()
+        {
+            var random = new Random(25);
+            foreach (var length in new[] { 1, 2, 3, 4, 5, 6, 7, 8, 9, 20, 21, 25, 33, 38, 39, 64, 95, 96, 97, 128, 300 })
+            {
+                for (var i = 0; i < 8; i++)
+                {
+                    var data = new byte[length];
+                    random.NextBytes(data);
+                    var zeros = random.Next(0, Math.Min(length, 4) + 1);
+                    Array.Clear(data, 0, i == 0 ? length : zeros);
+
+                    var encoded = NeoSharp.Crypto.Base58.Encode(data);
+
+                    encoded.Should().Be(ReferenceEncode(data), $"length {length}");
+                    NeoSharp.Crypto.Base58.Decode(encoded).Should().Equal(data, $"length {length}");
+                    encoded.Length.Should().BeLessThanOrEqualTo(NeoSharp.Crypto.Base58.GetMaxEncodedLength(length));
+                }
+            }
+        }
+
+        [Fact]
+        public void TestBase58SpanApis()
+        {
+            var data = new byte[] { 0x00, 0x00, 0x28, 0x7f, 0xb4, 0xcd };
+            var expected = NeoSharp.Crypto.Base58.Encode(data);
+
+            Span<char> chars = stackalloc char[NeoSharp.Crypto.Base58.GetMaxEncodedLength(data.Length)];
+            NeoSharp.Crypto.Base58.TryEncode(data, chars, out var charsWritten).Should().BeTrue();
+            chars.Slice(0, charsWritten).ToString().Should().Be(expected);
+            NeoSharp.Crypto.Base58.TryEncode(data, chars.Slice(0, expected.Length - 1), out charsWritten).Should().BeFalse();
+            charsWritten.Should().Be(0);
+
+            Span<byte> bytes = stackalloc byte[NeoSharp.Crypto.Base58.GetMaxDecodedLength(expected.Length)];
+            NeoSharp.Crypto.Base58.TryDecode(expected, bytes, out var bytesWritten).Should().BeTrue();
+            bytes.Slice(0, bytesWritten).ToArray().Should().Equal(data);
+            NeoSharp.Crypto.Base58.TryDecode(expected, bytes.Slice(0, data.Length - 1), out _).Should().BeFalse();
+            NeoSharp.Crypto.Base58.TryDecode("3mJr0", bytes, out _).Should().BeFalse();
+        }
+
+        [Fact]
+        public void TestBase58CheckRoundTrip()
+        {
+            var inputData = new byte[]
+            {
+                6, 161, 159, 136, 34, 110, 33, 238, 14, 79, 14, 218, 133, 13, 109, 40, 194, 236, 153, 44, 61, 157, 254
+            };
+
+            var encoded = NeoSharp.Crypto.Base58.EncodeCheck(inputData);
+            encoded.Should().Be("tz1Y3qqTg9HdrzZGbEjiCPmwuZ7fWVxpPtRw");
+            NeoSharp.Crypto.Base58.DecodeCheck(encoded).Should().Equal(inputData);
+
+            Span<char> chars = stackalloc char[64];
+            NeoSharp.Crypto.Base58.TryEncodeCheck(inputData, chars, out var charsWritten).Should().BeTrue();
+            chars.Slice(0, charsWritten).ToString().Should().Be(encoded);
+
+            Span<byte> bytes = stackalloc byte[inputData.Length];
+            NeoSharp.Crypto.Base58.TryDecodeCheck(encoded, bytes, out var bytesWritten).Should().BeTrue();
+            bytesWritten.Should().Be(inputData.Length);
+            NeoSharp.Crypto.Base58.TryDecodeCheck(encoded, bytes.Slice(1), out _).Should().BeFalse();
+            NeoSharp.Crypto.Base58.TryDecodeCheck("1", bytes, out _).Should().BeFalse();
+        }
+
+        [Fact]
+        public void TestUtilsBase58RoutesToTheSameCodec()
+        {
+            NeoSharp.Utils.Base58.Encode(new byte[] { 0 }).Should().Be("1");
+            NeoSharp.Utils.Base58.Decode("1").Should().Equal(0);
+            NeoSharp.Utils.Base58.Decode("111").Should().Equal(0, 0, 0);
+            NeoSharp.Utils.Base58.Decode("3mJr7AoUXx2Wqd").Should().Equal(Encoding.UTF8.GetBytes("1234598760"));
+
+            Action invalid = () => NeoSharp.Utils.Base58.Decode("3mJr0");
+            Action nullInput = () => NeoSharp.Utils.Base58.Decode(null!);
+            invalid.Should().Throw<FormatException>().WithMessage("*0*");
+            nullInput.Should().Throw<ArgumentNullException>();
+        }
+
+        [Fact]
+        public void TestAddressWithTrailingBytesIsRejected()
+        {
+            var address = TestConstants.DefaultAccountAddress;
+            var scriptHash = address.AddressToScriptHash();
+            scriptHash.ScriptHashToAddress().Should().Be(address);
+
+            // A valid 25-byte address followed by extra bytes must not decode to the same script hash.
+            var decoded = NeoSharp.Crypto.Base58.Decode(address);
+            var extended = NeoSharp.Crypto.Base58.Encode(decoded.Concat(new byte[] { 0x00 }).ToArray());
+
+            Action decode = () => extended.AddressToScriptHash();
+            decode.Should().Throw<ArgumentException>().WithMessage("Invalid address length*");
+        }
     }
-}
\ No newline at end of file
+}
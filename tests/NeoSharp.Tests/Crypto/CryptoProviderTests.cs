@@ -0,0 +1,166 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Text;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Utils;
+using Xunit;
+using BCBigInteger = Org.BouncyCastle.Math.BigInteger;
+
+namespace NeoSharp.Tests.Crypto
+{
+    /// <summary>
+    /// Conformance tests that every <see cref="ICryptoProvider"/> available on the platform derives the
+    /// same keys as the managed provider and accepts and rejects exactly the same signatures.
+    /// </summary>
+    public class CryptoProviderTests
+    {
+        private const string PrivateKeyHex = "c9afa9d845ba75166b5c215767b1d6934e50c3db36e89b127b8a622b120f6721";
+        private const string PublicKeyHex = "0360fed4ba255a9d31c961eb74c6356d68c049b8923b61fa6ce669622e60f29fb6";
+
+        private static readonly ICryptoProvider Reference = BouncyCastleCryptoProvider.Instance;
+
+        public static IEnumerable<object[]> Providers()
+        {
+            yield return new object[] { BouncyCastleCryptoProvider.Instance };
+            if (NativeCryptoProvider.IsSupported)
+                yield return new object[] { NativeCryptoProvider.Instance };
+        }
+
+        private static byte[] Scalar(BCBigInteger value) =>
+            Org.BouncyCastle.Utilities.BigIntegers.AsUnsignedByteArray(32, value);
+
+        private static IEnumerable<byte[]> PrivateKeys()
+        {
+            yield return Scalar(BCBigInteger.One);
+            yield return Scalar(BCBigInteger.Two);
+            yield return Scalar(Secp256r1Curve.N.Subtract(BCBigInteger.One));
+            yield return PrivateKeyHex.HexToBytes();
+
+            var random = new Random(21);
+            for (var i = 0; i < 16; i++)
+            {
+                var key = new byte[32];
+                random.NextBytes(key);
+                key[0] &= 0x7F;
+                yield return key;
+            }
+        }
+
+        [Theory]
+        [MemberData(nameof(Providers))]
+        public void DerivePublicKey_IsByteIdentical(ICryptoProvider provider)
+        {
+            provider.DerivePublicKey(PrivateKeyHex.HexToBytes()).ToHexString().Should().Be(PublicKeyHex);
+
+            foreach (var privateKey in PrivateKeys())
+            {
+                provider.DerivePublicKey(privateKey).Should().Equal(Reference.DerivePublicKey(privateKey));
+            }
+        }
+
+        [Theory]
+        [MemberData(nameof(Providers))]
+        public void RejectsPrivateKeysOutOfRange(ICryptoProvider provider)
+        {
+            var invalid = new[] { new byte[32], Scalar(Secp256r1Curve.N), Enumerable.Repeat((byte)0xFF, 32).ToArray(), new byte[31] };
+            var hash = Hash.SHA256(Encoding.UTF8.GetBytes("sample"));
+
+            foreach (var privateKey in invalid)
+            {
+                Action derive = () => provider.DerivePublicKey(privateKey);
+                Action sign = () => provider.SignHash(privateKey, hash);
+                derive.Should().Throw<ArgumentException>();
+                sign.Should().Throw<ArgumentException>();
+            }
+        }
+
+        [Theory]
+        [MemberData(nameof(Providers))]
+        public void SignaturesVerifyWithEveryProvider(ICryptoProvider provider)
+        {
+            var publicKey = new ECPublicKey(PublicKeyHex.HexToBytes());
+            var hash = Hash.SHA256(Encoding.UTF8.GetBytes("sample"));
+
+            var signature = provider.SignHash(PrivateKeyHex.HexToBytes(), hash);
+
+            signature.Should().HaveCount(64);
+            foreach (var verifier in Providers().Select(p => (ICryptoProvider)p[0]))
+            {
+                verifier.VerifyHash(publicKey, hash, signature).Should().BeTrue(verifier.Name);
+            }
+        }
+
+        [Theory]
+        [MemberData(nameof(Providers))]
+        public void VerifyHash_AgreesWithTheReferenceOnEveryCase(ICryptoProvider provider)
+        {
+            var publicKey = new ECPublicKey(PublicKeyHex.HexToBytes());
+            var otherKey = new ECPublicKey(Reference.DerivePublicKey(Scalar(BCBigInteger.Two)));
+            var offCurveKey = new ECPublicKey(("02" + new string('0', 63) + "1").HexToBytes());
+            var hash = Hash.SHA256(Encoding.UTF8.GetBytes("sample"));
+
+            var keyPair = new ECKeyPair(new ECPrivateKey(PrivateKeyHex.HexToBytes()));
+            var deterministic = Sign.SignHash(hash, keyPair);
+            var signature = deterministic.R.Concat(deterministic.S).ToArray();
+            var r = new BCBigInteger(1, deterministic.R);
+            var s = new BCBigInteger(1, deterministic.S);
+
+            var cases = new (string Name, ECPublicKey Key, byte[] Hash, byte[] Signature, bool Expected)[]
+            {
+                ("valid", publicKey, hash, signature, true),
+                ("high S", publicKey, hash, Scalar(r).Concat(Scalar(Secp256r1Curve.N.Subtract(s))).ToArray(), true),
+                ("other hash", publicKey, Hash.SHA256(Encoding.UTF8.GetBytes("test")), signature, false),
+                ("other key", otherKey, hash, signature, false),
+                ("off-curve key", offCurveKey, hash, signature, false),
+                ("r = 0", publicKey, hash, new byte[32].Concat(Scalar(s)).ToArray(), false),
+                ("s = 0", publicKey, hash, Scalar(r).Concat(new byte[32]).ToArray(), false),
+                ("r + n", publicKey, hash, Scalar(r.Add(Secp256r1Curve.N).Mod(BCBigInteger.One.ShiftLeft(256))).Concat(Scalar(s)).ToArray(), false),
+                ("s = n", publicKey, hash, Scalar(r).Concat(Scalar(Secp256r1Curve.N)).ToArray(), false),
+                ("short", publicKey, hash, signature.Take(63).ToArray(), false),
+            };
+
+            foreach (var (name, key, messageHash, sig, expected) in cases)
+            {
+                var result = provider.VerifyHash(key, messageHash, sig);
+                result.Should().Be(expected, name);
+                result.Should().Be(Reference.VerifyHash(key, messageHash, sig), name);
+            }
+        }
+
+        [Theory]
+        [MemberData(nameof(Providers))]
+        public void VerifyHash_IsConsistentAcrossThreadsAndManyKeys(ICryptoProvider provider)
+        {
+            // More keys than the native provider keeps imported per thread, so entries are evicted and re-imported.
+            var hash = Hash.SHA256(Encoding.UTF8.GetBytes("sample"));
+            var signed = PrivateKeys()
+                .Select(privateKey => (Key: new ECPublicKey(Reference.DerivePublicKey(privateKey)), Signature: Reference.SignHash(privateKey, hash)))
+                .ToArray();
+
+            var results = new bool[8 * signed.Length];
+            Parallel.For(0, results.Length, i =>
+            {
+                var (key, signature) = signed[i % signed.Length];
+                var other = signed[(i + 1) % signed.Length].Key;
+                results[i] = provider.VerifyHash(key, hash, signature) && !provider.VerifyHash(other, hash, signature);
+            });
+
+            results.Should().OnlyContain(result => result);
+        }
+
+        [Fact]
+        public void Detect_PrefersTheNativeProvider()
+        {
+            var expected = NativeCryptoProvider.IsSupported
+                ? (ICryptoProvider)NativeCryptoProvider.Instance
+                : BouncyCastleCryptoProvider.Instance;
+
+            CryptoProvider.Detect().Should().BeSameAs(expected);
+            Action clear = () => CryptoProvider.Current = null;
+            clear.Should().Throw<ArgumentNullException>();
+        }
+    }
+}
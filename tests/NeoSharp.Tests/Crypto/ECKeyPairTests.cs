@@ -253,5 +253,61 @@ namespace NeoSharp.Tests.Crypto
             keyPair1.PublicKey.Should().BeEquivalentTo(keyPair2.PublicKey);
             keyPair1.GetAddress().Should().Be(keyPair2.GetAddress());
         }
+
+        [Fact]
+        public void EncodedSpan_ExposesTheEncodingWithoutCopying()
+        {
+            var publicKey = new ECPublicKey(TestConstants.HexToBytes(EncodedPoint));
+            var point = publicKey.ToECPoint();
+
+            HexExtensions.ToHexString(publicKey.EncodedSpan.ToArray()).Should().Be(EncodedPoint);
+            point.EncodedSpan.SequenceEqual(publicKey.EncodedSpan).Should().BeTrue();
+            publicKey.GetEncoded().Should().NotBeSameAs(publicKey.GetEncoded());
+        }
+
+        [Fact]
+        public void CurvePoint_IsDecodedOnceAndMatchesTheEncoding()
+        {
+            var publicKey = new ECPublicKey(TestConstants.HexToBytes(EncodedPoint));
+            var point = publicKey.ToECPoint();
+
+            publicKey.CurvePoint.Should().BeSameAs(publicKey.CurvePoint);
+            publicKey.CurvePoint.IsNormalized().Should().BeTrue();
+            HexExtensions.ToHexString(publicKey.CurvePoint.GetEncoded(true)).Should().Be(EncodedPoint);
+            point.CurvePoint.Should().Be(publicKey.CurvePoint);
+        }
+
+        [Fact]
+        public void CachedPoint_KeepsVerifyingRepeatedly()
+        {
+            var keyPair = ECKeyPair.CreateEcKeyPair();
+            var point = keyPair.PublicKey.ToECPoint();
+
+            for (var i = 0; i < 5; i++)
+            {
+                var message = System.Text.Encoding.UTF8.GetBytes($"witness {i}");
+                var messageHash = NeoSharp.Crypto.Hash.SHA256(message);
+                var signature = keyPair.Sign(messageHash);
+
+                keyPair.PublicKey.Verify(messageHash, signature).Should().BeTrue();
+                point.VerifySignature(message, signature).Should().BeTrue();
+                keyPair.PublicKey.Verify(NeoSharp.Crypto.Hash.SHA256(signature), signature).Should().BeFalse();
+            }
+        }
+
+        [Fact]
+        public void CurvePoint_RejectsEncodingsOffTheCurve()
+        {
+            // x = 1 has no point on secp256r1
+            var bytes = new byte[33];
+            bytes[0] = 0x02;
+            bytes[32] = 0x01;
+            var publicKey = new ECPublicKey(bytes);
+
+            Action act = () => _ = publicKey.CurvePoint;
+
+            act.Should().Throw<ArgumentException>();
+            publicKey.Verify(new byte[32], new byte[64]).Should().BeFalse();
+        }
     }
 }
\ No newline at end of file
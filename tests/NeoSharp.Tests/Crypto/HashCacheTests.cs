@@ -0,0 +1,227 @@
+using System;
+using System.Linq;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using Xunit;
+
+namespace NeoSharp.Tests.Crypto
+{
+    /// <summary>
+    /// Tests for <see cref="NeoSharp.Crypto.HashCache"/>.
+    /// </summary>
+    public class HashCacheTests
+    {
+        private static byte[] Data(int i) => Encoding.UTF8.GetBytes($"hash cache entry {i}");
+
+        [Fact]
+        public void ComputesTheSameHashesAsHash()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache();
+            var data = Data(1);
+
+            cache.Sha256(data).Should().Equal(Hash.SHA256(data));
+            cache.Hash256(data).Should().Equal(Hash.Hash256(data));
+            cache.Hash160(data).Should().Equal(Hash.Hash160(data));
+
+            // Served from the cache the second time.
+            cache.Sha256(data).Should().Equal(Hash.SHA256(data));
+            cache.Hash256(data).Should().Equal(Hash.Hash256(data));
+            cache.Hash160(data).Should().Equal(Hash.Hash160(data));
+            cache.Statistics.hits.Should().Be(3);
+        }
+
+        [Fact]
+        public void SpanOverloadsWriteToDestination()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache();
+            var data = Data(2);
+            Span<byte> destination = stackalloc byte[32];
+
+            cache.Hash256(data.AsSpan(), destination).Should().Be(32);
+            destination.ToArray().Should().Equal(Hash.Hash256(data));
+
+            cache.Hash160(data.AsSpan(), destination).Should().Be(20);
+            destination.Slice(0, 20).ToArray().Should().Equal(Hash.Hash160(data));
+
+            var tooShort = new byte[31];
+            Action act = () => cache.Sha256(data.AsSpan(), tooShort);
+            act.Should().Throw<ArgumentException>();
+        }
+
+        [Fact]
+        public void MatchesOnContentAndKeepsAlgorithmsApart()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache();
+
+            cache.Sha256(Data(3));
+            cache.Sha256(Data(3)).Should().Equal(Hash.SHA256(Data(3)));
+            cache.Sha256(Data(4)).Should().Equal(Hash.SHA256(Data(4)));
+            cache.Hash256(Data(3)).Should().Equal(Hash.Hash256(Data(3)));
+
+            cache.Statistics.Should().Be((1L, 3L, 0.25));
+            cache.Count.Should().Be(3);
+        }
+
+        [Fact]
+        public void ReturnedArraysCannotCorruptTheCache()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache();
+            var data = Data(5);
+
+            var first = cache.Sha256(data);
+            Array.Clear(first);
+
+            cache.Sha256(data).Should().Equal(Hash.SHA256(data));
+        }
+
+        [Fact]
+        public void EvictsOnInsertToHonorMaxCacheSize()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache { MaxCacheSize = 10 };
+
+            for (var i = 0; i < 100; i++)
+            {
+                cache.Hash256(Data(i));
+                cache.Count.Should().BeLessOrEqualTo(10);
+            }
+            cache.Count.Should().Be(10);
+        }
+
+        [Fact]
+        public void EvictsOnInsertToHonorMaxMemoryUsage()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache { MaxMemoryUsage = 4096 };
+            var large = Enumerable.Range(0, 20).Select(i => Enumerable.Repeat((byte)i, 1000).ToArray()).ToList();
+
+            foreach (var data in large)
+            {
+                cache.Sha256(data);
+                cache.MemoryUsage.Should().BeLessOrEqualTo(4096);
+            }
+            cache.Count.Should().BeInRange(1, 4);
+
+            // Entries larger than the whole budget are not cached at all.
+            cache.Sha256(new byte[8192]);
+            cache.MemoryUsage.Should().BeLessOrEqualTo(4096);
+        }
+
+        [Fact]
+        public void GivesRecentlyUsedEntriesASecondChance()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache { MaxCacheSize = 3 };
+            cache.Sha256(Data(0));
+            cache.Sha256(Data(1));
+            cache.Sha256(Data(2));
+            cache.Sha256(Data(0));
+
+            // Data(0) has been used since it was added, so Data(1) is evicted instead.
+            cache.Sha256(Data(3));
+            var before = cache.Statistics;
+            cache.Sha256(Data(0));
+            cache.Statistics.hits.Should().Be(before.hits + 1);
+            cache.Sha256(Data(1));
+            cache.Statistics.misses.Should().Be(before.misses + 1);
+        }
+
+        [Fact]
+        public void IdleAlgorithmsGiveUpTheirSpace()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache { MaxCacheSize = 10 };
+            for (var i = 0; i < 10; i++)
+            {
+                cache.Hash160(Data(i));
+            }
+
+            for (var i = 0; i < 50; i++)
+            {
+                cache.Sha256(Data(100 + i));
+            }
+
+            // The most recent SHA256 entries are cached; the idle Hash160 entries are gone.
+            var before = cache.Statistics.hits;
+            cache.Sha256(Data(149));
+            cache.Sha256(Data(148));
+            cache.Statistics.hits.Should().Be(before + 2);
+            cache.Count.Should().Be(10);
+        }
+
+        [Fact]
+        public void ExpiredEntriesAreRecomputed()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache { CacheTtlMs = 1 };
+            var data = Data(6);
+
+            cache.Sha256(data);
+            Thread.Sleep(50);
+            cache.Sha256(data).Should().Equal(Hash.SHA256(data));
+
+            cache.Statistics.misses.Should().Be(2);
+            cache.Count.Should().Be(1);
+        }
+
+        [Fact]
+        public void RemoveCachedRemovesOnlyThatAlgorithm()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache();
+            var data = Data(7);
+            cache.Sha256(data);
+            cache.Hash160(data);
+
+            cache.RemoveCached(data, "sha256");
+
+            cache.Count.Should().Be(1);
+            cache.Sha256(data);
+            cache.Hash160(data);
+            cache.Statistics.Should().Be((1L, 3L, 0.25));
+        }
+
+        [Fact]
+        public void ClearCacheResetsEntriesAndStatistics()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache();
+            cache.Sha256(Data(8));
+            cache.Sha256(Data(8));
+
+            cache.ClearCache();
+
+            cache.Count.Should().Be(0);
+            cache.MemoryUsage.Should().Be(0);
+            cache.Statistics.Should().Be((0L, 0L, 0.0));
+        }
+
+        [Fact]
+        public async Task ConcurrentUseStaysConsistent()
+        {
+            using var cache = new NeoSharp.Crypto.HashCache { MaxCacheSize = 64 };
+            var inputs = Enumerable.Range(0, 200).Select(Data).ToArray();
+            var expected = inputs.Select(Hash.Hash256).ToArray();
+
+            await Task.WhenAll(Enumerable.Range(0, 8).Select(worker => Task.Run(() =>
+            {
+                for (var i = 0; i < 2000; i++)
+                {
+                    var index = (i * 7 + worker) % (i % 3 == 0 ? inputs.Length : 32);
+                    cache.Hash256(inputs[index]).Should().Equal(expected[index]);
+                }
+            })));
+
+            cache.Count.Should().BeLessOrEqualTo(64);
+            var (hits, misses, _) = cache.Statistics;
+            (hits + misses).Should().Be(16000);
+            hits.Should().BeGreaterThan(0);
+        }
+
+        [Fact]
+        public void DisposedCacheThrows()
+        {
+            var cache = new NeoSharp.Crypto.HashCache();
+            cache.Dispose();
+
+            Action act = () => cache.Sha256(Data(9));
+            act.Should().Throw<ObjectDisposedException>();
+        }
+    }
+}
@@ -0,0 +1,153 @@
+using System;
+using System.Linq;
+using System.Text;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Types;
+using NeoSharp.Utils;
+using Xunit;
+
+namespace NeoSharp.Tests.Crypto
+{
+    /// <summary>
+    /// Tests for the byte array and span APIs of <see cref="Hash"/>.
+    /// </summary>
+    public class HashTests
+    {
+        private static readonly byte[] Abc = Encoding.ASCII.GetBytes("abc");
+
+        [Fact]
+        public void ByteArrayApis_MatchKnownVectors()
+        {
+            Hash.SHA256(Abc).ToHexString().Should().Be("ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad");
+            Hash.Hash256(Abc).ToHexString().Should().Be("4f8b42c22dd3729b519ba6f68d2da7cc5b2d606d05daed5ad5128cc03e6c6358");
+            Hash.RIPEMD160(Abc).ToHexString().Should().Be("8eb208f7e05d987a9b044a8e98c6b087f15a0bfc");
+            Hash.Hash160(Abc).ToHexString().Should().Be("bb1be98c142444d7a56aa3981c3942a978e4dc33");
+        }
+
+        [Fact]
+        public void SpanApis_WriteTheSameDigestsAsByteArrayApis()
+        {
+            Span<byte> destination = stackalloc byte[32];
+
+            Hash.SHA256(Abc, destination).Should().Be(32);
+            destination.ToArray().Should().Equal(Hash.SHA256(Abc));
+
+            Hash.Hash256(Abc, destination).Should().Be(32);
+            destination.ToArray().Should().Equal(Hash.Hash256(Abc));
+
+            Hash.RIPEMD160(Abc, destination).Should().Be(20);
+            destination.Slice(0, 20).ToArray().Should().Equal(Hash.RIPEMD160(Abc));
+
+            Hash.Hash160(Abc, destination).Should().Be(20);
+            destination.Slice(0, 20).ToArray().Should().Equal(Hash.Hash160(Abc));
+        }
+
+        [Fact]
+        public void SpanApis_RejectShortDestinations()
+        {
+            var destination = new byte[19];
+
+            Hash.TrySHA256(Abc, destination, out var written).Should().BeFalse();
+            written.Should().Be(0);
+            Hash.TryHash256(Abc, destination, out _).Should().BeFalse();
+            Hash.TryRIPEMD160(Abc, destination, out _).Should().BeFalse();
+            Hash.TryHash160(Abc, destination, out _).Should().BeFalse();
+
+            Action act = () => Hash.Hash160(Abc, destination);
+            act.Should().Throw<ArgumentException>();
+        }
+
+        [Fact]
+        public void TryApis_ReportBytesWritten()
+        {
+            var destination = new byte[32];
+
+            Hash.TryHash256(Abc, destination, out var written).Should().BeTrue();
+            written.Should().Be(32);
+            Hash.TryHash160(Abc, destination, out written).Should().BeTrue();
+            written.Should().Be(20);
+            destination.Take(20).Should().Equal(Hash.Hash160(Abc));
+        }
+
+        [Fact]
+        public void RIPEMD160_IsSafeToUseFromManyThreads()
+        {
+            var inputs = Enumerable.Range(0, 64).Select(i => Encoding.ASCII.GetBytes($"input {i}")).ToArray();
+            var expected = inputs.Select(Hash.RIPEMD160).ToArray();
+
+            Parallel.For(0, 10_000, i =>
+            {
+                Span<byte> digest = stackalloc byte[20];
+                Hash.RIPEMD160(inputs[i % inputs.Length], digest);
+                digest.SequenceEqual(expected[i % inputs.Length]).Should().BeTrue();
+            });
+        }
+
+        [Fact]
+        public void HashFactories_AcceptSpans()
+        {
+            var script = "0c21026aa8fe6b4360a67a530e23c08c6a72525afde34719c5436f9d3ced759f939a3d4156e7b327".FromHexString();
+
+            Hash160.FromScript(script.AsSpan()).Should().Be(Hash160.FromScript(script));
+            Hash256.FromData(script.AsSpan()).Should().Be(Hash256.FromData(script));
+
+            var littleEndian = Hash.Hash256(script);
+            Hash256.FromLittleEndianBytes(littleEndian.AsSpan()).ToArray().Should().Equal(littleEndian.Reverse());
+            new Hash256(littleEndian.AsSpan()).ToArray().Should().Equal(littleEndian);
+        }
+
+        [Theory]
+        [InlineData(10, -1)]
+        [InlineData(5000, -1)]
+        [InlineData(5000, 1)]
+        [InlineData(5000, 3)]
+        public void HashMany_MatchesSingleInputHashing(int count, int maxDegreeOfParallelism)
+        {
+            var random = new Random(count);
+            var inputs = Enumerable.Range(0, count).Select(i =>
+            {
+                var data = new byte[random.Next(0, 300)];
+                random.NextBytes(data);
+                return new ReadOnlyMemory<byte>(data);
+            }).ToArray();
+            var scriptHashes = new Hash160[count];
+            var hashes = new Hash256[count];
+
+            Hash.Hash160Many(inputs, scriptHashes, maxDegreeOfParallelism);
+            Hash.Hash256Many(inputs, hashes, maxDegreeOfParallelism);
+
+            for (var i = 0; i < count; i++)
+            {
+                scriptHashes[i].Should().Be(Hash160.FromScript(inputs[i].Span));
+                hashes[i].Should().Be(Hash256.FromLittleEndianBytes(Hash.Hash256(inputs[i].ToArray())));
+            }
+        }
+
+        [Fact]
+        public void HashMany_WritesOnlyTheInputCount()
+        {
+            var inputs = Enumerable.Range(0, 1000).Select(i => new ReadOnlyMemory<byte>(BitConverter.GetBytes(i))).ToArray();
+            var destination = new Hash256[1001];
+
+            Hash.Hash256Many(inputs.AsSpan(1), destination);
+
+            destination[0].Should().Be(Hash256.FromLittleEndianBytes(Hash.Hash256(BitConverter.GetBytes(1))));
+            destination[998].Should().Be(Hash256.FromLittleEndianBytes(Hash.Hash256(BitConverter.GetBytes(999))));
+            destination[999].Should().Be(default(Hash256));
+        }
+
+        [Fact]
+        public void HashMany_RejectsShortDestinationsAndInvalidParallelism()
+        {
+            var inputs = new[] { new ReadOnlyMemory<byte>(Abc), new ReadOnlyMemory<byte>(Abc) };
+
+            Action shortDestination = () => Hash.Hash160Many(inputs, new Hash160[1]);
+            shortDestination.Should().Throw<ArgumentException>();
+
+            Action invalidParallelism = () => Hash.Hash256Many(inputs, new Hash256[2], 0);
+            invalidParallelism.Should().Throw<ArgumentOutOfRangeException>();
+        }
+    }
+}
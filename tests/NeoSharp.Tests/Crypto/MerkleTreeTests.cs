@@ -0,0 +1,110 @@
+using System;
+using System.Linq;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Crypto
+{
+    /// <summary>
+    /// Tests for <see cref="MerkleTree"/>.
+    /// </summary>
+    public class MerkleTreeTests
+    {
+        private static Hash256[] Leaves(int count) =>
+            Enumerable.Range(0, count).Select(i => Hash256.FromLittleEndianBytes(Hash.Hash256(BitConverter.GetBytes(i)))).ToArray();
+
+        // Straightforward recursive construction, one array per node, as a reference.
+        private static Hash256 ReferenceRoot(Hash256[] level)
+        {
+            if (level.Length == 1) return level[0];
+
+            var parents = new Hash256[(level.Length + 1) / 2];
+            for (var i = 0; i < parents.Length; i++)
+            {
+                var left = level[2 * i];
+                var right = 2 * i + 1 < level.Length ? level[2 * i + 1] : left;
+                var data = left.ToLittleEndianArray().Concat(right.ToLittleEndianArray()).ToArray();
+                parents[i] = Hash256.FromLittleEndianBytes(Hash.Hash256(data));
+            }
+            return ReferenceRoot(parents);
+        }
+
+        [Theory]
+        [InlineData(2)]
+        [InlineData(3)]
+        [InlineData(4)]
+        [InlineData(7)]
+        [InlineData(16)]
+        [InlineData(1000)]
+        public void ComputeRoot_MatchesReferenceConstruction(int count)
+        {
+            var leaves = Leaves(count);
+
+            MerkleTree.ComputeRoot(leaves).Should().Be(ReferenceRoot(leaves));
+        }
+
+        [Fact]
+        public void ComputeRoot_HandlesEmptyAndSingleLeafTrees()
+        {
+            var leaf = Leaves(1)[0];
+
+            MerkleTree.ComputeRoot(ReadOnlySpan<Hash256>.Empty).Should().Be(Hash256.Zero);
+            MerkleTree.ComputeRoot(new[] { leaf }).Should().Be(leaf);
+        }
+
+        [Fact]
+        public void ComputeRoot_DependsOnLeafOrder()
+        {
+            var leaves = Leaves(4);
+            var swapped = new[] { leaves[1], leaves[0], leaves[2], leaves[3] };
+
+            MerkleTree.ComputeRoot(swapped).Should().NotBe(MerkleTree.ComputeRoot(leaves));
+        }
+
+        [Fact]
+        public void Proofs_VerifyForEveryLeaf()
+        {
+            for (var count = 1; count <= 13; count++)
+            {
+                var leaves = Leaves(count);
+                var root = MerkleTree.ComputeRoot(leaves);
+
+                for (var index = 0; index < count; index++)
+                {
+                    var proof = MerkleTree.GetProof(leaves, index);
+                    MerkleTree.VerifyProof(root, leaves[index], index, proof).Should().BeTrue($"leaf {index} of {count}");
+                }
+            }
+        }
+
+        [Fact]
+        public void Proofs_FailForWrongLeafIndexOrSibling()
+        {
+            var leaves = Leaves(6);
+            var root = MerkleTree.ComputeRoot(leaves);
+            var proof = MerkleTree.GetProof(leaves, 2);
+
+            proof.Should().HaveCount(3);
+            MerkleTree.VerifyProof(root, leaves[3], 2, proof).Should().BeFalse();
+            MerkleTree.VerifyProof(root, leaves[2], 3, proof).Should().BeFalse();
+            MerkleTree.VerifyProof(root, leaves[2], 10, proof).Should().BeFalse();
+
+            proof[1] = leaves[0];
+            MerkleTree.VerifyProof(root, leaves[2], 2, proof).Should().BeFalse();
+        }
+
+        [Fact]
+        public void GetProof_RejectsIndexOutsideTheTree()
+        {
+            var leaves = Leaves(3);
+
+            Action negative = () => MerkleTree.GetProof(leaves, -1);
+            Action tooLarge = () => MerkleTree.GetProof(leaves, 3);
+
+            negative.Should().Throw<ArgumentOutOfRangeException>();
+            tooLarge.Should().Throw<ArgumentOutOfRangeException>();
+        }
+    }
+}
@@ -20,7 +20,7 @@ namespace NeoSharp.Tests.Crypto
         {
             // Test decryption with default scrypt parameters
             var decrypted = NEP2.Decrypt(
-                "6PYNuCdKFYG8m7hYDHdoEdmWnrkV9ETs6qqTHUsRUZ7yQvzZrCCtDxSf9D", // Correct encrypted key
+                "6PYKmpM6RowSx6F23hyM67oZMMLoPUh6fbfn3zWBCx6Fw9avVb1Xp4BjiH", // Correct encrypted key
                 TestConstants.DefaultAccountPassword);
 
             var expectedPrivateKey = TestConstants.HexToBytes(TestConstants.DefaultAccountPrivateKey);
@@ -32,7 +32,7 @@ namespace NeoSharp.Tests.Crypto
         {
             // Test decryption with custom scrypt parameters
             var scryptParams = new NeoSharp.Wallet.NEP6.ScryptParams { N = 256, R = 1, P = 1 };
-            var encrypted = "6PYNuCdKEF9T4CEgfpfzUeQPYgeFgFTvm9UryhWw1rYUxjXvMBKWTcfXqD"; // Correct encrypted key
+            var encrypted = "6PYKmpM6RUAVh9FVj92ZU43p7sA2BZe8vFb2T9mHhdvfT4QAGixraEV39Z"; // Correct encrypted key
             
             var decrypted = NEP2.Decrypt(encrypted, TestConstants.DefaultAccountPassword, scryptParams);
             
@@ -64,7 +64,7 @@ namespace NeoSharp.Tests.Crypto
         {
             // Test encryption with custom scrypt parameters
             var scryptParams = new NeoSharp.Wallet.NEP6.ScryptParams { N = 256, R = 1, P = 1 };
-            var expected = "6PYNuCdKEF9T4CEgfpfzUeQPYgeFgFTvm9UryhWw1rYUxjXvMBKWTcfXqD"; // Correct encrypted key
+            var expected = "6PYKmpM6RUAVh9FVj92ZU43p7sA2BZe8vFb2T9mHhdvfT4QAGixraEV39Z"; // Correct encrypted key
             
             var privateKeyBytes = TestConstants.HexToBytes(TestConstants.DefaultAccountPrivateKey);
             var keyPair = new ECKeyPair(privateKeyBytes);
@@ -198,7 +198,7 @@ namespace NeoSharp.Tests.Crypto
         public void TestNEP2AddressGeneration()
         {
             // Test that decrypted key can generate correct address
-            var encrypted = "6PYNuCdKFYG8m7hYDHdoEdmWnrkV9ETs6qqTHUsRUZ7yQvzZrCCtDxSf9D"; // Correct encrypted key
+            var encrypted = "6PYKmpM6RowSx6F23hyM67oZMMLoPUh6fbfn3zWBCx6Fw9avVb1Xp4BjiH"; // Correct encrypted key
             var password = TestConstants.DefaultAccountPassword;
 
             var keyPair = NEP2.Decrypt(encrypted, password);
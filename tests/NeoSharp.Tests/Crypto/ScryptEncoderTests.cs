@@ -0,0 +1,77 @@
+using System;
+using System.Text;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Utils;
+using Xunit;
+
+namespace NeoSharp.Tests.Crypto
+{
+    /// <summary>
+    /// Tests for <see cref="ScryptEncoder"/> against the RFC 7914 test vectors and BouncyCastle.
+    /// </summary>
+    public class ScryptEncoderTests
+    {
+        [Theory]
+        [InlineData("", "", 16, 1, 1,
+            "77d6576238657b203b19ca42c18a0497f16b4844e3074ae8dfdffa3fede21442fcd0069ded0948f8326a753a0fc81f17e8d3e0fb2e0d3628cf35e20c38d18906")]
+        [InlineData("password", "NaCl", 1024, 8, 16,
+            "fdbabe1c9d3472007856e7190d01e9fe7c6ad7cbc8237830e77376634b3731622eaf30d92e22a3886ff109279d9830dac727afb94a83ee6d8360cbdfa2cc0640")]
+        [InlineData("pleaseletmein", "SodiumChloride", 16384, 8, 1,
+            "7023bdcb3afd7348461c06cd81fd38ebfda8fbba904f8e3ea9b543f6545da1f2d5432955613f0fcf62d49705242a9af9e61e85dc0d651e40dfcf017b45575887")]
+        public void MatchesRfc7914TestVectors(string password, string salt, int n, int r, int p, string expected)
+        {
+            var derived = ScryptEncoder.CryptoScrypt(Encoding.ASCII.GetBytes(password), Encoding.ASCII.GetBytes(salt), n, r, p, 64);
+
+            derived.ToHexString().Should().Be(expected);
+        }
+
+        [Fact]
+        public void MatchesBouncyCastleForVariousParameters()
+        {
+            var random = new Random(22);
+            for (var i = 0; i < 12; i++)
+            {
+                var password = new byte[random.Next(0, 40)];
+                var salt = new byte[random.Next(0, 40)];
+                random.NextBytes(password);
+                random.NextBytes(salt);
+                var n = 2 << random.Next(0, 8);
+                var r = random.Next(1, 5);
+                var p = random.Next(1, 4);
+                var dkLen = random.Next(1, 100);
+
+                var expected = Org.BouncyCastle.Crypto.Generators.SCrypt.Generate(password, salt, n, r, p, dkLen);
+
+                ScryptEncoder.CryptoScrypt(password, salt, n, r, p, dkLen).Should().Equal(expected, $"N={n}, r={r}, p={p}");
+            }
+        }
+
+        [Fact]
+        public void LanesGiveTheSameResultWithOrWithoutParallelism()
+        {
+            var password = Encoding.UTF8.GetBytes("123");
+            var salt = new byte[] { 0x01, 0x02, 0x03, 0x04 };
+
+            var parallel = ScryptEncoder.CryptoScrypt(password, salt, 256, 2, 8, 64);
+            var sequential = ScryptEncoder.CryptoScrypt(password, salt, 256, 2, 8, 64, maxDegreeOfParallelism: 1);
+
+            parallel.Should().Equal(sequential);
+        }
+
+        [Fact]
+        public void RejectsInvalidParameters()
+        {
+            var password = new byte[] { 0x01 };
+            var salt = new byte[] { 0x02 };
+
+            Action notPowerOfTwo = () => ScryptEncoder.CryptoScrypt(password, salt, 1000, 1, 1, 32);
+            Action tooLarge = () => ScryptEncoder.CryptoScrypt(password, salt, 1 << 30, 8, 1, 32);
+            Action zeroDegree = () => ScryptEncoder.CryptoScrypt(password, salt, 16, 1, 1, 32, maxDegreeOfParallelism: 0);
+
+            notPowerOfTwo.Should().Throw<ArgumentException>();
+            tooLarge.Should().Throw<ArgumentException>();
+            zeroDegree.Should().Throw<ArgumentOutOfRangeException>();
+        }
+    }
+}
@@ -0,0 +1,53 @@
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Utils;
+using Xunit;
+using BCBigInteger = Org.BouncyCastle.Math.BigInteger;
+
+namespace NeoSharp.Tests.Crypto
+{
+    /// <summary>
+    /// Tests for the shared <see cref="Secp256r1Curve"/> context.
+    /// </summary>
+    public class Secp256r1CurveTests
+    {
+        [Fact]
+        public void ExposesTheP256Constants()
+        {
+            Secp256r1Curve.N.ToString(16).Should().Be("ffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551");
+            Secp256r1Curve.P.ToString(16).Should().Be("ffffffff00000001000000000000000000000000ffffffffffffffffffffffff");
+            Secp256r1Curve.HalfN.ShiftLeft(1).Add(BCBigInteger.One).Should().Be(Secp256r1Curve.N);
+            Secp256r1Curve.G.GetEncoded(true).ToHexString().Should().Be("036b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296");
+        }
+
+        [Fact]
+        public void NeoConstantsShareTheContext()
+        {
+            global::NeoSharp.Core.NeoConstants.Secp256r1.Should().BeSameAs(Secp256r1Curve.Parameters);
+            global::NeoSharp.Core.NeoConstants.Secp256r1Domain.Should().BeSameAs(Secp256r1Curve.Domain);
+            global::NeoSharp.Core.NeoConstants.Secp256r1HalfCurveOrder.Should().Be(Secp256r1Curve.HalfN);
+        }
+
+        [Fact]
+        public void MultiplyG_MatchesGenericMultiplication()
+        {
+            var k = new BCBigInteger("c9afa9d845ba75166b5c215767b1d6934e50c3db36e89b127b8a622b120f6721", 16);
+
+            var point = Secp256r1Curve.MultiplyG(k);
+
+            point.Should().Be(Secp256r1Curve.G.Multiply(k).Normalize());
+            point.GetEncoded(true).ToHexString().Should().Be("0360fed4ba255a9d31c961eb74c6356d68c049b8923b61fa6ce669622e60f29fb6");
+        }
+
+        [Fact]
+        public void KeyDerivationPathsAgree()
+        {
+            var privateKey = new ECPrivateKey("c9afa9d845ba75166b5c215767b1d6934e50c3db36e89b127b8a622b120f6721".FromHexString());
+
+            var publicKey = privateKey.GetPublicKey();
+
+            Sign.PublicKeyFromPrivateKey(privateKey).Should().Be(publicKey);
+            Secp256r1Curve.DecodePoint(publicKey.GetEncoded(true)).Should().Be(Sign.PublicPointFromPrivateKey(privateKey));
+        }
+    }
+}
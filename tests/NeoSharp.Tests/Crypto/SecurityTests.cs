@@ -231,7 +231,7 @@ namespace NeoSharp.Tests.Crypto
 
             // Verify we can still use it
             var address = secureKeyPair.GetAddress();
-            address.Should().Be("2ddPMF3ajyp94qQ8NuaVvSkQVWuyJsd6ZvMu");
+            address.Should().Be("NSTpBS47ZovwLaLLv9VkpyWLbsWycV7hY8");
         }
 
         [Fact]
@@ -181,17 +181,45 @@ namespace NeoSharp.Tests.Crypto
         [Fact]
         public void TestDeterministicSigning()
         {
-            // Note: Current implementation uses random nonces, so signatures will differ
-            // But both should be valid signatures of the same message
+            // Signing uses RFC 6979 nonces, so the same key and message give the same signature
             var sig1 = Sign.SignMessage(TestMessageBytes, KeyPair);
             var sig2 = Sign.SignMessage(TestMessageBytes, KeyPair);
 
-            // Signatures should be different (due to random nonce)
-            sig1.Should().NotBeEquivalentTo(sig2);
-            
-            // But both should verify correctly
+            sig1.Should().Be(sig2);
             Sign.VerifySignature(TestMessageBytes, sig1, _publicKey).Should().BeTrue();
-            Sign.VerifySignature(TestMessageBytes, sig2, _publicKey).Should().BeTrue();
+        }
+
+        [Theory]
+        [InlineData("sample",
+            "efd48b2aacb6a8fd1140dd9cd45e81d69d2c877b56aaf991c34d0ea84eaf3716",
+            "f7cb1c942d657c41d436c7a1b6e29f65f3e900dbb9aff4064dc4ab2f843acda8")]
+        [InlineData("test",
+            "f1abb023518351cd71d881567b1ea663ed3efcf6c5132b354f28d3b0b7d38367",
+            "019f4113742a2b14bd25926b49c649155f267e60d3814b4c0cc84250e46f0083")]
+        public void TestSignMessageMatchesRfc6979Vectors(string message, string expectedR, string expectedS)
+        {
+            // RFC 6979 A.2.5, P-256 with SHA-256
+            var keyPair = new ECKeyPair(new ECPrivateKey(
+                HexExtensions.HexToBytes("c9afa9d845ba75166b5c215767b1d6934e50c3db36e89b127b8a622b120f6721")));
+
+            var signature = Sign.SignMessage(System.Text.Encoding.UTF8.GetBytes(message), keyPair);
+
+            signature.R.Should().Equal(HexExtensions.HexToBytes(expectedR));
+            signature.S.Should().Equal(HexExtensions.HexToBytes(expectedS));
+        }
+
+        [Fact]
+        public void TestSignMessageSetsTheRecoveryId()
+        {
+            for (var i = 0; i < 20; i++)
+            {
+                var keyPair = ECKeyPair.CreateEcKeyPair();
+                var message = System.Text.Encoding.UTF8.GetBytes($"message {i}");
+
+                var signature = Sign.SignMessage(message, keyPair);
+
+                Sign.SignedMessageToKey(message, signature).Should().Be(keyPair.PublicKey);
+            }
         }
 
         [Fact]
@@ -299,6 +327,74 @@ namespace NeoSharp.Tests.Crypto
             var isValid = Sign.VerifySignature(TestMessageBytes, signature, differentKeyPair.PublicKey);
             isValid.Should().BeFalse();
         }
+
+        private (byte[] Message, SignatureData Signature, ECPublicKey PublicKey)[] CreateBatch(int count)
+        {
+            var otherKeyPair = ECKeyPair.Create(new BigInteger(7));
+            var items = new (byte[] Message, SignatureData Signature, ECPublicKey PublicKey)[count];
+            for (var i = 0; i < count; i++)
+            {
+                var keyPair = i % 2 == 0 ? KeyPair : otherKeyPair;
+                var message = System.Text.Encoding.UTF8.GetBytes($"witness {i}");
+                items[i] = (message, Sign.SignMessage(message, keyPair), keyPair.PublicKey);
+            }
+            return items;
+        }
+
+        [Theory]
+        [InlineData(1)]
+        [InlineData(-1)]
+        public void TestVerifyBatch(int maxDegreeOfParallelism)
+        {
+            var items = CreateBatch(8);
+            var results = new bool[items.Length];
+
+            Sign.VerifyBatch(items, results, maxDegreeOfParallelism: maxDegreeOfParallelism).Should().BeTrue();
+            results.Should().OnlyContain(valid => valid);
+
+            // A signature checked against the wrong key, a tampered message and a missing key all fail.
+            items[1].PublicKey = _publicKey;
+            items[4].Message = System.Text.Encoding.UTF8.GetBytes("tampered");
+            items[6].PublicKey = null;
+
+            Sign.VerifyBatch(items, results, maxDegreeOfParallelism: maxDegreeOfParallelism).Should().BeFalse();
+            results.Should().Equal(true, false, true, true, false, true, false, true);
+            for (var i = 0; i < items.Length; i++)
+            {
+                if (items[i].PublicKey != null)
+                    results[i].Should().Be(Sign.VerifySignature(items[i].Message, items[i].Signature, items[i].PublicKey));
+            }
+        }
+
+        [Fact]
+        public void TestVerifyBatchStopOnFirstFailure()
+        {
+            var items = CreateBatch(6);
+            items[0].Message = new byte[] { 0x01 };
+            var results = new bool[items.Length];
+
+            Sign.VerifyBatch(items, results, stopOnFirstFailure: true, maxDegreeOfParallelism: 1).Should().BeFalse();
+            results.Should().OnlyContain(valid => !valid);
+
+            Sign.VerifyBatch(items, results, stopOnFirstFailure: true).Should().BeFalse();
+            results[0].Should().BeFalse();
+        }
+
+        [Fact]
+        public void TestVerifyBatchArguments()
+        {
+            Sign.VerifyBatch(Array.Empty<(byte[], SignatureData, ECPublicKey)>()).Should().BeTrue();
+
+            Action nullItems = () => Sign.VerifyBatch(null);
+            nullItems.Should().Throw<ArgumentNullException>();
+
+            var items = CreateBatch(2);
+            Action shortResults = () => Sign.VerifyBatch(items, new bool[1]);
+            shortResults.Should().Throw<ArgumentException>();
+
+            Action zeroDegree = () => Sign.VerifyBatch(items, maxDegreeOfParallelism: 0);
+            zeroDegree.Should().Throw<ArgumentOutOfRangeException>();
+        }
     }
 
 }
\ No newline at end of file
@@ -0,0 +1,101 @@
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Tests.Helpers
+{
+    /// <summary>
+    /// In-memory JSON-RPC node stand-in. Answers single and batch requests by
+    /// dispatching each call to a per-method handler and records every HTTP request body.
+    /// </summary>
+    public class JsonRpcStubHandler : HttpMessageHandler
+    {
+        private readonly Dictionary<string, Func<JsonElement, object>> _methods = new();
+
+        /// <summary>
+        /// Raw bodies of all HTTP requests received, in order.
+        /// </summary>
+        public ConcurrentQueue<string> RequestBodies { get; } = new();
+
+        /// <summary>
+        /// Number of HTTP round trips received.
+        /// </summary>
+        public int RequestCount => RequestBodies.Count;
+
+        /// <summary>
+        /// Registers a handler returning the result for a method. The handler receives the params array.
+        /// Throwing a <see cref="StubRpcError"/> produces a JSON-RPC error response.
+        /// </summary>
+        public JsonRpcStubHandler On(string method, Func<JsonElement, object> handler)
+        {
+            _methods[method] = handler;
+            return this;
+        }
+
+        protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            var body = await request.Content!.ReadAsStringAsync(cancellationToken);
+            RequestBodies.Enqueue(body);
+
+            using var document = JsonDocument.Parse(body);
+            object payload;
+            if (document.RootElement.ValueKind == JsonValueKind.Array)
+            {
+                var responses = new List<object>();
+                foreach (var call in document.RootElement.EnumerateArray())
+                {
+                    responses.Add(Answer(call));
+                }
+                payload = responses;
+            }
+            else
+            {
+                payload = Answer(document.RootElement);
+            }
+
+            return new HttpResponseMessage(HttpStatusCode.OK)
+            {
+                Content = new StringContent(JsonSerializer.Serialize(payload), Encoding.UTF8, "application/json")
+            };
+        }
+
+        private object Answer(JsonElement call)
+        {
+            var id = call.GetProperty("id").GetString();
+            var method = call.GetProperty("method").GetString()!;
+
+            if (!_methods.TryGetValue(method, out var handler))
+            {
+                return new { jsonrpc = "2.0", id, error = new { code = -32601, message = "Method not found" } };
+            }
+
+            try
+            {
+                return new { jsonrpc = "2.0", id, result = handler(call.GetProperty("params")) };
+            }
+            catch (StubRpcError ex)
+            {
+                return new { jsonrpc = "2.0", id, error = new { code = ex.Code, message = ex.Message } };
+            }
+        }
+    }
+
+    /// <summary>
+    /// Thrown by stub method handlers to return a JSON-RPC error.
+    /// </summary>
+    public class StubRpcError : Exception
+    {
+        public StubRpcError(int code, string message) : base(message)
+        {
+            Code = code;
+        }
+
+        public int Code { get; }
+    }
+}
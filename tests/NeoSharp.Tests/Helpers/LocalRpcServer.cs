@@ -0,0 +1,132 @@
+using System;
+using System.IO;
+using System.Net;
+using System.Net.Http;
+using System.Net.Sockets;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Tests.Helpers
+{
+    /// <summary>
+    /// Stand-in RPC node listening on a loopback port. Requests are answered by a
+    /// <see cref="JsonRpcStubHandler"/>; the server can be slowed down, made to fail with an
+    /// HTTP status code, or stopped to refuse connections.
+    /// </summary>
+    public sealed class LocalRpcServer : IDisposable
+    {
+        private readonly HttpListener _listener = new();
+        private readonly HttpMessageInvoker _invoker;
+        private readonly CancellationTokenSource _stopping = new();
+        private readonly Task _loop;
+        private int _requestCount;
+
+        public LocalRpcServer(JsonRpcStubHandler handler)
+        {
+            Handler = handler;
+            _invoker = new HttpMessageInvoker(handler);
+            Url = $"http://127.0.0.1:{GetFreePort()}/";
+            _listener.Prefixes.Add(Url);
+            _listener.Start();
+            _loop = Task.Run(AcceptLoopAsync);
+        }
+
+        public string Url { get; }
+
+        public JsonRpcStubHandler Handler { get; }
+
+        /// <summary>
+        /// Number of HTTP requests received, including failed ones.
+        /// </summary>
+        public int RequestCount => Volatile.Read(ref _requestCount);
+
+        /// <summary>
+        /// Delay applied before answering each request.
+        /// </summary>
+        public TimeSpan Delay { get; set; }
+
+        /// <summary>
+        /// When set, every request is answered with this status code instead of a JSON-RPC response.
+        /// </summary>
+        public HttpStatusCode? FailWith { get; set; }
+
+        /// <summary>
+        /// Returns a loopback URL on which nothing is listening.
+        /// </summary>
+        public static string UnusedUrl() => $"http://127.0.0.1:{GetFreePort()}/";
+
+        public void Dispose()
+        {
+            _stopping.Cancel();
+            _listener.Close();
+            try { _loop.Wait(TimeSpan.FromSeconds(5)); } catch (AggregateException) { }
+            _invoker.Dispose();
+        }
+
+        private async Task AcceptLoopAsync()
+        {
+            while (!_stopping.IsCancellationRequested)
+            {
+                HttpListenerContext context;
+                try
+                {
+                    context = await _listener.GetContextAsync();
+                }
+                catch (Exception) when (_stopping.IsCancellationRequested)
+                {
+                    return;
+                }
+                catch (HttpListenerException)
+                {
+                    return;
+                }
+
+                _ = Task.Run(() => RespondAsync(context));
+            }
+        }
+
+        private async Task RespondAsync(HttpListenerContext context)
+        {
+            Interlocked.Increment(ref _requestCount);
+            try
+            {
+                if (Delay > TimeSpan.Zero)
+                {
+                    await Task.Delay(Delay, _stopping.Token);
+                }
+
+                if (FailWith is { } status)
+                {
+                    context.Response.StatusCode = (int)status;
+                    context.Response.Close();
+                    return;
+                }
+
+                using var body = new MemoryStream();
+                await context.Request.InputStream.CopyToAsync(body);
+                var request = new HttpRequestMessage(HttpMethod.Post, Url) { Content = new ByteArrayContent(body.ToArray()) };
+                using var response = await _invoker.SendAsync(request, _stopping.Token);
+                var payload = await response.Content.ReadAsByteArrayAsync();
+
+                context.Response.StatusCode = (int)response.StatusCode;
+                context.Response.ContentType = "application/json";
+                context.Response.ContentLength64 = payload.Length;
+                await context.Response.OutputStream.WriteAsync(payload);
+                context.Response.Close();
+            }
+            catch (Exception) when (_stopping.IsCancellationRequested)
+            {
+                context.Response.Abort();
+            }
+        }
+
+        private static int GetFreePort()
+        {
+            var listener = new TcpListener(IPAddress.Loopback, 0);
+            listener.Start();
+            var port = ((IPEndPoint)listener.LocalEndpoint).Port;
+            listener.Stop();
+            return port;
+        }
+    }
+}
@@ -0,0 +1,217 @@
+using System;
+using System.Collections.Concurrent;
+using System.Linq;
+using System.Net;
+using System.Net.Sockets;
+using System.Net.WebSockets;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+namespace NeoSharp.Tests.Helpers
+{
+    /// <summary>
+    /// Stand-in for the WebSocket endpoint of a node listening on a loopback port. Answers subscribe and
+    /// unsubscribe requests, pushes events to the clients subscribed to them and can drop all connections
+    /// to simulate network failures.
+    /// </summary>
+    public sealed class LocalWebSocketServer : IDisposable
+    {
+        private readonly HttpListener _listener = new();
+        private readonly CancellationTokenSource _stopping = new();
+        private readonly ConcurrentDictionary<Connection, byte> _connections = new();
+        private readonly Task _loop;
+        private int _subscriptionIds;
+        private int _connectionCount;
+
+        public LocalWebSocketServer()
+        {
+            var port = GetFreePort();
+            _listener.Prefixes.Add($"http://127.0.0.1:{port}/");
+            _listener.Start();
+            Url = $"ws://127.0.0.1:{port}/ws";
+            _loop = Task.Run(AcceptLoopAsync);
+        }
+
+        public string Url { get; }
+
+        /// <summary>
+        /// Number of connections accepted so far.
+        /// </summary>
+        public int ConnectionCount => Volatile.Read(ref _connectionCount);
+
+        /// <summary>
+        /// Methods and parameters of all requests received, in order, e.g. "subscribe:block_added".
+        /// </summary>
+        public ConcurrentQueue<string> Requests { get; } = new();
+
+        /// <summary>
+        /// Returns whether an open connection is subscribed to the event.
+        /// </summary>
+        public bool IsSubscribed(string eventName) =>
+            _connections.Keys.Any(c => c.Subscriptions.Values.Contains(eventName));
+
+        /// <summary>
+        /// Waits until an open connection is subscribed to the event.
+        /// </summary>
+        public async Task WaitForSubscriptionAsync(string eventName, bool subscribed = true)
+        {
+            using var timeout = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+            while (IsSubscribed(eventName) != subscribed)
+            {
+                await Task.Delay(10, timeout.Token);
+            }
+        }
+
+        /// <summary>
+        /// Pushes an event to every connection subscribed to it.
+        /// </summary>
+        public async Task PublishAsync(string eventName, object payload)
+        {
+            var message = JsonSerializer.SerializeToUtf8Bytes(new { jsonrpc = "2.0", method = eventName, @params = new[] { payload } });
+            foreach (var connection in _connections.Keys.Where(c => c.Subscriptions.Values.Contains(eventName)))
+            {
+                await connection.SendAsync(message);
+            }
+        }
+
+        /// <summary>
+        /// Aborts all open connections without a closing handshake.
+        /// </summary>
+        public void DropConnections()
+        {
+            foreach (var connection in _connections.Keys)
+            {
+                // Aborting the WebSocket alone leaves the TCP connection open.
+                connection.Socket.Abort();
+                connection.Context.Response.Abort();
+                _connections.TryRemove(connection, out _);
+            }
+        }
+
+        public void Dispose()
+        {
+            _stopping.Cancel();
+            DropConnections();
+            _listener.Close();
+            try { _loop.Wait(TimeSpan.FromSeconds(5)); } catch (AggregateException) { }
+        }
+
+        private async Task AcceptLoopAsync()
+        {
+            while (!_stopping.IsCancellationRequested)
+            {
+                HttpListenerContext context;
+                try
+                {
+                    context = await _listener.GetContextAsync();
+                }
+                catch (Exception) when (_stopping.IsCancellationRequested)
+                {
+                    return;
+                }
+                catch (HttpListenerException)
+                {
+                    return;
+                }
+
+                if (!context.Request.IsWebSocketRequest)
+                {
+                    context.Response.StatusCode = (int)HttpStatusCode.BadRequest;
+                    context.Response.Close();
+                    continue;
+                }
+
+                var webSocketContext = await context.AcceptWebSocketAsync(null);
+                var connection = new Connection(context, webSocketContext.WebSocket);
+                _connections[connection] = 0;
+                Interlocked.Increment(ref _connectionCount);
+                _ = Task.Run(() => ServeAsync(connection));
+            }
+        }
+
+        private async Task ServeAsync(Connection connection)
+        {
+            var buffer = new byte[64 * 1024];
+            try
+            {
+                while (connection.Socket.State == WebSocketState.Open)
+                {
+                    var result = await connection.Socket.ReceiveAsync(buffer.AsMemory(), _stopping.Token);
+                    if (result.MessageType == WebSocketMessageType.Close) break;
+
+                    using var request = JsonDocument.Parse(buffer.AsMemory(0, result.Count));
+                    var method = request.RootElement.GetProperty("method").GetString();
+                    var parameter = request.RootElement.GetProperty("params")[0].GetString();
+                    Requests.Enqueue($"{method}:{parameter}");
+
+                    object answer;
+                    if (method == "subscribe")
+                    {
+                        var id = Interlocked.Increment(ref _subscriptionIds).ToString();
+                        connection.Subscriptions[id] = parameter!;
+                        answer = id;
+                    }
+                    else
+                    {
+                        answer = connection.Subscriptions.TryRemove(parameter!, out _);
+                    }
+
+                    var response = JsonSerializer.SerializeToUtf8Bytes(new
+                    {
+                        jsonrpc = "2.0",
+                        id = request.RootElement.GetProperty("id").GetString(),
+                        result = answer
+                    });
+                    await connection.SendAsync(response);
+                }
+            }
+            catch (Exception) when (_stopping.IsCancellationRequested || connection.Socket.State != WebSocketState.Open)
+            {
+            }
+            finally
+            {
+                _connections.TryRemove(connection, out _);
+            }
+        }
+
+        private static int GetFreePort()
+        {
+            var listener = new TcpListener(IPAddress.Loopback, 0);
+            listener.Start();
+            var port = ((IPEndPoint)listener.LocalEndpoint).Port;
+            listener.Stop();
+            return port;
+        }
+
+        private sealed class Connection
+        {
+            private readonly SemaphoreSlim _sendLock = new(1, 1);
+
+            public Connection(HttpListenerContext context, WebSocket socket)
+            {
+                Context = context;
+                Socket = socket;
+            }
+
+            public HttpListenerContext Context { get; }
+
+            public WebSocket Socket { get; }
+
+            public ConcurrentDictionary<string, string> Subscriptions { get; } = new();
+
+            public async Task SendAsync(byte[] message)
+            {
+                await _sendLock.WaitAsync();
+                try
+                {
+                    await Socket.SendAsync(message.AsMemory(), WebSocketMessageType.Text, true, CancellationToken.None);
+                }
+                finally
+                {
+                    _sendLock.Release();
+                }
+            }
+        }
+    }
+}
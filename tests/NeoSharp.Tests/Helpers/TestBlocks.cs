@@ -0,0 +1,47 @@
+namespace NeoSharp.Tests.Helpers
+{
+    /// <summary>
+    /// Serialized blocks and transactions with their expected hashes. The genesis block is the Neo N3 MainNet
+    /// genesis block, and its hash is the one MainNet nodes report. Block 1 links to it and carries two
+    /// transfer transactions. Its hashes and merkle root were computed with Python's hashlib, independently
+    /// of NeoSharp, following the protocol's definition: a single SHA-256 of the unsigned serialization,
+    /// with merkle parents hashed by double SHA-256.
+    /// </summary>
+    public static class TestBlocks
+    {
+        // MainNet genesis: no transactions, witness PUSH1, next consensus the standby validators' BFT address.
+        public const string GenesisBlock =
+            "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACI6hnvVQEAAB2sK3wAAAAAAAAAAABrEj3YvscYZIhSu8eFleNTagWPnwEAAREA";
+
+        public const string GenesisHeader =
+            "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAACI6hnvVQEAAB2sK3wAAAAAAAAAAABrEj3YvscYZIhSu8eFleNTagWPnwEAARE=";
+
+        public const string GenesisHash = "0x1f4d1defa46faa5e7b9b8d3f79a06bec777d7c26c4aa5f6f5899a291daa87c15";
+        public const string GenesisNextConsensus = "0x9f8f056a53e39585c7bb52886418c7bed83d126b";
+        public const ulong GenesisTimestamp = 1468595301000;
+        public const ulong GenesisNonce = 2083236893;
+
+        // Block 1 holds a NEO transfer and a GAS transfer that carries a Conflicts attribute.
+        public const string Block1 =
+            "AAAAABV8qNqRoplYb1+qxCZ8fXfsa6B5P42be16qb6TvHU0fFEphpkfZwS8oPPcsheZeuUmVsq64g3gWS4DHIL+N0NYgJRrvVQEAAIRufKnxsjtdAQAAAABrEj3YvscYZIhSu8eFleNTagWPnwH9SgEMQAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEMQAICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIMQAMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMMQAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQMQAUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQX8FQwhAkhv0VcCxEkKJnAxEqXMHQkj/Wl6M0Br1aHADgATsJpwDCECTHt/tsMQ/M8bozsIJRnYKWTqk4aNZ2Zi1KWa1UjfDn0MIQKq7DhHD2qtAELG6HfP2Ah9Jnaw9Rb93TYoAbm9OTY5ngwhA7IJ/U9TpxcOpERODLCmu2pTwr0BaSaYnPhfmw+6F6cMDCEDuNnVdx2PUTqghpucyNUJhkA7eMbaNokGOMPUalrc4EoMIQLKDidpe5wkj28W4IX9AGHib0TahbWO6DXBEMql7DulVAwhAt9I9g6PPgHEj/QLm38TENeosqGTGIvv4cLj33QOiVCTF0Ge0Nw6AgBvDPhmlDkPAAAAAABU3gEAAAAAAIEWAAAB7p6iLCfjS9AUj8QQjgj3To9QSLIBAFYLGgwUf1e0TLw9Ui8s22FA8TJTZggE2LoMFO6eoiwn40vQFI/EEI4I906PUEiyFMAfDAh0cmFuc2ZlcgwU9WPqQLwoPU0OBcSOowWz8qBzQO9BYn1bUgFCDEABAgMEBQYHCAkKCwwNDg8QERITFBUWFxgZGhscHR4fICEiIyQlJicoKSorLC0uLzAxMjM0NTY3ODk6Ozw9Pj9AKAwhArNiK/QBe9/jF8WK7V9MdT8ga324lgRvp9d0u8S/f43CQVbnsycAS3sDuGQwpwAAAAAAKN4SAAAAAACeFgAAAX9XtEy8PVIvLNthQPEyU2YIBNi6AQEhK9NFFI2V2IssrZ+E2vq1d5YAYYZ9fLKiF04lhUL7dwdaCwIA4fUFDBTunqIsJ+NL0BSPxBCOCPdOj1BIsgwUf1e0TLw9Ui8s22FA8TJTZggE2LoUwB8MCHRyYW5zZmVyDBTPduKL0AYsSkeO41VhARMZ88+k0kFifVtSAUIMQEA/Pj08Ozo5ODc2NTQzMjEwLy4tLCsqKSgnJiUkIyIhIB8eHRwbGhkYFxYVFBMSERAPDg0MCwoJCAcGBQQDAgEoDCEDqPHkixxra2/2xexac/DlsLH+PBwm9GtuqfelvTjgpfFBVuezJw==";
+
+        public const string Block1Header =
+            "AAAAABV8qNqRoplYb1+qxCZ8fXfsa6B5P42be16qb6TvHU0fFEphpkfZwS8oPPcsheZeuUmVsq64g3gWS4DHIL+N0NYgJRrvVQEAAIRufKnxsjtdAQAAAABrEj3YvscYZIhSu8eFleNTagWPnwH9SgEMQAEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEMQAICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIMQAMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMMQAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQEBAQMQAUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQX8FQwhAkhv0VcCxEkKJnAxEqXMHQkj/Wl6M0Br1aHADgATsJpwDCECTHt/tsMQ/M8bozsIJRnYKWTqk4aNZ2Zi1KWa1UjfDn0MIQKq7DhHD2qtAELG6HfP2Ah9Jnaw9Rb93TYoAbm9OTY5ngwhA7IJ/U9TpxcOpERODLCmu2pTwr0BaSaYnPhfmw+6F6cMDCEDuNnVdx2PUTqghpucyNUJhkA7eMbaNokGOMPUalrc4EoMIQLKDidpe5wkj28W4IX9AGHib0TahbWO6DXBEMql7DulVAwhAt9I9g6PPgHEj/QLm38TENeosqGTGIvv4cLj33QOiVCTF0Ge0Nw6";
+
+        public const string Block1Hash = "0x4f817e65806dafc0d46a107a546727a8c72a5f8bf554bae7c8fa3d871b986fad";
+        public const string Block1MerkleRoot = "0xd6d08dbf20c7804b167883b8aeb29549b95ee6852cf73c282fc1d947a6614a14";
+        public const int Block1Size = 1222;
+
+        public const string NeoTransfer =
+            "AG8M+GaUOQ8AAAAAAFTeAQAAAAAAgRYAAAHunqIsJ+NL0BSPxBCOCPdOj1BIsgEAVgsaDBR/V7RMvD1SLyzbYUDxMlNmCATYugwU7p6iLCfjS9AUj8QQjgj3To9QSLIUwB8MCHRyYW5zZmVyDBT1Y+pAvCg9TQ4FxI6jBbPyoHNA70FifVtSAUIMQAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8gISIjJCUmJygpKissLS4vMDEyMzQ1Njc4OTo7PD0+P0AoDCECs2Ir9AF73+MXxYrtX0x1PyBrfbiWBG+n13S7xL9/jcJBVuezJw==";
+
+        public const string NeoTransferHash = "0x726f542bf0ba7f8e828e5dd0b638dbf7b025e5a35fab5972f1bcf652e850785a";
+        public const int NeoTransferSize = 244;
+
+        public const string GasTransfer =
+            "AEt7A7hkMKcAAAAAACjeEgAAAAAAnhYAAAF/V7RMvD1SLyzbYUDxMlNmCATYugEBISvTRRSNldiLLK2fhNr6tXeWAGGGfXyyohdOJYVC+3cHWgsCAOH1BQwU7p6iLCfjS9AUj8QQjgj3To9QSLIMFH9XtEy8PVIvLNthQPEyU2YIBNi6FMAfDAh0cmFuc2ZlcgwUz3bii9AGLEpHjuNVYQETGfPPpNJBYn1bUgFCDEBAPz49PDs6OTg3NjU0MzIxMC8uLSwrKikoJyYlJCMiISAfHh0cGxoZGBcWFRQTEhEQDw4NDAsKCQgHBgUEAwIBKAwhA6jx5Isca2tv9sXsWnPw5bCx/jwcJvRrbqn3pb044KXxQVbnsyc=";
+
+        public const string GasTransferHash = "0xd9740936c5e54f463bf49757cc36460e497796b204b6ff93a64884ab96401c30";
+        public const int GasTransferSize = 281;
+    }
+}
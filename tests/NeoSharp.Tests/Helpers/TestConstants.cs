@@ -23,7 +23,7 @@ namespace NeoSharp.Tests.Helpers
         public const string NameServiceHash = "7a8fcf0392cd625647907afa8e45cc66872b596b";
 
         // Test account constants (safe test values) - Updated to be consistent with private key
-        public const string DefaultAccountAddress = "2e1hLQVqdSvizuTzKxXTraC9FzijLQuhavAT";
+        public const string DefaultAccountAddress = "NXWyxczEhK4dEFGhztm9WiwtRrnPXLeHkK";
         public const string DefaultAccountScriptHash = "7f4896875d05a596a413300712c964998ebec290";
         public const string DefaultAccountVerificationScript = "0c2102c0b60c995bc092e866f15a37c176bb59b7ebacf069ba94c0ebf561cb8f95623841138defaf";
         public const string DefaultAccountPublicKey = "02c0b60c995bc092e866f15a37c176bb59b7ebacf069ba94c0ebf561cb8f956238";
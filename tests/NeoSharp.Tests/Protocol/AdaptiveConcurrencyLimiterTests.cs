@@ -0,0 +1,209 @@
+using System;
+using System.Collections.Concurrent;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol.Http;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for the adaptive concurrency limiter and its priority lanes.
+    /// </summary>
+    public class AdaptiveConcurrencyLimiterTests
+    {
+        private static ConcurrencyLimiterOptions FixedLimit(int limit) => new()
+        {
+            InitialLimit = limit,
+            MinLimit = limit,
+            MaxLimit = limit
+        };
+
+        private static HttpService CreateService(SlowNodeHandler node, ConcurrencyLimiterOptions options)
+        {
+            return new HttpService("http://localhost:10332", new HttpClient(node))
+            {
+                ConcurrencyLimiter = new AdaptiveConcurrencyLimiter(options)
+            };
+        }
+
+        [Fact]
+        public async Task Requests_NeverExceedLimit()
+        {
+            var node = new SlowNodeHandler(TimeSpan.FromMilliseconds(30));
+            using var service = CreateService(node, FixedLimit(4));
+
+            await Task.WhenAll(Enumerable.Range(0, 40).Select(_ => service.SendAsync<int>("getblockcount")));
+
+            node.MaxConcurrency.Should().Be(4);
+            service.ConcurrencyLimiter.InFlight.Should().Be(0);
+            service.ConcurrencyLimiter.QueueDepth.Should().Be(0);
+        }
+
+        [Fact]
+        public async Task InteractiveRequests_OvertakeQueuedBulkRequests()
+        {
+            var node = new SlowNodeHandler(TimeSpan.FromMilliseconds(50));
+            using var service = CreateService(node, FixedLimit(1));
+
+            var bulk = Enumerable.Range(0, 5).Select(i => service.SendAsync<int>("getblock", new object[] { i })).ToList();
+            await WaitUntil(() => service.ConcurrencyLimiter.GetQueueDepth(RequestPriority.Bulk) == 4);
+
+            var interactive = service.SendAsync<int>("sendrawtransaction", new object[] { "00" });
+            service.ConcurrencyLimiter.GetQueueDepth(RequestPriority.Interactive).Should().Be(1);
+            await Task.WhenAll(bulk.Append(interactive));
+
+            node.Methods.Take(2).Should().Equal("getblock", "sendrawtransaction");
+        }
+
+        [Fact]
+        public async Task BulkRequests_LeaveHeadroomForInteractiveRequests()
+        {
+            var node = new SlowNodeHandler(TimeSpan.FromMilliseconds(100));
+            var options = FixedLimit(4);
+            options.MaxBulkShare = 0.5;
+            using var service = CreateService(node, options);
+            var limiter = service.ConcurrencyLimiter;
+
+            var bulk = Enumerable.Range(0, 10).Select(i => service.SendAsync<int>("getblock", new object[] { i })).ToList();
+            await WaitUntil(() => limiter.GetInFlight(RequestPriority.Bulk) == 2);
+
+            limiter.GetInFlight(RequestPriority.Bulk).Should().Be(2);
+            limiter.GetQueueDepth(RequestPriority.Bulk).Should().Be(8);
+
+            var interactive = service.SendAsync<int>("invokescript", new object[] { "00" });
+            limiter.GetInFlight(RequestPriority.Interactive).Should().Be(1);
+            limiter.GetQueueDepth(RequestPriority.Interactive).Should().Be(0);
+
+            await Task.WhenAll(bulk.Append(interactive));
+        }
+
+        [Fact]
+        public async Task PriorityScope_OverridesMethodPriority()
+        {
+            var node = new SlowNodeHandler(TimeSpan.FromMilliseconds(50));
+            using var service = CreateService(node, FixedLimit(1));
+
+            var first = service.SendAsync<int>("getblock", new object[] { 0 });
+            Task<int> queued;
+            using (RequestPriorityScope.Begin(RequestPriority.Bulk))
+            {
+                queued = service.SendAsync<int>("getversion");
+            }
+
+            service.ConcurrencyLimiter.GetQueueDepth(RequestPriority.Bulk).Should().Be(1);
+            RequestPriorityScope.Current.Should().BeNull();
+            await Task.WhenAll(first, queued);
+        }
+
+        [Fact]
+        public async Task Limit_ShrinksWhenRequestsFail()
+        {
+            var node = new SlowNodeHandler(TimeSpan.Zero) { FailWith = HttpStatusCode.ServiceUnavailable };
+            using var service = CreateService(node, new ConcurrencyLimiterOptions { InitialLimit = 20 });
+
+            for (var i = 0; i < 10; i++)
+            {
+                Func<Task> call = () => service.SendAsync<int>("getblockcount");
+                await call.Should().ThrowAsync<JsonRpcException>();
+            }
+
+            service.ConcurrencyLimiter.Limit.Should().BeLessThan(20);
+        }
+
+        [Fact]
+        public async Task Limit_GrowsWhileLatencyIsStableAndLimitIsSaturated()
+        {
+            var node = new SlowNodeHandler(TimeSpan.FromMilliseconds(5));
+            using var service = CreateService(node, new ConcurrencyLimiterOptions { InitialLimit = 2, MaxLimit = 50 });
+
+            await Task.WhenAll(Enumerable.Range(0, 300).Select(_ => service.SendAsync<int>("getblockcount")));
+
+            service.ConcurrencyLimiter.Limit.Should().BeGreaterThan(2);
+        }
+
+        [Fact]
+        public async Task CancelledWaiter_LeavesQueue()
+        {
+            var node = new SlowNodeHandler(TimeSpan.FromMilliseconds(200));
+            using var service = CreateService(node, FixedLimit(1));
+            using var cancellation = new CancellationTokenSource();
+
+            var running = service.SendAsync<int>("getblockcount");
+            var waiting = service.SendAsync<int>("getblockcount", null, cancellation.Token);
+            service.ConcurrencyLimiter.QueueDepth.Should().Be(1);
+
+            cancellation.Cancel();
+
+            await waiting.Invoking(t => t).Should().ThrowAsync<JsonRpcException>();
+            service.ConcurrencyLimiter.QueueDepth.Should().Be(0);
+            await running;
+            node.Methods.Should().HaveCount(1);
+        }
+
+        private static async Task WaitUntil(Func<bool> condition)
+        {
+            for (var i = 0; i < 200 && !condition(); i++)
+            {
+                await Task.Delay(5);
+            }
+        }
+
+        /// <summary>
+        /// Node stand-in answering every call with 1 after a delay and recording concurrency and call order.
+        /// </summary>
+        private class SlowNodeHandler : HttpMessageHandler
+        {
+            private readonly TimeSpan _delay;
+            private int _concurrency;
+            private int _maxConcurrency;
+
+            public SlowNodeHandler(TimeSpan delay) => _delay = delay;
+
+            public HttpStatusCode? FailWith { get; set; }
+
+            public int MaxConcurrency => _maxConcurrency;
+
+            public ConcurrentQueue<string> Methods { get; } = new();
+
+            protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                var current = Interlocked.Increment(ref _concurrency);
+                InterlockedMax(ref _maxConcurrency, current);
+                try
+                {
+                    using var body = JsonDocument.Parse(await request.Content!.ReadAsStringAsync(cancellationToken));
+                    Methods.Enqueue(body.RootElement.GetProperty("method").GetString()!);
+                    await Task.Delay(_delay, cancellationToken);
+
+                    if (FailWith is { } status) return new HttpResponseMessage(status);
+
+                    var id = body.RootElement.GetProperty("id").GetString();
+                    var json = JsonSerializer.Serialize(new { jsonrpc = "2.0", id, result = 1 });
+                    return new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent(json, Encoding.UTF8, "application/json") };
+                }
+                finally
+                {
+                    Interlocked.Decrement(ref _concurrency);
+                }
+            }
+
+            private static void InterlockedMax(ref int target, int value)
+            {
+                var current = Volatile.Read(ref target);
+                while (value > current)
+                {
+                    var previous = Interlocked.CompareExchange(ref target, value, current);
+                    if (previous == current) return;
+                    current = previous;
+                }
+            }
+        }
+    }
+}
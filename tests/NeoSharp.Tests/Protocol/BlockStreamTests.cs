@@ -0,0 +1,190 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol;
+using NeoSharp.Tests.Helpers;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for streaming block ranges with <see cref="global::NeoSharp.Protocol.NeoSharp.StreamBlocksAsync"/>.
+    /// </summary>
+    public class BlockStreamTests
+    {
+        private sealed class ChainNode : IDisposable
+        {
+            private readonly LocalRpcServer _server;
+            private int _inFlight;
+            private int _maxInFlight;
+            private int _blockCalls;
+
+            public ChainNode(int height)
+            {
+                Height = height;
+                Handler = new JsonRpcStubHandler()
+                    .On("getblockcount", _ => Volatile.Read(ref Height) + 1)
+                    .On("getblock", p =>
+                    {
+                        var index = p[0].GetInt32();
+                        Interlocked.Increment(ref _blockCalls);
+                        var inFlight = Interlocked.Increment(ref _inFlight);
+                        InterlockedMax(ref _maxInFlight, inFlight);
+                        try
+                        {
+                            // Later blocks come back first, so the stream has to reorder them.
+                            Thread.Sleep(index % 4 == 0 ? 30 : 5);
+                        }
+                        finally
+                        {
+                            Interlocked.Decrement(ref _inFlight);
+                        }
+                        return new { hash = "0x" + index.ToString("x64"), index, tx = Array.Empty<object>() };
+                    });
+                _server = new LocalRpcServer(Handler);
+            }
+
+            public int Height;
+
+            public JsonRpcStubHandler Handler { get; }
+
+            public int MaxInFlight => Volatile.Read(ref _maxInFlight);
+
+            public int BlockCalls => Volatile.Read(ref _blockCalls);
+
+            public global::NeoSharp.Protocol.NeoSharp CreateClient(NeoSharpConfig? config = null)
+            {
+                return new global::NeoSharp.Protocol.NeoSharp(_server.Url, config);
+            }
+
+            public void Dispose() => _server.Dispose();
+
+            private static void InterlockedMax(ref int target, int value)
+            {
+                int current;
+                while ((current = Volatile.Read(ref target)) < value &&
+                       Interlocked.CompareExchange(ref target, value, current) != current)
+                {
+                }
+            }
+        }
+
+        private static async Task<List<int>> CollectAsync(IAsyncEnumerable<global::NeoSharp.Protocol.Core.Response.NeoBlock> blocks, int? take = null)
+        {
+            var indexes = new List<int>();
+            await foreach (var block in blocks)
+            {
+                indexes.Add(block.Index);
+                if (indexes.Count == take) break;
+            }
+            return indexes;
+        }
+
+        [Fact]
+        public async Task StreamBlocksAsync_YieldsRangeInHeightOrderWithBoundedParallelism()
+        {
+            using var node = new ChainNode(100);
+            var neo = node.CreateClient();
+
+            var indexes = await CollectAsync(neo.StreamBlocksAsync(10, 60, new BlockStreamOptions { MaxParallelism = 4 }));
+
+            indexes.Should().Equal(Enumerable.Range(10, 51));
+            node.MaxInFlight.Should().BeGreaterThan(1).And.BeLessOrEqualTo(4);
+        }
+
+        [Fact]
+        public async Task StreamBlocksAsync_BatchesConsecutiveBlocks()
+        {
+            using var node = new ChainNode(100);
+            var neo = node.CreateClient();
+
+            var indexes = await CollectAsync(neo.StreamBlocksAsync(0, 24, new BlockStreamOptions { BatchSize = 10, MaxParallelism = 2 }));
+
+            indexes.Should().Equal(Enumerable.Range(0, 25));
+            var batchSizes = node.Handler.RequestBodies
+                .Select(body => JsonDocument.Parse(body).RootElement)
+                .Where(root => root.ValueKind == JsonValueKind.Array)
+                .Select(root => root.GetArrayLength())
+                .ToList();
+            batchSizes.Should().BeEquivalentTo(new[] { 10, 10, 5 });
+        }
+
+        [Fact]
+        public async Task StreamBlocksAsync_StopsFetchingWhileConsumerIsSlow()
+        {
+            using var node = new ChainNode(1000);
+            var neo = node.CreateClient();
+            var options = new BlockStreamOptions { MaxParallelism = 3, BatchSize = 2 };
+
+            await using var enumerator = neo.StreamBlocksAsync(0, null, options).GetAsyncEnumerator();
+            (await enumerator.MoveNextAsync()).Should().BeTrue();
+            await Task.Delay(200);
+
+            // One request consumed, at most MaxParallelism requests fetched ahead of the consumer.
+            node.BlockCalls.Should().BeLessOrEqualTo(2 + 3 * 2);
+        }
+
+        [Fact]
+        public async Task StreamBlocksAsync_ResumesFromCheckpoint()
+        {
+            using var node = new ChainNode(100);
+            var neo = node.CreateClient();
+            var checkpoint = Path.Combine(Path.GetTempPath(), "neosharp-stream-" + Guid.NewGuid().ToString("N"));
+            var options = new BlockStreamOptions { CheckpointPath = checkpoint, CheckpointInterval = 5 };
+
+            try
+            {
+                // Stop while block 12 is being processed: only blocks up to 9 are checkpointed.
+                var first = await CollectAsync(neo.StreamBlocksAsync(0, 30, options), take: 13);
+                first.Last().Should().Be(12);
+                File.ReadAllText(checkpoint).Should().Be("9");
+
+                var resumed = await CollectAsync(neo.StreamBlocksAsync(0, 30, options));
+                resumed.Should().Equal(Enumerable.Range(10, 21));
+                File.ReadAllText(checkpoint).Should().Be("30");
+            }
+            finally
+            {
+                File.Delete(checkpoint);
+            }
+        }
+
+        [Fact]
+        public async Task StreamBlocksAsync_FollowsTheChainAfterCatchingUp()
+        {
+            using var node = new ChainNode(5);
+            var neo = node.CreateClient(new NeoSharpConfig { BlockInterval = 20 });
+            using var cancellation = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+            var indexes = new List<int>();
+
+            await foreach (var block in neo.StreamBlocksAsync(3, null, new BlockStreamOptions { Follow = true }, cancellation.Token))
+            {
+                indexes.Add(block.Index);
+                if (block.Index == 5)
+                {
+                    // New blocks are produced once the stream has reached the head.
+                    Volatile.Write(ref node.Height, 8);
+                }
+                if (block.Index == 8) break;
+            }
+
+            indexes.Should().Equal(3, 4, 5, 6, 7, 8);
+        }
+
+        [Fact]
+        public async Task StreamBlocksAsync_WithoutFollowStopsAtTheHead()
+        {
+            using var node = new ChainNode(5);
+            var neo = node.CreateClient();
+
+            var indexes = await CollectAsync(neo.StreamBlocksAsync(2, 50));
+
+            indexes.Should().Equal(2, 3, 4, 5);
+        }
+    }
+}
@@ -0,0 +1,189 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Protocol;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Types;
+using Xunit;
+using ResponseTransaction = NeoSharp.Protocol.Core.Response.Transaction;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for <see cref="BlockVerifier"/>.
+    /// </summary>
+    public class BlockVerifierTests
+    {
+        private static Block CreateBlock(uint index, Hash256 prevHash, int transactionCount)
+        {
+            var block = new Block();
+            block.Header.Index = index;
+            block.Header.PrevHash = prevHash;
+            for (var i = 0; i < transactionCount; i++)
+            {
+                block.Transactions.Add(new global::NeoSharp.Transaction.Transaction
+                {
+                    Nonce = index * 1000 + (uint)i,
+                    ValidUntilBlock = index + 100,
+                    Script = new byte[] { 0x11, (byte)i }
+                });
+            }
+            block.Header.MerkleRoot = MerkleTree.ComputeRoot(block.Transactions.Select(t => t.Hash).ToArray());
+            return block;
+        }
+
+        private static List<Block> CreateChain(int length, int transactionCount)
+        {
+            var chain = new List<Block>();
+            var prevHash = Hash256.Zero;
+            for (var i = 0; i < length; i++)
+            {
+                var block = CreateBlock((uint)i, prevHash, transactionCount);
+                chain.Add(block);
+                prevHash = block.Hash;
+            }
+            return chain;
+        }
+
+        private static async IAsyncEnumerable<T> StreamAsync<T>(IEnumerable<T> items)
+        {
+            foreach (var item in items)
+            {
+                await Task.Yield();
+                yield return item;
+            }
+        }
+
+        [Theory]
+        [InlineData(0, -1)]
+        [InlineData(1, -1)]
+        [InlineData(100, -1)]
+        [InlineData(100, 1)]
+        public void Verify_AcceptsConsistentBlocks(int transactionCount, int maxDegreeOfParallelism)
+        {
+            var chain = CreateChain(2, transactionCount);
+            var verifier = new BlockVerifier(maxDegreeOfParallelism);
+
+            verifier.Invoking(v => v.Verify(chain[1], chain[0])).Should().NotThrow();
+            verifier.ComputeMerkleRoot(chain[1]).Should().Be(chain[1].Header.MerkleRoot);
+        }
+
+        [Fact]
+        public void Verify_AcceptsBlocksDecodedFromTheNode()
+        {
+            var genesis = Block.FromBase64(TestBlocks.GenesisBlock);
+            var block = Block.FromBase64(TestBlocks.Block1);
+            var verifier = new BlockVerifier();
+
+            verifier.ComputeMerkleRoot(genesis).Should().Be(Hash256.Zero);
+            verifier.ComputeMerkleRoot(block).ToString().Should().Be(TestBlocks.Block1MerkleRoot);
+            verifier.Invoking(v => v.Verify(genesis)).Should().NotThrow();
+            verifier.Invoking(v => v.Verify(block, genesis)).Should().NotThrow();
+
+            block.Transactions.Reverse();
+            verifier.Invoking(v => v.Verify(block, genesis)).Should().Throw<BlockVerificationException>().WithMessage("*merkle root*");
+        }
+
+        [Fact]
+        public void Verify_AcceptsVerboseBlocksWithNodeReportedHashes()
+        {
+            var genesis = new NeoBlock
+            {
+                Hash = Hash256.Parse(TestBlocks.GenesisHash),
+                Index = 0,
+                PreviousBlockHash = Hash256.Zero,
+                MerkleRoot = Hash256.Zero,
+                Transactions = new List<ResponseTransaction>()
+            };
+            var block = new NeoBlock
+            {
+                Hash = Hash256.Parse(TestBlocks.Block1Hash),
+                Index = 1,
+                PreviousBlockHash = Hash256.Parse(TestBlocks.GenesisHash),
+                MerkleRoot = Hash256.Parse(TestBlocks.Block1MerkleRoot),
+                Transactions = new[] { TestBlocks.NeoTransferHash, TestBlocks.GasTransferHash }
+                    .Select(hash => new ResponseTransaction { Hash = Hash256.Parse(hash) }).ToList()
+            };
+
+            new BlockVerifier().Invoking(v => v.Verify(block, genesis)).Should().NotThrow();
+        }
+
+        [Fact]
+        public void Verify_RejectsTransactionsThatDoNotMatchTheMerkleRoot()
+        {
+            var block = CreateBlock(7, Hash256.Zero, 20);
+            block.Transactions[13].Nonce++;
+
+            var act = () => new BlockVerifier().Verify(block);
+
+            act.Should().Throw<BlockVerificationException>().Which.BlockIndex.Should().Be(7);
+        }
+
+        [Fact]
+        public void Verify_RejectsBrokenOrNonConsecutiveLinks()
+        {
+            var chain = CreateChain(3, 2);
+            var verifier = new BlockVerifier();
+
+            verifier.Invoking(v => v.Verify(chain[2], chain[0])).Should().Throw<BlockVerificationException>().WithMessage("*does not follow*");
+
+            chain[1].Header.PrevHash = chain[2].Hash;
+            verifier.Invoking(v => v.Verify(chain[1], chain[0])).Should().Throw<BlockVerificationException>().WithMessage("*links to previous block*");
+        }
+
+        [Fact]
+        public async Task VerifyAsync_PassesVerifiedBlocksOnAndStopsAtTheFirstBadOne()
+        {
+            var chain = CreateChain(6, 3);
+            chain[4].Header.MerkleRoot = Hash256.Zero;
+            var passed = new List<uint>();
+
+            var act = async () =>
+            {
+                await foreach (var block in new BlockVerifier().VerifyAsync(StreamAsync(chain)))
+                {
+                    passed.Add(block.Index);
+                }
+            };
+
+            (await act.Should().ThrowAsync<BlockVerificationException>()).Which.BlockIndex.Should().Be(4);
+            passed.Should().Equal(0u, 1u, 2u, 3u);
+        }
+
+        [Fact]
+        public async Task VerifyAsync_ChecksVerboseBlocksAgainstTheirReportedTransactions()
+        {
+            var chain = CreateChain(3, 4).Select(block => new NeoBlock
+            {
+                Hash = block.Hash,
+                Index = (int)block.Index,
+                PreviousBlockHash = block.Header.PrevHash,
+                MerkleRoot = block.Header.MerkleRoot,
+                Transactions = block.Transactions.Select(t => new ResponseTransaction { Hash = t.Hash }).ToList()
+            }).ToList();
+
+            var verified = new List<NeoBlock>();
+            await foreach (var block in new BlockVerifier().VerifyAsync(StreamAsync(chain)))
+            {
+                verified.Add(block);
+            }
+            verified.Should().Equal(chain);
+
+            chain[2].Transactions.RemoveAt(0);
+            var act = () => new BlockVerifier().Verify(chain[2], chain[1]);
+            act.Should().Throw<BlockVerificationException>().WithMessage("*merkle root*");
+        }
+
+        [Fact]
+        public void Constructor_RejectsInvalidParallelism()
+        {
+            var act = () => new BlockVerifier(0);
+
+            act.Should().Throw<ArgumentOutOfRangeException>();
+        }
+    }
+}
@@ -0,0 +1,127 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for the JSON-RPC request and response handling of HttpService.
+    /// </summary>
+    public class HttpServiceTests
+    {
+        private const string BlockHash = "0x1f4d1defa46faa5e7b9b8d3f79a06bec777d7c26c4aa5f6f5899a291daa87c15";
+
+        [Fact]
+        public async Task SendAsync_SendsUtf8JsonRequest()
+        {
+            var handler = new JsonRpcStubHandler().On("getblockcount", _ => 7);
+            using var service = new HttpService("http://localhost:10332", new HttpClient(handler));
+
+            var result = await service.SendAsync<int>("getblockcount");
+
+            result.Should().Be(7);
+            using var body = JsonDocument.Parse(handler.RequestBodies.Single());
+            body.RootElement.GetProperty("jsonrpc").GetString().Should().Be("2.0");
+            body.RootElement.GetProperty("method").GetString().Should().Be("getblockcount");
+            body.RootElement.GetProperty("params").GetArrayLength().Should().Be(0);
+        }
+
+        [Fact]
+        public async Task SendAsync_DeserializesLargeBlockFromStream()
+        {
+            var transactions = Enumerable.Range(0, 500).Select(i => new
+            {
+                hash = BlockHash,
+                size = 250,
+                version = 0,
+                nonce = i,
+                sender = "NQ5D43HX4QBXZ3XZ4QBXZ3XZ4QBXZ3XZ4Q",
+                sysfee = "100000",
+                netfee = "120000",
+                validuntilblock = 5000,
+                script = new string('a', 400)
+            }).ToArray();
+            var handler = new JsonRpcStubHandler().On("getblock", _ => new
+            {
+                hash = BlockHash,
+                index = 42,
+                previousblockhash = BlockHash,
+                merkleroot = BlockHash,
+                nextblockhash = (string?)null,
+                tx = transactions
+            });
+            using var service = new HttpService("http://localhost:10332", new HttpClient(handler));
+
+            var block = await service.SendAsync<NeoBlock>("getblock", new object[] { 42, true });
+
+            block.Index.Should().Be(42);
+            block.Hash.Should().Be(Hash256.Parse(BlockHash));
+            block.NextBlockHash.Should().Be(default(Hash256));
+            block.Transactions.Should().HaveCount(500);
+        }
+
+        [Fact]
+        public async Task SendAsync_DeserializesInvocationResultWithStack()
+        {
+            var handler = new JsonRpcStubHandler().On("invokefunction", _ => new
+            {
+                state = "HALT",
+                gasconsumed = "984060",
+                stack = new object[] { new { type = "Integer", value = "8" }, new { type = "ByteString", value = "TkVP" } }
+            });
+            using var service = new HttpService("http://localhost:10332", new HttpClient(handler));
+
+            var result = await service.SendAsync<InvocationResult>("invokefunction", new object[]
+            {
+                "0xef4073a0f2b305a38ec4050e4d3d28bc40ea63f5", "decimals", new List<Dictionary<string, object>>()
+            });
+
+            result.State.Should().Be("HALT");
+            result.GasConsumed.Should().Be("984060");
+            result.Stack.Should().HaveCount(2);
+            result.Stack![0].Type.Should().Be("Integer");
+        }
+
+        [Fact]
+        public async Task SendAsync_WithRpcError_ThrowsJsonRpcException()
+        {
+            var handler = new JsonRpcStubHandler().On("getblock", _ => throw new StubRpcError(-100, "Unknown block"));
+            using var service = new HttpService("http://localhost:10332", new HttpClient(handler));
+
+            await service.Invoking(s => s.SendAsync<NeoBlock>("getblock", new object[] { 99 }))
+                .Should().ThrowAsync<JsonRpcException>().WithMessage("*-100*Unknown block*");
+        }
+
+        [Fact]
+        public async Task SendAsync_WithHttpFailure_ThrowsJsonRpcException()
+        {
+            using var service = new HttpService("http://localhost:10332", new HttpClient(new StatusCodeHandler(HttpStatusCode.BadGateway)));
+
+            await service.Invoking(s => s.SendAsync<int>("getblockcount"))
+                .Should().ThrowAsync<JsonRpcException>().WithMessage("HTTP request failed*");
+        }
+
+        private class StatusCodeHandler : HttpMessageHandler
+        {
+            private readonly HttpStatusCode _statusCode;
+
+            public StatusCodeHandler(HttpStatusCode statusCode) => _statusCode = statusCode;
+
+            protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                return Task.FromResult(new HttpResponseMessage(_statusCode));
+            }
+        }
+    }
+}
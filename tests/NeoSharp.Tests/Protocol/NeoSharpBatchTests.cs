@@ -0,0 +1,194 @@
+using System;
+using System.Linq;
+using System.Net.Http;
+using System.Runtime.CompilerServices;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for JSON-RPC batch requests and automatic micro-batching.
+    /// </summary>
+    public class NeoSharpBatchTests
+    {
+        private const string BlockHash = "0x1f4d1defa46faa5e7b9b8d3f79a06bec777d7c26c4aa5f6f5899a291daa87c15";
+
+        private static (global::NeoSharp.Protocol.NeoSharp neo, JsonRpcStubHandler handler) CreateClient(NeoSharpConfig config = null)
+        {
+            var handler = new JsonRpcStubHandler()
+                .On("getblockcount", _ => 1234)
+                .On("getblockhash", _ => BlockHash)
+                .On("gettransactionheight", p => p[0].GetString() == BlockHash
+                    ? throw new StubRpcError(-100, "Unknown transaction")
+                    : 42);
+            var service = new HttpService("http://localhost:10332", new HttpClient(handler));
+            return (new global::NeoSharp.Protocol.NeoSharp(service, config), handler);
+        }
+
+        [Fact]
+        public async Task BatchAsync_SendsAllCallsInOneRoundTrip()
+        {
+            var (neo, handler) = CreateClient();
+            Task<int> count = null!;
+            Task<Hash256> hash = null!;
+
+            await neo.BatchAsync(batch =>
+            {
+                count = batch.GetBlockCountAsync();
+                hash = batch.GetBlockHashAsync(7);
+            });
+
+            handler.RequestCount.Should().Be(1);
+            (await count).Should().Be(1234);
+            (await hash).Should().Be(Hash256.Parse(BlockHash));
+
+            using var body = JsonDocument.Parse(handler.RequestBodies.Single());
+            body.RootElement.ValueKind.Should().Be(JsonValueKind.Array);
+            body.RootElement.GetArrayLength().Should().Be(2);
+        }
+
+        [Fact]
+        public async Task BatchAsync_ItemErrorDoesNotFailOtherCalls()
+        {
+            var (neo, _) = CreateClient();
+            var batch = neo.CreateBatch();
+            var failing = batch.GetTransactionHeightAsync(Hash256.Parse(BlockHash));
+            var succeeding = batch.GetBlockCountAsync();
+            var unknown = batch.Add<string>("nosuchmethod");
+
+            await batch.ExecuteAsync();
+
+            (await succeeding).Should().Be(1234);
+            await failing.Invoking(t => t).Should().ThrowAsync<JsonRpcException>().WithMessage("*-100*Unknown transaction*");
+            await unknown.Invoking(t => t).Should().ThrowAsync<JsonRpcException>().WithMessage("*-32601*");
+        }
+
+        [Fact]
+        public async Task ExecuteAsync_SplitsBatchesByMaxBatchSize()
+        {
+            var (neo, handler) = CreateClient(new NeoSharpConfig { MaxBatchSize = 2 });
+            var batch = neo.CreateBatch();
+            var heights = Enumerable.Range(0, 5).Select(_ => batch.GetBlockCountAsync()).ToList();
+
+            await batch.ExecuteAsync();
+
+            handler.RequestCount.Should().Be(3);
+            (await Task.WhenAll(heights)).Should().AllBeEquivalentTo(1234);
+        }
+
+        [Fact]
+        public async Task ExecuteAsync_CannotRunTwice()
+        {
+            var (neo, _) = CreateClient();
+            var batch = neo.CreateBatch();
+            batch.GetBlockCountAsync();
+            await batch.ExecuteAsync();
+
+            await batch.Invoking(b => b.ExecuteAsync()).Should().ThrowAsync<InvalidOperationException>();
+            Action addAfterExecute = () => batch.GetBlockCountAsync();
+            addAfterExecute.Should().Throw<InvalidOperationException>();
+        }
+
+        [Fact]
+        public async Task MicroBatching_CollectsConcurrentCalls()
+        {
+            var (neo, handler) = CreateClient(new NeoSharpConfig().EnableMicroBatching(50));
+
+            var calls = Enumerable.Range(0, 10).Select(_ => neo.GetBlockCountAsync()).ToList();
+            var hash = neo.GetBlockHashAsync(3);
+
+            (await Task.WhenAll(calls)).Should().AllBeEquivalentTo(1234);
+            (await hash).Should().Be(Hash256.Parse(BlockHash));
+            handler.RequestCount.Should().Be(1);
+        }
+
+        [Fact]
+        public void Constructor_KeepsBatchingSettingsOfSuppliedServiceWithoutConfig()
+        {
+            var service = new HttpService("http://localhost:10332", new HttpClient(new JsonRpcStubHandler()))
+            {
+                MicroBatchWindow = 25,
+                MaxBatchSize = 7
+            };
+
+            _ = new global::NeoSharp.Protocol.NeoSharp(service);
+
+            service.MicroBatchWindow.Should().Be(25);
+            service.MaxBatchSize.Should().Be(7);
+
+            _ = new global::NeoSharp.Protocol.NeoSharp(service, new NeoSharpConfig().EnableMicroBatching(5, maxBatchSize: 3));
+
+            service.MicroBatchWindow.Should().Be(5);
+            service.MaxBatchSize.Should().Be(3);
+        }
+
+        [MethodImpl(MethodImplOptions.NoInlining)]
+        private static async Task<WeakReference> CallWithTrackedParameterAsync(HttpService service, CancellationToken cancellationToken)
+        {
+            var parameter = new[] { BlockHash };
+            await service.SendAsync<int>("gettransactionheight", new object[] { parameter }, cancellationToken);
+            return new WeakReference(parameter);
+        }
+
+        [Fact]
+        public async Task MicroBatching_ReleasesCancellationRegistrationsOfCompletedCalls()
+        {
+            using var lifetime = new CancellationTokenSource();
+            var handler = new JsonRpcStubHandler().On("gettransactionheight", _ => 42);
+            var service = new HttpService("http://localhost:10332", new HttpClient(handler)) { MicroBatchWindow = 1 };
+
+            var parameter = await CallWithTrackedParameterAsync(service, lifetime.Token);
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+            GC.Collect();
+
+            // A registration left on the long-lived token would keep the call, and its parameters, reachable.
+            parameter.IsAlive.Should().BeFalse();
+        }
+
+        private sealed class ThrowingHandler : HttpMessageHandler
+        {
+            protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                throw new NotSupportedException("Unexpected failure");
+            }
+        }
+
+        [Fact]
+        public async Task MicroBatching_FailsPendingCallsOnUnexpectedException()
+        {
+            var service = new HttpService("http://localhost:10332", new HttpClient(new ThrowingHandler()));
+            var neo = new global::NeoSharp.Protocol.NeoSharp(service, new NeoSharpConfig().EnableMicroBatching(10));
+
+            var calls = Enumerable.Range(0, 3).Select(_ => neo.GetBlockCountAsync()).ToList();
+
+            var all = Task.WhenAll(calls);
+            (await Task.WhenAny(all, Task.Delay(5_000))).Should().Be(all);
+            foreach (var call in calls)
+            {
+                await call.Invoking(t => t).Should().ThrowAsync<JsonRpcException>()
+                    .WithInnerException(typeof(NotSupportedException));
+            }
+        }
+
+        [Fact]
+        public async Task MicroBatching_FlushesWhenMaxBatchSizeReached()
+        {
+            var (neo, handler) = CreateClient(new NeoSharpConfig().EnableMicroBatching(10_000, maxBatchSize: 4));
+
+            var calls = Enumerable.Range(0, 4).Select(_ => neo.GetBlockCountAsync()).ToList();
+
+            var all = Task.WhenAll(calls);
+            (await Task.WhenAny(all, Task.Delay(5_000))).Should().Be(all);
+            handler.RequestCount.Should().Be(1);
+        }
+    }
+}
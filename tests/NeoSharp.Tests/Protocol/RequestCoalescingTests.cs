@@ -0,0 +1,139 @@
+using System;
+using System.Linq;
+using System.Net.Http;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for sharing one request between concurrent identical calls.
+    /// </summary>
+    public class RequestCoalescingTests
+    {
+        private static readonly Hash160 NeoToken = Hash160.Parse("0xef4073a0f2b305a38ec4050e4d3d28bc40ea63f5");
+
+        private static LocalRpcServer StartNode(int delayMilliseconds = 100)
+        {
+            var handler = new JsonRpcStubHandler()
+                .On("getblockcount", _ => 1234)
+                .On("invokefunction", p => new
+                {
+                    state = "HALT",
+                    gasconsumed = "984060",
+                    stack = new object[] { new { type = "ByteString", value = p[1].GetString() } }
+                });
+            return new LocalRpcServer(handler) { Delay = TimeSpan.FromMilliseconds(delayMilliseconds) };
+        }
+
+        private static global::NeoSharp.Protocol.NeoSharp CreateClient(LocalRpcServer node, RequestCoalescingOptions options = null)
+        {
+            return new global::NeoSharp.Protocol.NeoSharp(node.Url, new NeoSharpConfig().EnableRequestCoalescing(options));
+        }
+
+        [Fact]
+        public async Task ConcurrentIdenticalCalls_ShareOneRequest()
+        {
+            using var node = StartNode();
+            using var neo = CreateClient(node);
+
+            var counts = await Task.WhenAll(Enumerable.Range(0, 1000).Select(_ => neo.GetBlockCountAsync()));
+
+            counts.Should().OnlyContain(c => c == 1234);
+            node.RequestCount.Should().Be(1);
+        }
+
+        [Fact]
+        public async Task ConcurrentCallsWithDifferentParameters_AreSentSeparately()
+        {
+            using var node = StartNode();
+            using var neo = CreateClient(node);
+
+            var results = await Task.WhenAll(
+                neo.InvokeFunctionAsync(NeoToken, "symbol"),
+                neo.InvokeFunctionAsync(NeoToken, "symbol"),
+                neo.InvokeFunctionAsync(NeoToken, "decimals"));
+
+            node.RequestCount.Should().Be(2);
+            results[2].Stack![0].Value!.ToString().Should().Be("decimals");
+        }
+
+        [Fact]
+        public async Task CoalescedCalls_ReceiveIndependentResults()
+        {
+            using var node = StartNode();
+            using var neo = CreateClient(node);
+
+            var results = await Task.WhenAll(neo.InvokeFunctionAsync(NeoToken, "symbol"), neo.InvokeFunctionAsync(NeoToken, "symbol"));
+            results[0].State = "FAULT";
+
+            results[1].Should().NotBeSameAs(results[0]);
+            results[1].State.Should().Be("HALT");
+        }
+
+        [Fact]
+        public async Task TimeToLive_AnswersLaterCallsUntilItExpires()
+        {
+            using var node = StartNode(delayMilliseconds: 0);
+            using var neo = CreateClient(node, new RequestCoalescingOptions().Coalesce("getblockcount", 300));
+
+            await neo.GetBlockCountAsync();
+            await neo.GetBlockCountAsync();
+            node.RequestCount.Should().Be(1);
+
+            await Task.Delay(600);
+            await neo.GetBlockCountAsync();
+            node.RequestCount.Should().Be(2);
+        }
+
+        [Fact]
+        public async Task WithoutTimeToLive_SequentialCallsAreSentSeparately()
+        {
+            using var node = StartNode(delayMilliseconds: 0);
+            using var neo = CreateClient(node, new RequestCoalescingOptions().Coalesce("getblockcount"));
+
+            await neo.GetBlockCountAsync();
+            await neo.GetBlockCountAsync();
+
+            node.RequestCount.Should().Be(2);
+        }
+
+        [Fact]
+        public async Task FailedRequest_IsNotSharedWithLaterCalls()
+        {
+            var failures = 1;
+            var handler = new JsonRpcStubHandler().On("getblockcount", _ =>
+                Interlocked.Decrement(ref failures) >= 0 ? throw new StubRpcError(-1, "Node busy") : 1234);
+            using var service = new HttpService("http://localhost:10332", new HttpClient(handler))
+            {
+                RequestCoalescing = new RequestCoalescingOptions().Coalesce("getblockcount", 10000)
+            };
+
+            Func<Task> first = () => service.SendAsync<int>("getblockcount");
+            await first.Should().ThrowAsync<JsonRpcException>();
+
+            (await service.SendAsync<int>("getblockcount")).Should().Be(1234);
+        }
+
+        [Fact]
+        public async Task CancellingOneCaller_DoesNotCancelSharedRequest()
+        {
+            using var node = StartNode(delayMilliseconds: 200);
+            using var neo = CreateClient(node);
+            using var cancellation = new CancellationTokenSource(50);
+
+            var cancelled = neo.GetBlockCountAsync(cancellation.Token);
+            var other = neo.GetBlockCountAsync();
+
+            await cancelled.Invoking(t => t).Should().ThrowAsync<OperationCanceledException>();
+            (await other).Should().Be(1234);
+            node.RequestCount.Should().Be(1);
+        }
+    }
+}
@@ -0,0 +1,213 @@
+using System;
+using System.Linq;
+using System.IO.Pipes;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Tests.Helpers;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for routing, ejection and re-admission of the multi-endpoint RPC pool,
+    /// run against local stand-in RPC servers.
+    /// </summary>
+    public class RpcEndpointPoolTests
+    {
+        private static LocalRpcServer StartNode(int blockCount = 100)
+        {
+            return new LocalRpcServer(new JsonRpcStubHandler().On("getblockcount", _ => blockCount));
+        }
+
+        private static RpcEndpointPoolOptions ManualHealthChecks(int failureThreshold = 2) => new()
+        {
+            HealthCheckInterval = 0,
+            FailureThreshold = failureThreshold
+        };
+
+        [Fact]
+        public async Task Requests_FailOverWhenConnectionIsRefused()
+        {
+            using var node = StartNode();
+            var pool = new RpcEndpointPool(new[] { LocalRpcServer.UnusedUrl(), node.Url }, ManualHealthChecks());
+            using var neo = new global::NeoSharp.Protocol.NeoSharp(new HttpService(pool));
+
+            for (var i = 0; i < 3; i++)
+            {
+                (await neo.GetBlockCountAsync()).Should().Be(100);
+            }
+
+            pool.Endpoints[0].IsHealthy.Should().BeFalse();
+            pool.Endpoints[1].IsHealthy.Should().BeTrue();
+            node.RequestCount.Should().Be(3);
+        }
+
+        [Fact]
+        public async Task Requests_EjectEndpointAfterRepeatedErrors()
+        {
+            using var failing = StartNode();
+            using var healthy = StartNode();
+            failing.FailWith = HttpStatusCode.ServiceUnavailable;
+            var pool = new RpcEndpointPool(new[] { failing.Url, healthy.Url }, ManualHealthChecks(failureThreshold: 2));
+            using var neo = new global::NeoSharp.Protocol.NeoSharp(new HttpService(pool));
+
+            var failed = 0;
+            for (var i = 0; i < 5; i++)
+            {
+                try { await neo.GetBlockCountAsync(); }
+                catch (JsonRpcException) { failed++; }
+            }
+
+            // Errors after the request reached a node are surfaced rather than replayed elsewhere.
+            failed.Should().Be(2);
+            pool.Endpoints[0].IsHealthy.Should().BeFalse();
+            pool.Endpoints[0].EjectionReason.Should().Contain("consecutive failures");
+
+            var before = failing.RequestCount;
+            (await neo.GetBlockCountAsync()).Should().Be(100);
+            failing.RequestCount.Should().Be(before);
+        }
+
+        [Fact]
+        public async Task CheckHealth_EjectsLaggingEndpointAndReadmitsItAfterCatchUp()
+        {
+            var lagging = 90;
+            using var ahead = StartNode(blockCount: 100);
+            using var behind = new LocalRpcServer(new JsonRpcStubHandler().On("getblockcount", _ => lagging));
+            var options = ManualHealthChecks();
+            options.MaxBlockLag = 5;
+            using var service = new HttpService(new RpcEndpointPool(new[] { ahead.Url, behind.Url }, options));
+            var pool = service.EndpointPool;
+
+            await pool.CheckHealthAsync();
+
+            pool.Endpoints[1].IsHealthy.Should().BeFalse();
+            pool.Endpoints[1].LastBlockCount.Should().Be(90);
+            pool.HealthyEndpoints.Should().ContainSingle().Which.Should().BeSameAs(pool.Endpoints[0]);
+
+            lagging = 98;
+            await pool.CheckHealthAsync();
+
+            pool.Endpoints[1].IsHealthy.Should().BeTrue();
+            pool.Endpoints[1].EjectionReason.Should().BeNull();
+        }
+
+        [Fact]
+        public async Task CheckHealth_ReadmitsRecoveredEndpoint()
+        {
+            using var node = StartNode();
+            using var flaky = StartNode();
+            flaky.FailWith = HttpStatusCode.InternalServerError;
+            using var service = new HttpService(new RpcEndpointPool(new[] { node.Url, flaky.Url }, ManualHealthChecks()));
+
+            await service.EndpointPool.CheckHealthAsync();
+            service.EndpointPool.Endpoints[1].IsHealthy.Should().BeFalse();
+
+            flaky.FailWith = null;
+            await service.EndpointPool.CheckHealthAsync();
+            service.EndpointPool.Endpoints[1].IsHealthy.Should().BeTrue();
+        }
+
+        [Fact]
+        public async Task Requests_PreferLowerLatencyEndpoint()
+        {
+            using var slow = StartNode();
+            using var fast = StartNode();
+            slow.Delay = TimeSpan.FromMilliseconds(150);
+            var pool = new RpcEndpointPool(new[] { slow.Url, fast.Url }, ManualHealthChecks());
+            using var service = new HttpService(pool);
+
+            for (var i = 0; i < 10; i++)
+            {
+                await service.SendAsync<int>("getblockcount");
+            }
+
+            slow.RequestCount.Should().BeLessOrEqualTo(1);
+            pool.Endpoints[0].LatencyMilliseconds.Should().BeGreaterThan(pool.Endpoints[1].LatencyMilliseconds);
+        }
+
+        [Fact]
+        public async Task Requests_SpreadConcurrentLoadByOutstandingRequests()
+        {
+            using var first = StartNode();
+            using var second = StartNode();
+            first.Delay = second.Delay = TimeSpan.FromMilliseconds(100);
+            using var service = new HttpService(new RpcEndpointPool(new[] { first.Url, second.Url }, ManualHealthChecks()));
+
+            await Task.WhenAll(Enumerable.Range(0, 8).Select(_ => service.SendAsync<int>("getblockcount")));
+
+            first.RequestCount.Should().BeGreaterThan(0);
+            second.RequestCount.Should().BeGreaterThan(0);
+        }
+
+        /// <summary>
+        /// Answers with headers at once and streams the body only when <see cref="SendBody"/> is called.
+        /// </summary>
+        private sealed class DelayedBodyHandler : HttpMessageHandler
+        {
+            private readonly AnonymousPipeServerStream _body = new(PipeDirection.Out);
+
+            public TaskCompletionSource HeadersSent { get; } = new(TaskCreationOptions.RunContinuationsAsynchronously);
+
+            public async Task SendBody(string json)
+            {
+                await _body.WriteAsync(Encoding.UTF8.GetBytes(json));
+                await _body.DisposeAsync();
+            }
+
+            protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                HeadersSent.TrySetResult();
+                return Task.FromResult(new HttpResponseMessage(HttpStatusCode.OK) { Content = new StreamContent(new AnonymousPipeClientStream(PipeDirection.In, _body.ClientSafePipeHandle)) });
+            }
+        }
+
+        [Fact]
+        public async Task Requests_CountBodyTransferTowardsLatencyAndOutstanding()
+        {
+            var handler = new DelayedBodyHandler();
+            var pool = new RpcEndpointPool(new[] { "http://node.invalid:10332" }, ManualHealthChecks());
+            using var service = new HttpService(pool, new HttpClient(handler));
+            var endpoint = pool.Endpoints[0];
+
+            var call = service.SendAsync<int>("getblockcount");
+            await handler.HeadersSent.Task;
+            await Task.Delay(200);
+
+            endpoint.OutstandingRequests.Should().Be(1);
+            await handler.SendBody("{\"jsonrpc\":\"2.0\",\"id\":\"1\",\"result\":100}");
+
+            (await call).Should().Be(100);
+            endpoint.OutstandingRequests.Should().Be(0);
+            endpoint.LatencyMilliseconds.Should().BeGreaterOrEqualTo(150);
+        }
+
+        [Fact]
+        public async Task Requests_ReportMalformedBodiesAsEndpointFailures()
+        {
+            var handler = new DelayedBodyHandler();
+            var pool = new RpcEndpointPool(new[] { "http://node.invalid:10332" }, ManualHealthChecks());
+            using var service = new HttpService(pool, new HttpClient(handler));
+            var endpoint = pool.Endpoints[0];
+
+            var call = service.SendAsync<int>("getblockcount");
+            await handler.SendBody("{\"jsonrpc\":");
+
+            await call.Invoking(c => c).Should().ThrowAsync<JsonRpcException>();
+            endpoint.OutstandingRequests.Should().Be(0);
+            endpoint.ConsecutiveFailures.Should().Be(1);
+        }
+
+        [Fact]
+        public void Constructor_RequiresAtLeastOneEndpoint()
+        {
+            Action act = () => new RpcEndpointPool(Array.Empty<string>());
+            act.Should().Throw<ArgumentException>();
+        }
+    }
+}
@@ -0,0 +1,205 @@
+using System;
+using System.Diagnostics;
+using System.Net;
+using System.Net.Http;
+using System.Text;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Tests.Helpers;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for the retry, hedging and circuit breaker policies.
+    /// </summary>
+    public class RpcPolicyTests
+    {
+        private static HttpService CreateService(HttpMessageHandler node, params IRpcPolicy[] policies)
+        {
+            return new HttpService("http://localhost:10332", new HttpClient(node)) { Policies = new RpcPolicyPipeline(policies) };
+        }
+
+        private static RetryPolicy FastRetry(int maxRetries = 2) => new() { MaxRetries = maxRetries, BaseDelay = 1, MaxDelay = 5 };
+
+        [Fact]
+        public async Task Retry_RepeatsIdempotentCallAfterTransientFailures()
+        {
+            var node = new ScriptedNodeHandler((call, _) => call < 2 ? HttpStatusCode.ServiceUnavailable : HttpStatusCode.OK);
+            using var service = CreateService(node, FastRetry());
+
+            (await service.SendAsync<int>("getblockcount")).Should().Be(1);
+            node.CallCount.Should().Be(3);
+        }
+
+        [Fact]
+        public async Task Retry_GivesUpAfterMaxRetries()
+        {
+            var node = new ScriptedNodeHandler((_, _) => HttpStatusCode.BadGateway);
+            using var service = CreateService(node, FastRetry(maxRetries: 3));
+
+            Func<Task> call = () => service.SendAsync<int>("getblockcount");
+
+            await call.Should().ThrowAsync<JsonRpcException>().WithMessage("HTTP request failed*");
+            node.CallCount.Should().Be(4);
+        }
+
+        [Fact]
+        public async Task Retry_NeverRepeatsNonIdempotentCall()
+        {
+            var node = new ScriptedNodeHandler((_, _) => HttpStatusCode.ServiceUnavailable);
+            using var service = CreateService(node, FastRetry());
+
+            Func<Task> call = () => service.SendAsync<JsonElement>("sendrawtransaction", new object[] { "00" });
+
+            await call.Should().ThrowAsync<JsonRpcException>();
+            node.CallCount.Should().Be(1);
+        }
+
+        [Fact]
+        public async Task Retry_DoesNotRepeatErrorsReportedByNode()
+        {
+            var node = new JsonRpcStubHandler().On("getblock", _ => throw new StubRpcError(-100, "Unknown block"));
+            using var service = CreateService(node, FastRetry());
+
+            Func<Task> call = () => service.SendAsync<JsonElement>("getblock", new object[] { 99 });
+
+            await call.Should().ThrowAsync<JsonRpcException>().WithMessage("*Unknown block*");
+            node.RequestCount.Should().Be(1);
+        }
+
+        [Fact]
+        public async Task Retry_RespectsDeclaredIdempotency()
+        {
+            var node = new ScriptedNodeHandler((call, _) => call == 0 ? HttpStatusCode.ServiceUnavailable : HttpStatusCode.OK);
+            using var service = CreateService(node, FastRetry());
+            service.Policies.DeclareIdempotent("getblockcount", false);
+
+            Func<Task> call = () => service.SendAsync<int>("getblockcount");
+
+            await call.Should().ThrowAsync<JsonRpcException>();
+            service.Policies.IsIdempotent("getblockcount").Should().BeFalse();
+            service.Policies.IsIdempotent("sendrawtransaction").Should().BeFalse();
+        }
+
+        [Fact]
+        public async Task Hedging_TakesFirstAnswerOfDuplicateRequest()
+        {
+            var node = new ScriptedNodeHandler((_, _) => HttpStatusCode.OK, call => call == 0 ? TimeSpan.FromSeconds(2) : TimeSpan.Zero);
+            var hedging = new HedgingPolicy { Delay = 50 };
+            using var service = CreateService(node, hedging);
+            var stopwatch = Stopwatch.StartNew();
+
+            (await service.SendAsync<int>("getblock", new object[] { 1 })).Should().Be(1);
+
+            stopwatch.Elapsed.Should().BeLessThan(TimeSpan.FromSeconds(1));
+            hedging.HedgedCount.Should().Be(1);
+            node.CallCount.Should().Be(2);
+        }
+
+        [Fact]
+        public async Task Hedging_NeverDuplicatesSendRawTransaction()
+        {
+            var node = new ScriptedNodeHandler((_, _) => HttpStatusCode.OK, _ => TimeSpan.FromMilliseconds(200));
+            var hedging = new HedgingPolicy { Delay = 20 };
+            using var service = CreateService(node, hedging);
+
+            await service.SendAsync<int>("sendrawtransaction", new object[] { "00" });
+
+            hedging.HedgedCount.Should().Be(0);
+            node.CallCount.Should().Be(1);
+        }
+
+        [Fact]
+        public async Task Hedging_DerivesDelayFromObservedLatency()
+        {
+            var node = new ScriptedNodeHandler((_, _) => HttpStatusCode.OK, _ => TimeSpan.FromMilliseconds(20));
+            var hedging = new HedgingPolicy { MinSamples = 10, MinDelay = 1 };
+            using var service = CreateService(node, hedging);
+
+            for (var i = 0; i < 9; i++)
+            {
+                await service.SendAsync<int>("getblockcount");
+            }
+            hedging.CurrentDelay.Should().BeNull();
+
+            await service.SendAsync<int>("getblockcount");
+            hedging.CurrentDelay.Should().BeGreaterOrEqualTo(15);
+        }
+
+        [Fact]
+        public async Task CircuitBreaker_FailsFastWhileOpenAndClosesAfterTrial()
+        {
+            var failing = true;
+            var node = new ScriptedNodeHandler((_, _) => failing ? HttpStatusCode.ServiceUnavailable : HttpStatusCode.OK);
+            var breaker = new CircuitBreakerPolicy { FailureThreshold = 3, BreakDuration = 200 };
+            using var service = CreateService(node, breaker);
+
+            for (var i = 0; i < 3; i++)
+            {
+                Func<Task> failed = () => service.SendAsync<int>("getblockcount");
+                await failed.Should().ThrowAsync<JsonRpcException>().WithMessage("HTTP request failed*");
+            }
+
+            breaker.State.Should().Be(CircuitState.Open);
+            Func<Task> rejected = () => service.SendAsync<int>("getblockcount");
+            await rejected.Should().ThrowAsync<JsonRpcException>().WithMessage("Circuit breaker is open*");
+            node.CallCount.Should().Be(3);
+
+            failing = false;
+            await Task.Delay(300);
+            breaker.State.Should().Be(CircuitState.HalfOpen);
+
+            (await service.SendAsync<int>("getblockcount")).Should().Be(1);
+            breaker.State.Should().Be(CircuitState.Closed);
+        }
+
+        [Fact]
+        public async Task DefaultPipeline_RetriesAroundCircuitBreaker()
+        {
+            var node = new ScriptedNodeHandler((call, _) => call == 0 ? HttpStatusCode.ServiceUnavailable : HttpStatusCode.OK);
+            var pipeline = RpcPolicyPipeline.CreateDefault();
+            ((RetryPolicy)pipeline.Policies[0]).BaseDelay = 1;
+            using var service = new HttpService("http://localhost:10332", new HttpClient(node)) { Policies = pipeline };
+
+            (await service.SendAsync<int>("getblockcount")).Should().Be(1);
+            ((CircuitBreakerPolicy)pipeline.Policies[1]).State.Should().Be(CircuitState.Closed);
+        }
+
+        /// <summary>
+        /// Node stand-in answering every call with 1, or with the status code chosen per call index.
+        /// </summary>
+        private class ScriptedNodeHandler : HttpMessageHandler
+        {
+            private readonly Func<int, string, HttpStatusCode> _status;
+            private readonly Func<int, TimeSpan> _delay;
+            private int _callCount;
+
+            public ScriptedNodeHandler(Func<int, string, HttpStatusCode> status, Func<int, TimeSpan> delay = null)
+            {
+                _status = status;
+                _delay = delay ?? (_ => TimeSpan.Zero);
+            }
+
+            public int CallCount => Volatile.Read(ref _callCount);
+
+            protected override async Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+            {
+                var call = Interlocked.Increment(ref _callCount) - 1;
+                using var body = JsonDocument.Parse(await request.Content!.ReadAsStringAsync(cancellationToken));
+                var method = body.RootElement.GetProperty("method").GetString()!;
+                await Task.Delay(_delay(call), cancellationToken);
+
+                var status = _status(call, method);
+                if (status != HttpStatusCode.OK) return new HttpResponseMessage(status);
+
+                var id = body.RootElement.GetProperty("id").GetString();
+                var json = JsonSerializer.Serialize(new { jsonrpc = "2.0", id, result = 1 });
+                return new HttpResponseMessage(HttpStatusCode.OK) { Content = new StringContent(json, Encoding.UTF8, "application/json") };
+            }
+        }
+    }
+}
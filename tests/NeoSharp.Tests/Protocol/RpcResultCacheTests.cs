@@ -0,0 +1,219 @@
+using System;
+using System.IO;
+using System.Linq;
+using System.Net.Http;
+using System.Text.Json;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for the cache of immutable JSON-RPC results.
+    /// </summary>
+    public class RpcResultCacheTests
+    {
+        private const string BlockHash = "0x1f4d1defa46faa5e7b9b8d3f79a06bec777d7c26c4aa5f6f5899a291daa87c15";
+        private const string TxHash = "0x5c2f1a9e6e1b4a43f5bb3b6d6f3d0b1a3c9e0f7a2d9c1b2e3f4a5b6c7d8e9f00";
+        private const int BlockCount = 100;
+
+        private static JsonRpcStubHandler CreateNode()
+        {
+            return new JsonRpcStubHandler()
+                .On("getblockcount", _ => BlockCount)
+                .On("getblockhash", p => BlockHash)
+                .On("getblock", p =>
+                {
+                    var index = p[0].ValueKind == JsonValueKind.Number ? p[0].GetInt32() : 10;
+                    return new { hash = BlockHash, index, confirmations = BlockCount - index, tx = Array.Empty<object>() };
+                })
+                .On("gettransactionheight", _ => 10)
+                .On("getrawtransaction", p => p[1].GetBoolean()
+                    ? new { hash = TxHash, size = 250 }
+                    : (object)Convert.ToBase64String(new byte[64]));
+        }
+
+        private static (global::NeoSharp.Protocol.NeoSharp neo, JsonRpcStubHandler node) CreateClient(RpcResultCacheOptions options = null)
+        {
+            var node = CreateNode();
+            var service = new HttpService("http://localhost:10332", new HttpClient(node));
+            var config = new NeoSharpConfig().EnableResultCache(options);
+            return (new global::NeoSharp.Protocol.NeoSharp(service, config), node);
+        }
+
+        private static int CallsTo(JsonRpcStubHandler node, string method)
+        {
+            return node.RequestBodies.Count(body =>
+            {
+                using var document = JsonDocument.Parse(body);
+                return document.RootElement.GetProperty("method").GetString() == method;
+            });
+        }
+
+        [Fact]
+        public async Task GetBlockAsync_ServesConfirmedBlockFromCache()
+        {
+            var (neo, node) = CreateClient();
+
+            var first = await neo.GetBlockAsync(10);
+            var second = await neo.GetBlockAsync(10);
+
+            second.Hash.Should().Be(first.Hash);
+            CallsTo(node, "getblock").Should().Be(1);
+            neo.ResultCache.Statistics.MemoryHits.Should().Be(1);
+            neo.ResultCache.Statistics.Misses.Should().Be(1);
+            neo.ResultCache.Statistics.HitRate.Should().Be(0.5);
+        }
+
+        [Fact]
+        public async Task GetBlockAsync_DoesNotCacheBlocksAboveConfirmationDepth()
+        {
+            var (neo, node) = CreateClient(new RpcResultCacheOptions { ConfirmationDepth = 5 });
+
+            await neo.GetBlockAsync(BlockCount - 3);
+            await neo.GetBlockAsync(BlockCount - 3);
+            await neo.GetBlockAsync(BlockCount - 10);
+            await neo.GetBlockAsync(BlockCount - 10);
+
+            CallsTo(node, "getblock").Should().Be(3);
+            neo.ResultCache.Statistics.Skipped.Should().Be(2);
+        }
+
+        [Fact]
+        public async Task GetBlockHashAsync_RefreshesBlockCountToDecideDepth()
+        {
+            var (neo, node) = CreateClient();
+
+            await neo.GetBlockHashAsync(7);
+            await neo.GetBlockHashAsync(7);
+
+            CallsTo(node, "getblockhash").Should().Be(1);
+            CallsTo(node, "getblockcount").Should().Be(1);
+            neo.ResultCache.KnownBlockCount.Should().Be(BlockCount);
+        }
+
+        [Fact]
+        public async Task GetTransactionAsync_DoesNotCacheMempoolTransactions()
+        {
+            var (neo, node) = CreateClient();
+
+            await neo.GetTransactionAsync(Hash256.Parse(TxHash));
+            await neo.GetTransactionAsync(Hash256.Parse(TxHash));
+
+            CallsTo(node, "getrawtransaction").Should().Be(2);
+        }
+
+        [Fact]
+        public async Task GetRawTransactionAsync_CachesPersistedTransaction()
+        {
+            var (neo, node) = CreateClient();
+
+            var first = await neo.GetRawTransactionAsync(Hash256.Parse(TxHash));
+            var second = await neo.GetRawTransactionAsync(Hash256.Parse(TxHash));
+
+            second.Should().Be(first);
+            CallsTo(node, "getrawtransaction").Should().Be(1);
+            CallsTo(node, "gettransactionheight").Should().Be(1);
+        }
+
+        [Fact]
+        public async Task DepthLookupsWithUnexpectedResultsDoNotFailTheCall()
+        {
+            var node = CreateNode()
+                .On("gettransactionheight", _ => null)
+                .On("getblockcount", _ => "not a number");
+            var service = new HttpService("http://localhost:10332", new HttpClient(node));
+            var neo = new global::NeoSharp.Protocol.NeoSharp(service, new NeoSharpConfig().EnableResultCache());
+
+            var raw = await neo.GetRawTransactionAsync(Hash256.Parse(TxHash));
+            var hash = await neo.GetBlockHashAsync(10);
+
+            raw.Should().NotBeNull();
+            hash.Should().Be(Hash256.Parse(BlockHash));
+            neo.ResultCache.Statistics.Skipped.Should().Be(2);
+            neo.ResultCache.Statistics.Count.Should().Be(0);
+        }
+
+        [Fact]
+        public async Task GetRawBlockAsync_ReadsIndexFromSerializedHeader()
+        {
+            var header = new byte[120];
+            BitConverter.GetBytes(95).CopyTo(header, 84);
+            var node = new JsonRpcStubHandler()
+                .On("getblockcount", _ => BlockCount)
+                .On("getblock", _ => Convert.ToBase64String(header));
+            var service = new HttpService("http://localhost:10332", new HttpClient(node));
+            using var neo = new global::NeoSharp.Protocol.NeoSharp(service, new NeoSharpConfig().EnableResultCache(new RpcResultCacheOptions { ConfirmationDepth = 6 }));
+
+            await neo.GetRawBlockAsync(Hash256.Parse(BlockHash));
+            await neo.GetRawBlockAsync(Hash256.Parse(BlockHash));
+            neo.ResultCache.Statistics.Skipped.Should().Be(2);
+
+            BitConverter.GetBytes(90).CopyTo(header, 84);
+            neo.ResultCache.Options.ConfirmationDepth = 4;
+            await neo.GetRawBlockAsync(Hash256.Parse(BlockHash));
+            await neo.GetRawBlockAsync(Hash256.Parse(BlockHash));
+
+            CallsTo(node, "getblock").Should().Be(3);
+        }
+
+        [Fact]
+        public async Task SendAsync_SharesEntryForDifferentlyCasedHashes()
+        {
+            var node = CreateNode();
+            using var service = new HttpService("http://localhost:10332", new HttpClient(node)) { ResultCache = new RpcResultCache() };
+
+            await service.SendAsync<JsonElement>("getblock", new object[] { BlockHash.ToUpperInvariant().Replace("0X", "0x"), true });
+            await service.SendAsync<JsonElement>("getblock", new object[] { BlockHash, true });
+
+            CallsTo(node, "getblock").Should().Be(1);
+        }
+
+        [Fact]
+        public async Task Cache_EvictsLeastRecentlyUsedResultsOverMemoryBudget()
+        {
+            var (neo, _) = CreateClient(new RpcResultCacheOptions { MaxMemoryUsage = 800 });
+
+            for (var i = 0; i < 10; i++)
+            {
+                await neo.GetBlockAsync(i);
+            }
+
+            var statistics = neo.ResultCache.Statistics;
+            statistics.MemoryUsage.Should().BeLessOrEqualTo(800);
+            statistics.Evictions.Should().Be(10 - statistics.Count);
+            statistics.Evictions.Should().BePositive();
+        }
+
+        [Fact]
+        public async Task Cache_ServesResultsFromDiskTier()
+        {
+            var directory = Path.Combine(Path.GetTempPath(), "neosharp-cache-" + Guid.NewGuid().ToString("N"));
+            try
+            {
+                var options = new RpcResultCacheOptions { DiskCacheDirectory = directory };
+                var (warm, _) = CreateClient(options);
+                await warm.GetBlockAsync(10);
+
+                var (cold, node) = CreateClient(options);
+                var block = await cold.GetBlockAsync(10);
+
+                block.Index.Should().Be(10);
+                node.RequestCount.Should().Be(0);
+                cold.ResultCache.Statistics.DiskHits.Should().Be(1);
+
+                cold.ResultCache.Clear(includeDisk: true);
+                Directory.EnumerateFiles(directory).Should().BeEmpty();
+            }
+            finally
+            {
+                if (Directory.Exists(directory)) Directory.Delete(directory, true);
+            }
+        }
+    }
+}
@@ -0,0 +1,218 @@
+using System;
+using System.Collections.Concurrent;
+using System.Linq;
+using System.Net.Http;
+using System.Reactive.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol;
+using NeoSharp.Protocol.Core.Response;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Protocol.WebSockets;
+using NeoSharp.Tests.Helpers;
+using Xunit;
+
+namespace NeoSharp.Tests.Protocol
+{
+    /// <summary>
+    /// Tests for the WebSocket subscription transport, driven by an in-process WebSocket node stand-in.
+    /// </summary>
+    public class WebSocketServiceTests
+    {
+        private static readonly WebSocketServiceOptions FastReconnect = new() { ReconnectDelay = 20, MaxReconnectDelay = 100 };
+
+        private static object Block(int index) => new { hash = BlockHash(index), index, tx = Array.Empty<object>() };
+
+        private static string BlockHash(int index) => "0x" + index.ToString("x64");
+
+        private static async Task WaitUntilAsync(Func<bool> condition)
+        {
+            using var timeout = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+            while (!condition())
+            {
+                await Task.Delay(10, timeout.Token);
+            }
+        }
+
+        [Fact]
+        public async Task Blocks_DeliversPushedBlocks()
+        {
+            using var server = new LocalWebSocketServer();
+            await using var service = new WebSocketService(server.Url);
+            var received = new ConcurrentQueue<NeoBlock>();
+
+            using (service.Blocks.Subscribe(received.Enqueue))
+            {
+                await server.WaitForSubscriptionAsync(WebSocketService.BlockAddedEvent);
+                await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(1));
+                await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(2));
+
+                await WaitUntilAsync(() => received.Count == 2);
+            }
+
+            received.Select(b => b.Index).Should().Equal(1, 2);
+            received.First().Hash.ToString().Should().Be(BlockHash(1));
+            service.IsConnected.Should().BeTrue();
+        }
+
+        [Fact]
+        public async Task ReadNotificationsAsync_StreamsNotificationsWithContainer()
+        {
+            using var server = new LocalWebSocketServer();
+            await using var service = new WebSocketService(server.Url);
+            using var cancellation = new CancellationTokenSource(TimeSpan.FromSeconds(10));
+            var container = BlockHash(7);
+
+            var reading = Task.Run(async () =>
+            {
+                await foreach (var notification in service.ReadNotificationsAsync(cancellation.Token))
+                {
+                    return notification;
+                }
+                return null;
+            });
+
+            await server.WaitForSubscriptionAsync(WebSocketService.NotificationFromExecutionEvent);
+            await server.PublishAsync(WebSocketService.NotificationFromExecutionEvent, new
+            {
+                container,
+                contract = "0xd2a4cff31913016155e38e474a2c06d08be276cf",
+                eventname = "Transfer",
+                state = new { type = "Array", value = Array.Empty<object>() }
+            });
+
+            var received = await reading;
+            received.Should().NotBeNull();
+            received!.EventName.Should().Be("Transfer");
+            received.Container.ToString().Should().Be(container);
+            received.State.Type.Should().Be("Array");
+
+            // The enumeration ended, so its subscription is released on the node.
+            await server.WaitForSubscriptionAsync(WebSocketService.NotificationFromExecutionEvent, subscribed: false);
+        }
+
+        [Fact]
+        public async Task Observers_ShareOneSubscriptionUntilTheLastLeaves()
+        {
+            using var server = new LocalWebSocketServer();
+            await using var service = new WebSocketService(server.Url);
+            var first = new ConcurrentQueue<TransactionExecution>();
+            var second = new ConcurrentQueue<TransactionExecution>();
+
+            var firstSubscription = service.Executions.Subscribe(first.Enqueue);
+            var secondSubscription = service.Executions.Where(e => e.VmState == "FAULT").Subscribe(second.Enqueue);
+            await server.WaitForSubscriptionAsync(WebSocketService.TransactionExecutedEvent);
+
+            await server.PublishAsync(WebSocketService.TransactionExecutedEvent, new { container = BlockHash(1), trigger = "Application", vmstate = "HALT" });
+            await server.PublishAsync(WebSocketService.TransactionExecutedEvent, new { container = BlockHash(2), trigger = "Application", vmstate = "FAULT" });
+            await WaitUntilAsync(() => first.Count == 2 && second.Count == 1);
+
+            firstSubscription.Dispose();
+            await Task.Delay(100);
+            server.IsSubscribed(WebSocketService.TransactionExecutedEvent).Should().BeTrue();
+
+            secondSubscription.Dispose();
+            await server.WaitForSubscriptionAsync(WebSocketService.TransactionExecutedEvent, subscribed: false);
+
+            server.Requests.Should().Equal("subscribe:transaction_executed", "unsubscribe:1");
+            second.Single().Container.ToString().Should().Be(BlockHash(2));
+        }
+
+        [Fact]
+        public async Task Reconnect_ResubscribesAndFillsMissedBlocksInOrder()
+        {
+            var chainHeight = 2;
+            var node = new JsonRpcStubHandler()
+                .On("getblockcount", _ => Volatile.Read(ref chainHeight) + 1)
+                .On("getblock", p => Block(p[0].GetInt32()));
+            var neo = new global::NeoSharp.Protocol.NeoSharp(new HttpService("http://localhost:10332", new HttpClient(node)));
+
+            using var server = new LocalWebSocketServer();
+            await using var service = new WebSocketService(server.Url, neo, FastReconnect);
+            var received = new ConcurrentQueue<int>();
+
+            using var subscription = service.Blocks.Subscribe(b => received.Enqueue(b.Index));
+            await server.WaitForSubscriptionAsync(WebSocketService.BlockAddedEvent);
+            await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(1));
+            await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(2));
+            await WaitUntilAsync(() => received.Count == 2);
+
+            // Blocks 3 and 4 are produced while the connection is down.
+            server.DropConnections();
+            Volatile.Write(ref chainHeight, 4);
+            await server.WaitForSubscriptionAsync(WebSocketService.BlockAddedEvent);
+            await WaitUntilAsync(() => received.Count == 4);
+
+            // A block delivered by gap filling is not repeated, and a skipped block is fetched.
+            await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(4));
+            await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(6));
+            await WaitUntilAsync(() => received.Count == 6);
+
+            received.Should().Equal(1, 2, 3, 4, 5, 6);
+            service.ReconnectCount.Should().Be(1);
+            service.LastBlockIndex.Should().Be(6);
+            server.ConnectionCount.Should().Be(2);
+        }
+
+        [Fact]
+        public async Task Reconnect_RecoversFromUnexpectedExceptions()
+        {
+            var failures = 1;
+            var node = new JsonRpcStubHandler()
+                .On("getblockcount", _ => Interlocked.Decrement(ref failures) >= 0 ? throw new InvalidOperationException("Unexpected failure") : 3)
+                .On("getblock", p => Block(p[0].GetInt32()));
+            var neo = new global::NeoSharp.Protocol.NeoSharp(new HttpService("http://localhost:10332", new HttpClient(node)));
+
+            using var server = new LocalWebSocketServer();
+            await using var service = new WebSocketService(server.Url, neo, FastReconnect);
+            var received = new ConcurrentQueue<int>();
+
+            using var subscription = service.Blocks.Subscribe(b => received.Enqueue(b.Index));
+            await server.WaitForSubscriptionAsync(WebSocketService.BlockAddedEvent);
+            await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(1));
+            await WaitUntilAsync(() => received.Count == 1);
+
+            // Catching up after the first reconnection throws, which must not end the reconnect loop.
+            server.DropConnections();
+            await WaitUntilAsync(() => received.Count == 2);
+
+            received.Should().Equal(1, 2);
+            service.ReconnectCount.Should().Be(2);
+            server.ConnectionCount.Should().Be(3);
+        }
+
+        [Fact]
+        public async Task Dispose_FromAnObserverCallbackDoesNotDeadlock()
+        {
+            using var server = new LocalWebSocketServer();
+            var service = new WebSocketService(server.Url);
+            var completed = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+
+            service.Blocks.Subscribe(_ => service.Dispose(), () => completed.TrySetResult());
+            await server.WaitForSubscriptionAsync(WebSocketService.BlockAddedEvent);
+            await server.PublishAsync(WebSocketService.BlockAddedEvent, Block(1));
+
+            (await Task.WhenAny(completed.Task, Task.Delay(5_000))).Should().Be(completed.Task);
+            await WaitUntilAsync(() => !service.IsConnected);
+            await service.Invoking(s => s.ConnectAsync()).Should().ThrowAsync<ObjectDisposedException>();
+        }
+
+        [Fact]
+        public async Task ConnectAsync_ThrowsAfterDispose()
+        {
+            using var server = new LocalWebSocketServer();
+            var service = new WebSocketService(server.Url);
+            await service.ConnectAsync();
+            service.IsConnected.Should().BeTrue();
+
+            var completed = false;
+            service.Blocks.Subscribe(_ => { }, () => completed = true);
+            await service.DisposeAsync();
+
+            completed.Should().BeTrue();
+            service.IsConnected.Should().BeFalse();
+            await service.Invoking(s => s.ConnectAsync()).Should().ThrowAsync<ObjectDisposedException>();
+        }
+    }
+}
@@ -0,0 +1,116 @@
+using System;
+using System.Buffers.Binary;
+using System.IO;
+using System.Linq;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Serialization;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Serialization
+{
+    /// <summary>
+    /// Tests for hashing serialized data through <see cref="HashingStream"/>.
+    /// </summary>
+    public class HashingStreamTests
+    {
+        private static byte[] Bytes(int length, int seed)
+        {
+            var bytes = new byte[length];
+            new Random(seed).NextBytes(bytes);
+            return bytes;
+        }
+
+        [Fact]
+        public void HashesEverythingWrittenAcrossBufferBoundaries()
+        {
+            var chunks = new[] { Bytes(1, 1), Bytes(300, 2), Bytes(211, 3), Bytes(2000, 4), Bytes(7, 5) };
+            using var stream = new HashingStream();
+            using var memory = new MemoryStream();
+            using var hashing = new NeoSharp.Serialization.BinaryWriter(stream);
+            using var buffered = new NeoSharp.Serialization.BinaryWriter(memory);
+
+            foreach (var writer in new[] { hashing, buffered })
+            {
+                writer.WriteUInt32(0x01020304);
+                foreach (var chunk in chunks)
+                {
+                    writer.WriteVarBytes(chunk);
+                    writer.WriteByte(0xAB);
+                }
+            }
+
+            stream.Length.Should().Be(memory.Length);
+            Span<byte> hash = stackalloc byte[32];
+            stream.GetHash256(hash).Should().Be(32);
+            hash.ToArray().Should().Equal(Hash.Hash256(memory.ToArray()));
+        }
+
+        [Fact]
+        public void GetSha256ResetsTheStream()
+        {
+            using var stream = new HashingStream();
+            Span<byte> hash = stackalloc byte[32];
+
+            stream.Write(Bytes(100, 6));
+            stream.GetSha256(hash);
+
+            stream.Length.Should().Be(0);
+            stream.Write(new byte[] { 0x61, 0x62, 0x63 });
+            stream.GetSha256(hash);
+            hash.ToArray().Should().Equal(Hash.SHA256(new byte[] { 0x61, 0x62, 0x63 }));
+        }
+
+        [Fact]
+        public void IsWriteOnly()
+        {
+            using var stream = new HashingStream();
+            using var writer = new NeoSharp.Serialization.BinaryWriter(stream);
+
+            stream.CanRead.Should().BeFalse();
+            stream.CanSeek.Should().BeFalse();
+            Action toArray = () => writer.ToArray();
+            toArray.Should().Throw<NotSupportedException>();
+        }
+
+        [Fact]
+        public void TransactionHashMatchesTheSerializedUnsignedTransaction()
+        {
+            var transaction = new NeoSharp.Transaction.Transaction
+            {
+                Nonce = 42,
+                SystemFee = 1_000,
+                NetworkFee = 2_000,
+                ValidUntilBlock = 100,
+                Signers = { new Signer(new Hash160(Bytes(20, 7)), WitnessScope.CalledByEntry) },
+                Script = Bytes(700, 8)
+            };
+            using var memory = new MemoryStream();
+            using (var writer = new NeoSharp.Serialization.BinaryWriter(memory))
+            {
+                transaction.SerializeUnsigned(writer);
+            }
+
+            var digest = Hash.SHA256(memory.ToArray());
+            transaction.Hash.ToArray().Should().Equal(digest.Reverse());
+        }
+
+        [Fact]
+        public void GetHashDataWritesMagicAndLittleEndianHash()
+        {
+            var transaction = new NeoSharp.Transaction.Transaction { Nonce = 7, ValidUntilBlock = 10, Script = new byte[] { 0x40 } };
+            Span<byte> data = stackalloc byte[36];
+
+            transaction.GetHashData(860833102, data).Should().Be(36);
+
+            BinaryPrimitives.ReadUInt32LittleEndian(data).Should().Be(860833102);
+            data.Slice(4).ToArray().Should().Equal(transaction.Hash.ToLittleEndianArray());
+            transaction.GetHashData(860833102).Should().Equal(data.ToArray());
+
+            var tooShort = new byte[35];
+            Action act = () => transaction.GetHashData(860833102, tooShort);
+            act.Should().Throw<ArgumentException>();
+        }
+    }
+}
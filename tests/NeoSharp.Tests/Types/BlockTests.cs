@@ -0,0 +1,119 @@
+using System;
+using System.Linq;
+using System.Net.Http;
+using System.Threading.Tasks;
+using FluentAssertions;
+using NeoSharp.Protocol.Http;
+using NeoSharp.Serialization;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Transaction;
+using NeoSharp.Types;
+using Xunit;
+
+namespace NeoSharp.Tests.Types
+{
+    /// <summary>
+    /// Tests for decoding blocks and headers from their binary form.
+    /// </summary>
+    public class BlockTests
+    {
+        [Fact]
+        public void FromBase64_DecodesHeaderFieldsAndComputesHash()
+        {
+            var block = Block.FromBase64(TestBlocks.GenesisBlock);
+
+            block.Index.Should().Be(0);
+            block.Hash.ToString().Should().Be(TestBlocks.GenesisHash);
+            block.Header.Version.Should().Be(0);
+            block.Header.PrevHash.Should().Be(Hash256.Zero);
+            block.Header.MerkleRoot.Should().Be(Hash256.Zero);
+            block.Header.Timestamp.Should().Be(TestBlocks.GenesisTimestamp);
+            block.Header.Nonce.Should().Be(TestBlocks.GenesisNonce);
+            block.Header.PrimaryIndex.Should().Be(0);
+            block.Header.NextConsensus.ToString().Should().Be(TestBlocks.GenesisNextConsensus);
+            block.Header.Witness.InvocationScript.Should().BeEmpty();
+            block.Header.Witness.VerificationScript.Should().Equal(0x11);
+            block.Transactions.Should().BeEmpty();
+        }
+
+        [Fact]
+        public void FromBase64_DecodesTransactionsWithNeoHashes()
+        {
+            var block = Block.FromBase64(TestBlocks.Block1);
+
+            block.Index.Should().Be(1);
+            block.Hash.ToString().Should().Be(TestBlocks.Block1Hash);
+            block.Header.PrevHash.ToString().Should().Be(TestBlocks.GenesisHash);
+            block.Header.MerkleRoot.ToString().Should().Be(TestBlocks.Block1MerkleRoot);
+            block.Size.Should().Be(TestBlocks.Block1Size);
+            block.Transactions.Select(t => t.Hash.ToString()).Should().Equal(TestBlocks.NeoTransferHash, TestBlocks.GasTransferHash);
+
+            var transaction = block.Transactions[1];
+            transaction.SystemFee.Should().Be(10956900);
+            transaction.NetworkFee.Should().Be(1236520);
+            transaction.ValidUntilBlock.Should().Be(5790);
+            transaction.Attributes.Should().ContainSingle().Which.Type.Should().Be(TransactionAttributeType.Conflicts);
+            transaction.Size.Should().Be(TestBlocks.GasTransferSize);
+        }
+
+        [Fact]
+        public void FromArray_DecodesAStandaloneTransaction()
+        {
+            var transaction = NeoSerializableExtensions.FromArray<global::NeoSharp.Transaction.Transaction>(Convert.FromBase64String(TestBlocks.NeoTransfer));
+
+            transaction.Hash.ToString().Should().Be(TestBlocks.NeoTransferHash);
+            transaction.Size.Should().Be(TestBlocks.NeoTransferSize);
+            transaction.Signers.Should().ContainSingle();
+            transaction.Witnesses.Should().ContainSingle();
+            Convert.ToBase64String(transaction.ToArray()).Should().Be(TestBlocks.NeoTransfer);
+        }
+
+        [Fact]
+        public void Serialize_RoundTripsTheBinaryForm()
+        {
+            foreach (var (raw, header) in new[] { (TestBlocks.GenesisBlock, TestBlocks.GenesisHeader), (TestBlocks.Block1, TestBlocks.Block1Header) })
+            {
+                var block = Block.FromBase64(raw);
+
+                Convert.ToBase64String(block.ToArray()).Should().Be(raw);
+                Convert.ToBase64String(block.Header.ToArray()).Should().Be(header);
+                Header.FromBase64(header).Hash.Should().Be(block.Hash);
+            }
+        }
+
+        [Fact]
+        public void Hash_ChangesWithUnsignedFieldsOnly()
+        {
+            var header = Header.FromBase64(TestBlocks.Block1Header);
+            header.Hash.ToString().Should().Be(TestBlocks.Block1Hash);
+
+            header.Witness = new Witness(new byte[] { 0x0c }, new byte[] { 0x11 });
+            header.Hash.ToString().Should().Be(TestBlocks.Block1Hash);
+
+            header.Index = 2;
+            header.Hash.ToString().Should().NotBe(TestBlocks.Block1Hash);
+        }
+
+        [Fact]
+        public void FromBase64_RejectsHeaderWithoutWitness()
+        {
+            var bytes = Convert.FromBase64String(TestBlocks.GenesisHeader);
+            bytes[109] = 0;
+
+            Action act = () => NeoSerializableExtensions.FromArray<Header>(bytes);
+            act.Should().Throw<FormatException>();
+        }
+
+        [Fact]
+        public async Task GetBinaryBlockAsync_FetchesRawBlockAndDecodesIt()
+        {
+            var node = new JsonRpcStubHandler().On("getblock", p => p[1].GetBoolean() ? throw new StubRpcError(-32602, "verbose") : TestBlocks.Block1);
+            var neo = new global::NeoSharp.Protocol.NeoSharp(new HttpService("http://localhost:10332", new HttpClient(node)));
+
+            var block = await neo.GetBinaryBlockAsync(1);
+
+            block.Hash.ToString().Should().Be(TestBlocks.Block1Hash);
+            block.Transactions.Select(t => t.Hash.ToString()).Should().Equal(TestBlocks.NeoTransferHash, TestBlocks.GasTransferHash);
+        }
+    }
+}
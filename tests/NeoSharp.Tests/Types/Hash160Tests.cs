@@ -1,4 +1,5 @@
 using System;
+using System.Text.Json;
 using FluentAssertions;
 using NeoSharp.Tests.Helpers;
 using NeoSharp.Types;
@@ -256,5 +257,27 @@ namespace NeoSharp.Tests.Types
             // Assert
             hash.ToString().Should().Be("0x" + hexString);
         }
+
+        [Fact]
+        public void JsonSerialization_ShouldRoundTripPrefixedHex()
+        {
+            // Arrange
+            var hash = Hash160.Parse("23ba2703c53263e8d6e522dc32203339dcd8eee9");
+
+            // Act
+            var json = JsonSerializer.Serialize(hash);
+            var deserialized = JsonSerializer.Deserialize<Hash160>(json);
+
+            // Assert
+            json.Should().Be("\"0x23ba2703c53263e8d6e522dc32203339dcd8eee9\"");
+            deserialized.Should().Be(hash);
+        }
+
+        [Fact]
+        public void JsonDeserialization_WithInvalidHex_ShouldThrowJsonException()
+        {
+            Action act = () => JsonSerializer.Deserialize<Hash160>("\"0xzz\"");
+            act.Should().Throw<JsonException>();
+        }
     }
-}
\ No newline at end of file
+}
@@ -1,4 +1,5 @@
 using System;
+using System.Text.Json;
 using FluentAssertions;
 using NeoSharp.Tests.Helpers;
 using NeoSharp.Types;
@@ -261,5 +262,26 @@ namespace NeoSharp.Tests.Types
             // Assert
             hash.ToString().Should().Be("0x" + hexString);
         }
+
+        [Fact]
+        public void JsonSerialization_ShouldRoundTripPrefixedHex()
+        {
+            // Arrange
+            var hash = Hash256.Parse("b804a98220c69ab4674e97142beeeb00909113d417b9d6a67c12b71a3974a21a");
+
+            // Act
+            var json = JsonSerializer.Serialize(hash);
+            var deserialized = JsonSerializer.Deserialize<Hash256>(json);
+
+            // Assert
+            json.Should().Be("\"0xb804a98220c69ab4674e97142beeeb00909113d417b9d6a67c12b71a3974a21a\"");
+            deserialized.Should().Be(hash);
+        }
+
+        [Fact]
+        public void JsonDeserialization_WithNull_ShouldReturnDefault()
+        {
+            JsonSerializer.Deserialize<Hash256>("null").Should().Be(default(Hash256));
+        }
     }
-}
\ No newline at end of file
+}
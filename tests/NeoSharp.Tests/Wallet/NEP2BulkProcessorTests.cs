@@ -0,0 +1,130 @@
+using System;
+using System.Collections.Generic;
+using System.Linq;
+using System.Threading;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Wallet;
+using ScryptParams = NeoSharp.Wallet.NEP6.ScryptParams;
+using Xunit;
+
+namespace NeoSharp.Tests.Wallet
+{
+    /// <summary>
+    /// Tests for bulk NEP-2 encryption and decryption through <see cref="NEP2BulkProcessor"/>.
+    /// </summary>
+    public class NEP2BulkProcessorTests
+    {
+        private static readonly ScryptParams LightParams = new ScryptParams { N = 256, R = 1, P = 1 };
+
+        private sealed class RecordingProgress : IProgress<int>
+        {
+            public List<int> Values { get; } = new List<int>();
+
+            public void Report(int value)
+            {
+                lock (Values) Values.Add(value);
+            }
+        }
+
+        private static List<ECKeyPair> CreateKeyPairs(int count) =>
+            Enumerable.Range(0, count).Select(_ => ECKeyPair.CreateEcKeyPair()).ToList();
+
+        [Fact]
+        public void EncryptManyAndDecryptMany_RoundTrip()
+        {
+            var keyPairs = CreateKeyPairs(6);
+            var options = new NEP2BulkOptions { MaxDegreeOfParallelism = 4 };
+
+            var encrypted = NEP2.EncryptMany(keyPairs, TestConstants.DefaultAccountPassword, LightParams, options);
+            var decrypted = NEP2.DecryptMany(encrypted.Results.ToList(), TestConstants.DefaultAccountPassword, LightParams, options);
+
+            encrypted.Succeeded.Should().BeTrue();
+            decrypted.Succeeded.Should().BeTrue();
+            for (var i = 0; i < keyPairs.Count; i++)
+            {
+                encrypted.Results[i].Should().Be(NEP2.Encrypt(keyPairs[i], TestConstants.DefaultAccountPassword, LightParams));
+                decrypted.Results[i].PrivateKeyBytes.Should().Equal(keyPairs[i].PrivateKeyBytes);
+            }
+        }
+
+        [Fact]
+        public void DecryptMany_ReportsFailuresWithoutAborting()
+        {
+            var keyPairs = CreateKeyPairs(3);
+            var nep2Keys = keyPairs.Select(k => NEP2.Encrypt(k, TestConstants.DefaultAccountPassword, LightParams)).ToList();
+            nep2Keys.Insert(1, "not a NEP-2 key");
+            nep2Keys.Add(NEP2.Encrypt(ECKeyPair.CreateEcKeyPair(), "another password", LightParams));
+
+            var result = NEP2.DecryptMany(nep2Keys, TestConstants.DefaultAccountPassword, LightParams);
+
+            result.Succeeded.Should().BeFalse();
+            result.Failures.Select(f => f.Index).Should().Equal(1, 4);
+            result.Failures.Should().OnlyContain(f => f.Error != null);
+            result.Results[1].Should().BeNull();
+            result.Results[4].Should().BeNull();
+            result.Results[0].PrivateKeyBytes.Should().Equal(keyPairs[0].PrivateKeyBytes);
+            result.Results[2].PrivateKeyBytes.Should().Equal(keyPairs[1].PrivateKeyBytes);
+            result.Results[3].PrivateKeyBytes.Should().Equal(keyPairs[2].PrivateKeyBytes);
+        }
+
+        [Fact]
+        public void EncryptMany_ReportsProgressForEveryItem()
+        {
+            var progress = new RecordingProgress();
+
+            NEP2.EncryptMany(CreateKeyPairs(5), TestConstants.DefaultAccountPassword, LightParams, progress: progress);
+
+            progress.Values.OrderBy(v => v).Should().Equal(1, 2, 3, 4, 5);
+        }
+
+        [Fact]
+        public void EncryptMany_ThrowsWhenCanceled()
+        {
+            using var cts = new CancellationTokenSource();
+            cts.Cancel();
+
+            Action encrypt = () => NEP2.EncryptMany(CreateKeyPairs(3), TestConstants.DefaultAccountPassword, LightParams,
+                cancellationToken: cts.Token);
+
+            encrypt.Should().Throw<OperationCanceledException>();
+        }
+
+        [Fact]
+        public void GetConcurrency_IsBoundedByMemoryBudgetAndParallelism()
+        {
+            var bytesPerLane = 128L * LightParams.R * LightParams.N;
+
+            new NEP2BulkProcessor(new NEP2BulkOptions { MemoryBudget = 3 * bytesPerLane, MaxDegreeOfParallelism = 8 })
+                .GetConcurrency(LightParams).Should().Be(3);
+            new NEP2BulkProcessor(new NEP2BulkOptions { MemoryBudget = 1, MaxDegreeOfParallelism = 8 })
+                .GetConcurrency(LightParams).Should().Be(1);
+            new NEP2BulkProcessor(new NEP2BulkOptions { MaxDegreeOfParallelism = 8 })
+                .GetConcurrency(ScryptParams.Default).Should().Be(8);
+
+            Action zeroBudget = () => new NEP2BulkProcessor(new NEP2BulkOptions { MemoryBudget = 0 });
+            Action zeroDegree = () => new NEP2BulkProcessor(new NEP2BulkOptions { MaxDegreeOfParallelism = 0 });
+            zeroBudget.Should().Throw<ArgumentOutOfRangeException>();
+            zeroDegree.Should().Throw<ArgumentOutOfRangeException>();
+        }
+
+        [Fact]
+        public void WalletEncryptAndDecryptAllAccounts_UseTheBulkEngine()
+        {
+            var keyPairs = CreateKeyPairs(4);
+            var wallet = NeoSharp.Wallet.Wallet.WithAccounts(keyPairs.Select(k => new Account(k)).ToArray())
+                .SetScryptParams(LightParams);
+
+            wallet.EncryptAllAccounts(TestConstants.DefaultAccountPassword).Should().BeEmpty();
+            wallet.Accounts.Should().OnlyContain(a => a.KeyPair == null && a.EncryptedPrivateKey != null);
+
+            wallet.DecryptAllAccounts("wrong password").Should().HaveCount(4);
+            wallet.Accounts.Should().OnlyContain(a => a.KeyPair == null);
+
+            wallet.DecryptAllAccounts(TestConstants.DefaultAccountPassword).Should().BeEmpty();
+            wallet.Accounts.Select(a => a.KeyPair!.PrivateKeyBytes.ToArray())
+                .Should().BeEquivalentTo(keyPairs.Select(k => k.PrivateKeyBytes));
+        }
+    }
+}
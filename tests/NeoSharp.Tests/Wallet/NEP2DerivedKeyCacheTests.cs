@@ -0,0 +1,127 @@
+using System;
+using System.Threading;
+using FluentAssertions;
+using NeoSharp.Crypto;
+using NeoSharp.Tests.Helpers;
+using NeoSharp.Wallet;
+using Xunit;
+using ScryptParams = NeoSharp.Wallet.NEP6.ScryptParams;
+
+namespace NeoSharp.Tests.Wallet
+{
+    /// <summary>
+    /// Tests for <see cref="NEP2DerivedKeyCache"/> and its use by NEP-2 and accounts.
+    /// </summary>
+    public class NEP2DerivedKeyCacheTests
+    {
+        private static readonly ScryptParams LightParams = new ScryptParams { N = 256, R = 1, P = 1 };
+
+        [Fact]
+        public void EncryptAndDecrypt_ShareOneCachedKey()
+        {
+            using var cache = new NEP2DerivedKeyCache();
+            var keyPair = ECKeyPair.CreateEcKeyPair();
+
+            var encrypted = NEP2.Encrypt(keyPair, TestConstants.DefaultAccountPassword, LightParams, cache);
+            var first = NEP2.Decrypt(encrypted, TestConstants.DefaultAccountPassword, LightParams, cache);
+            var second = NEP2.DecryptToBytes(encrypted, TestConstants.DefaultAccountPassword, LightParams, cache);
+
+            encrypted.Should().Be(NEP2.Encrypt(keyPair, TestConstants.DefaultAccountPassword, LightParams));
+            first.PrivateKeyBytes.Should().Equal(keyPair.PrivateKeyBytes);
+            second.Should().Equal(keyPair.PrivateKeyBytes);
+            cache.Count.Should().Be(1);
+        }
+
+        [Fact]
+        public void Decrypt_DoesNotCacheKeysDerivedFromAWrongPassword()
+        {
+            using var cache = new NEP2DerivedKeyCache();
+            var encrypted = NEP2.Encrypt(ECKeyPair.CreateEcKeyPair(), TestConstants.DefaultAccountPassword, LightParams);
+
+            Action decrypt = () => NEP2.Decrypt(encrypted, "wrong password", LightParams, cache);
+
+            decrypt.Should().Throw<NEP2Exception>();
+            cache.Count.Should().Be(0);
+        }
+
+        [Fact]
+        public void Cache_IsBoundedByCountAndTime()
+        {
+            using var cache = new NEP2DerivedKeyCache { MaxEntries = 2, TimeToLiveMs = 200 };
+            var keyPair = ECKeyPair.CreateEcKeyPair();
+
+            foreach (var password in new[] { "one", "two", "three" })
+            {
+                NEP2.Encrypt(keyPair, password, LightParams, cache);
+            }
+
+            cache.Count.Should().Be(2);
+
+            Thread.Sleep(300);
+            cache.RemoveExpired().Should().Be(2);
+            cache.Count.Should().Be(0);
+        }
+
+        [Fact]
+        public void PurgeApis_RemoveEntries()
+        {
+            var cache = new NEP2DerivedKeyCache();
+            var keyPair = ECKeyPair.CreateEcKeyPair();
+            var other = ECKeyPair.CreateEcKeyPair();
+            NEP2.Encrypt(keyPair, "one", LightParams, cache);
+            NEP2.Encrypt(keyPair, "two", LightParams, cache);
+            NEP2.Encrypt(other, "one", LightParams, cache);
+
+            cache.Remove(keyPair.GetAddress()).Should().Be(2);
+            cache.Count.Should().Be(1);
+
+            cache.Clear();
+            cache.Count.Should().Be(0);
+
+            cache.Dispose();
+            Action encrypt = () => NEP2.Encrypt(keyPair, "one", LightParams, cache);
+            encrypt.Should().Throw<ObjectDisposedException>();
+        }
+
+        [Fact]
+        public void Account_UsesTheWalletCache()
+        {
+            using var cache = new NEP2DerivedKeyCache();
+            var keyPair = ECKeyPair.CreateEcKeyPair();
+            var account = new Account(keyPair);
+            NeoSharp.Wallet.Wallet.WithAccounts(account).SetDerivedKeyCache(cache);
+
+            for (var i = 0; i < 3; i++)
+            {
+                account.EncryptPrivateKey(TestConstants.DefaultAccountPassword, LightParams);
+                account.KeyPair.Should().BeNull();
+                account.DecryptPrivateKey(TestConstants.DefaultAccountPassword, LightParams);
+                account.KeyPair!.PrivateKeyBytes.Should().Equal(keyPair.PrivateKeyBytes);
+            }
+
+            cache.Count.Should().Be(1);
+        }
+
+        [Fact]
+        public void BulkDecryptAndEncrypt_UseTheWalletCache()
+        {
+            using var cache = new NEP2DerivedKeyCache();
+            var accounts = new[] { new Account(ECKeyPair.CreateEcKeyPair()), new Account(ECKeyPair.CreateEcKeyPair()), new Account(ECKeyPair.CreateEcKeyPair()) };
+            foreach (var account in accounts)
+            {
+                account.EncryptPrivateKey(TestConstants.DefaultAccountPassword, LightParams);
+            }
+
+            var wallet = NeoSharp.Wallet.Wallet.WithAccounts(accounts).SetScryptParams(LightParams).SetDerivedKeyCache(cache);
+
+            wallet.DecryptAllAccounts(TestConstants.DefaultAccountPassword).Should().BeEmpty();
+            cache.Count.Should().Be(accounts.Length);
+
+            // Encrypting again derives from the same password and salts, so the cached keys are reused.
+            wallet.EncryptAllAccounts(TestConstants.DefaultAccountPassword).Should().BeEmpty();
+            cache.Count.Should().Be(accounts.Length);
+            wallet.DecryptAllAccounts(TestConstants.DefaultAccountPassword).Should().BeEmpty();
+            accounts.Should().OnlyContain(a => a.KeyPair != null);
+        }
+    }
+}